@@ -0,0 +1,76 @@
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, TypeVar
+
+from ..constants import VIEWER_CACHE_MAX_BYTES
+
+T = TypeVar("T")
+
+
+class FileCache:
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.entries: "OrderedDict[tuple[str, Path], tuple[tuple[int, int], Any, int]]" = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, kind: str, path: Path, load: Callable[[], T]) -> T:
+        stat = path.stat()
+        file_key = (stat.st_size, stat.st_mtime_ns)
+        with self.lock:
+            cached = self.entries.get((kind, path))
+            if cached is not None and cached[0] == file_key:
+                self.entries.move_to_end((kind, path))
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+
+        value = load()
+        value_size = estimate_size(value)
+        with self.lock:
+            previous = self.entries.pop((kind, path), None)
+            if previous is not None:
+                self.size -= previous[2]
+            if value_size <= self.max_bytes:
+                self.entries[(kind, path)] = (file_key, value, value_size)
+                self.size += value_size
+            while self.size > self.max_bytes:
+                _, (_, _, evicted_size) = self.entries.popitem(last=False)
+                self.size -= evicted_size
+                self.evictions += 1
+        return value
+
+    def stats(self):
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "size": self.size,
+                "max_size": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def estimate_size(value, seen=None) -> int:
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, seen) + estimate_size(v, seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(estimate_size(item, seen) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += estimate_size(vars(value), seen)
+    return size
+
+
+viewer_cache = FileCache(VIEWER_CACHE_MAX_BYTES)
@@ -1,11 +1,12 @@
 from flask import Blueprint, request, render_template, url_for, redirect, flash
 
-from ....constants import GRAPH_DIR
+from ....constants import GRAPH_DIR, PAGE_SIZE
 from ....utils.batch_data.helpers import get_batch_list, pause_batch, delete_batch
+from ....utils.batch_data.jobs import count_jobs
 from ...forms.batch import BatchForm
 from ...tasks.create_batch import create_batch
 from ...tasks.resume_processing import resume_processing
-from .graphs import bp as graph_bp
+from .graphs import bp as graph_bp, list_graphs
 
 from ....utils.batch_data.types import BlabKGException
 
@@ -17,7 +18,7 @@ bp.register_blueprint(graph_bp)
 @bp.route("/")
 def index(language):
     batches = get_batch_list(language)
-    return render_template("batches/index.j2", language=language, batches=batches)
+    return render_template("batches/index.j2", language=language, batches=batches, jobs=count_jobs())
 
 
 @bp.route("/new/")
@@ -36,6 +37,8 @@ def new(language):
             similarity_threshold=form.similarity_threshold.data,  # type: ignore
             bridge_threshold=form.bridge_threshold.data,  # type: ignore
             batch_size=form.processing_batch_size.data,  # type: ignore
+            workers=form.workers.data,  # type: ignore
+            priority=form.priority.data,  # type: ignore
         )
         return redirect(url_for(".index", language=language))
     return render_template("batches/new.j2", language=language, form=form)
@@ -64,12 +67,14 @@ def delete(language, batch):
 
 @bp.route("/<batch>/")
 def batch(language, batch):
-    base_graphs = (GRAPH_DIR / language / batch / "base").glob("*.json")
-    clean_graphs = (GRAPH_DIR / language / batch / "clean").glob("*.json")
+    base_names, base_next = list_graphs(language, batch, "base", "", PAGE_SIZE)
+    clean_names, clean_next = list_graphs(language, batch, "clean", "", PAGE_SIZE)
     return render_template(
         "batches/batch.j2",
         language=language,
         batch=batch,
-        base_graphs=base_graphs,
-        clean_graphs=clean_graphs,
+        base_graphs=[GRAPH_DIR / language / batch / "base" / name for name in base_names],
+        clean_graphs=[GRAPH_DIR / language / batch / "clean" / name for name in clean_names],
+        base_next=base_next,
+        clean_next=clean_next,
     )
@@ -1,8 +1,11 @@
-from flask import Blueprint, jsonify, render_template
-import json
+from flask import Blueprint, current_app, jsonify, render_template, request, send_file
 from pathlib import Path
 
-from .....constants import GRAPH_DIR
+from .....constants import GRAPH_DIR, MAX_PAGE_SIZE, PAGE_SIZE
+from .....ctxkg.models.adjacency_index import AdjacencyIndex
+from .....ctxkg.models.graph_file import get_graph_format
+from .....ctxkg.models.graph_store import GraphStore
+from ....cache import viewer_cache
 
 bp = Blueprint('graphs', __name__, url_prefix='/<batch>/graphs')
 
@@ -10,17 +13,37 @@ bp = Blueprint('graphs', __name__, url_prefix='/<batch>/graphs')
 @bp.route("/base/", defaults={"version": "base"})
 @bp.route("/clean/", defaults={"version": "clean"})
 def index(language, batch, version):
-    graphs = (GRAPH_DIR / language / batch / version).glob("*.json")
+    after = request.args.get("after", "")
+    names, next_after = list_graphs(language, batch, version, after, PAGE_SIZE)
     return render_template(
         "batches/graphs/index.j2",
         language=language,
         batch=batch,
         version=version,
-        graphs=graphs,
+        graphs=[GRAPH_DIR / language / batch / version / name for name in names],
+        after=after,
+        next_after=next_after,
         title=f"{version.capitalize()} Graphs"
     )
 
 
+@bp.route("/base/files/", defaults={"version": "base"})
+@bp.route("/clean/files/", defaults={"version": "clean"})
+def graph_files(language, batch, version):
+    names, next_after = list_graphs(language, batch, version, request.args.get("after", ""), get_limit())
+    return jsonify({"graphs": names, "next": next_after})
+
+
+def list_graphs(language, batch, version, after: str, limit: int):
+    # Batches whose stage hasn't run yet have no graphs, and may not have a directory for the store either
+    if not (GRAPH_DIR / language / batch / version).is_dir():
+        return [], None
+    # One extra name is read to know whether there is a next page, whose cursor is the last name shown
+    names = GraphStore(GRAPH_DIR / language / batch).list_graphs(version, after, limit + 1)
+    next_after = names[limit - 1] if len(names) > limit else None
+    return names[:limit], next_after
+
+
 @bp.route("/base/<graph>/", defaults={"version": "base"})
 @bp.route("/clean/<graph>/", defaults={"version": "clean"})
 def graph(language, batch, version, graph):
@@ -40,69 +63,71 @@ def graph(language, batch, version, graph):
 @bp.route("/base/<graph>/json/", defaults={"version": "base"})
 @bp.route("/clean/<graph>/json/", defaults={"version": "clean"})
 def graph_json(language, batch, version, graph):
-    graph = GRAPH_DIR / language / batch / version / graph
-    with graph.open(encoding="utf-8") as f:
-        return jsonify(json.load(f))
+    graph_path = GRAPH_DIR / language / batch / version / graph
+    if get_graph_format(graph_path) == "json":
+        return send_file(graph_path, mimetype="application/json", conditional=True)
+    store = GraphStore(GRAPH_DIR / language / batch)
+    return current_app.response_class(store.iter_graph_json(version, graph_path), mimetype="application/json")
+
+
+@bp.route("/base/<graph>/entities/", defaults={"version": "base"})
+@bp.route("/clean/<graph>/entities/", defaults={"version": "clean"})
+def graph_entities(language, batch, version, graph):
+    graph_path = GRAPH_DIR / language / batch / version / graph
+    offset, limit = request.args.get("offset", 0, type=int), get_limit()
+    entities, total = GraphStore(GRAPH_DIR / language / batch).get_entity_range(version, graph_path, offset, limit)
+    return jsonify({"entities": entities, "total": total, "next": get_next_offset(offset, len(entities), total)})
+
+
+@bp.route("/base/<graph>/triples/", defaults={"version": "base"})
+@bp.route("/clean/<graph>/triples/", defaults={"version": "clean"})
+def graph_triples(language, batch, version, graph):
+    graph_path = GRAPH_DIR / language / batch / version / graph
+    offset, limit = request.args.get("offset", 0, type=int), get_limit()
+    triples, total = GraphStore(GRAPH_DIR / language / batch).get_triple_range(version, graph_path, offset, limit)
+    return jsonify({"triples": triples, "total": total, "next": get_next_offset(offset, len(triples), total)})
+
+
+def get_limit():
+    return min(max(request.args.get("limit", PAGE_SIZE, type=int), 1), MAX_PAGE_SIZE)
+
+
+def get_next_offset(offset: int, count: int, total: int):
+    return offset + count if count and offset + count < total else None
 
 
 @bp.route("/base/<graph>/bridges/<node>/")
 @bp.route("/clean/<graph>/bridges/<node>/")
 def node_bridges(language, batch, graph, node):
-    bridges = {}
     bridge_path = GRAPH_DIR / language / batch / "bridges" / graph
-    with bridge_path.open(encoding="utf-8") as f:
-        all_bridges = json.load(f)
-        for target_graph, target_graph_bridges in all_bridges.items():
-            if node in target_graph_bridges:
-                bridges[target_graph] = target_graph_bridges[node]
-    return jsonify(bridges)
+    store = GraphStore(GRAPH_DIR / language / batch)
+    return current_app.response_class(store.get_node_bridges_json(bridge_path, node), mimetype="application/json")
 
 
 @bp.route("/base/<graph>/<node>/", defaults={"version": "base"})
 @bp.route("/clean/<graph>/<node>/", defaults={"version": "clean"})
 def expand_node(language, batch, version, graph, node):
     graph_path = GRAPH_DIR / language / batch / version / graph
-    with graph_path.open(encoding="utf-8") as f:
-        graph = json.load(f)
-        expanded_nodes = get_expanded_nodes(graph, node)
-
-        links = {}
-        for node, linked_nodes in graph["links"].items():
-            if node in expanded_nodes:
-                links[node] = [ln for ln in linked_nodes if ln in expanded_nodes]
-
-        expanded_node_json = {
-            "entities": {e_id: e_label for e_id, e_label in graph["entities"].items() if e_id in expanded_nodes},
-            "graph": [triple for triple in graph["graph"] if triple["subject_id"] in expanded_nodes],
-            "links": links,
-        }
-        return jsonify(expanded_node_json)
-
-
-def get_expanded_nodes(graph, initial_node):
-    explored = set()
-    entities = {initial_node}
-    while len(explored) != len(entities):
-        to_explore = {e for e in entities if e not in explored}
-        new_entities = set()
-        for e in to_explore:
-            e_triples = [t for t in graph["graph"] if e == t["subject_id"] or e == t["object_id"]]
-            e_expanded_entities = {t["object_id"] if e == t["subject_id"] else t["subject_id"] for t in e_triples}
-            e_new_entities = {e for e in e_expanded_entities if e not in to_explore and e not in explored}
-            new_entities.update(e_new_entities)
-        entities.update(new_entities)
-        explored.update(to_explore)
-
-    return entities
+    index = viewer_cache.get(
+        "adjacency", graph_path, lambda: AdjacencyIndex(get_graph_data(language, batch, version, graph))
+    )
+    max_depth = request.args.get("depth", type=int)
+    max_nodes = request.args.get("limit", type=int)
+    return jsonify(index.expand(node, max_depth, max_nodes))
+
+
+def get_graph_data(language, batch, version, graph):
+    graph_path = GRAPH_DIR / language / batch / version / graph
+    return viewer_cache.get(
+        "graph", graph_path, lambda: GraphStore(GRAPH_DIR / language / batch).get_graph_data(version, graph_path)
+    )
 
 
 @bp.route("/base/<graph>/document/", defaults={"version": "base"})
 @bp.route("/clean/<graph>/document/", defaults={"version": "clean"})
 def get_original_document(language, batch, version, graph):
     graph_path = GRAPH_DIR / language / batch / version / graph
-    with graph_path.open(encoding="utf-8") as f:
-        graph = json.load(f)
-    document_file = Path(graph["document"])
+    document_file = Path(GraphStore(GRAPH_DIR / language / batch).get_document(version, graph_path))
     with document_file.open(encoding="utf-8") as f:
         document_text = f.read()
     return jsonify(document_text)
@@ -1,4 +1,6 @@
-from flask import Blueprint, render_template
+from flask import Blueprint, jsonify, render_template
+
+from ..cache import viewer_cache
 
 bp = Blueprint('home', __name__)
 
@@ -6,3 +8,8 @@ bp = Blueprint('home', __name__)
 @bp.route("/")
 def index():
     return render_template("home/index.j2")
+
+
+@bp.route("/cache/")
+def cache_stats():
+    return jsonify(viewer_cache.stats())
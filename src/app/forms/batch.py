@@ -22,6 +22,9 @@ class BatchForm(Form):
     bridge_threshold = FloatField("Similarity coef. (bridges)", [NumberRange(0.0, 1.0)],
                                   default=DEFAULT_PARAMS["bridges"]["threshold"])
     processing_batch_size = IntegerField("Processing batch size", default=DEFAULT_PARAMS["base"]["batch_size"])
+    workers = IntegerField("Worker processes (reduction and bridges)", [NumberRange(min=1)],
+                           default=DEFAULT_PARAMS["base"]["workers"])
+    priority = IntegerField("Queue priority (higher runs first)", default=0)
 
     def show_bert_size(self):
         return self.language.data == "en"
@@ -35,6 +38,8 @@ class BatchForm(Form):
             or self.similarity_threshold.data != self.similarity_threshold.default
             or self.bridge_threshold.data != self.bridge_threshold.default
             or self.processing_batch_size.data != self.processing_batch_size.default
+            or self.workers.data != self.workers.default
+            or self.priority.data != self.priority.default
         )
 
     def validate_name(self, field):
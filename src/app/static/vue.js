@@ -1 +1 @@
-(()=>{"use strict";var t={744:(t,e)=>{e.Z=(t,e)=>{const n=t.__vccOpts||t;for(const[t,r]of e)n[t]=r;return n}}},e={};function n(r){var i=e[r];if(void 0!==i)return i.exports;var o=e[r]={exports:{}};return t[r](o,o.exports,n),o.exports}n.g=function(){if("object"==typeof globalThis)return globalThis;try{return this||new Function("return this")()}catch(t){if("object"==typeof window)return window}}(),(()=>{function t(t,e){const n=Object.create(null),r=t.split(",");for(let t=0;t<r.length;t++)n[r[t]]=!0;return e?t=>!!n[t.toLowerCase()]:t=>!!n[t]}const e=t("itemscope,allowfullscreen,formnovalidate,ismap,nomodule,novalidate,readonly");function r(t){return!!t||""===t}function i(t){if(w(t)){const e={};for(let n=0;n<t.length;n++){const r=t[n],o=E(r)?l(r):i(r);if(o)for(const t in o)e[t]=o[t]}return e}return E(t)||N(t)?t:void 0}const o=/;(?![^(]*\))/g,s=/:(.+)/;function l(t){const e={};return t.split(o).forEach((t=>{if(t){const n=t.split(s);n.length>1&&(e[n[0].trim()]=n[1].trim())}})),e}function a(t){let e="";if(E(t))e=t;else if(w(t))for(let n=0;n<t.length;n++){const r=a(t[n]);r&&(e+=r+" ")}else if(N(t))for(const n in t)t[n]&&(e+=n+" ");return e.trim()}const u=t=>E(t)?t:null==t?"":w(t)||N(t)&&(t.toString===O||!M(t.toString))?JSON.stringify(t,c,2):String(t),c=(t,e)=>e&&e.__v_isRef?c(t,e.value):S(e)?{[`Map(${e.size})`]:[...e.entries()].reduce(((t,[e,n])=>(t[`${e} =>`]=n,t)),{})}:k(e)?{[`Set(${e.size})`]:[...e.values()]}:!N(e)||w(e)||T(e)?e:String(e),f={},h=[],p=()=>{},d=()=>!1,g=/^on[^a-z]/,v=t=>g.test(t),y=t=>t.startsWith("onUpdate:"),m=Object.assign,_=(t,e)=>{const n=t.indexOf(e);n>-1&&t.splice(n,1)},x=Object.prototype.hasOwnProperty,b=(t,e)=>x.call(t,e),w=Array.isArray,S=t=>"[object Map]"===$(t),k=t=>"[object Set]"===$(t),M=t=>"function"==typeof t,E=t=>"string"==typeof t,A=t=>"symbol"==typeof t,N=t=>null!==t&&"object"==typeof t,C=t=>N(t)&&M(t.then)&&M(t.catch),O=Object.prototype.toString,$=t=>O.call(t),T=t=>"[object Object]"===$(t),L=t=>E(t)&&"NaN"!==t&&"-"!==t[0]&&""+parseInt(t,10)===t,P=t(",key,ref,ref_for,ref_key,onVnodeBeforeMount,onVnodeMounted,onVnodeBeforeUpdate,onVnodeUpdated,onVnodeBeforeUnmount,onVnodeUnmounted"),V=t=>{const e=Object.create(null);return n=>e[n]||(e[n]=t(n))},j=/-(\w)/g,F=V((t=>t.replace(j,((t,e)=>e?e.toUpperCase():"")))),R=/\B([A-Z])/g,U=V((t=>t.replace(R,"-$1").toLowerCase())),D=V((t=>t.charAt(0).toUpperCase()+t.slice(1))),I=V((t=>t?`on${D(t)}`:"")),B=(t,e)=>!Object.is(t,e),z=(t,e)=>{for(let n=0;n<t.length;n++)t[n](e)},q=(t,e,n)=>{Object.defineProperty(t,e,{configurable:!0,enumerable:!1,value:n})},X=t=>{const e=parseFloat(t);return isNaN(e)?t:e};let H;const Y=()=>H||(H="undefined"!=typeof globalThis?globalThis:"undefined"!=typeof self?self:"undefined"!=typeof window?window:void 0!==n.g?n.g:{});let W;class G{constructor(t=!1){this.active=!0,this.effects=[],this.cleanups=[],!t&&W&&(this.parent=W,this.index=(W.scopes||(W.scopes=[])).push(this)-1)}run(t){if(this.active){const e=W;try{return W=this,t()}finally{W=e}}}on(){W=this}off(){W=this.parent}stop(t){if(this.active){let e,n;for(e=0,n=this.effects.length;e<n;e++)this.effects[e].stop();for(e=0,n=this.cleanups.length;e<n;e++)this.cleanups[e]();if(this.scopes)for(e=0,n=this.scopes.length;e<n;e++)this.scopes[e].stop(!0);if(this.parent&&!t){const t=this.parent.scopes.pop();t&&t!==this&&(this.parent.scopes[this.index]=t,t.index=this.index)}this.active=!1}}}const K=t=>{const e=new Set(t);return e.w=0,e.n=0,e},Z=t=>(t.w&nt)>0,J=t=>(t.n&nt)>0,Q=new WeakMap;let tt,et=0,nt=1;const rt=Symbol(""),it=Symbol("");class ot{constructor(t,e=null,n){this.fn=t,this.scheduler=e,this.active=!0,this.deps=[],this.parent=void 0,function(t,e=W){e&&e.active&&e.effects.push(t)}(this,n)}run(){if(!this.active)return this.fn();let t=tt,e=lt;for(;t;){if(t===this)return;t=t.parent}try{return this.parent=tt,tt=this,lt=!0,nt=1<<++et,et<=30?(({deps:t})=>{if(t.length)for(let e=0;e<t.length;e++)t[e].w|=nt})(this):st(this),this.fn()}finally{et<=30&&(t=>{const{deps:e}=t;if(e.length){let n=0;for(let r=0;r<e.length;r++){const i=e[r];Z(i)&&!J(i)?i.delete(t):e[n++]=i,i.w&=~nt,i.n&=~nt}e.length=n}})(this),nt=1<<--et,tt=this.parent,lt=e,this.parent=void 0,this.deferStop&&this.stop()}}stop(){tt===this?this.deferStop=!0:this.active&&(st(this),this.onStop&&this.onStop(),this.active=!1)}}function st(t){const{deps:e}=t;if(e.length){for(let n=0;n<e.length;n++)e[n].delete(t);e.length=0}}let lt=!0;const at=[];function ut(){at.push(lt),lt=!1}function ct(){const t=at.pop();lt=void 0===t||t}function ft(t,e,n){if(lt&&tt){let e=Q.get(t);e||Q.set(t,e=new Map);let r=e.get(n);r||e.set(n,r=K()),ht(r)}}function ht(t,e){let n=!1;et<=30?J(t)||(t.n|=nt,n=!Z(t)):n=!t.has(tt),n&&(t.add(tt),tt.deps.push(t))}function pt(t,e,n,r,i,o){const s=Q.get(t);if(!s)return;let l=[];if("clear"===e)l=[...s.values()];else if("length"===n&&w(t))s.forEach(((t,e)=>{("length"===e||e>=r)&&l.push(t)}));else switch(void 0!==n&&l.push(s.get(n)),e){case"add":w(t)?L(n)&&l.push(s.get("length")):(l.push(s.get(rt)),S(t)&&l.push(s.get(it)));break;case"delete":w(t)||(l.push(s.get(rt)),S(t)&&l.push(s.get(it)));break;case"set":S(t)&&l.push(s.get(rt))}if(1===l.length)l[0]&&dt(l[0]);else{const t=[];for(const e of l)e&&t.push(...e);dt(K(t))}}function dt(t,e){const n=w(t)?t:[...t];for(const t of n)t.computed&&gt(t);for(const t of n)t.computed||gt(t)}function gt(t,e){(t!==tt||t.allowRecurse)&&(t.scheduler?t.scheduler():t.run())}const vt=t("__proto__,__v_isRef,__isVue"),yt=new Set(Object.getOwnPropertyNames(Symbol).filter((t=>"arguments"!==t&&"caller"!==t)).map((t=>Symbol[t])).filter(A)),mt=St(),_t=St(!1,!0),xt=St(!0),bt=wt();function wt(){const t={};return["includes","indexOf","lastIndexOf"].forEach((e=>{t[e]=function(...t){const n=se(this);for(let t=0,e=this.length;t<e;t++)ft(n,0,t+"");const r=n[e](...t);return-1===r||!1===r?n[e](...t.map(se)):r}})),["push","pop","shift","unshift","splice"].forEach((e=>{t[e]=function(...t){ut();const n=se(this)[e].apply(this,t);return ct(),n}})),t}function St(t=!1,e=!1){return function(n,r,i){if("__v_isReactive"===r)return!t;if("__v_isReadonly"===r)return t;if("__v_isShallow"===r)return e;if("__v_raw"===r&&i===(t?e?Jt:Zt:e?Kt:Gt).get(n))return n;const o=w(n);if(!t&&o&&b(bt,r))return Reflect.get(bt,r,i);const s=Reflect.get(n,r,i);return(A(r)?yt.has(r):vt(r))?s:(t||ft(n,0,r),e?s:ce(s)?o&&L(r)?s:s.value:N(s)?t?te(s):Qt(s):s)}}function kt(t=!1){return function(e,n,r,i){let o=e[n];if(re(o)&&ce(o)&&!ce(r))return!1;if(!t&&!re(r)&&(ie(r)||(r=se(r),o=se(o)),!w(e)&&ce(o)&&!ce(r)))return o.value=r,!0;const s=w(e)&&L(n)?Number(n)<e.length:b(e,n),l=Reflect.set(e,n,r,i);return e===se(i)&&(s?B(r,o)&&pt(e,"set",n,r):pt(e,"add",n,r)),l}}const Mt={get:mt,set:kt(),deleteProperty:function(t,e){const n=b(t,e),r=(t[e],Reflect.deleteProperty(t,e));return r&&n&&pt(t,"delete",e,void 0),r},has:function(t,e){const n=Reflect.has(t,e);return A(e)&&yt.has(e)||ft(t,0,e),n},ownKeys:function(t){return ft(t,0,w(t)?"length":rt),Reflect.ownKeys(t)}},Et={get:xt,set:(t,e)=>!0,deleteProperty:(t,e)=>!0},At=m({},Mt,{get:_t,set:kt(!0)}),Nt=t=>t,Ct=t=>Reflect.getPrototypeOf(t);function Ot(t,e,n=!1,r=!1){const i=se(t=t.__v_raw),o=se(e);n||(e!==o&&ft(i,0,e),ft(i,0,o));const{has:s}=Ct(i),l=r?Nt:n?ue:ae;return s.call(i,e)?l(t.get(e)):s.call(i,o)?l(t.get(o)):void(t!==i&&t.get(e))}function $t(t,e=!1){const n=this.__v_raw,r=se(n),i=se(t);return e||(t!==i&&ft(r,0,t),ft(r,0,i)),t===i?n.has(t):n.has(t)||n.has(i)}function Tt(t,e=!1){return t=t.__v_raw,!e&&ft(se(t),0,rt),Reflect.get(t,"size",t)}function Lt(t){t=se(t);const e=se(this);return Ct(e).has.call(e,t)||(e.add(t),pt(e,"add",t,t)),this}function Pt(t,e){e=se(e);const n=se(this),{has:r,get:i}=Ct(n);let o=r.call(n,t);o||(t=se(t),o=r.call(n,t));const s=i.call(n,t);return n.set(t,e),o?B(e,s)&&pt(n,"set",t,e):pt(n,"add",t,e),this}function Vt(t){const e=se(this),{has:n,get:r}=Ct(e);let i=n.call(e,t);i||(t=se(t),i=n.call(e,t)),r&&r.call(e,t);const o=e.delete(t);return i&&pt(e,"delete",t,void 0),o}function jt(){const t=se(this),e=0!==t.size,n=t.clear();return e&&pt(t,"clear",void 0,void 0),n}function Ft(t,e){return function(n,r){const i=this,o=i.__v_raw,s=se(o),l=e?Nt:t?ue:ae;return!t&&ft(s,0,rt),o.forEach(((t,e)=>n.call(r,l(t),l(e),i)))}}function Rt(t,e,n){return function(...r){const i=this.__v_raw,o=se(i),s=S(o),l="entries"===t||t===Symbol.iterator&&s,a="keys"===t&&s,u=i[t](...r),c=n?Nt:e?ue:ae;return!e&&ft(o,0,a?it:rt),{next(){const{value:t,done:e}=u.next();return e?{value:t,done:e}:{value:l?[c(t[0]),c(t[1])]:c(t),done:e}},[Symbol.iterator](){return this}}}}function Ut(t){return function(...e){return"delete"!==t&&this}}function Dt(){const t={get(t){return Ot(this,t)},get size(){return Tt(this)},has:$t,add:Lt,set:Pt,delete:Vt,clear:jt,forEach:Ft(!1,!1)},e={get(t){return Ot(this,t,!1,!0)},get size(){return Tt(this)},has:$t,add:Lt,set:Pt,delete:Vt,clear:jt,forEach:Ft(!1,!0)},n={get(t){return Ot(this,t,!0)},get size(){return Tt(this,!0)},has(t){return $t.call(this,t,!0)},add:Ut("add"),set:Ut("set"),delete:Ut("delete"),clear:Ut("clear"),forEach:Ft(!0,!1)},r={get(t){return Ot(this,t,!0,!0)},get size(){return Tt(this,!0)},has(t){return $t.call(this,t,!0)},add:Ut("add"),set:Ut("set"),delete:Ut("delete"),clear:Ut("clear"),forEach:Ft(!0,!0)};return["keys","values","entries",Symbol.iterator].forEach((i=>{t[i]=Rt(i,!1,!1),n[i]=Rt(i,!0,!1),e[i]=Rt(i,!1,!0),r[i]=Rt(i,!0,!0)})),[t,n,e,r]}const[It,Bt,zt,qt]=Dt();function Xt(t,e){const n=e?t?qt:zt:t?Bt:It;return(e,r,i)=>"__v_isReactive"===r?!t:"__v_isReadonly"===r?t:"__v_raw"===r?e:Reflect.get(b(n,r)&&r in e?n:e,r,i)}const Ht={get:Xt(!1,!1)},Yt={get:Xt(!1,!0)},Wt={get:Xt(!0,!1)},Gt=new WeakMap,Kt=new WeakMap,Zt=new WeakMap,Jt=new WeakMap;function Qt(t){return re(t)?t:ee(t,!1,Mt,Ht,Gt)}function te(t){return ee(t,!0,Et,Wt,Zt)}function ee(t,e,n,r,i){if(!N(t))return t;if(t.__v_raw&&(!e||!t.__v_isReactive))return t;const o=i.get(t);if(o)return o;const s=function(t){return t.__v_skip||!Object.isExtensible(t)?0:function(t){switch(t){case"Object":case"Array":return 1;case"Map":case"Set":case"WeakMap":case"WeakSet":return 2;default:return 0}}((t=>$(t).slice(8,-1))(t))}(t);if(0===s)return t;const l=new Proxy(t,2===s?r:n);return i.set(t,l),l}function ne(t){return re(t)?ne(t.__v_raw):!(!t||!t.__v_isReactive)}function re(t){return!(!t||!t.__v_isReadonly)}function ie(t){return!(!t||!t.__v_isShallow)}function oe(t){return ne(t)||re(t)}function se(t){const e=t&&t.__v_raw;return e?se(e):t}function le(t){return q(t,"__v_skip",!0),t}const ae=t=>N(t)?Qt(t):t,ue=t=>N(t)?te(t):t;function ce(t){return!(!t||!0!==t.__v_isRef)}const fe={get:(t,e,n)=>{return ce(r=Reflect.get(t,e,n))?r.value:r;var r},set:(t,e,n,r)=>{const i=t[e];return ce(i)&&!ce(n)?(i.value=n,!0):Reflect.set(t,e,n,r)}};function he(t){return ne(t)?t:new Proxy(t,fe)}class pe{constructor(t,e,n,r){this._setter=e,this.dep=void 0,this.__v_isRef=!0,this._dirty=!0,this.effect=new ot(t,(()=>{var t;this._dirty||(this._dirty=!0,(t=se(t=this)).dep&&dt(t.dep))})),this.effect.computed=this,this.effect.active=this._cacheable=!r,this.__v_isReadonly=n}get value(){const t=se(this);return e=t,lt&&tt&&ht((e=se(e)).dep||(e.dep=K())),!t._dirty&&t._cacheable||(t._dirty=!1,t._value=t.effect.run()),t._value;var e}set value(t){this._setter(t)}}function de(t,e,n,r){let i;try{i=r?t(...r):t()}catch(t){ve(t,e,n)}return i}function ge(t,e,n,r){if(M(t)){const i=de(t,e,n,r);return i&&C(i)&&i.catch((t=>{ve(t,e,n)})),i}const i=[];for(let o=0;o<t.length;o++)i.push(ge(t[o],e,n,r));return i}function ve(t,e,n,r=!0){if(e&&e.vnode,e){let r=e.parent;const i=e.proxy,o=n;for(;r;){const e=r.ec;if(e)for(let n=0;n<e.length;n++)if(!1===e[n](t,i,o))return;r=r.parent}const s=e.appContext.config.errorHandler;if(s)return void de(s,null,10,[t,i,o])}!function(t,e,n,r=!0){console.error(t)}(t,0,0,r)}let ye=!1,me=!1;const _e=[];let xe=0;const be=[];let we=null,Se=0;const ke=[];let Me=null,Ee=0;const Ae=Promise.resolve();let Ne=null,Ce=null;function Oe(t){const e=Ne||Ae;return t?e.then(this?t.bind(this):t):e}function $e(t){_e.length&&_e.includes(t,ye&&t.allowRecurse?xe+1:xe)||t===Ce||(null==t.id?_e.push(t):_e.splice(function(t){let e=xe+1,n=_e.length;for(;e<n;){const r=e+n>>>1;je(_e[r])<t?e=r+1:n=r}return e}(t.id),0,t),Te())}function Te(){ye||me||(me=!0,Ne=Ae.then(Fe))}function Le(t,e,n,r){w(t)?n.push(...t):e&&e.includes(t,t.allowRecurse?r+1:r)||n.push(t),Te()}function Pe(t,e=null){if(be.length){for(Ce=e,we=[...new Set(be)],be.length=0,Se=0;Se<we.length;Se++)we[Se]();we=null,Se=0,Ce=null,Pe(t,e)}}function Ve(t){if(Pe(),ke.length){const t=[...new Set(ke)];if(ke.length=0,Me)return void Me.push(...t);for(Me=t,Me.sort(((t,e)=>je(t)-je(e))),Ee=0;Ee<Me.length;Ee++)Me[Ee]();Me=null,Ee=0}}const je=t=>null==t.id?1/0:t.id;function Fe(t){me=!1,ye=!0,Pe(t),_e.sort(((t,e)=>je(t)-je(e)));try{for(xe=0;xe<_e.length;xe++){const t=_e[xe];t&&!1!==t.active&&de(t,null,14)}}finally{xe=0,_e.length=0,Ve(),ye=!1,Ne=null,(_e.length||be.length||ke.length)&&Fe(t)}}new Set,new Map;let Re,Ue=[],De=!1;function Ie(t,...e){Re?Re.emit(t,...e):De||Ue.push({event:t,args:e})}function Be(t,e){var n,r;Re=t,Re?(Re.enabled=!0,Ue.forEach((({event:t,args:e})=>Re.emit(t,...e))),Ue=[]):"undefined"!=typeof window&&window.HTMLElement&&!(null===(r=null===(n=window.navigator)||void 0===n?void 0:n.userAgent)||void 0===r?void 0:r.includes("jsdom"))?((e.__VUE_DEVTOOLS_HOOK_REPLAY__=e.__VUE_DEVTOOLS_HOOK_REPLAY__||[]).push((t=>{Be(t,e)})),setTimeout((()=>{Re||(e.__VUE_DEVTOOLS_HOOK_REPLAY__=null,De=!0,Ue=[])}),3e3)):(De=!0,Ue=[])}const ze=He("component:added"),qe=He("component:updated"),Xe=He("component:removed");function He(t){return e=>{Ie(t,e.appContext.app,e.uid,e.parent?e.parent.uid:void 0,e)}}function Ye(t,e,...n){if(t.isUnmounted)return;const r=t.vnode.props||f;let i=n;const o=e.startsWith("update:"),s=o&&e.slice(7);if(s&&s in r){const t=`${"modelValue"===s?"model":s}Modifiers`,{number:e,trim:o}=r[t]||f;o&&(i=n.map((t=>t.trim()))),e&&(i=n.map(X))}let l;__VUE_PROD_DEVTOOLS__&&function(t,e,n){Ie("component:emit",t.appContext.app,t,e,n)}(t,e,i);let a=r[l=I(e)]||r[l=I(F(e))];!a&&o&&(a=r[l=I(U(e))]),a&&ge(a,t,6,i);const u=r[l+"Once"];if(u){if(t.emitted){if(t.emitted[l])return}else t.emitted={};t.emitted[l]=!0,ge(u,t,6,i)}}function We(t,e,n=!1){const r=e.emitsCache,i=r.get(t);if(void 0!==i)return i;const o=t.emits;let s={},l=!1;if(__VUE_OPTIONS_API__&&!M(t)){const r=t=>{const n=We(t,e,!0);n&&(l=!0,m(s,n))};!n&&e.mixins.length&&e.mixins.forEach(r),t.extends&&r(t.extends),t.mixins&&t.mixins.forEach(r)}return o||l?(w(o)?o.forEach((t=>s[t]=null)):m(s,o),r.set(t,s),s):(r.set(t,null),null)}function Ge(t,e){return!(!t||!v(e))&&(e=e.slice(2).replace(/Once$/,""),b(t,e[0].toLowerCase()+e.slice(1))||b(t,U(e))||b(t,e))}let Ke=null,Ze=null;function Je(t){const e=Ke;return Ke=t,Ze=t&&t.type.__scopeId||null,e}function Qe(t){const{type:e,vnode:n,proxy:r,withProxy:i,props:o,propsOptions:[s],slots:l,attrs:a,emit:u,render:c,renderCache:f,data:h,setupState:p,ctx:d,inheritAttrs:g}=t;let v,m;const _=Je(t);try{if(4&n.shapeFlag){const t=i||r;v=Xr(c.call(t,t,f,o,p,h,d)),m=a}else{const t=e;v=Xr(t.length>1?t(o,{attrs:a,slots:l,emit:u}):t(o,null)),m=e.props?a:tn(a)}}catch(e){Ar.length=0,ve(e,t,1),v=Ir(Mr)}let x=v;if(m&&!1!==g){const t=Object.keys(m),{shapeFlag:e}=x;t.length&&7&e&&(s&&t.some(y)&&(m=en(m,s)),x=Br(x,m))}return n.dirs&&(x=Br(x),x.dirs=x.dirs?x.dirs.concat(n.dirs):n.dirs),n.transition&&(x.transition=n.transition),v=x,Je(_),v}const tn=t=>{let e;for(const n in t)("class"===n||"style"===n||v(n))&&((e||(e={}))[n]=t[n]);return e},en=(t,e)=>{const n={};for(const r in t)y(r)&&r.slice(9)in e||(n[r]=t[r]);return n};function nn(t,e,n){const r=Object.keys(e);if(r.length!==Object.keys(t).length)return!0;for(let i=0;i<r.length;i++){const o=r[i];if(e[o]!==t[o]&&!Ge(n,o))return!0}return!1}function rn(t,e,n=!1){const r=Zr||Ke;if(r){const i=null==r.parent?r.vnode.appContext&&r.vnode.appContext.provides:r.parent.provides;if(i&&t in i)return i[t];if(arguments.length>1)return n&&M(e)?e.call(r.proxy):e}}const on={};function sn(t,e,n){return ln(t,e,n)}function ln(t,e,{immediate:n,deep:r,flush:i,onTrack:o,onTrigger:s}=f){const l=Zr;let a,u,c=!1,h=!1;if(ce(t)?(a=()=>t.value,c=ie(t)):ne(t)?(a=()=>t,r=!0):w(t)?(h=!0,c=t.some((t=>ne(t)||ie(t))),a=()=>t.map((t=>ce(t)?t.value:ne(t)?cn(t):M(t)?de(t,l,2):void 0))):a=M(t)?e?()=>de(t,l,2):()=>{if(!l||!l.isUnmounted)return u&&u(),ge(t,l,3,[d])}:p,e&&r){const t=a;a=()=>cn(t())}let d=t=>{u=m.onStop=()=>{de(t,l,4)}};if(ni)return d=p,e?n&&ge(e,l,3,[a(),h?[]:void 0,d]):a(),p;let g=h?[]:on;const v=()=>{if(m.active)if(e){const t=m.run();(r||c||(h?t.some(((t,e)=>B(t,g[e]))):B(t,g)))&&(u&&u(),ge(e,l,3,[t,g===on?void 0:g,d]),g=t)}else m.run()};let y;v.allowRecurse=!!e,y="sync"===i?v:"post"===i?()=>_r(v,l&&l.suspense):()=>function(t){Le(t,we,be,Se)}(v);const m=new ot(a,y);return e?n?v():g=m.run():"post"===i?_r(m.run.bind(m),l&&l.suspense):m.run(),()=>{m.stop(),l&&l.scope&&_(l.scope.effects,m)}}function an(t,e,n){const r=this.proxy,i=E(t)?t.includes(".")?un(r,t):()=>r[t]:t.bind(r,r);let o;M(e)?o=e:(o=e.handler,n=e);const s=Zr;Qr(this);const l=ln(i,o.bind(r),n);return s?Qr(s):ti(),l}function un(t,e){const n=e.split(".");return()=>{let e=t;for(let t=0;t<n.length&&e;t++)e=e[n[t]];return e}}function cn(t,e){if(!N(t)||t.__v_skip)return t;if((e=e||new Set).has(t))return t;if(e.add(t),ce(t))cn(t.value,e);else if(w(t))for(let n=0;n<t.length;n++)cn(t[n],e);else if(k(t)||S(t))t.forEach((t=>{cn(t,e)}));else if(T(t))for(const n in t)cn(t[n],e);return t}const fn=[Function,Array],hn={name:"BaseTransition",props:{mode:String,appear:Boolean,persisted:Boolean,onBeforeEnter:fn,onEnter:fn,onAfterEnter:fn,onEnterCancelled:fn,onBeforeLeave:fn,onLeave:fn,onAfterLeave:fn,onLeaveCancelled:fn,onBeforeAppear:fn,onAppear:fn,onAfterAppear:fn,onAppearCancelled:fn},setup(t,{slots:e}){const n=Jr(),r=function(){const t={isMounted:!1,isLeaving:!1,isUnmounting:!1,leavingVNodes:new Map};return Cn((()=>{t.isMounted=!0})),Tn((()=>{t.isUnmounting=!0})),t}();let i;return()=>{const o=e.default&&_n(e.default(),!0);if(!o||!o.length)return;let s=o[0];if(o.length>1){let t=!1;for(const e of o)if(e.type!==Mr){s=e,t=!0;break}}const l=se(t),{mode:a}=l;if(r.isLeaving)return vn(s);const u=yn(s);if(!u)return vn(s);const c=gn(u,l,r,n);mn(u,c);const f=n.subTree,h=f&&yn(f);let p=!1;const{getTransitionKey:d}=u.type;if(d){const t=d();void 0===i?i=t:t!==i&&(i=t,p=!0)}if(h&&h.type!==Mr&&(!jr(u,h)||p)){const t=gn(h,l,r,n);if(mn(h,t),"out-in"===a)return r.isLeaving=!0,t.afterLeave=()=>{r.isLeaving=!1,n.update()},vn(s);"in-out"===a&&u.type!==Mr&&(t.delayLeave=(t,e,n)=>{dn(r,h)[String(h.key)]=h,t._leaveCb=()=>{e(),t._leaveCb=void 0,delete c.delayedLeave},c.delayedLeave=n})}return s}}},pn=hn;function dn(t,e){const{leavingVNodes:n}=t;let r=n.get(e.type);return r||(r=Object.create(null),n.set(e.type,r)),r}function gn(t,e,n,r){const{appear:i,mode:o,persisted:s=!1,onBeforeEnter:l,onEnter:a,onAfterEnter:u,onEnterCancelled:c,onBeforeLeave:f,onLeave:h,onAfterLeave:p,onLeaveCancelled:d,onBeforeAppear:g,onAppear:v,onAfterAppear:y,onAppearCancelled:m}=e,_=String(t.key),x=dn(n,t),b=(t,e)=>{t&&ge(t,r,9,e)},S=(t,e)=>{const n=e[1];b(t,e),w(t)?t.every((t=>t.length<=1))&&n():t.length<=1&&n()},k={mode:o,persisted:s,beforeEnter(e){let r=l;if(!n.isMounted){if(!i)return;r=g||l}e._leaveCb&&e._leaveCb(!0);const o=x[_];o&&jr(t,o)&&o.el._leaveCb&&o.el._leaveCb(),b(r,[e])},enter(t){let e=a,r=u,o=c;if(!n.isMounted){if(!i)return;e=v||a,r=y||u,o=m||c}let s=!1;const l=t._enterCb=e=>{s||(s=!0,b(e?o:r,[t]),k.delayedLeave&&k.delayedLeave(),t._enterCb=void 0)};e?S(e,[t,l]):l()},leave(e,r){const i=String(t.key);if(e._enterCb&&e._enterCb(!0),n.isUnmounting)return r();b(f,[e]);let o=!1;const s=e._leaveCb=n=>{o||(o=!0,r(),b(n?d:p,[e]),e._leaveCb=void 0,x[i]===t&&delete x[i])};x[i]=t,h?S(h,[e,s]):s()},clone:t=>gn(t,e,n,r)};return k}function vn(t){if(bn(t))return(t=Br(t)).children=null,t}function yn(t){return bn(t)?t.children?t.children[0]:void 0:t}function mn(t,e){6&t.shapeFlag&&t.component?mn(t.component.subTree,e):128&t.shapeFlag?(t.ssContent.transition=e.clone(t.ssContent),t.ssFallback.transition=e.clone(t.ssFallback)):t.transition=e}function _n(t,e=!1,n){let r=[],i=0;for(let o=0;o<t.length;o++){let s=t[o];const l=null==n?s.key:String(n)+String(null!=s.key?s.key:o);s.type===Sr?(128&s.patchFlag&&i++,r=r.concat(_n(s.children,e,l))):(e||s.type!==Mr)&&r.push(null!=l?Br(s,{key:l}):s)}if(i>1)for(let t=0;t<r.length;t++)r[t].patchFlag=-2;return r}const xn=t=>!!t.type.__asyncLoader,bn=t=>t.type.__isKeepAlive;function wn(t,e){kn(t,"a",e)}function Sn(t,e){kn(t,"da",e)}function kn(t,e,n=Zr){const r=t.__wdc||(t.__wdc=()=>{let e=n;for(;e;){if(e.isDeactivated)return;e=e.parent}return t()});if(En(e,r,n),n){let t=n.parent;for(;t&&t.parent;)bn(t.parent.vnode)&&Mn(r,e,n,t),t=t.parent}}function Mn(t,e,n,r){const i=En(e,t,r,!0);Ln((()=>{_(r[e],i)}),n)}function En(t,e,n=Zr,r=!1){if(n){const i=n[t]||(n[t]=[]),o=e.__weh||(e.__weh=(...r)=>{if(n.isUnmounted)return;ut(),Qr(n);const i=ge(e,n,t,r);return ti(),ct(),i});return r?i.unshift(o):i.push(o),o}}RegExp,RegExp;const An=t=>(e,n=Zr)=>(!ni||"sp"===t)&&En(t,e,n),Nn=An("bm"),Cn=An("m"),On=An("bu"),$n=An("u"),Tn=An("bum"),Ln=An("um"),Pn=An("sp"),Vn=An("rtg"),jn=An("rtc");function Fn(t,e=Zr){En("ec",t,e)}function Rn(t,e,n,r){const i=t.dirs,o=e&&e.dirs;for(let s=0;s<i.length;s++){const l=i[s];o&&(l.oldValue=o[s].value);let a=l.dir[r];a&&(ut(),ge(a,n,8,[t.el,l,t,e]),ct())}}const Un="components";function Dn(t,e){return function(t,e,n=!0,r=!1){const i=Ke||Zr;if(i){const n=i.type;if(t===Un){const t=function(t){return M(t)&&t.displayName||t.name}(n);if(t&&(t===e||t===F(e)||t===D(F(e))))return n}const o=Bn(i[t]||n[t],e)||Bn(i.appContext[t],e);return!o&&r?n:o}}(Un,t,!0,e)||t}const In=Symbol();function Bn(t,e){return t&&(t[e]||t[F(e)]||t[D(F(e))])}function zn(t,e,n,r){let i;const o=n&&n[r];if(w(t)||E(t)){i=new Array(t.length);for(let n=0,r=t.length;n<r;n++)i[n]=e(t[n],n,void 0,o&&o[n])}else if("number"==typeof t){i=new Array(t);for(let n=0;n<t;n++)i[n]=e(n+1,n,void 0,o&&o[n])}else if(N(t))if(t[Symbol.iterator])i=Array.from(t,((t,n)=>e(t,n,void 0,o&&o[n])));else{const n=Object.keys(t);i=new Array(n.length);for(let r=0,s=n.length;r<s;r++){const s=n[r];i[r]=e(t[s],s,r,o&&o[r])}}else i=[];return n&&(n[r]=i),i}const qn=t=>t?ei(t)?oi(t)||t.proxy:qn(t.parent):null,Xn=m(Object.create(null),{$:t=>t,$el:t=>t.vnode.el,$data:t=>t.data,$props:t=>t.props,$attrs:t=>t.attrs,$slots:t=>t.slots,$refs:t=>t.refs,$parent:t=>qn(t.parent),$root:t=>qn(t.root),$emit:t=>t.emit,$options:t=>__VUE_OPTIONS_API__?Kn(t):t.type,$forceUpdate:t=>t.f||(t.f=()=>$e(t.update)),$nextTick:t=>t.n||(t.n=Oe.bind(t.proxy)),$watch:t=>__VUE_OPTIONS_API__?an.bind(t):p}),Hn={get({_:t},e){const{ctx:n,setupState:r,data:i,props:o,accessCache:s,type:l,appContext:a}=t;let u;if("$"!==e[0]){const l=s[e];if(void 0!==l)switch(l){case 1:return r[e];case 2:return i[e];case 4:return n[e];case 3:return o[e]}else{if(r!==f&&b(r,e))return s[e]=1,r[e];if(i!==f&&b(i,e))return s[e]=2,i[e];if((u=t.propsOptions[0])&&b(u,e))return s[e]=3,o[e];if(n!==f&&b(n,e))return s[e]=4,n[e];__VUE_OPTIONS_API__&&!Yn||(s[e]=0)}}const c=Xn[e];let h,p;return c?("$attrs"===e&&ft(t,0,e),c(t)):(h=l.__cssModules)&&(h=h[e])?h:n!==f&&b(n,e)?(s[e]=4,n[e]):(p=a.config.globalProperties,b(p,e)?p[e]:void 0)},set({_:t},e,n){const{data:r,setupState:i,ctx:o}=t;return i!==f&&b(i,e)?(i[e]=n,!0):r!==f&&b(r,e)?(r[e]=n,!0):!(b(t.props,e)||"$"===e[0]&&e.slice(1)in t||(o[e]=n,0))},has({_:{data:t,setupState:e,accessCache:n,ctx:r,appContext:i,propsOptions:o}},s){let l;return!!n[s]||t!==f&&b(t,s)||e!==f&&b(e,s)||(l=o[0])&&b(l,s)||b(r,s)||b(Xn,s)||b(i.config.globalProperties,s)},defineProperty(t,e,n){return null!=n.get?t._.accessCache[e]=0:b(n,"value")&&this.set(t,e,n.value,null),Reflect.defineProperty(t,e,n)}};let Yn=!0;function Wn(t,e,n){ge(w(t)?t.map((t=>t.bind(e.proxy))):t.bind(e.proxy),e,n)}function Gn(t,e,n,r){const i=r.includes(".")?un(n,r):()=>n[r];if(E(t)){const n=e[t];M(n)&&sn(i,n)}else if(M(t))sn(i,t.bind(n));else if(N(t))if(w(t))t.forEach((t=>Gn(t,e,n,r)));else{const r=M(t.handler)?t.handler.bind(n):e[t.handler];M(r)&&sn(i,r,t)}}function Kn(t){const e=t.type,{mixins:n,extends:r}=e,{mixins:i,optionsCache:o,config:{optionMergeStrategies:s}}=t.appContext,l=o.get(e);let a;return l?a=l:i.length||n||r?(a={},i.length&&i.forEach((t=>Zn(a,t,s,!0))),Zn(a,e,s)):a=e,o.set(e,a),a}function Zn(t,e,n,r=!1){const{mixins:i,extends:o}=e;o&&Zn(t,o,n,!0),i&&i.forEach((e=>Zn(t,e,n,!0)));for(const i in e)if(r&&"expose"===i);else{const r=Jn[i]||n&&n[i];t[i]=r?r(t[i],e[i]):e[i]}return t}const Jn={data:Qn,props:nr,emits:nr,methods:nr,computed:nr,beforeCreate:er,created:er,beforeMount:er,mounted:er,beforeUpdate:er,updated:er,beforeDestroy:er,beforeUnmount:er,destroyed:er,unmounted:er,activated:er,deactivated:er,errorCaptured:er,serverPrefetch:er,components:nr,directives:nr,watch:function(t,e){if(!t)return e;if(!e)return t;const n=m(Object.create(null),t);for(const r in e)n[r]=er(t[r],e[r]);return n},provide:Qn,inject:function(t,e){return nr(tr(t),tr(e))}};function Qn(t,e){return e?t?function(){return m(M(t)?t.call(this,this):t,M(e)?e.call(this,this):e)}:e:t}function tr(t){if(w(t)){const e={};for(let n=0;n<t.length;n++)e[t[n]]=t[n];return e}return t}function er(t,e){return t?[...new Set([].concat(t,e))]:e}function nr(t,e){return t?m(m(Object.create(null),t),e):e}function rr(t,e,n,r){const[i,o]=t.propsOptions;let s,l=!1;if(e)for(let a in e){if(P(a))continue;const u=e[a];let c;i&&b(i,c=F(a))?o&&o.includes(c)?(s||(s={}))[c]=u:n[c]=u:Ge(t.emitsOptions,a)||a in r&&u===r[a]||(r[a]=u,l=!0)}if(o){const e=se(n),r=s||f;for(let s=0;s<o.length;s++){const l=o[s];n[l]=ir(i,e,l,r[l],t,!b(r,l))}}return l}function ir(t,e,n,r,i,o){const s=t[n];if(null!=s){const t=b(s,"default");if(t&&void 0===r){const t=s.default;if(s.type!==Function&&M(t)){const{propsDefaults:o}=i;n in o?r=o[n]:(Qr(i),r=o[n]=t.call(null,e),ti())}else r=t}s[0]&&(o&&!t?r=!1:!s[1]||""!==r&&r!==U(n)||(r=!0))}return r}function or(t,e,n=!1){const r=e.propsCache,i=r.get(t);if(i)return i;const o=t.props,s={},l=[];let a=!1;if(__VUE_OPTIONS_API__&&!M(t)){const r=t=>{a=!0;const[n,r]=or(t,e,!0);m(s,n),r&&l.push(...r)};!n&&e.mixins.length&&e.mixins.forEach(r),t.extends&&r(t.extends),t.mixins&&t.mixins.forEach(r)}if(!o&&!a)return r.set(t,h),h;if(w(o))for(let t=0;t<o.length;t++){const e=F(o[t]);sr(e)&&(s[e]=f)}else if(o)for(const t in o){const e=F(t);if(sr(e)){const n=o[t],r=s[e]=w(n)||M(n)?{type:n}:n;if(r){const t=ur(Boolean,r.type),n=ur(String,r.type);r[0]=t>-1,r[1]=n<0||t<n,(t>-1||b(r,"default"))&&l.push(e)}}}const u=[s,l];return r.set(t,u),u}function sr(t){return"$"!==t[0]}function lr(t){const e=t&&t.toString().match(/^\s*function (\w+)/);return e?e[1]:null===t?"null":""}function ar(t,e){return lr(t)===lr(e)}function ur(t,e){return w(e)?e.findIndex((e=>ar(e,t))):M(e)&&ar(e,t)?0:-1}const cr=t=>"_"===t[0]||"$stable"===t,fr=t=>w(t)?t.map(Xr):[Xr(t)],hr=(t,e,n)=>{if(e._n)return e;const r=function(t,e=Ke,n){if(!e)return t;if(t._n)return t;const r=(...n)=>{r._d&&$r(-1);const i=Je(e),o=t(...n);return Je(i),r._d&&$r(1),__VUE_PROD_DEVTOOLS__&&qe(e),o};return r._n=!0,r._c=!0,r._d=!0,r}(((...t)=>fr(e(...t))),n);return r._c=!1,r},pr=(t,e,n)=>{const r=t._ctx;for(const n in t){if(cr(n))continue;const i=t[n];if(M(i))e[n]=hr(0,i,r);else if(null!=i){const t=fr(i);e[n]=()=>t}}},dr=(t,e)=>{const n=fr(e);t.slots.default=()=>n};function gr(){return{app:null,config:{isNativeTag:d,performance:!1,globalProperties:{},optionMergeStrategies:{},errorHandler:void 0,warnHandler:void 0,compilerOptions:{}},mixins:[],components:{},directives:{},provides:Object.create(null),optionsCache:new WeakMap,propsCache:new WeakMap,emitsCache:new WeakMap}}let vr=0;function yr(t,e){return function(n,r=null){M(n)||(n=Object.assign({},n)),null==r||N(r)||(r=null);const i=gr(),o=new Set;let s=!1;const l=i.app={_uid:vr++,_component:n,_props:r,_container:null,_context:i,_instance:null,version:li,get config(){return i.config},set config(t){},use:(t,...e)=>(o.has(t)||(t&&M(t.install)?(o.add(t),t.install(l,...e)):M(t)&&(o.add(t),t(l,...e))),l),mixin:t=>(__VUE_OPTIONS_API__&&(i.mixins.includes(t)||i.mixins.push(t)),l),component:(t,e)=>e?(i.components[t]=e,l):i.components[t],directive:(t,e)=>e?(i.directives[t]=e,l):i.directives[t],mount(o,a,u){if(!s){const c=Ir(n,r);return c.appContext=i,a&&e?e(c,o):t(c,o,u),s=!0,l._container=o,o.__vue_app__=l,__VUE_PROD_DEVTOOLS__&&(l._instance=c.component,function(t,e){Ie("app:init",t,e,{Fragment:Sr,Text:kr,Comment:Mr,Static:Er})}(l,li)),oi(c.component)||c.component.proxy}},unmount(){s&&(t(null,l._container),__VUE_PROD_DEVTOOLS__&&(l._instance=null,function(t){Ie("app:unmount",t)}(l)),delete l._container.__vue_app__)},provide:(t,e)=>(i.provides[t]=e,l)};return l}}function mr(t,e,n,r,i=!1){if(w(t))return void t.forEach(((t,o)=>mr(t,e&&(w(e)?e[o]:e),n,r,i)));if(xn(r)&&!i)return;const o=4&r.shapeFlag?oi(r.component)||r.component.proxy:r.el,s=i?null:o,{i:l,r:a}=t,u=e&&e.r,c=l.refs===f?l.refs={}:l.refs,h=l.setupState;if(null!=u&&u!==a&&(E(u)?(c[u]=null,b(h,u)&&(h[u]=null)):ce(u)&&(u.value=null)),M(a))de(a,l,12,[s,c]);else{const e=E(a),r=ce(a);if(e||r){const r=()=>{if(t.f){const n=e?c[a]:a.value;i?w(n)&&_(n,o):w(n)?n.includes(o)||n.push(o):e?(c[a]=[o],b(h,a)&&(h[a]=c[a])):(a.value=[o],t.k&&(c[t.k]=a.value))}else e?(c[a]=s,b(h,a)&&(h[a]=s)):ce(a)&&(a.value=s,t.k&&(c[t.k]=s))};s?(r.id=-1,_r(r,n)):r()}}}const _r=function(t,e){e&&e.pendingBranch?w(t)?e.effects.push(...t):e.effects.push(t):Le(t,Me,ke,Ee)};function xr(t,e){"boolean"!=typeof __VUE_OPTIONS_API__&&(Y().__VUE_OPTIONS_API__=!0),"boolean"!=typeof __VUE_PROD_DEVTOOLS__&&(Y().__VUE_PROD_DEVTOOLS__=!1);const n=Y();n.__VUE__=!0,__VUE_PROD_DEVTOOLS__&&Be(n.__VUE_DEVTOOLS_GLOBAL_HOOK__,n);const{insert:r,remove:i,patchProp:o,createElement:s,createText:l,createComment:a,setText:u,setElementText:c,parentNode:d,nextSibling:g,setScopeId:v=p,cloneNode:y,insertStaticContent:_}=t,x=(t,e,n,r=null,i=null,o=null,s=!1,l=null,a=!!e.dynamicChildren)=>{if(t===e)return;t&&!jr(t,e)&&(r=et(t),K(t,i,o,!0),t=null),-2===e.patchFlag&&(a=!1,e.dynamicChildren=null);const{type:u,ref:c,shapeFlag:f}=e;switch(u){case kr:w(t,e,n,r);break;case Mr:S(t,e,n,r);break;case Er:null==t&&k(e,n,r,s);break;case Sr:L(t,e,n,r,i,o,s,l,a);break;default:1&f?M(t,e,n,r,i,o,s,l,a):6&f?V(t,e,n,r,i,o,s,l,a):(64&f||128&f)&&u.process(t,e,n,r,i,o,s,l,a,rt)}null!=c&&i&&mr(c,t&&t.ref,o,e||t,!e)},w=(t,e,n,i)=>{if(null==t)r(e.el=l(e.children),n,i);else{const n=e.el=t.el;e.children!==t.children&&u(n,e.children)}},S=(t,e,n,i)=>{null==t?r(e.el=a(e.children||""),n,i):e.el=t.el},k=(t,e,n,r)=>{[t.el,t.anchor]=_(t.children,e,n,r,t.el,t.anchor)},M=(t,e,n,r,i,o,s,l,a)=>{s=s||"svg"===e.type,null==t?E(e,n,r,i,o,s,l,a):O(t,e,i,o,s,l,a)},E=(t,e,n,i,l,a,u,f)=>{let h,p;const{type:d,props:g,shapeFlag:v,transition:m,patchFlag:_,dirs:x}=t;if(t.el&&void 0!==y&&-1===_)h=t.el=y(t.el);else{if(h=t.el=s(t.type,a,g&&g.is,g),8&v?c(h,t.children):16&v&&N(t.children,h,null,i,l,a&&"foreignObject"!==d,u,f),x&&Rn(t,null,i,"created"),g){for(const e in g)"value"===e||P(e)||o(h,e,null,g[e],a,t.children,i,l,tt);"value"in g&&o(h,"value",null,g.value),(p=g.onVnodeBeforeMount)&&Wr(p,i,t)}A(h,t,t.scopeId,u,i)}__VUE_PROD_DEVTOOLS__&&(Object.defineProperty(h,"__vnode",{value:t,enumerable:!1}),Object.defineProperty(h,"__vueParentComponent",{value:i,enumerable:!1})),x&&Rn(t,null,i,"beforeMount");const b=(!l||l&&!l.pendingBranch)&&m&&!m.persisted;b&&m.beforeEnter(h),r(h,e,n),((p=g&&g.onVnodeMounted)||b||x)&&_r((()=>{p&&Wr(p,i,t),b&&m.enter(h),x&&Rn(t,null,i,"mounted")}),l)},A=(t,e,n,r,i)=>{if(n&&v(t,n),r)for(let e=0;e<r.length;e++)v(t,r[e]);if(i&&e===i.subTree){const e=i.vnode;A(t,e,e.scopeId,e.slotScopeIds,i.parent)}},N=(t,e,n,r,i,o,s,l,a=0)=>{for(let u=a;u<t.length;u++){const a=t[u]=l?Hr(t[u]):Xr(t[u]);x(null,a,e,n,r,i,o,s,l)}},O=(t,e,n,r,i,s,l)=>{const a=e.el=t.el;let{patchFlag:u,dynamicChildren:h,dirs:p}=e;u|=16&t.patchFlag;const d=t.props||f,g=e.props||f;let v;n&&br(n,!1),(v=g.onVnodeBeforeUpdate)&&Wr(v,n,e,t),p&&Rn(e,t,n,"beforeUpdate"),n&&br(n,!0);const y=i&&"foreignObject"!==e.type;if(h?$(t.dynamicChildren,h,a,n,r,y,s):l||B(t,e,a,null,n,r,y,s,!1),u>0){if(16&u)T(a,e,d,g,n,r,i);else if(2&u&&d.class!==g.class&&o(a,"class",null,g.class,i),4&u&&o(a,"style",d.style,g.style,i),8&u){const s=e.dynamicProps;for(let e=0;e<s.length;e++){const l=s[e],u=d[l],c=g[l];c===u&&"value"!==l||o(a,l,u,c,i,t.children,n,r,tt)}}1&u&&t.children!==e.children&&c(a,e.children)}else l||null!=h||T(a,e,d,g,n,r,i);((v=g.onVnodeUpdated)||p)&&_r((()=>{v&&Wr(v,n,e,t),p&&Rn(e,t,n,"updated")}),r)},$=(t,e,n,r,i,o,s)=>{for(let l=0;l<e.length;l++){const a=t[l],u=e[l],c=a.el&&(a.type===Sr||!jr(a,u)||70&a.shapeFlag)?d(a.el):n;x(a,u,c,null,r,i,o,s,!0)}},T=(t,e,n,r,i,s,l)=>{if(n!==r){for(const a in r){if(P(a))continue;const u=r[a],c=n[a];u!==c&&"value"!==a&&o(t,a,c,u,l,e.children,i,s,tt)}if(n!==f)for(const a in n)P(a)||a in r||o(t,a,n[a],null,l,e.children,i,s,tt);"value"in r&&o(t,"value",n.value,r.value)}},L=(t,e,n,i,o,s,a,u,c)=>{const f=e.el=t?t.el:l(""),h=e.anchor=t?t.anchor:l("");let{patchFlag:p,dynamicChildren:d,slotScopeIds:g}=e;g&&(u=u?u.concat(g):g),null==t?(r(f,n,i),r(h,n,i),N(e.children,n,h,o,s,a,u,c)):p>0&&64&p&&d&&t.dynamicChildren?($(t.dynamicChildren,d,n,o,s,a,u),(null!=e.key||o&&e===o.subTree)&&wr(t,e,!0)):B(t,e,n,h,o,s,a,u,c)},V=(t,e,n,r,i,o,s,l,a)=>{e.slotScopeIds=l,null==t?512&e.shapeFlag?i.ctx.activate(e,n,r,s,a):j(e,n,r,i,o,s,a):R(t,e,a)},j=(t,e,n,r,i,o,s)=>{const l=t.component=function(t,e,n){const r=t.type,i=(e?e.appContext:t.appContext)||Gr,o={uid:Kr++,vnode:t,type:r,parent:e,appContext:i,root:null,next:null,subTree:null,effect:null,update:null,scope:new G(!0),render:null,proxy:null,exposed:null,exposeProxy:null,withProxy:null,provides:e?e.provides:Object.create(i.provides),accessCache:null,renderCache:[],components:null,directives:null,propsOptions:or(r,i),emitsOptions:We(r,i),emit:null,emitted:null,propsDefaults:f,inheritAttrs:r.inheritAttrs,ctx:f,data:f,props:f,attrs:f,slots:f,refs:f,setupState:f,setupContext:null,suspense:n,suspenseId:n?n.pendingId:0,asyncDep:null,asyncResolved:!1,isMounted:!1,isUnmounted:!1,isDeactivated:!1,bc:null,c:null,bm:null,m:null,bu:null,u:null,um:null,bum:null,da:null,a:null,rtg:null,rtc:null,ec:null,sp:null};return o.ctx={_:o},o.root=e?e.root:o,o.emit=Ye.bind(null,o),t.ce&&t.ce(o),o}(t,r,i);if(bn(t)&&(l.ctx.renderer=rt),function(t,e=!1){ni=e;const{props:n,children:r}=t.vnode,i=ei(t);(function(t,e,n,r=!1){const i={},o={};q(o,Fr,1),t.propsDefaults=Object.create(null),rr(t,e,i,o);for(const e in t.propsOptions[0])e in i||(i[e]=void 0);n?t.props=r?i:ee(i,!1,At,Yt,Kt):t.type.props?t.props=i:t.props=o,t.attrs=o})(t,n,i,e),((t,e)=>{if(32&t.vnode.shapeFlag){const n=e._;n?(t.slots=se(e),q(e,"_",n)):pr(e,t.slots={})}else t.slots={},e&&dr(t,e);q(t.slots,Fr,1)})(t,r);const o=i?function(t,e){const n=t.type;t.accessCache=Object.create(null),t.proxy=le(new Proxy(t.ctx,Hn));const{setup:r}=n;if(r){const n=t.setupContext=r.length>1?function(t){const e=e=>{t.exposed=e||{}};let n;return{get attrs(){return n||(n=function(t){return new Proxy(t.attrs,{get:(e,n)=>(ft(t,0,"$attrs"),e[n])})}(t))},slots:t.slots,emit:t.emit,expose:e}}(t):null;Qr(t),ut();const i=de(r,t,0,[t.props,n]);if(ct(),ti(),C(i)){if(i.then(ti,ti),e)return i.then((n=>{ri(t,n,e)})).catch((e=>{ve(e,t,0)}));t.asyncDep=i}else ri(t,i,e)}else ii(t,e)}(t,e):void 0;ni=!1}(l),l.asyncDep){if(i&&i.registerDep(l,D),!t.el){const t=l.subTree=Ir(Mr);S(null,t,e,n)}}else D(l,t,e,n,i,o,s)},R=(t,e,n)=>{const r=e.component=t.component;if(function(t,e,n){const{props:r,children:i,component:o}=t,{props:s,children:l,patchFlag:a}=e,u=o.emitsOptions;if(e.dirs||e.transition)return!0;if(!(n&&a>=0))return!(!i&&!l||l&&l.$stable)||r!==s&&(r?!s||nn(r,s,u):!!s);if(1024&a)return!0;if(16&a)return r?nn(r,s,u):!!s;if(8&a){const t=e.dynamicProps;for(let e=0;e<t.length;e++){const n=t[e];if(s[n]!==r[n]&&!Ge(u,n))return!0}}return!1}(t,e,n)){if(r.asyncDep&&!r.asyncResolved)return void I(r,e,n);r.next=e,function(t){const e=_e.indexOf(t);e>xe&&_e.splice(e,1)}(r.update),r.update()}else e.el=t.el,r.vnode=e},D=(t,e,n,r,i,o,s)=>{const l=t.effect=new ot((()=>{if(t.isMounted){let e,{next:n,bu:r,u:l,parent:a,vnode:u}=t,c=n;br(t,!1),n?(n.el=u.el,I(t,n,s)):n=u,r&&z(r),(e=n.props&&n.props.onVnodeBeforeUpdate)&&Wr(e,a,n,u),br(t,!0);const f=Qe(t),h=t.subTree;t.subTree=f,x(h,f,d(h.el),et(h),t,i,o),n.el=f.el,null===c&&function({vnode:t,parent:e},n){for(;e&&e.subTree===t;)(t=e.vnode).el=n,e=e.parent}(t,f.el),l&&_r(l,i),(e=n.props&&n.props.onVnodeUpdated)&&_r((()=>Wr(e,a,n,u)),i),__VUE_PROD_DEVTOOLS__&&qe(t)}else{let s;const{el:l,props:a}=e,{bm:u,m:c,parent:f}=t,h=xn(e);if(br(t,!1),u&&z(u),!h&&(s=a&&a.onVnodeBeforeMount)&&Wr(s,f,e),br(t,!0),l&&st){const n=()=>{t.subTree=Qe(t),st(l,t.subTree,t,i,null)};h?e.type.__asyncLoader().then((()=>!t.isUnmounted&&n())):n()}else{const s=t.subTree=Qe(t);x(null,s,n,r,t,i,o),e.el=s.el}if(c&&_r(c,i),!h&&(s=a&&a.onVnodeMounted)){const t=e;_r((()=>Wr(s,f,t)),i)}(256&e.shapeFlag||f&&xn(f.vnode)&&256&f.vnode.shapeFlag)&&t.a&&_r(t.a,i),t.isMounted=!0,__VUE_PROD_DEVTOOLS__&&ze(t),e=n=r=null}}),(()=>$e(a)),t.scope),a=t.update=()=>l.run();a.id=t.uid,br(t,!0),a()},I=(t,e,n)=>{e.component=t;const r=t.vnode.props;t.vnode=e,t.next=null,function(t,e,n,r){const{props:i,attrs:o,vnode:{patchFlag:s}}=t,l=se(i),[a]=t.propsOptions;let u=!1;if(!(r||s>0)||16&s){let r;rr(t,e,i,o)&&(u=!0);for(const o in l)e&&(b(e,o)||(r=U(o))!==o&&b(e,r))||(a?!n||void 0===n[o]&&void 0===n[r]||(i[o]=ir(a,l,o,void 0,t,!0)):delete i[o]);if(o!==l)for(const t in o)e&&b(e,t)||(delete o[t],u=!0)}else if(8&s){const n=t.vnode.dynamicProps;for(let r=0;r<n.length;r++){let s=n[r];if(Ge(t.emitsOptions,s))continue;const c=e[s];if(a)if(b(o,s))c!==o[s]&&(o[s]=c,u=!0);else{const e=F(s);i[e]=ir(a,l,e,c,t,!1)}else c!==o[s]&&(o[s]=c,u=!0)}}u&&pt(t,"set","$attrs")}(t,e.props,r,n),((t,e,n)=>{const{vnode:r,slots:i}=t;let o=!0,s=f;if(32&r.shapeFlag){const t=e._;t?n&&1===t?o=!1:(m(i,e),n||1!==t||delete i._):(o=!e.$stable,pr(e,i)),s=e}else e&&(dr(t,e),s={default:1});if(o)for(const t in i)cr(t)||t in s||delete i[t]})(t,e.children,n),ut(),Pe(void 0,t.update),ct()},B=(t,e,n,r,i,o,s,l,a=!1)=>{const u=t&&t.children,f=t?t.shapeFlag:0,h=e.children,{patchFlag:p,shapeFlag:d}=e;if(p>0){if(128&p)return void H(u,h,n,r,i,o,s,l,a);if(256&p)return void X(u,h,n,r,i,o,s,l,a)}8&d?(16&f&&tt(u,i,o),h!==u&&c(n,h)):16&f?16&d?H(u,h,n,r,i,o,s,l,a):tt(u,i,o,!0):(8&f&&c(n,""),16&d&&N(h,n,r,i,o,s,l,a))},X=(t,e,n,r,i,o,s,l,a)=>{e=e||h;const u=(t=t||h).length,c=e.length,f=Math.min(u,c);let p;for(p=0;p<f;p++){const r=e[p]=a?Hr(e[p]):Xr(e[p]);x(t[p],r,n,null,i,o,s,l,a)}u>c?tt(t,i,o,!0,!1,f):N(e,n,r,i,o,s,l,a,f)},H=(t,e,n,r,i,o,s,l,a)=>{let u=0;const c=e.length;let f=t.length-1,p=c-1;for(;u<=f&&u<=p;){const r=t[u],c=e[u]=a?Hr(e[u]):Xr(e[u]);if(!jr(r,c))break;x(r,c,n,null,i,o,s,l,a),u++}for(;u<=f&&u<=p;){const r=t[f],u=e[p]=a?Hr(e[p]):Xr(e[p]);if(!jr(r,u))break;x(r,u,n,null,i,o,s,l,a),f--,p--}if(u>f){if(u<=p){const t=p+1,f=t<c?e[t].el:r;for(;u<=p;)x(null,e[u]=a?Hr(e[u]):Xr(e[u]),n,f,i,o,s,l,a),u++}}else if(u>p)for(;u<=f;)K(t[u],i,o,!0),u++;else{const d=u,g=u,v=new Map;for(u=g;u<=p;u++){const t=e[u]=a?Hr(e[u]):Xr(e[u]);null!=t.key&&v.set(t.key,u)}let y,m=0;const _=p-g+1;let b=!1,w=0;const S=new Array(_);for(u=0;u<_;u++)S[u]=0;for(u=d;u<=f;u++){const r=t[u];if(m>=_){K(r,i,o,!0);continue}let c;if(null!=r.key)c=v.get(r.key);else for(y=g;y<=p;y++)if(0===S[y-g]&&jr(r,e[y])){c=y;break}void 0===c?K(r,i,o,!0):(S[c-g]=u+1,c>=w?w=c:b=!0,x(r,e[c],n,null,i,o,s,l,a),m++)}const k=b?function(t){const e=t.slice(),n=[0];let r,i,o,s,l;const a=t.length;for(r=0;r<a;r++){const a=t[r];if(0!==a){if(i=n[n.length-1],t[i]<a){e[r]=i,n.push(r);continue}for(o=0,s=n.length-1;o<s;)l=o+s>>1,t[n[l]]<a?o=l+1:s=l;a<t[n[o]]&&(o>0&&(e[r]=n[o-1]),n[o]=r)}}for(o=n.length,s=n[o-1];o-- >0;)n[o]=s,s=e[s];return n}(S):h;for(y=k.length-1,u=_-1;u>=0;u--){const t=g+u,f=e[t],h=t+1<c?e[t+1].el:r;0===S[u]?x(null,f,n,h,i,o,s,l,a):b&&(y<0||u!==k[y]?W(f,n,h,2):y--)}}},W=(t,e,n,i,o=null)=>{const{el:s,type:l,transition:a,children:u,shapeFlag:c}=t;if(6&c)W(t.component.subTree,e,n,i);else if(128&c)t.suspense.move(e,n,i);else if(64&c)l.move(t,e,n,rt);else if(l!==Sr)if(l!==Er)if(2!==i&&1&c&&a)if(0===i)a.beforeEnter(s),r(s,e,n),_r((()=>a.enter(s)),o);else{const{leave:t,delayLeave:i,afterLeave:o}=a,l=()=>r(s,e,n),u=()=>{t(s,(()=>{l(),o&&o()}))};i?i(s,l,u):u()}else r(s,e,n);else(({el:t,anchor:e},n,i)=>{let o;for(;t&&t!==e;)o=g(t),r(t,n,i),t=o;r(e,n,i)})(t,e,n);else{r(s,e,n);for(let t=0;t<u.length;t++)W(u[t],e,n,i);r(t.anchor,e,n)}},K=(t,e,n,r=!1,i=!1)=>{const{type:o,props:s,ref:l,children:a,dynamicChildren:u,shapeFlag:c,patchFlag:f,dirs:h}=t;if(null!=l&&mr(l,null,n,t,!0),256&c)return void e.ctx.deactivate(t);const p=1&c&&h,d=!xn(t);let g;if(d&&(g=s&&s.onVnodeBeforeUnmount)&&Wr(g,e,t),6&c)Q(t.component,n,r);else{if(128&c)return void t.suspense.unmount(n,r);p&&Rn(t,null,e,"beforeUnmount"),64&c?t.type.remove(t,e,n,i,rt,r):u&&(o!==Sr||f>0&&64&f)?tt(u,e,n,!1,!0):(o===Sr&&384&f||!i&&16&c)&&tt(a,e,n),r&&Z(t)}(d&&(g=s&&s.onVnodeUnmounted)||p)&&_r((()=>{g&&Wr(g,e,t),p&&Rn(t,null,e,"unmounted")}),n)},Z=t=>{const{type:e,el:n,anchor:r,transition:o}=t;if(e===Sr)return void J(n,r);if(e===Er)return void(({el:t,anchor:e})=>{let n;for(;t&&t!==e;)n=g(t),i(t),t=n;i(e)})(t);const s=()=>{i(n),o&&!o.persisted&&o.afterLeave&&o.afterLeave()};if(1&t.shapeFlag&&o&&!o.persisted){const{leave:e,delayLeave:r}=o,i=()=>e(n,s);r?r(t.el,s,i):i()}else s()},J=(t,e)=>{let n;for(;t!==e;)n=g(t),i(t),t=n;i(e)},Q=(t,e,n)=>{const{bum:r,scope:i,update:o,subTree:s,um:l}=t;r&&z(r),i.stop(),o&&(o.active=!1,K(s,t,e,n)),l&&_r(l,e),_r((()=>{t.isUnmounted=!0}),e),e&&e.pendingBranch&&!e.isUnmounted&&t.asyncDep&&!t.asyncResolved&&t.suspenseId===e.pendingId&&(e.deps--,0===e.deps&&e.resolve()),__VUE_PROD_DEVTOOLS__&&Xe(t)},tt=(t,e,n,r=!1,i=!1,o=0)=>{for(let s=o;s<t.length;s++)K(t[s],e,n,r,i)},et=t=>6&t.shapeFlag?et(t.component.subTree):128&t.shapeFlag?t.suspense.next():g(t.anchor||t.el),nt=(t,e,n)=>{null==t?e._vnode&&K(e._vnode,null,null,!0):x(e._vnode||null,t,e,null,null,null,n),Ve(),e._vnode=t},rt={p:x,um:K,m:W,r:Z,mt:j,mc:N,pc:B,pbc:$,n:et,o:t};let it,st;return e&&([it,st]=e(rt)),{render:nt,hydrate:it,createApp:yr(nt,it)}}function br({effect:t,update:e},n){t.allowRecurse=e.allowRecurse=n}function wr(t,e,n=!1){const r=t.children,i=e.children;if(w(r)&&w(i))for(let t=0;t<r.length;t++){const e=r[t];let o=i[t];1&o.shapeFlag&&!o.dynamicChildren&&((o.patchFlag<=0||32===o.patchFlag)&&(o=i[t]=Hr(i[t]),o.el=e.el),n||wr(e,o))}}const Sr=Symbol(void 0),kr=Symbol(void 0),Mr=Symbol(void 0),Er=Symbol(void 0),Ar=[];let Nr=null;function Cr(t=!1){Ar.push(Nr=t?null:[])}let Or=1;function $r(t){Or+=t}function Tr(t){return t.dynamicChildren=Or>0?Nr||h:null,Ar.pop(),Nr=Ar[Ar.length-1]||null,Or>0&&Nr&&Nr.push(t),t}function Lr(t,e,n,r,i,o){return Tr(Dr(t,e,n,r,i,o,!0))}function Pr(t,e,n,r,i){return Tr(Ir(t,e,n,r,i,!0))}function Vr(t){return!!t&&!0===t.__v_isVNode}function jr(t,e){return t.type===e.type&&t.key===e.key}const Fr="__vInternal",Rr=({key:t})=>null!=t?t:null,Ur=({ref:t,ref_key:e,ref_for:n})=>null!=t?E(t)||ce(t)||M(t)?{i:Ke,r:t,k:e,f:!!n}:t:null;function Dr(t,e=null,n=null,r=0,i=null,o=(t===Sr?0:1),s=!1,l=!1){const a={__v_isVNode:!0,__v_skip:!0,type:t,props:e,key:e&&Rr(e),ref:e&&Ur(e),scopeId:Ze,slotScopeIds:null,children:n,component:null,suspense:null,ssContent:null,ssFallback:null,dirs:null,transition:null,el:null,anchor:null,target:null,targetAnchor:null,staticCount:0,shapeFlag:o,patchFlag:r,dynamicProps:i,dynamicChildren:null,appContext:null};return l?(Yr(a,n),128&o&&t.normalize(a)):n&&(a.shapeFlag|=E(n)?8:16),Or>0&&!s&&Nr&&(a.patchFlag>0||6&o)&&32!==a.patchFlag&&Nr.push(a),a}const Ir=function(t,e=null,n=null,r=0,o=null,s=!1){if(t&&t!==In||(t=Mr),Vr(t)){const r=Br(t,e,!0);return n&&Yr(r,n),Or>0&&!s&&Nr&&(6&r.shapeFlag?Nr[Nr.indexOf(t)]=r:Nr.push(r)),r.patchFlag|=-2,r}if(function(t){return M(t)&&"__vccOpts"in t}(t)&&(t=t.__vccOpts),e){e=function(t){return t?oe(t)||Fr in t?m({},t):t:null}(e);let{class:t,style:n}=e;t&&!E(t)&&(e.class=a(t)),N(n)&&(oe(n)&&!w(n)&&(n=m({},n)),e.style=i(n))}return Dr(t,e,n,r,o,E(t)?1:(t=>t.__isSuspense)(t)?128:(t=>t.__isTeleport)(t)?64:N(t)?4:M(t)?2:0,s,!0)};function Br(t,e,n=!1){const{props:r,ref:o,patchFlag:s,children:l}=t,u=e?function(...t){const e={};for(let n=0;n<t.length;n++){const r=t[n];for(const t in r)if("class"===t)e.class!==r.class&&(e.class=a([e.class,r.class]));else if("style"===t)e.style=i([e.style,r.style]);else if(v(t)){const n=e[t],i=r[t];!i||n===i||w(n)&&n.includes(i)||(e[t]=n?[].concat(n,i):i)}else""!==t&&(e[t]=r[t])}return e}(r||{},e):r;return{__v_isVNode:!0,__v_skip:!0,type:t.type,props:u,key:u&&Rr(u),ref:e&&e.ref?n&&o?w(o)?o.concat(Ur(e)):[o,Ur(e)]:Ur(e):o,scopeId:t.scopeId,slotScopeIds:t.slotScopeIds,children:l,target:t.target,targetAnchor:t.targetAnchor,staticCount:t.staticCount,shapeFlag:t.shapeFlag,patchFlag:e&&t.type!==Sr?-1===s?16:16|s:s,dynamicProps:t.dynamicProps,dynamicChildren:t.dynamicChildren,appContext:t.appContext,dirs:t.dirs,transition:t.transition,component:t.component,suspense:t.suspense,ssContent:t.ssContent&&Br(t.ssContent),ssFallback:t.ssFallback&&Br(t.ssFallback),el:t.el,anchor:t.anchor}}function zr(t=" ",e=0){return Ir(kr,null,t,e)}function qr(t="",e=!1){return e?(Cr(),Pr(Mr,null,t)):Ir(Mr,null,t)}function Xr(t){return null==t||"boolean"==typeof t?Ir(Mr):w(t)?Ir(Sr,null,t.slice()):"object"==typeof t?Hr(t):Ir(kr,null,String(t))}function Hr(t){return null===t.el||t.memo?t:Br(t)}function Yr(t,e){let n=0;const{shapeFlag:r}=t;if(null==e)e=null;else if(w(e))n=16;else if("object"==typeof e){if(65&r){const n=e.default;return void(n&&(n._c&&(n._d=!1),Yr(t,n()),n._c&&(n._d=!0)))}{n=32;const r=e._;r||Fr in e?3===r&&Ke&&(1===Ke.slots._?e._=1:(e._=2,t.patchFlag|=1024)):e._ctx=Ke}}else M(e)?(e={default:e,_ctx:Ke},n=32):(e=String(e),64&r?(n=16,e=[zr(e)]):n=8);t.children=e,t.shapeFlag|=n}function Wr(t,e,n,r=null){ge(t,e,7,[n,r])}const Gr=gr();let Kr=0;let Zr=null;const Jr=()=>Zr||Ke,Qr=t=>{Zr=t,t.scope.on()},ti=()=>{Zr&&Zr.scope.off(),Zr=null};function ei(t){return 4&t.vnode.shapeFlag}let ni=!1;function ri(t,e,n){M(e)?t.type.__ssrInlineRender?t.ssrRender=e:t.render=e:N(e)&&(__VUE_PROD_DEVTOOLS__&&(t.devtoolsRawSetupState=e),t.setupState=he(e)),ii(t,n)}function ii(t,e,n){const r=t.type;t.render||(t.render=r.render||p),__VUE_OPTIONS_API__&&(Qr(t),ut(),function(t){const e=Kn(t),n=t.proxy,r=t.ctx;Yn=!1,e.beforeCreate&&Wn(e.beforeCreate,t,"bc");const{data:i,computed:o,methods:s,watch:l,provide:a,inject:u,created:c,beforeMount:f,mounted:h,beforeUpdate:d,updated:g,activated:v,deactivated:y,beforeDestroy:m,beforeUnmount:_,destroyed:x,unmounted:b,render:S,renderTracked:k,renderTriggered:E,errorCaptured:A,serverPrefetch:C,expose:O,inheritAttrs:$,components:T,directives:L,filters:P}=e;if(u&&function(t,e,n=p,r=!1){w(t)&&(t=tr(t));for(const n in t){const i=t[n];let o;o=N(i)?"default"in i?rn(i.from||n,i.default,!0):rn(i.from||n):rn(i),ce(o)&&r?Object.defineProperty(e,n,{enumerable:!0,configurable:!0,get:()=>o.value,set:t=>o.value=t}):e[n]=o}}(u,r,null,t.appContext.config.unwrapInjectedRef),s)for(const t in s){const e=s[t];M(e)&&(r[t]=e.bind(n))}if(i){const e=i.call(n,n);N(e)&&(t.data=Qt(e))}if(Yn=!0,o)for(const t in o){const e=o[t],i=M(e)?e.bind(n,n):M(e.get)?e.get.bind(n,n):p,s=!M(e)&&M(e.set)?e.set.bind(n):p,l=si({get:i,set:s});Object.defineProperty(r,t,{enumerable:!0,configurable:!0,get:()=>l.value,set:t=>l.value=t})}if(l)for(const t in l)Gn(l[t],r,n,t);if(a){const t=M(a)?a.call(n):a;Reflect.ownKeys(t).forEach((e=>{!function(t,e){if(Zr){let n=Zr.provides;const r=Zr.parent&&Zr.parent.provides;r===n&&(n=Zr.provides=Object.create(r)),n[t]=e}}(e,t[e])}))}function V(t,e){w(e)?e.forEach((e=>t(e.bind(n)))):e&&t(e.bind(n))}if(c&&Wn(c,t,"c"),V(Nn,f),V(Cn,h),V(On,d),V($n,g),V(wn,v),V(Sn,y),V(Fn,A),V(jn,k),V(Vn,E),V(Tn,_),V(Ln,b),V(Pn,C),w(O))if(O.length){const e=t.exposed||(t.exposed={});O.forEach((t=>{Object.defineProperty(e,t,{get:()=>n[t],set:e=>n[t]=e})}))}else t.exposed||(t.exposed={});S&&t.render===p&&(t.render=S),null!=$&&(t.inheritAttrs=$),T&&(t.components=T),L&&(t.directives=L)}(t),ct(),ti())}function oi(t){if(t.exposed)return t.exposeProxy||(t.exposeProxy=new Proxy(he(le(t.exposed)),{get:(e,n)=>n in e?e[n]:n in Xn?Xn[n](t):void 0}))}const si=(t,e)=>function(t,e,n=!1){let r,i;const o=M(t);return o?(r=t,i=p):(r=t.get,i=t.set),new pe(r,i,o||!i,n)}(t,0,ni);Symbol("");const li="3.2.35",ai="undefined"!=typeof document?document:null,ui=ai&&ai.createElement("template"),ci={insert:(t,e,n)=>{e.insertBefore(t,n||null)},remove:t=>{const e=t.parentNode;e&&e.removeChild(t)},createElement:(t,e,n,r)=>{const i=e?ai.createElementNS("http://www.w3.org/2000/svg",t):ai.createElement(t,n?{is:n}:void 0);return"select"===t&&r&&null!=r.multiple&&i.setAttribute("multiple",r.multiple),i},createText:t=>ai.createTextNode(t),createComment:t=>ai.createComment(t),setText:(t,e)=>{t.nodeValue=e},setElementText:(t,e)=>{t.textContent=e},parentNode:t=>t.parentNode,nextSibling:t=>t.nextSibling,querySelector:t=>ai.querySelector(t),setScopeId(t,e){t.setAttribute(e,"")},cloneNode(t){const e=t.cloneNode(!0);return"_value"in t&&(e._value=t._value),e},insertStaticContent(t,e,n,r,i,o){const s=n?n.previousSibling:e.lastChild;if(i&&(i===o||i.nextSibling))for(;e.insertBefore(i.cloneNode(!0),n),i!==o&&(i=i.nextSibling););else{ui.innerHTML=r?`<svg>${t}</svg>`:t;const i=ui.content;if(r){const t=i.firstChild;for(;t.firstChild;)i.appendChild(t.firstChild);i.removeChild(t)}e.insertBefore(i,n)}return[s?s.nextSibling:e.firstChild,n?n.previousSibling:e.lastChild]}},fi=/\s*!important$/;function hi(t,e,n){if(w(n))n.forEach((n=>hi(t,e,n)));else if(null==n&&(n=""),e.startsWith("--"))t.setProperty(e,n);else{const r=function(t,e){const n=di[e];if(n)return n;let r=F(e);if("filter"!==r&&r in t)return di[e]=r;r=D(r);for(let n=0;n<pi.length;n++){const i=pi[n]+r;if(i in t)return di[e]=i}return e}(t,e);fi.test(n)?t.setProperty(U(r),n.replace(fi,""),"important"):t[r]=n}}const pi=["Webkit","Moz","ms"],di={},gi="http://www.w3.org/1999/xlink",[vi,yi]=(()=>{let t=Date.now,e=!1;if("undefined"!=typeof window){Date.now()>document.createEvent("Event").timeStamp&&(t=()=>performance.now());const n=navigator.userAgent.match(/firefox\/(\d+)/i);e=!!(n&&Number(n[1])<=53)}return[t,e]})();let mi=0;const _i=Promise.resolve(),xi=()=>{mi=0};const bi=/(?:Once|Passive|Capture)$/,wi=/^on[a-z]/;"undefined"!=typeof HTMLElement&&HTMLElement;const Si="transition",ki="animation",Mi=(t,{slots:e})=>function(t,e,n){const r=arguments.length;return 2===r?N(e)&&!w(e)?Vr(e)?Ir(t,null,[e]):Ir(t,e):Ir(t,null,e):(r>3?n=Array.prototype.slice.call(arguments,2):3===r&&Vr(n)&&(n=[n]),Ir(t,e,n))}(pn,function(t){const e={};for(const n in t)n in Ei||(e[n]=t[n]);if(!1===t.css)return e;const{name:n="v",type:r,duration:i,enterFromClass:o=`${n}-enter-from`,enterActiveClass:s=`${n}-enter-active`,enterToClass:l=`${n}-enter-to`,appearFromClass:a=o,appearActiveClass:u=s,appearToClass:c=l,leaveFromClass:f=`${n}-leave-from`,leaveActiveClass:h=`${n}-leave-active`,leaveToClass:p=`${n}-leave-to`}=t,d=function(t){if(null==t)return null;if(N(t))return[Ci(t.enter),Ci(t.leave)];{const e=Ci(t);return[e,e]}}(i),g=d&&d[0],v=d&&d[1],{onBeforeEnter:y,onEnter:_,onEnterCancelled:x,onLeave:b,onLeaveCancelled:w,onBeforeAppear:S=y,onAppear:k=_,onAppearCancelled:M=x}=e,E=(t,e,n)=>{$i(t,e?c:l),$i(t,e?u:s),n&&n()};let A=!1;const C=(t,e)=>{A=!1,$i(t,f),$i(t,p),$i(t,h),e&&e()},O=t=>(e,n)=>{const i=t?k:_,s=()=>E(e,t,n);Ai(i,[e,s]),Ti((()=>{$i(e,t?a:o),Oi(e,t?c:l),Ni(i)||Pi(e,r,g,s)}))};return m(e,{onBeforeEnter(t){Ai(y,[t]),Oi(t,o),Oi(t,s)},onBeforeAppear(t){Ai(S,[t]),Oi(t,a),Oi(t,u)},onEnter:O(!1),onAppear:O(!0),onLeave(t,e){A=!0;const n=()=>C(t,e);Oi(t,f),document.body.offsetHeight,Oi(t,h),Ti((()=>{A&&($i(t,f),Oi(t,p),Ni(b)||Pi(t,r,v,n))})),Ai(b,[t,n])},onEnterCancelled(t){E(t,!1),Ai(x,[t])},onAppearCancelled(t){E(t,!0),Ai(M,[t])},onLeaveCancelled(t){C(t),Ai(w,[t])}})}(t),e);Mi.displayName="Transition";const Ei={name:String,type:String,css:{type:Boolean,default:!0},duration:[String,Number,Object],enterFromClass:String,enterActiveClass:String,enterToClass:String,appearFromClass:String,appearActiveClass:String,appearToClass:String,leaveFromClass:String,leaveActiveClass:String,leaveToClass:String},Ai=(Mi.props=m({},pn.props,Ei),(t,e=[])=>{w(t)?t.forEach((t=>t(...e))):t&&t(...e)}),Ni=t=>!!t&&(w(t)?t.some((t=>t.length>1)):t.length>1);function Ci(t){return X(t)}function Oi(t,e){e.split(/\s+/).forEach((e=>e&&t.classList.add(e))),(t._vtc||(t._vtc=new Set)).add(e)}function $i(t,e){e.split(/\s+/).forEach((e=>e&&t.classList.remove(e)));const{_vtc:n}=t;n&&(n.delete(e),n.size||(t._vtc=void 0))}function Ti(t){requestAnimationFrame((()=>{requestAnimationFrame(t)}))}let Li=0;function Pi(t,e,n,r){const i=t._endId=++Li,o=()=>{i===t._endId&&r()};if(n)return setTimeout(o,n);const{type:s,timeout:l,propCount:a}=function(t,e){const n=window.getComputedStyle(t),r=t=>(n[t]||"").split(", "),i=r("transitionDelay"),o=r("transitionDuration"),s=Vi(i,o),l=r("animationDelay"),a=r("animationDuration"),u=Vi(l,a);let c=null,f=0,h=0;return e===Si?s>0&&(c=Si,f=s,h=o.length):e===ki?u>0&&(c=ki,f=u,h=a.length):(f=Math.max(s,u),c=f>0?s>u?Si:ki:null,h=c?c===Si?o.length:a.length:0),{type:c,timeout:f,propCount:h,hasTransform:c===Si&&/\b(transform|all)(,|$)/.test(n.transitionProperty)}}(t,e);if(!s)return r();const u=s+"end";let c=0;const f=()=>{t.removeEventListener(u,h),o()},h=e=>{e.target===t&&++c>=a&&f()};setTimeout((()=>{c<a&&f()}),l+1),t.addEventListener(u,h)}function Vi(t,e){for(;t.length<e.length;)t=t.concat(t);return Math.max(...e.map(((e,n)=>ji(e)+ji(t[n]))))}function ji(t){return 1e3*Number(t.slice(0,-1).replace(",","."))}new WeakMap,new WeakMap;const Fi={beforeMount(t,{value:e},{transition:n}){t._vod="none"===t.style.display?"":t.style.display,n&&e?n.beforeEnter(t):Ri(t,e)},mounted(t,{value:e},{transition:n}){n&&e&&n.enter(t)},updated(t,{value:e,oldValue:n},{transition:r}){!e!=!n&&(r?e?(r.beforeEnter(t),Ri(t,!0),r.enter(t)):r.leave(t,(()=>{Ri(t,!1)})):Ri(t,e))},beforeUnmount(t,{value:e}){Ri(t,e)}};function Ri(t,e){t.style.display=e?t._vod:"none"}const Ui=m({patchProp:(t,n,i,o,s=!1,l,a,u,c)=>{"class"===n?function(t,e,n){const r=t._vtc;r&&(e=(e?[e,...r]:[...r]).join(" ")),null==e?t.removeAttribute("class"):n?t.setAttribute("class",e):t.className=e}(t,o,s):"style"===n?function(t,e,n){const r=t.style,i=E(n);if(n&&!i){for(const t in n)hi(r,t,n[t]);if(e&&!E(e))for(const t in e)null==n[t]&&hi(r,t,"")}else{const o=r.display;i?e!==n&&(r.cssText=n):e&&t.removeAttribute("style"),"_vod"in t&&(r.display=o)}}(t,i,o):v(n)?y(n)||function(t,e,n,r,i=null){const o=t._vei||(t._vei={}),s=o[e];if(r&&s)s.value=r;else{const[n,l]=function(t){let e;if(bi.test(t)){let n;for(e={};n=t.match(bi);)t=t.slice(0,t.length-n[0].length),e[n[0].toLowerCase()]=!0}return[U(t.slice(2)),e]}(e);if(r){const s=o[e]=function(t,e){const n=t=>{const r=t.timeStamp||vi();(yi||r>=n.attached-1)&&ge(function(t,e){if(w(e)){const n=t.stopImmediatePropagation;return t.stopImmediatePropagation=()=>{n.call(t),t._stopped=!0},e.map((t=>e=>!e._stopped&&t&&t(e)))}return e}(t,n.value),e,5,[t])};return n.value=t,n.attached=mi||(_i.then(xi),mi=vi()),n}(r,i);!function(t,e,n,r){t.addEventListener(e,n,r)}(t,n,s,l)}else s&&(function(t,e,n,r){t.removeEventListener(e,n,r)}(t,n,s,l),o[e]=void 0)}}(t,n,0,o,a):("."===n[0]?(n=n.slice(1),1):"^"===n[0]?(n=n.slice(1),0):function(t,e,n,r){return r?"innerHTML"===e||"textContent"===e||!!(e in t&&wi.test(e)&&M(n)):"spellcheck"!==e&&"draggable"!==e&&"translate"!==e&&("form"!==e&&(("list"!==e||"INPUT"!==t.tagName)&&(("type"!==e||"TEXTAREA"!==t.tagName)&&((!wi.test(e)||!E(n))&&e in t))))}(t,n,o,s))?function(t,e,n,i,o,s,l){if("innerHTML"===e||"textContent"===e)return i&&l(i,o,s),void(t[e]=null==n?"":n);if("value"===e&&"PROGRESS"!==t.tagName&&!t.tagName.includes("-")){t._value=n;const r=null==n?"":n;return t.value===r&&"OPTION"!==t.tagName||(t.value=r),void(null==n&&t.removeAttribute(e))}let a=!1;if(""===n||null==n){const i=typeof t[e];"boolean"===i?n=r(n):null==n&&"string"===i?(n="",a=!0):"number"===i&&(n=0,a=!0)}try{t[e]=n}catch(t){}a&&t.removeAttribute(e)}(t,n,o,l,a,u,c):("true-value"===n?t._trueValue=o:"false-value"===n&&(t._falseValue=o),function(t,n,i,o,s){if(o&&n.startsWith("xlink:"))null==i?t.removeAttributeNS(gi,n.slice(6,n.length)):t.setAttributeNS(gi,n,i);else{const o=e(n);null==i||o&&!r(i)?t.removeAttribute(n):t.setAttribute(n,o?"":i)}}(t,n,o,s))}},ci);let Di;const Ii={class:"overflow-auto h-full w-full"},Bi=["viewBox"],zi=["x1","y1","x2","y2","index","onMouseover"],qi=["x1","y1","x2","y2","index","onMouseover"],Xi=["transform"],Hi=["r","fill","index","onMouseover","onClick"];function Yi(){}function Wi(t){return null==t?Yi:function(){return this.querySelector(t)}}function Gi(t){return null==t?[]:Array.isArray(t)?t:Array.from(t)}function Ki(){return[]}function Zi(t){return null==t?Ki:function(){return this.querySelectorAll(t)}}function Ji(t){return function(){return this.matches(t)}}function Qi(t){return function(e){return e.matches(t)}}var to=Array.prototype.find;function eo(){return this.firstElementChild}var no=Array.prototype.filter;function ro(){return Array.from(this.children)}function io(t){return new Array(t.length)}function oo(t,e){this.ownerDocument=t.ownerDocument,this.namespaceURI=t.namespaceURI,this._next=null,this._parent=t,this.__data__=e}function so(t){return function(){return t}}function lo(t,e,n,r,i,o){for(var s,l=0,a=e.length,u=o.length;l<u;++l)(s=e[l])?(s.__data__=o[l],r[l]=s):n[l]=new oo(t,o[l]);for(;l<a;++l)(s=e[l])&&(i[l]=s)}function ao(t,e,n,r,i,o,s){var l,a,u,c=new Map,f=e.length,h=o.length,p=new Array(f);for(l=0;l<f;++l)(a=e[l])&&(p[l]=u=s.call(a,a.__data__,l,e)+"",c.has(u)?i[l]=a:c.set(u,a));for(l=0;l<h;++l)u=s.call(t,o[l],l,o)+"",(a=c.get(u))?(r[l]=a,a.__data__=o[l],c.delete(u)):n[l]=new oo(t,o[l]);for(l=0;l<f;++l)(a=e[l])&&c.get(p[l])===a&&(i[l]=a)}function uo(t){return t.__data__}function co(t){return"object"==typeof t&&"length"in t?t:Array.from(t)}function fo(t,e){return t<e?-1:t>e?1:t>=e?0:NaN}oo.prototype={constructor:oo,appendChild:function(t){return this._parent.insertBefore(t,this._next)},insertBefore:function(t,e){return this._parent.insertBefore(t,e)},querySelector:function(t){return this._parent.querySelector(t)},querySelectorAll:function(t){return this._parent.querySelectorAll(t)}};var ho="http://www.w3.org/1999/xhtml";const po={svg:"http://www.w3.org/2000/svg",xhtml:ho,xlink:"http://www.w3.org/1999/xlink",xml:"http://www.w3.org/XML/1998/namespace",xmlns:"http://www.w3.org/2000/xmlns/"};function go(t){var e=t+="",n=e.indexOf(":");return n>=0&&"xmlns"!==(e=t.slice(0,n))&&(t=t.slice(n+1)),po.hasOwnProperty(e)?{space:po[e],local:t}:t}function vo(t){return function(){this.removeAttribute(t)}}function yo(t){return function(){this.removeAttributeNS(t.space,t.local)}}function mo(t,e){return function(){this.setAttribute(t,e)}}function _o(t,e){return function(){this.setAttributeNS(t.space,t.local,e)}}function xo(t,e){return function(){var n=e.apply(this,arguments);null==n?this.removeAttribute(t):this.setAttribute(t,n)}}function bo(t,e){return function(){var n=e.apply(this,arguments);null==n?this.removeAttributeNS(t.space,t.local):this.setAttributeNS(t.space,t.local,n)}}function wo(t){return t.ownerDocument&&t.ownerDocument.defaultView||t.document&&t||t.defaultView}function So(t){return function(){this.style.removeProperty(t)}}function ko(t,e,n){return function(){this.style.setProperty(t,e,n)}}function Mo(t,e,n){return function(){var r=e.apply(this,arguments);null==r?this.style.removeProperty(t):this.style.setProperty(t,r,n)}}function Eo(t,e){return t.style.getPropertyValue(e)||wo(t).getComputedStyle(t,null).getPropertyValue(e)}function Ao(t){return function(){delete this[t]}}function No(t,e){return function(){this[t]=e}}function Co(t,e){return function(){var n=e.apply(this,arguments);null==n?delete this[t]:this[t]=n}}function Oo(t){return t.trim().split(/^|\s+/)}function $o(t){return t.classList||new To(t)}function To(t){this._node=t,this._names=Oo(t.getAttribute("class")||"")}function Lo(t,e){for(var n=$o(t),r=-1,i=e.length;++r<i;)n.add(e[r])}function Po(t,e){for(var n=$o(t),r=-1,i=e.length;++r<i;)n.remove(e[r])}function Vo(t){return function(){Lo(this,t)}}function jo(t){return function(){Po(this,t)}}function Fo(t,e){return function(){(e.apply(this,arguments)?Lo:Po)(this,t)}}function Ro(){this.textContent=""}function Uo(t){return function(){this.textContent=t}}function Do(t){return function(){var e=t.apply(this,arguments);this.textContent=null==e?"":e}}function Io(){this.innerHTML=""}function Bo(t){return function(){this.innerHTML=t}}function zo(t){return function(){var e=t.apply(this,arguments);this.innerHTML=null==e?"":e}}function qo(){this.nextSibling&&this.parentNode.appendChild(this)}function Xo(){this.previousSibling&&this.parentNode.insertBefore(this,this.parentNode.firstChild)}function Ho(t){return function(){var e=this.ownerDocument,n=this.namespaceURI;return n===ho&&e.documentElement.namespaceURI===ho?e.createElement(t):e.createElementNS(n,t)}}function Yo(t){return function(){return this.ownerDocument.createElementNS(t.space,t.local)}}function Wo(t){var e=go(t);return(e.local?Yo:Ho)(e)}function Go(){return null}function Ko(){var t=this.parentNode;t&&t.removeChild(this)}function Zo(){var t=this.cloneNode(!1),e=this.parentNode;return e?e.insertBefore(t,this.nextSibling):t}function Jo(){var t=this.cloneNode(!0),e=this.parentNode;return e?e.insertBefore(t,this.nextSibling):t}function Qo(t){return t.trim().split(/^|\s+/).map((function(t){var e="",n=t.indexOf(".");return n>=0&&(e=t.slice(n+1),t=t.slice(0,n)),{type:t,name:e}}))}function ts(t){return function(){var e=this.__on;if(e){for(var n,r=0,i=-1,o=e.length;r<o;++r)n=e[r],t.type&&n.type!==t.type||n.name!==t.name?e[++i]=n:this.removeEventListener(n.type,n.listener,n.options);++i?e.length=i:delete this.__on}}}function es(t,e,n){return function(){var r,i=this.__on,o=function(t){return function(e){t.call(this,e,this.__data__)}}(e);if(i)for(var s=0,l=i.length;s<l;++s)if((r=i[s]).type===t.type&&r.name===t.name)return this.removeEventListener(r.type,r.listener,r.options),this.addEventListener(r.type,r.listener=o,r.options=n),void(r.value=e);this.addEventListener(t.type,o,n),r={type:t.type,name:t.name,value:e,listener:o,options:n},i?i.push(r):this.__on=[r]}}function ns(t,e,n){var r=wo(t),i=r.CustomEvent;"function"==typeof i?i=new i(e,n):(i=r.document.createEvent("Event"),n?(i.initEvent(e,n.bubbles,n.cancelable),i.detail=n.detail):i.initEvent(e,!1,!1)),t.dispatchEvent(i)}function rs(t,e){return function(){return ns(this,t,e)}}function is(t,e){return function(){return ns(this,t,e.apply(this,arguments))}}To.prototype={add:function(t){this._names.indexOf(t)<0&&(this._names.push(t),this._node.setAttribute("class",this._names.join(" ")))},remove:function(t){var e=this._names.indexOf(t);e>=0&&(this._names.splice(e,1),this._node.setAttribute("class",this._names.join(" ")))},contains:function(t){return this._names.indexOf(t)>=0}};var os=[null];function ss(t,e){this._groups=t,this._parents=e}function ls(){return new ss([[document.documentElement]],os)}ss.prototype=ls.prototype={constructor:ss,select:function(t){"function"!=typeof t&&(t=Wi(t));for(var e=this._groups,n=e.length,r=new Array(n),i=0;i<n;++i)for(var o,s,l=e[i],a=l.length,u=r[i]=new Array(a),c=0;c<a;++c)(o=l[c])&&(s=t.call(o,o.__data__,c,l))&&("__data__"in o&&(s.__data__=o.__data__),u[c]=s);return new ss(r,this._parents)},selectAll:function(t){t="function"==typeof t?function(t){return function(){return Gi(t.apply(this,arguments))}}(t):Zi(t);for(var e=this._groups,n=e.length,r=[],i=[],o=0;o<n;++o)for(var s,l=e[o],a=l.length,u=0;u<a;++u)(s=l[u])&&(r.push(t.call(s,s.__data__,u,l)),i.push(s));return new ss(r,i)},selectChild:function(t){return this.select(null==t?eo:function(t){return function(){return to.call(this.children,t)}}("function"==typeof t?t:Qi(t)))},selectChildren:function(t){return this.selectAll(null==t?ro:function(t){return function(){return no.call(this.children,t)}}("function"==typeof t?t:Qi(t)))},filter:function(t){"function"!=typeof t&&(t=Ji(t));for(var e=this._groups,n=e.length,r=new Array(n),i=0;i<n;++i)for(var o,s=e[i],l=s.length,a=r[i]=[],u=0;u<l;++u)(o=s[u])&&t.call(o,o.__data__,u,s)&&a.push(o);return new ss(r,this._parents)},data:function(t,e){if(!arguments.length)return Array.from(this,uo);var n=e?ao:lo,r=this._parents,i=this._groups;"function"!=typeof t&&(t=so(t));for(var o=i.length,s=new Array(o),l=new Array(o),a=new Array(o),u=0;u<o;++u){var c=r[u],f=i[u],h=f.length,p=co(t.call(c,c&&c.__data__,u,r)),d=p.length,g=l[u]=new Array(d),v=s[u]=new Array(d),y=a[u]=new Array(h);n(c,f,g,v,y,p,e);for(var m,_,x=0,b=0;x<d;++x)if(m=g[x]){for(x>=b&&(b=x+1);!(_=v[b])&&++b<d;);m._next=_||null}}return(s=new ss(s,r))._enter=l,s._exit=a,s},enter:function(){return new ss(this._enter||this._groups.map(io),this._parents)},exit:function(){return new ss(this._exit||this._groups.map(io),this._parents)},join:function(t,e,n){var r=this.enter(),i=this,o=this.exit();return"function"==typeof t?(r=t(r))&&(r=r.selection()):r=r.append(t+""),null!=e&&(i=e(i))&&(i=i.selection()),null==n?o.remove():n(o),r&&i?r.merge(i).order():i},merge:function(t){for(var e=t.selection?t.selection():t,n=this._groups,r=e._groups,i=n.length,o=r.length,s=Math.min(i,o),l=new Array(i),a=0;a<s;++a)for(var u,c=n[a],f=r[a],h=c.length,p=l[a]=new Array(h),d=0;d<h;++d)(u=c[d]||f[d])&&(p[d]=u);for(;a<i;++a)l[a]=n[a];return new ss(l,this._parents)},selection:function(){return this},order:function(){for(var t=this._groups,e=-1,n=t.length;++e<n;)for(var r,i=t[e],o=i.length-1,s=i[o];--o>=0;)(r=i[o])&&(s&&4^r.compareDocumentPosition(s)&&s.parentNode.insertBefore(r,s),s=r);return this},sort:function(t){function e(e,n){return e&&n?t(e.__data__,n.__data__):!e-!n}t||(t=fo);for(var n=this._groups,r=n.length,i=new Array(r),o=0;o<r;++o){for(var s,l=n[o],a=l.length,u=i[o]=new Array(a),c=0;c<a;++c)(s=l[c])&&(u[c]=s);u.sort(e)}return new ss(i,this._parents).order()},call:function(){var t=arguments[0];return arguments[0]=this,t.apply(null,arguments),this},nodes:function(){return Array.from(this)},node:function(){for(var t=this._groups,e=0,n=t.length;e<n;++e)for(var r=t[e],i=0,o=r.length;i<o;++i){var s=r[i];if(s)return s}return null},size:function(){let t=0;for(const e of this)++t;return t},empty:function(){return!this.node()},each:function(t){for(var e=this._groups,n=0,r=e.length;n<r;++n)for(var i,o=e[n],s=0,l=o.length;s<l;++s)(i=o[s])&&t.call(i,i.__data__,s,o);return this},attr:function(t,e){var n=go(t);if(arguments.length<2){var r=this.node();return n.local?r.getAttributeNS(n.space,n.local):r.getAttribute(n)}return this.each((null==e?n.local?yo:vo:"function"==typeof e?n.local?bo:xo:n.local?_o:mo)(n,e))},style:function(t,e,n){return arguments.length>1?this.each((null==e?So:"function"==typeof e?Mo:ko)(t,e,null==n?"":n)):Eo(this.node(),t)},property:function(t,e){return arguments.length>1?this.each((null==e?Ao:"function"==typeof e?Co:No)(t,e)):this.node()[t]},classed:function(t,e){var n=Oo(t+"");if(arguments.length<2){for(var r=$o(this.node()),i=-1,o=n.length;++i<o;)if(!r.contains(n[i]))return!1;return!0}return this.each(("function"==typeof e?Fo:e?Vo:jo)(n,e))},text:function(t){return arguments.length?this.each(null==t?Ro:("function"==typeof t?Do:Uo)(t)):this.node().textContent},html:function(t){return arguments.length?this.each(null==t?Io:("function"==typeof t?zo:Bo)(t)):this.node().innerHTML},raise:function(){return this.each(qo)},lower:function(){return this.each(Xo)},append:function(t){var e="function"==typeof t?t:Wo(t);return this.select((function(){return this.appendChild(e.apply(this,arguments))}))},insert:function(t,e){var n="function"==typeof t?t:Wo(t),r=null==e?Go:"function"==typeof e?e:Wi(e);return this.select((function(){return this.insertBefore(n.apply(this,arguments),r.apply(this,arguments)||null)}))},remove:function(){return this.each(Ko)},clone:function(t){return this.select(t?Jo:Zo)},datum:function(t){return arguments.length?this.property("__data__",t):this.node().__data__},on:function(t,e,n){var r,i,o=Qo(t+""),s=o.length;if(!(arguments.length<2)){for(l=e?es:ts,r=0;r<s;++r)this.each(l(o[r],e,n));return this}var l=this.node().__on;if(l)for(var a,u=0,c=l.length;u<c;++u)for(r=0,a=l[u];r<s;++r)if((i=o[r]).type===a.type&&i.name===a.name)return a.value},dispatch:function(t,e){return this.each(("function"==typeof e?is:rs)(t,e))},[Symbol.iterator]:function*(){for(var t=this._groups,e=0,n=t.length;e<n;++e)for(var r,i=t[e],o=0,s=i.length;o<s;++o)(r=i[o])&&(yield r)}};const as=ls;var us={value:()=>{}};function cs(){for(var t,e=0,n=arguments.length,r={};e<n;++e){if(!(t=arguments[e]+"")||t in r||/[\s.]/.test(t))throw new Error("illegal type: "+t);r[t]=[]}return new fs(r)}function fs(t){this._=t}function hs(t,e){return t.trim().split(/^|\s+/).map((function(t){var n="",r=t.indexOf(".");if(r>=0&&(n=t.slice(r+1),t=t.slice(0,r)),t&&!e.hasOwnProperty(t))throw new Error("unknown type: "+t);return{type:t,name:n}}))}function ps(t,e){for(var n,r=0,i=t.length;r<i;++r)if((n=t[r]).name===e)return n.value}function ds(t,e,n){for(var r=0,i=t.length;r<i;++r)if(t[r].name===e){t[r]=us,t=t.slice(0,r).concat(t.slice(r+1));break}return null!=n&&t.push({name:e,value:n}),t}fs.prototype=cs.prototype={constructor:fs,on:function(t,e){var n,r=this._,i=hs(t+"",r),o=-1,s=i.length;if(!(arguments.length<2)){if(null!=e&&"function"!=typeof e)throw new Error("invalid callback: "+e);for(;++o<s;)if(n=(t=i[o]).type)r[n]=ds(r[n],t.name,e);else if(null==e)for(n in r)r[n]=ds(r[n],t.name,null);return this}for(;++o<s;)if((n=(t=i[o]).type)&&(n=ps(r[n],t.name)))return n},copy:function(){var t={},e=this._;for(var n in e)t[n]=e[n].slice();return new fs(t)},call:function(t,e){if((n=arguments.length-2)>0)for(var n,r,i=new Array(n),o=0;o<n;++o)i[o]=arguments[o+2];if(!this._.hasOwnProperty(t))throw new Error("unknown type: "+t);for(o=0,n=(r=this._[t]).length;o<n;++o)r[o].value.apply(e,i)},apply:function(t,e,n){if(!this._.hasOwnProperty(t))throw new Error("unknown type: "+t);for(var r=this._[t],i=0,o=r.length;i<o;++i)r[i].value.apply(e,n)}};const gs=cs;var vs,ys,ms=0,_s=0,xs=0,bs=0,ws=0,Ss=0,ks="object"==typeof performance&&performance.now?performance:Date,Ms="object"==typeof window&&window.requestAnimationFrame?window.requestAnimationFrame.bind(window):function(t){setTimeout(t,17)};function Es(){return ws||(Ms(As),ws=ks.now()+Ss)}function As(){ws=0}function Ns(){this._call=this._time=this._next=null}function Cs(t,e,n){var r=new Ns;return r.restart(t,e,n),r}function Os(){ws=(bs=ks.now())+Ss,ms=_s=0;try{!function(){Es(),++ms;for(var t,e=vs;e;)(t=ws-e._time)>=0&&e._call.call(void 0,t),e=e._next;--ms}()}finally{ms=0,function(){for(var t,e,n=vs,r=1/0;n;)n._call?(r>n._time&&(r=n._time),t=n,n=n._next):(e=n._next,n._next=null,n=t?t._next=e:vs=e);ys=t,Ts(r)}(),ws=0}}function $s(){var t=ks.now(),e=t-bs;e>1e3&&(Ss-=e,bs=t)}function Ts(t){ms||(_s&&(_s=clearTimeout(_s)),t-ws>24?(t<1/0&&(_s=setTimeout(Os,t-ks.now()-Ss)),xs&&(xs=clearInterval(xs))):(xs||(bs=ks.now(),xs=setInterval($s,1e3)),ms=1,Ms(Os)))}function Ls(t,e,n){var r=new Ns;return e=null==e?0:+e,r.restart((n=>{r.stop(),t(n+e)}),e,n),r}Ns.prototype=Cs.prototype={constructor:Ns,restart:function(t,e,n){if("function"!=typeof t)throw new TypeError("callback is not a function");n=(null==n?Es():+n)+(null==e?0:+e),this._next||ys===this||(ys?ys._next=this:vs=this,ys=this),this._call=t,this._time=n,Ts()},stop:function(){this._call&&(this._call=null,this._time=1/0,Ts())}};var Ps=gs("start","end","cancel","interrupt"),Vs=[];function js(t,e,n,r,i,o){var s=t.__transition;if(s){if(n in s)return}else t.__transition={};!function(t,e,n){var r,i=t.__transition;function o(a){var u,c,f,h;if(1!==n.state)return l();for(u in i)if((h=i[u]).name===n.name){if(3===h.state)return Ls(o);4===h.state?(h.state=6,h.timer.stop(),h.on.call("interrupt",t,t.__data__,h.index,h.group),delete i[u]):+u<e&&(h.state=6,h.timer.stop(),h.on.call("cancel",t,t.__data__,h.index,h.group),delete i[u])}if(Ls((function(){3===n.state&&(n.state=4,n.timer.restart(s,n.delay,n.time),s(a))})),n.state=2,n.on.call("start",t,t.__data__,n.index,n.group),2===n.state){for(n.state=3,r=new Array(f=n.tween.length),u=0,c=-1;u<f;++u)(h=n.tween[u].value.call(t,t.__data__,n.index,n.group))&&(r[++c]=h);r.length=c+1}}function s(e){for(var i=e<n.duration?n.ease.call(null,e/n.duration):(n.timer.restart(l),n.state=5,1),o=-1,s=r.length;++o<s;)r[o].call(t,i);5===n.state&&(n.on.call("end",t,t.__data__,n.index,n.group),l())}function l(){for(var r in n.state=6,n.timer.stop(),delete i[e],i)return;delete t.__transition}i[e]=n,n.timer=Cs((function(t){n.state=1,n.timer.restart(o,n.delay,n.time),n.delay<=t&&o(t-n.delay)}),0,n.time)}(t,n,{name:e,index:r,group:i,on:Ps,tween:Vs,time:o.time,delay:o.delay,duration:o.duration,ease:o.ease,timer:null,state:0})}function Fs(t,e){var n=Us(t,e);if(n.state>0)throw new Error("too late; already scheduled");return n}function Rs(t,e){var n=Us(t,e);if(n.state>3)throw new Error("too late; already running");return n}function Us(t,e){var n=t.__transition;if(!n||!(n=n[e]))throw new Error("transition not found");return n}function Ds(t,e){return t=+t,e=+e,function(n){return t*(1-n)+e*n}}var Is,Bs=180/Math.PI,zs={translateX:0,translateY:0,rotate:0,skewX:0,scaleX:1,scaleY:1};function qs(t,e,n,r,i,o){var s,l,a;return(s=Math.sqrt(t*t+e*e))&&(t/=s,e/=s),(a=t*n+e*r)&&(n-=t*a,r-=e*a),(l=Math.sqrt(n*n+r*r))&&(n/=l,r/=l,a/=l),t*r<e*n&&(t=-t,e=-e,a=-a,s=-s),{translateX:i,translateY:o,rotate:Math.atan2(e,t)*Bs,skewX:Math.atan(a)*Bs,scaleX:s,scaleY:l}}function Xs(t,e,n,r){function i(t){return t.length?t.pop()+" ":""}return function(o,s){var l=[],a=[];return o=t(o),s=t(s),function(t,r,i,o,s,l){if(t!==i||r!==o){var a=s.push("translate(",null,e,null,n);l.push({i:a-4,x:Ds(t,i)},{i:a-2,x:Ds(r,o)})}else(i||o)&&s.push("translate("+i+e+o+n)}(o.translateX,o.translateY,s.translateX,s.translateY,l,a),function(t,e,n,o){t!==e?(t-e>180?e+=360:e-t>180&&(t+=360),o.push({i:n.push(i(n)+"rotate(",null,r)-2,x:Ds(t,e)})):e&&n.push(i(n)+"rotate("+e+r)}(o.rotate,s.rotate,l,a),function(t,e,n,o){t!==e?o.push({i:n.push(i(n)+"skewX(",null,r)-2,x:Ds(t,e)}):e&&n.push(i(n)+"skewX("+e+r)}(o.skewX,s.skewX,l,a),function(t,e,n,r,o,s){if(t!==n||e!==r){var l=o.push(i(o)+"scale(",null,",",null,")");s.push({i:l-4,x:Ds(t,n)},{i:l-2,x:Ds(e,r)})}else 1===n&&1===r||o.push(i(o)+"scale("+n+","+r+")")}(o.scaleX,o.scaleY,s.scaleX,s.scaleY,l,a),o=s=null,function(t){for(var e,n=-1,r=a.length;++n<r;)l[(e=a[n]).i]=e.x(t);return l.join("")}}}var Hs=Xs((function(t){const e=new("function"==typeof DOMMatrix?DOMMatrix:WebKitCSSMatrix)(t+"");return e.isIdentity?zs:qs(e.a,e.b,e.c,e.d,e.e,e.f)}),"px, ","px)","deg)"),Ys=Xs((function(t){return null==t?zs:(Is||(Is=document.createElementNS("http://www.w3.org/2000/svg","g")),Is.setAttribute("transform",t),(t=Is.transform.baseVal.consolidate())?qs((t=t.matrix).a,t.b,t.c,t.d,t.e,t.f):zs)}),", ",")",")");function Ws(t,e){var n,r;return function(){var i=Rs(this,t),o=i.tween;if(o!==n)for(var s=0,l=(r=n=o).length;s<l;++s)if(r[s].name===e){(r=r.slice()).splice(s,1);break}i.tween=r}}function Gs(t,e,n){var r,i;if("function"!=typeof n)throw new Error;return function(){var o=Rs(this,t),s=o.tween;if(s!==r){i=(r=s).slice();for(var l={name:e,value:n},a=0,u=i.length;a<u;++a)if(i[a].name===e){i[a]=l;break}a===u&&i.push(l)}o.tween=i}}function Ks(t,e,n){var r=t._id;return t.each((function(){var t=Rs(this,r);(t.value||(t.value={}))[e]=n.apply(this,arguments)})),function(t){return Us(t,r).value[e]}}function Zs(t,e,n){t.prototype=e.prototype=n,n.constructor=t}function Js(t,e){var n=Object.create(t.prototype);for(var r in e)n[r]=e[r];return n}function Qs(){}var tl=.7,el=1/tl,nl="\\s*([+-]?\\d+)\\s*",rl="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)\\s*",il="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)%\\s*",ol=/^#([0-9a-f]{3,8})$/,sl=new RegExp(`^rgb\\(${nl},${nl},${nl}\\)$`),ll=new RegExp(`^rgb\\(${il},${il},${il}\\)$`),al=new RegExp(`^rgba\\(${nl},${nl},${nl},${rl}\\)$`),ul=new RegExp(`^rgba\\(${il},${il},${il},${rl}\\)$`),cl=new RegExp(`^hsl\\(${rl},${il},${il}\\)$`),fl=new RegExp(`^hsla\\(${rl},${il},${il},${rl}\\)$`),hl={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};function pl(){return this.rgb().formatHex()}function dl(){return this.rgb().formatRgb()}function gl(t){var e,n;return t=(t+"").trim().toLowerCase(),(e=ol.exec(t))?(n=e[1].length,e=parseInt(e[1],16),6===n?vl(e):3===n?new xl(e>>8&15|e>>4&240,e>>4&15|240&e,(15&e)<<4|15&e,1):8===n?yl(e>>24&255,e>>16&255,e>>8&255,(255&e)/255):4===n?yl(e>>12&15|e>>8&240,e>>8&15|e>>4&240,e>>4&15|240&e,((15&e)<<4|15&e)/255):null):(e=sl.exec(t))?new xl(e[1],e[2],e[3],1):(e=ll.exec(t))?new xl(255*e[1]/100,255*e[2]/100,255*e[3]/100,1):(e=al.exec(t))?yl(e[1],e[2],e[3],e[4]):(e=ul.exec(t))?yl(255*e[1]/100,255*e[2]/100,255*e[3]/100,e[4]):(e=cl.exec(t))?El(e[1],e[2]/100,e[3]/100,1):(e=fl.exec(t))?El(e[1],e[2]/100,e[3]/100,e[4]):hl.hasOwnProperty(t)?vl(hl[t]):"transparent"===t?new xl(NaN,NaN,NaN,0):null}function vl(t){return new xl(t>>16&255,t>>8&255,255&t,1)}function yl(t,e,n,r){return r<=0&&(t=e=n=NaN),new xl(t,e,n,r)}function ml(t){return t instanceof Qs||(t=gl(t)),t?new xl((t=t.rgb()).r,t.g,t.b,t.opacity):new xl}function _l(t,e,n,r){return 1===arguments.length?ml(t):new xl(t,e,n,null==r?1:r)}function xl(t,e,n,r){this.r=+t,this.g=+e,this.b=+n,this.opacity=+r}function bl(){return`#${Ml(this.r)}${Ml(this.g)}${Ml(this.b)}`}function wl(){const t=Sl(this.opacity);return`${1===t?"rgb(":"rgba("}${kl(this.r)}, ${kl(this.g)}, ${kl(this.b)}${1===t?")":`, ${t})`}`}function Sl(t){return isNaN(t)?1:Math.max(0,Math.min(1,t))}function kl(t){return Math.max(0,Math.min(255,Math.round(t)||0))}function Ml(t){return((t=kl(t))<16?"0":"")+t.toString(16)}function El(t,e,n,r){return r<=0?t=e=n=NaN:n<=0||n>=1?t=e=NaN:e<=0&&(t=NaN),new Nl(t,e,n,r)}function Al(t){if(t instanceof Nl)return new Nl(t.h,t.s,t.l,t.opacity);if(t instanceof Qs||(t=gl(t)),!t)return new Nl;if(t instanceof Nl)return t;var e=(t=t.rgb()).r/255,n=t.g/255,r=t.b/255,i=Math.min(e,n,r),o=Math.max(e,n,r),s=NaN,l=o-i,a=(o+i)/2;return l?(s=e===o?(n-r)/l+6*(n<r):n===o?(r-e)/l+2:(e-n)/l+4,l/=a<.5?o+i:2-o-i,s*=60):l=a>0&&a<1?0:s,new Nl(s,l,a,t.opacity)}function Nl(t,e,n,r){this.h=+t,this.s=+e,this.l=+n,this.opacity=+r}function Cl(t){return(t=(t||0)%360)<0?t+360:t}function Ol(t){return Math.max(0,Math.min(1,t||0))}function $l(t,e,n){return 255*(t<60?e+(n-e)*t/60:t<180?n:t<240?e+(n-e)*(240-t)/60:e)}function Tl(t,e,n,r,i){var o=t*t,s=o*t;return((1-3*t+3*o-s)*e+(4-6*o+3*s)*n+(1+3*t+3*o-3*s)*r+s*i)/6}Zs(Qs,gl,{copy(t){return Object.assign(new this.constructor,this,t)},displayable(){return this.rgb().displayable()},hex:pl,formatHex:pl,formatHex8:function(){return this.rgb().formatHex8()},formatHsl:function(){return Al(this).formatHsl()},formatRgb:dl,toString:dl}),Zs(xl,_l,Js(Qs,{brighter(t){return t=null==t?el:Math.pow(el,t),new xl(this.r*t,this.g*t,this.b*t,this.opacity)},darker(t){return t=null==t?tl:Math.pow(tl,t),new xl(this.r*t,this.g*t,this.b*t,this.opacity)},rgb(){return this},clamp(){return new xl(kl(this.r),kl(this.g),kl(this.b),Sl(this.opacity))},displayable(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:bl,formatHex:bl,formatHex8:function(){return`#${Ml(this.r)}${Ml(this.g)}${Ml(this.b)}${Ml(255*(isNaN(this.opacity)?1:this.opacity))}`},formatRgb:wl,toString:wl})),Zs(Nl,(function(t,e,n,r){return 1===arguments.length?Al(t):new Nl(t,e,n,null==r?1:r)}),Js(Qs,{brighter(t){return t=null==t?el:Math.pow(el,t),new Nl(this.h,this.s,this.l*t,this.opacity)},darker(t){return t=null==t?tl:Math.pow(tl,t),new Nl(this.h,this.s,this.l*t,this.opacity)},rgb(){var t=this.h%360+360*(this.h<0),e=isNaN(t)||isNaN(this.s)?0:this.s,n=this.l,r=n+(n<.5?n:1-n)*e,i=2*n-r;return new xl($l(t>=240?t-240:t+120,i,r),$l(t,i,r),$l(t<120?t+240:t-120,i,r),this.opacity)},clamp(){return new Nl(Cl(this.h),Ol(this.s),Ol(this.l),Sl(this.opacity))},displayable(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl(){const t=Sl(this.opacity);return`${1===t?"hsl(":"hsla("}${Cl(this.h)}, ${100*Ol(this.s)}%, ${100*Ol(this.l)}%${1===t?")":`, ${t})`}`}}));const Ll=t=>()=>t;function Pl(t,e){var n=e-t;return n?function(t,e){return function(n){return t+n*e}}(t,n):Ll(isNaN(t)?e:t)}const Vl=function t(e){var n=function(t){return 1==(t=+t)?Pl:function(e,n){return n-e?function(t,e,n){return t=Math.pow(t,n),e=Math.pow(e,n)-t,n=1/n,function(r){return Math.pow(t+r*e,n)}}(e,n,t):Ll(isNaN(e)?n:e)}}(e);function r(t,e){var r=n((t=_l(t)).r,(e=_l(e)).r),i=n(t.g,e.g),o=n(t.b,e.b),s=Pl(t.opacity,e.opacity);return function(e){return t.r=r(e),t.g=i(e),t.b=o(e),t.opacity=s(e),t+""}}return r.gamma=t,r}(1);function jl(t){return function(e){var n,r,i=e.length,o=new Array(i),s=new Array(i),l=new Array(i);for(n=0;n<i;++n)r=_l(e[n]),o[n]=r.r||0,s[n]=r.g||0,l[n]=r.b||0;return o=t(o),s=t(s),l=t(l),r.opacity=1,function(t){return r.r=o(t),r.g=s(t),r.b=l(t),r+""}}}jl((function(t){var e=t.length-1;return function(n){var r=n<=0?n=0:n>=1?(n=1,e-1):Math.floor(n*e),i=t[r],o=t[r+1],s=r>0?t[r-1]:2*i-o,l=r<e-1?t[r+2]:2*o-i;return Tl((n-r/e)*e,s,i,o,l)}})),jl((function(t){var e=t.length;return function(n){var r=Math.floor(((n%=1)<0?++n:n)*e),i=t[(r+e-1)%e],o=t[r%e],s=t[(r+1)%e],l=t[(r+2)%e];return Tl((n-r/e)*e,i,o,s,l)}}));var Fl=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,Rl=new RegExp(Fl.source,"g");function Ul(t,e){var n,r,i,o=Fl.lastIndex=Rl.lastIndex=0,s=-1,l=[],a=[];for(t+="",e+="";(n=Fl.exec(t))&&(r=Rl.exec(e));)(i=r.index)>o&&(i=e.slice(o,i),l[s]?l[s]+=i:l[++s]=i),(n=n[0])===(r=r[0])?l[s]?l[s]+=r:l[++s]=r:(l[++s]=null,a.push({i:s,x:Ds(n,r)})),o=Rl.lastIndex;return o<e.length&&(i=e.slice(o),l[s]?l[s]+=i:l[++s]=i),l.length<2?a[0]?function(t){return function(e){return t(e)+""}}(a[0].x):function(t){return function(){return t}}(e):(e=a.length,function(t){for(var n,r=0;r<e;++r)l[(n=a[r]).i]=n.x(t);return l.join("")})}function Dl(t,e){var n;return("number"==typeof e?Ds:e instanceof gl?Vl:(n=gl(e))?(e=n,Vl):Ul)(t,e)}function Il(t){return function(){this.removeAttribute(t)}}function Bl(t){return function(){this.removeAttributeNS(t.space,t.local)}}function zl(t,e,n){var r,i,o=n+"";return function(){var s=this.getAttribute(t);return s===o?null:s===r?i:i=e(r=s,n)}}function ql(t,e,n){var r,i,o=n+"";return function(){var s=this.getAttributeNS(t.space,t.local);return s===o?null:s===r?i:i=e(r=s,n)}}function Xl(t,e,n){var r,i,o;return function(){var s,l,a=n(this);if(null!=a)return(s=this.getAttribute(t))===(l=a+"")?null:s===r&&l===i?o:(i=l,o=e(r=s,a));this.removeAttribute(t)}}function Hl(t,e,n){var r,i,o;return function(){var s,l,a=n(this);if(null!=a)return(s=this.getAttributeNS(t.space,t.local))===(l=a+"")?null:s===r&&l===i?o:(i=l,o=e(r=s,a));this.removeAttributeNS(t.space,t.local)}}function Yl(t,e){return function(n){this.setAttribute(t,e.call(this,n))}}function Wl(t,e){return function(n){this.setAttributeNS(t.space,t.local,e.call(this,n))}}function Gl(t,e){var n,r;function i(){var i=e.apply(this,arguments);return i!==r&&(n=(r=i)&&Wl(t,i)),n}return i._value=e,i}function Kl(t,e){var n,r;function i(){var i=e.apply(this,arguments);return i!==r&&(n=(r=i)&&Yl(t,i)),n}return i._value=e,i}function Zl(t,e){return function(){Fs(this,t).delay=+e.apply(this,arguments)}}function Jl(t,e){return e=+e,function(){Fs(this,t).delay=e}}function Ql(t,e){return function(){Rs(this,t).duration=+e.apply(this,arguments)}}function ta(t,e){return e=+e,function(){Rs(this,t).duration=e}}function ea(t,e){if("function"!=typeof e)throw new Error;return function(){Rs(this,t).ease=e}}function na(t,e,n){var r,i,o=function(t){return(t+"").trim().split(/^|\s+/).every((function(t){var e=t.indexOf(".");return e>=0&&(t=t.slice(0,e)),!t||"start"===t}))}(e)?Fs:Rs;return function(){var s=o(this,t),l=s.on;l!==r&&(i=(r=l).copy()).on(e,n),s.on=i}}var ra=as.prototype.constructor;function ia(t){return function(){this.style.removeProperty(t)}}function oa(t,e,n){return function(r){this.style.setProperty(t,e.call(this,r),n)}}function sa(t,e,n){var r,i;function o(){var o=e.apply(this,arguments);return o!==i&&(r=(i=o)&&oa(t,o,n)),r}return o._value=e,o}function la(t){return function(e){this.textContent=t.call(this,e)}}function aa(t){var e,n;function r(){var r=t.apply(this,arguments);return r!==n&&(e=(n=r)&&la(r)),e}return r._value=t,r}var ua=0;function ca(t,e,n,r){this._groups=t,this._parents=e,this._name=n,this._id=r}function fa(){return++ua}var ha=as.prototype;ca.prototype=function(t){return as().transition(t)}.prototype={constructor:ca,select:function(t){var e=this._name,n=this._id;"function"!=typeof t&&(t=Wi(t));for(var r=this._groups,i=r.length,o=new Array(i),s=0;s<i;++s)for(var l,a,u=r[s],c=u.length,f=o[s]=new Array(c),h=0;h<c;++h)(l=u[h])&&(a=t.call(l,l.__data__,h,u))&&("__data__"in l&&(a.__data__=l.__data__),f[h]=a,js(f[h],e,n,h,f,Us(l,n)));return new ca(o,this._parents,e,n)},selectAll:function(t){var e=this._name,n=this._id;"function"!=typeof t&&(t=Zi(t));for(var r=this._groups,i=r.length,o=[],s=[],l=0;l<i;++l)for(var a,u=r[l],c=u.length,f=0;f<c;++f)if(a=u[f]){for(var h,p=t.call(a,a.__data__,f,u),d=Us(a,n),g=0,v=p.length;g<v;++g)(h=p[g])&&js(h,e,n,g,p,d);o.push(p),s.push(a)}return new ca(o,s,e,n)},selectChild:ha.selectChild,selectChildren:ha.selectChildren,filter:function(t){"function"!=typeof t&&(t=Ji(t));for(var e=this._groups,n=e.length,r=new Array(n),i=0;i<n;++i)for(var o,s=e[i],l=s.length,a=r[i]=[],u=0;u<l;++u)(o=s[u])&&t.call(o,o.__data__,u,s)&&a.push(o);return new ca(r,this._parents,this._name,this._id)},merge:function(t){if(t._id!==this._id)throw new Error;for(var e=this._groups,n=t._groups,r=e.length,i=n.length,o=Math.min(r,i),s=new Array(r),l=0;l<o;++l)for(var a,u=e[l],c=n[l],f=u.length,h=s[l]=new Array(f),p=0;p<f;++p)(a=u[p]||c[p])&&(h[p]=a);for(;l<r;++l)s[l]=e[l];return new ca(s,this._parents,this._name,this._id)},selection:function(){return new ra(this._groups,this._parents)},transition:function(){for(var t=this._name,e=this._id,n=fa(),r=this._groups,i=r.length,o=0;o<i;++o)for(var s,l=r[o],a=l.length,u=0;u<a;++u)if(s=l[u]){var c=Us(s,e);js(s,t,n,u,l,{time:c.time+c.delay+c.duration,delay:0,duration:c.duration,ease:c.ease})}return new ca(r,this._parents,t,n)},call:ha.call,nodes:ha.nodes,node:ha.node,size:ha.size,empty:ha.empty,each:ha.each,on:function(t,e){var n=this._id;return arguments.length<2?Us(this.node(),n).on.on(t):this.each(na(n,t,e))},attr:function(t,e){var n=go(t),r="transform"===n?Ys:Dl;return this.attrTween(t,"function"==typeof e?(n.local?Hl:Xl)(n,r,Ks(this,"attr."+t,e)):null==e?(n.local?Bl:Il)(n):(n.local?ql:zl)(n,r,e))},attrTween:function(t,e){var n="attr."+t;if(arguments.length<2)return(n=this.tween(n))&&n._value;if(null==e)return this.tween(n,null);if("function"!=typeof e)throw new Error;var r=go(t);return this.tween(n,(r.local?Gl:Kl)(r,e))},style:function(t,e,n){var r="transform"==(t+="")?Hs:Dl;return null==e?this.styleTween(t,function(t,e){var n,r,i;return function(){var o=Eo(this,t),s=(this.style.removeProperty(t),Eo(this,t));return o===s?null:o===n&&s===r?i:i=e(n=o,r=s)}}(t,r)).on("end.style."+t,ia(t)):"function"==typeof e?this.styleTween(t,function(t,e,n){var r,i,o;return function(){var s=Eo(this,t),l=n(this),a=l+"";return null==l&&(this.style.removeProperty(t),a=l=Eo(this,t)),s===a?null:s===r&&a===i?o:(i=a,o=e(r=s,l))}}(t,r,Ks(this,"style."+t,e))).each(function(t,e){var n,r,i,o,s="style."+e,l="end."+s;return function(){var a=Rs(this,t),u=a.on,c=null==a.value[s]?o||(o=ia(e)):void 0;u===n&&i===c||(r=(n=u).copy()).on(l,i=c),a.on=r}}(this._id,t)):this.styleTween(t,function(t,e,n){var r,i,o=n+"";return function(){var s=Eo(this,t);return s===o?null:s===r?i:i=e(r=s,n)}}(t,r,e),n).on("end.style."+t,null)},styleTween:function(t,e,n){var r="style."+(t+="");if(arguments.length<2)return(r=this.tween(r))&&r._value;if(null==e)return this.tween(r,null);if("function"!=typeof e)throw new Error;return this.tween(r,sa(t,e,null==n?"":n))},text:function(t){return this.tween("text","function"==typeof t?function(t){return function(){var e=t(this);this.textContent=null==e?"":e}}(Ks(this,"text",t)):function(t){return function(){this.textContent=t}}(null==t?"":t+""))},textTween:function(t){var e="text";if(arguments.length<1)return(e=this.tween(e))&&e._value;if(null==t)return this.tween(e,null);if("function"!=typeof t)throw new Error;return this.tween(e,aa(t))},remove:function(){return this.on("end.remove",function(t){return function(){var e=this.parentNode;for(var n in this.__transition)if(+n!==t)return;e&&e.removeChild(this)}}(this._id))},tween:function(t,e){var n=this._id;if(t+="",arguments.length<2){for(var r,i=Us(this.node(),n).tween,o=0,s=i.length;o<s;++o)if((r=i[o]).name===t)return r.value;return null}return this.each((null==e?Ws:Gs)(n,t,e))},delay:function(t){var e=this._id;return arguments.length?this.each(("function"==typeof t?Zl:Jl)(e,t)):Us(this.node(),e).delay},duration:function(t){var e=this._id;return arguments.length?this.each(("function"==typeof t?Ql:ta)(e,t)):Us(this.node(),e).duration},ease:function(t){var e=this._id;return arguments.length?this.each(ea(e,t)):Us(this.node(),e).ease},easeVarying:function(t){if("function"!=typeof t)throw new Error;return this.each(function(t,e){return function(){var n=e.apply(this,arguments);if("function"!=typeof n)throw new Error;Rs(this,t).ease=n}}(this._id,t))},end:function(){var t,e,n=this,r=n._id,i=n.size();return new Promise((function(o,s){var l={value:s},a={value:function(){0==--i&&o()}};n.each((function(){var n=Rs(this,r),i=n.on;i!==t&&((e=(t=i).copy())._.cancel.push(l),e._.interrupt.push(l),e._.end.push(a)),n.on=e})),0===i&&o()}))},[Symbol.iterator]:ha[Symbol.iterator]};var pa={time:null,delay:0,duration:250,ease:function(t){return((t*=2)<=1?t*t*t:(t-=2)*t*t+2)/2}};function da(t,e){for(var n;!(n=t.__transition)||!(n=n[e]);)if(!(t=t.parentNode))throw new Error(`transition ${e} not found`);return n}as.prototype.interrupt=function(t){return this.each((function(){!function(t,e){var n,r,i,o=t.__transition,s=!0;if(o){for(i in e=null==e?null:e+"",o)(n=o[i]).name===e?(r=n.state>2&&n.state<5,n.state=6,n.timer.stop(),n.on.call(r?"interrupt":"cancel",t,t.__data__,n.index,n.group),delete o[i]):s=!1;s&&delete t.__transition}}(this,t)}))},as.prototype.transition=function(t){var e,n;t instanceof ca?(e=t._id,t=t._name):(e=fa(),(n=pa).time=Es(),t=null==t?null:t+"");for(var r=this._groups,i=r.length,o=0;o<i;++o)for(var s,l=r[o],a=l.length,u=0;u<a;++u)(s=l[u])&&js(s,t,e,u,l,n||da(s,e));return new ca(r,this._parents,t,e)};const{abs:ga,max:va,min:ya}=Math;function ma(t){return{type:t}}function _a(t,e){var n,r=e?e.length:0,i=t?Math.min(r,t.length):0,o=new Array(i),s=new Array(r);for(n=0;n<i;++n)o[n]=Sa(t[n],e[n]);for(;n<r;++n)s[n]=e[n];return function(t){for(n=0;n<i;++n)s[n]=o[n](t);return s}}function xa(t,e){var n=new Date;return t=+t,e=+e,function(r){return n.setTime(t*(1-r)+e*r),n}}function ba(t,e){var n,r={},i={};for(n in null!==t&&"object"==typeof t||(t={}),null!==e&&"object"==typeof e||(e={}),e)n in t?r[n]=Sa(t[n],e[n]):i[n]=e[n];return function(t){for(n in r)i[n]=r[n](t);return i}}function wa(t,e){e||(e=[]);var n,r=t?Math.min(e.length,t.length):0,i=e.slice();return function(o){for(n=0;n<r;++n)i[n]=t[n]*(1-o)+e[n]*o;return i}}function Sa(t,e){var n,r=typeof e;return null==e||"boolean"===r?Ll(e):("number"===r?Ds:"string"===r?(n=gl(e))?(e=n,Vl):Ul:e instanceof gl?Vl:e instanceof Date?xa:function(t){return ArrayBuffer.isView(t)&&!(t instanceof DataView)}(e)?wa:Array.isArray(e)?_a:"function"!=typeof e.valueOf&&"function"!=typeof e.toString||isNaN(e)?ba:Ds)(t,e)}function ka(t,e){return t=+t,e=+e,function(n){return Math.round(t*(1-n)+e*n)}}function Ma(t){return t}function Ea(t,e){switch(arguments.length){case 0:break;case 1:"function"==typeof t?this.interpolator(t):this.range(t);break;default:this.domain(t),"function"==typeof e?this.interpolator(e):this.range(e)}return this}["w","e"].map(ma),["n","s"].map(ma),["n","w","e","s","nw","ne","sw","se"].map(ma);var Aa=Math.sqrt(50),Na=Math.sqrt(10),Ca=Math.sqrt(2);function Oa(t,e,n){var r=(e-t)/Math.max(0,n),i=Math.floor(Math.log(r)/Math.LN10),o=r/Math.pow(10,i);return i>=0?(o>=Aa?10:o>=Na?5:o>=Ca?2:1)*Math.pow(10,i):-Math.pow(10,-i)/(o>=Aa?10:o>=Na?5:o>=Ca?2:1)}var $a,Ta=/^(?:(.)?([<>=^]))?([+\-( ])?([$#])?(0)?(\d+)?(,)?(\.\d+)?(~)?([a-z%])?$/i;function La(t){if(!(e=Ta.exec(t)))throw new Error("invalid format: "+t);var e;return new Pa({fill:e[1],align:e[2],sign:e[3],symbol:e[4],zero:e[5],width:e[6],comma:e[7],precision:e[8]&&e[8].slice(1),trim:e[9],type:e[10]})}function Pa(t){this.fill=void 0===t.fill?" ":t.fill+"",this.align=void 0===t.align?">":t.align+"",this.sign=void 0===t.sign?"-":t.sign+"",this.symbol=void 0===t.symbol?"":t.symbol+"",this.zero=!!t.zero,this.width=void 0===t.width?void 0:+t.width,this.comma=!!t.comma,this.precision=void 0===t.precision?void 0:+t.precision,this.trim=!!t.trim,this.type=void 0===t.type?"":t.type+""}function Va(t,e){if((n=(t=e?t.toExponential(e-1):t.toExponential()).indexOf("e"))<0)return null;var n,r=t.slice(0,n);return[r.length>1?r[0]+r.slice(2):r,+t.slice(n+1)]}function ja(t){return(t=Va(Math.abs(t)))?t[1]:NaN}function Fa(t,e){var n=Va(t,e);if(!n)return t+"";var r=n[0],i=n[1];return i<0?"0."+new Array(-i).join("0")+r:r.length>i+1?r.slice(0,i+1)+"."+r.slice(i+1):r+new Array(i-r.length+2).join("0")}La.prototype=Pa.prototype,Pa.prototype.toString=function(){return this.fill+this.align+this.sign+this.symbol+(this.zero?"0":"")+(void 0===this.width?"":Math.max(1,0|this.width))+(this.comma?",":"")+(void 0===this.precision?"":"."+Math.max(0,0|this.precision))+(this.trim?"~":"")+this.type};const Ra={"%":(t,e)=>(100*t).toFixed(e),b:t=>Math.round(t).toString(2),c:t=>t+"",d:function(t){return Math.abs(t=Math.round(t))>=1e21?t.toLocaleString("en").replace(/,/g,""):t.toString(10)},e:(t,e)=>t.toExponential(e),f:(t,e)=>t.toFixed(e),g:(t,e)=>t.toPrecision(e),o:t=>Math.round(t).toString(8),p:(t,e)=>Fa(100*t,e),r:Fa,s:function(t,e){var n=Va(t,e);if(!n)return t+"";var r=n[0],i=n[1],o=i-($a=3*Math.max(-8,Math.min(8,Math.floor(i/3))))+1,s=r.length;return o===s?r:o>s?r+new Array(o-s+1).join("0"):o>0?r.slice(0,o)+"."+r.slice(o):"0."+new Array(1-o).join("0")+Va(t,Math.max(0,e+o-1))[0]},X:t=>Math.round(t).toString(16).toUpperCase(),x:t=>Math.round(t).toString(16)};function Ua(t){return t}var Da,Ia,Ba,za=Array.prototype.map,qa=["y","z","a","f","p","n","µ","m","","k","M","G","T","P","E","Z","Y"];function Xa(t){var e=t.domain;return t.ticks=function(t){var n=e();return function(t,e,n){var r,i,o,s,l=-1;if(n=+n,(t=+t)==(e=+e)&&n>0)return[t];if((r=e<t)&&(i=t,t=e,e=i),0===(s=Oa(t,e,n))||!isFinite(s))return[];if(s>0){let n=Math.round(t/s),r=Math.round(e/s);for(n*s<t&&++n,r*s>e&&--r,o=new Array(i=r-n+1);++l<i;)o[l]=(n+l)*s}else{s=-s;let n=Math.round(t*s),r=Math.round(e*s);for(n/s<t&&++n,r/s>e&&--r,o=new Array(i=r-n+1);++l<i;)o[l]=(n+l)/s}return r&&o.reverse(),o}(n[0],n[n.length-1],null==t?10:t)},t.tickFormat=function(t,n){var r=e();return function(t,e,n,r){var i,o=function(t,e,n){var r=Math.abs(e-t)/Math.max(0,n),i=Math.pow(10,Math.floor(Math.log(r)/Math.LN10)),o=r/i;return o>=Aa?i*=10:o>=Na?i*=5:o>=Ca&&(i*=2),e<t?-i:i}(t,e,n);switch((r=La(null==r?",f":r)).type){case"s":var s=Math.max(Math.abs(t),Math.abs(e));return null!=r.precision||isNaN(i=function(t,e){return Math.max(0,3*Math.max(-8,Math.min(8,Math.floor(ja(e)/3)))-ja(Math.abs(t)))}(o,s))||(r.precision=i),Ba(r,s);case"":case"e":case"g":case"p":case"r":null!=r.precision||isNaN(i=function(t,e){return t=Math.abs(t),e=Math.abs(e)-t,Math.max(0,ja(e)-ja(t))+1}(o,Math.max(Math.abs(t),Math.abs(e))))||(r.precision=i-("e"===r.type));break;case"f":case"%":null!=r.precision||isNaN(i=function(t){return Math.max(0,-ja(Math.abs(t)))}(o))||(r.precision=i-2*("%"===r.type))}return Ia(r)}(r[0],r[r.length-1],null==t?10:t,n)},t.nice=function(n){null==n&&(n=10);var r,i,o=e(),s=0,l=o.length-1,a=o[s],u=o[l],c=10;for(u<a&&(i=a,a=u,u=i,i=s,s=l,l=i);c-- >0;){if((i=Oa(a,u,n))===r)return o[s]=a,o[l]=u,e(o);if(i>0)a=Math.floor(a/i)*i,u=Math.ceil(u/i)*i;else{if(!(i<0))break;a=Math.ceil(a*i)/i,u=Math.floor(u*i)/i}r=i}return t},t}function Ha(){var t,e,n,r,i,o=0,s=1,l=Ma,a=!1;function u(e){return null==e||isNaN(e=+e)?i:l(0===n?.5:(e=(r(e)-t)*n,a?Math.max(0,Math.min(1,e)):e))}function c(t){return function(e){var n,r;return arguments.length?([n,r]=e,l=t(n,r),u):[l(0),l(1)]}}return u.domain=function(i){return arguments.length?([o,s]=i,t=r(o=+o),e=r(s=+s),n=t===e?0:1/(e-t),u):[o,s]},u.clamp=function(t){return arguments.length?(a=!!t,u):a},u.interpolator=function(t){return arguments.length?(l=t,u):l},u.range=c(Sa),u.rangeRound=c(ka),u.unknown=function(t){return arguments.length?(i=t,u):i},function(i){return r=i,t=i(o),e=i(s),n=t===e?0:1/(e-t),u}}function Ya(t,e){return e.domain(t.domain()).interpolator(t.interpolator()).clamp(t.clamp()).unknown(t.unknown())}function Wa(){var t=Xa(Ha()(Ma));return t.copy=function(){return Ya(t,Wa())},Ea.apply(t,arguments)}function Ga(t){return t=Math.max(0,Math.min(1,t)),"rgb("+Math.max(0,Math.min(255,Math.round(34.61+t*(1172.33-t*(10793.56-t*(33300.12-t*(38394.49-14825.05*t)))))))+", "+Math.max(0,Math.min(255,Math.round(23.31+t*(557.33+t*(1225.33-t*(3574.96-t*(1073.77+707.56*t)))))))+", "+Math.max(0,Math.min(255,Math.round(27.2+t*(3211.1-t*(15327.97-t*(27814-t*(22569.18-6838.66*t)))))))+")"}function Ka(t){return"string"==typeof t?new ss([[document.querySelector(t)]],[document.documentElement]):new ss([[t]],os)}function Za(t){return"string"==typeof t?new ss([document.querySelectorAll(t)],[document.documentElement]):new ss([Gi(t)],os)}function Ja(t,e,n){this.k=t,this.x=e,this.y=n}Da=function(t){var e,n,r=void 0===t.grouping||void 0===t.thousands?Ua:(e=za.call(t.grouping,Number),n=t.thousands+"",function(t,r){for(var i=t.length,o=[],s=0,l=e[0],a=0;i>0&&l>0&&(a+l+1>r&&(l=Math.max(1,r-a)),o.push(t.substring(i-=l,i+l)),!((a+=l+1)>r));)l=e[s=(s+1)%e.length];return o.reverse().join(n)}),i=void 0===t.currency?"":t.currency[0]+"",o=void 0===t.currency?"":t.currency[1]+"",s=void 0===t.decimal?".":t.decimal+"",l=void 0===t.numerals?Ua:function(t){return function(e){return e.replace(/[0-9]/g,(function(e){return t[+e]}))}}(za.call(t.numerals,String)),a=void 0===t.percent?"%":t.percent+"",u=void 0===t.minus?"−":t.minus+"",c=void 0===t.nan?"NaN":t.nan+"";function f(t){var e=(t=La(t)).fill,n=t.align,f=t.sign,h=t.symbol,p=t.zero,d=t.width,g=t.comma,v=t.precision,y=t.trim,m=t.type;"n"===m?(g=!0,m="g"):Ra[m]||(void 0===v&&(v=12),y=!0,m="g"),(p||"0"===e&&"="===n)&&(p=!0,e="0",n="=");var _="$"===h?i:"#"===h&&/[boxX]/.test(m)?"0"+m.toLowerCase():"",x="$"===h?o:/[%p]/.test(m)?a:"",b=Ra[m],w=/[defgprs%]/.test(m);function S(t){var i,o,a,h=_,S=x;if("c"===m)S=b(t)+S,t="";else{var k=(t=+t)<0||1/t<0;if(t=isNaN(t)?c:b(Math.abs(t),v),y&&(t=function(t){t:for(var e,n=t.length,r=1,i=-1;r<n;++r)switch(t[r]){case".":i=e=r;break;case"0":0===i&&(i=r),e=r;break;default:if(!+t[r])break t;i>0&&(i=0)}return i>0?t.slice(0,i)+t.slice(e+1):t}(t)),k&&0==+t&&"+"!==f&&(k=!1),h=(k?"("===f?f:u:"-"===f||"("===f?"":f)+h,S=("s"===m?qa[8+$a/3]:"")+S+(k&&"("===f?")":""),w)for(i=-1,o=t.length;++i<o;)if(48>(a=t.charCodeAt(i))||a>57){S=(46===a?s+t.slice(i+1):t.slice(i))+S,t=t.slice(0,i);break}}g&&!p&&(t=r(t,1/0));var M=h.length+t.length+S.length,E=M<d?new Array(d-M+1).join(e):"";switch(g&&p&&(t=r(E+t,E.length?d-S.length:1/0),E=""),n){case"<":t=h+t+S+E;break;case"=":t=h+E+t+S;break;case"^":t=E.slice(0,M=E.length>>1)+h+t+S+E.slice(M);break;default:t=E+h+t+S}return l(t)}return v=void 0===v?6:/[gprs]/.test(m)?Math.max(1,Math.min(21,v)):Math.max(0,Math.min(20,v)),S.toString=function(){return t+""},S}return{format:f,formatPrefix:function(t,e){var n=f(((t=La(t)).type="f",t)),r=3*Math.max(-8,Math.min(8,Math.floor(ja(e)/3))),i=Math.pow(10,-r),o=qa[8+r/3];return function(t){return n(i*t)+o}}}}({thousands:",",grouping:[3],currency:["$",""]}),Ia=Da.format,Ba=Da.formatPrefix,Ja.prototype={constructor:Ja,scale:function(t){return 1===t?this:new Ja(this.k*t,this.x,this.y)},translate:function(t,e){return 0===t&0===e?this:new Ja(this.k,this.x+this.k*t,this.y+this.k*e)},apply:function(t){return[t[0]*this.k+this.x,t[1]*this.k+this.y]},applyX:function(t){return t*this.k+this.x},applyY:function(t){return t*this.k+this.y},invert:function(t){return[(t[0]-this.x)/this.k,(t[1]-this.y)/this.k]},invertX:function(t){return(t-this.x)/this.k},invertY:function(t){return(t-this.y)/this.k},rescaleX:function(t){return t.copy().domain(t.range().map(this.invertX,this).map(t.invert,t))},rescaleY:function(t){return t.copy().domain(t.range().map(this.invertY,this).map(t.invert,t))},toString:function(){return"translate("+this.x+","+this.y+") scale("+this.k+")"}},new Ja(1,0,0),Ja.prototype;const Qa=4294967296;function tu(t){return t.x}function eu(t){return t.y}var nu=Math.PI*(3-Math.sqrt(5));function ru(t,e,n,r){if(isNaN(e)||isNaN(n))return t;var i,o,s,l,a,u,c,f,h,p=t._root,d={data:r},g=t._x0,v=t._y0,y=t._x1,m=t._y1;if(!p)return t._root=d,t;for(;p.length;)if((u=e>=(o=(g+y)/2))?g=o:y=o,(c=n>=(s=(v+m)/2))?v=s:m=s,i=p,!(p=p[f=c<<1|u]))return i[f]=d,t;if(l=+t._x.call(null,p.data),a=+t._y.call(null,p.data),e===l&&n===a)return d.next=p,i?i[f]=d:t._root=d,t;do{i=i?i[f]=new Array(4):t._root=new Array(4),(u=e>=(o=(g+y)/2))?g=o:y=o,(c=n>=(s=(v+m)/2))?v=s:m=s}while((f=c<<1|u)==(h=(a>=s)<<1|l>=o));return i[h]=p,i[f]=d,t}function iu(t,e,n,r,i){this.node=t,this.x0=e,this.y0=n,this.x1=r,this.y1=i}function ou(t){return t[0]}function su(t){return t[1]}function lu(t,e,n){var r=new au(null==e?ou:e,null==n?su:n,NaN,NaN,NaN,NaN);return null==t?r:r.addAll(t)}function au(t,e,n,r,i,o){this._x=t,this._y=e,this._x0=n,this._y0=r,this._x1=i,this._y1=o,this._root=void 0}function uu(t){for(var e={data:t.data},n=e;t=t.next;)n=n.next={data:t.data};return e}var cu=lu.prototype=au.prototype;function fu(t){return function(){return t}}function hu(t){return 1e-6*(t()-.5)}function pu(t){return t.x+t.vx}function du(t){return t.y+t.vy}function gu(t){return t.index}function vu(t,e){var n=t.get(e);if(!n)throw new Error("node not found: "+e);return n}function yu(t){var e,n,r,i,o,s,l=gu,a=function(t){return 1/Math.min(i[t.source.index],i[t.target.index])},u=fu(30),c=1;function f(r){for(var i=0,l=t.length;i<c;++i)for(var a,u,f,h,p,d,g,v=0;v<l;++v)u=(a=t[v]).source,h=(f=a.target).x+f.vx-u.x-u.vx||hu(s),p=f.y+f.vy-u.y-u.vy||hu(s),h*=d=((d=Math.sqrt(h*h+p*p))-n[v])/d*r*e[v],p*=d,f.vx-=h*(g=o[v]),f.vy-=p*g,u.vx+=h*(g=1-g),u.vy+=p*g}function h(){if(r){var s,a,u=r.length,c=t.length,f=new Map(r.map(((t,e)=>[l(t,e,r),t])));for(s=0,i=new Array(u);s<c;++s)(a=t[s]).index=s,"object"!=typeof a.source&&(a.source=vu(f,a.source)),"object"!=typeof a.target&&(a.target=vu(f,a.target)),i[a.source.index]=(i[a.source.index]||0)+1,i[a.target.index]=(i[a.target.index]||0)+1;for(s=0,o=new Array(c);s<c;++s)a=t[s],o[s]=i[a.source.index]/(i[a.source.index]+i[a.target.index]);e=new Array(c),p(),n=new Array(c),d()}}function p(){if(r)for(var n=0,i=t.length;n<i;++n)e[n]=+a(t[n],n,t)}function d(){if(r)for(var e=0,i=t.length;e<i;++e)n[e]=+u(t[e],e,t)}return null==t&&(t=[]),f.initialize=function(t,e){r=t,s=e,h()},f.links=function(e){return arguments.length?(t=e,h(),f):t},f.id=function(t){return arguments.length?(l=t,f):l},f.iterations=function(t){return arguments.length?(c=+t,f):c},f.strength=function(t){return arguments.length?(a="function"==typeof t?t:fu(+t),p(),f):a},f.distance=function(t){return arguments.length?(u="function"==typeof t?t:fu(+t),d(),f):u},f}cu.copy=function(){var t,e,n=new au(this._x,this._y,this._x0,this._y0,this._x1,this._y1),r=this._root;if(!r)return n;if(!r.length)return n._root=uu(r),n;for(t=[{source:r,target:n._root=new Array(4)}];r=t.pop();)for(var i=0;i<4;++i)(e=r.source[i])&&(e.length?t.push({source:e,target:r.target[i]=new Array(4)}):r.target[i]=uu(e));return n},cu.add=function(t){const e=+this._x.call(null,t),n=+this._y.call(null,t);return ru(this.cover(e,n),e,n,t)},cu.addAll=function(t){var e,n,r,i,o=t.length,s=new Array(o),l=new Array(o),a=1/0,u=1/0,c=-1/0,f=-1/0;for(n=0;n<o;++n)isNaN(r=+this._x.call(null,e=t[n]))||isNaN(i=+this._y.call(null,e))||(s[n]=r,l[n]=i,r<a&&(a=r),r>c&&(c=r),i<u&&(u=i),i>f&&(f=i));if(a>c||u>f)return this;for(this.cover(a,u).cover(c,f),n=0;n<o;++n)ru(this,s[n],l[n],t[n]);return this},cu.cover=function(t,e){if(isNaN(t=+t)||isNaN(e=+e))return this;var n=this._x0,r=this._y0,i=this._x1,o=this._y1;if(isNaN(n))i=(n=Math.floor(t))+1,o=(r=Math.floor(e))+1;else{for(var s,l,a=i-n||1,u=this._root;n>t||t>=i||r>e||e>=o;)switch(l=(e<r)<<1|t<n,(s=new Array(4))[l]=u,u=s,a*=2,l){case 0:i=n+a,o=r+a;break;case 1:n=i-a,o=r+a;break;case 2:i=n+a,r=o-a;break;case 3:n=i-a,r=o-a}this._root&&this._root.length&&(this._root=u)}return this._x0=n,this._y0=r,this._x1=i,this._y1=o,this},cu.data=function(){var t=[];return this.visit((function(e){if(!e.length)do{t.push(e.data)}while(e=e.next)})),t},cu.extent=function(t){return arguments.length?this.cover(+t[0][0],+t[0][1]).cover(+t[1][0],+t[1][1]):isNaN(this._x0)?void 0:[[this._x0,this._y0],[this._x1,this._y1]]},cu.find=function(t,e,n){var r,i,o,s,l,a,u,c=this._x0,f=this._y0,h=this._x1,p=this._y1,d=[],g=this._root;for(g&&d.push(new iu(g,c,f,h,p)),null==n?n=1/0:(c=t-n,f=e-n,h=t+n,p=e+n,n*=n);a=d.pop();)if(!(!(g=a.node)||(i=a.x0)>h||(o=a.y0)>p||(s=a.x1)<c||(l=a.y1)<f))if(g.length){var v=(i+s)/2,y=(o+l)/2;d.push(new iu(g[3],v,y,s,l),new iu(g[2],i,y,v,l),new iu(g[1],v,o,s,y),new iu(g[0],i,o,v,y)),(u=(e>=y)<<1|t>=v)&&(a=d[d.length-1],d[d.length-1]=d[d.length-1-u],d[d.length-1-u]=a)}else{var m=t-+this._x.call(null,g.data),_=e-+this._y.call(null,g.data),x=m*m+_*_;if(x<n){var b=Math.sqrt(n=x);c=t-b,f=e-b,h=t+b,p=e+b,r=g.data}}return r},cu.remove=function(t){if(isNaN(o=+this._x.call(null,t))||isNaN(s=+this._y.call(null,t)))return this;var e,n,r,i,o,s,l,a,u,c,f,h,p=this._root,d=this._x0,g=this._y0,v=this._x1,y=this._y1;if(!p)return this;if(p.length)for(;;){if((u=o>=(l=(d+v)/2))?d=l:v=l,(c=s>=(a=(g+y)/2))?g=a:y=a,e=p,!(p=p[f=c<<1|u]))return this;if(!p.length)break;(e[f+1&3]||e[f+2&3]||e[f+3&3])&&(n=e,h=f)}for(;p.data!==t;)if(r=p,!(p=p.next))return this;return(i=p.next)&&delete p.next,r?(i?r.next=i:delete r.next,this):e?(i?e[f]=i:delete e[f],(p=e[0]||e[1]||e[2]||e[3])&&p===(e[3]||e[2]||e[1]||e[0])&&!p.length&&(n?n[h]=p:this._root=p),this):(this._root=i,this)},cu.removeAll=function(t){for(var e=0,n=t.length;e<n;++e)this.remove(t[e]);return this},cu.root=function(){return this._root},cu.size=function(){var t=0;return this.visit((function(e){if(!e.length)do{++t}while(e=e.next)})),t},cu.visit=function(t){var e,n,r,i,o,s,l=[],a=this._root;for(a&&l.push(new iu(a,this._x0,this._y0,this._x1,this._y1));e=l.pop();)if(!t(a=e.node,r=e.x0,i=e.y0,o=e.x1,s=e.y1)&&a.length){var u=(r+o)/2,c=(i+s)/2;(n=a[3])&&l.push(new iu(n,u,c,o,s)),(n=a[2])&&l.push(new iu(n,r,c,u,s)),(n=a[1])&&l.push(new iu(n,u,i,o,c)),(n=a[0])&&l.push(new iu(n,r,i,u,c))}return this},cu.visitAfter=function(t){var e,n=[],r=[];for(this._root&&n.push(new iu(this._root,this._x0,this._y0,this._x1,this._y1));e=n.pop();){var i=e.node;if(i.length){var o,s=e.x0,l=e.y0,a=e.x1,u=e.y1,c=(s+a)/2,f=(l+u)/2;(o=i[0])&&n.push(new iu(o,s,l,c,f)),(o=i[1])&&n.push(new iu(o,c,l,a,f)),(o=i[2])&&n.push(new iu(o,s,f,c,u)),(o=i[3])&&n.push(new iu(o,c,f,a,u))}r.push(e)}for(;e=r.pop();)t(e.node,e.x0,e.y0,e.x1,e.y1);return this},cu.x=function(t){return arguments.length?(this._x=t,this):this._x},cu.y=function(t){return arguments.length?(this._y=t,this):this._y};const mu=window.location.pathname.match(/.*(?:base|clean)\//)[0],_u=window.location.pathname.match(/\/([^\/]*)\/$/)[1],xu={key:0,class:"absolute border border-neutral-700 bg-white top-0 right-10"},bu={class:"p-2 pt-3 text-center"},wu=zr("Pontes: "),Su={class:"font-semibold"},ku={class:"bg-slate-200 max-h-60 overflow-auto"},Mu={key:0,class:"py-2 px-3 border-t border-neutral-400 text-center"},Eu=[Dr("span",{class:"text-sm flex-grow"},"Carregando...",-1)],Au={class:"py-2 px-3 border-t border-neutral-400 flex items-center"},Nu={class:"text-sm flex-grow"},Cu=["onClick"],Ou=["href"],$u=[Dr("i",{class:"fas fa-level-up-alt"},null,-1)],Tu={key:2,class:"py-2 px-3 border-t border-neutral-400 text-center"},Lu=[Dr("span",{class:"text-sm flex-grow"},"Sem pontes.",-1)],Pu={props:["node"],emits:["expandNode"],data:()=>({bridges:{},title:null,show:!1,loading:!1}),watch:{node(t){t?(this.title=t.label,this.loading=!0,this.show=!0,fetch(mu+`${t.graph}/bridges/${t.id}/`).then((t=>t.json())).then((t=>{this.bridges=t})).finally((()=>{this.loading=!1}))):this.show=!1}},methods:{expandNode(t,e){fetch(mu+`${t}/${e}/`).then((t=>t.json())).then((n=>{let{entities:r,graph:i,links:o}=n,s=Object.entries(r).map((([e,n])=>({id:e,label:n,graph:t}))),l=i.map((({subject_id:t,relation:e,object_id:n})=>({source:t,target:n,label:e}))),a=Object.entries(o).flatMap((([t,e])=>e.map((e=>({source:t,target:e,label:"="}))))).filter(((t,e,n)=>t===n.find((e=>e.source===t.source&&e.target===t.target||e.source===t.target&&e.target===t.source))));a.push({source:this.node,target:e,label:"bridge"}),this.$emit("expandNode",this.node,{nodes:s,relationshipLinks:l,synonymLinks:a})}))},linkTo:t=>mu+`${t}/`}};var Vu=n(744);const ju=(0,Vu.Z)(Pu,[["render",function(t,e,n,r,i,o){return i.show?(Cr(),Lr("div",xu,[Dr("h1",bu,[wu,Dr("span",Su,u(i.title),1)]),Dr("div",ku,[i.loading?(Cr(),Lr("div",Mu,Eu)):Object.keys(i.bridges).length>0?(Cr(!0),Lr(Sr,{key:1},zn(i.bridges,((t,e)=>(Cr(),Lr("div",Au,[Dr("span",Nu,u(e.replace(".json","")),1),Dr("i",{class:"fas fa-code-branch mx-2",onClick:n=>o.expandNode(e,t)},null,8,Cu),Dr("a",{href:o.linkTo(e),target:"_blank"},$u,8,Ou)])))),256)):(Cr(),Lr("div",Tu,Lu))])])):qr("v-if",!0)}]]),Fu={class:"absolute top-4 left-4"},Ru=[Dr("i",{class:"fas fa-book cursor-pointer"},null,-1)],Uu={class:"absolute bottom-4 left-4"},Du={class:"flex mb-1"},Iu=[Dr("i",{class:"fas fa-sync-alt cursor-pointer"},null,-1)],Bu={class:"flex justify-between mb-1"},zu=zr(" Força - Geral: "),qu=["value"],Xu={class:"flex justify-between mb-1"},Hu=zr(" Força - Sinônimos: "),Yu=["value"],Wu={class:"flex justify-between mb-1"},Gu=zr(" Força - Relações: "),Ku=["value"],Zu={class:"flex justify-between mb-1"},Ju=zr(" Variação de Cores: "),Qu=["value"],tc={class:"flex justify-between mb-1"},ec=zr(" Tamanho do Texto: "),nc=["value"],rc={class:"flex justify-between"},ic=zr(" Raio: "),oc=["value"],sc={props:{documentVisible:Boolean,showText:Boolean,overallStrength:Number,synonymStrength:Number,relationshipStrength:Number,colorVariation:Number,textSize:Number,radius:Number},emits:["reload","update:documentVisible","update:showText","update:overallStrength","update:synonymStrength","update:relationshipStrength","update:colorVariation","update:textSize","update:radius"]},lc=(0,Vu.Z)(sc,[["render",function(t,e,n,r,i,o){return Cr(),Lr(Sr,null,[Dr("div",Fu,[Dr("div",{class:"mx-2",onClick:e[0]||(e[0]=e=>t.$emit("update:documentVisible",!n.documentVisible))},Ru)]),Dr("div",Uu,[Dr("div",Du,[Dr("div",{class:"mx-2",onClick:e[1]||(e[1]=e=>t.$emit("reload"))},Iu),Dr("div",{class:"mx-2",onClick:e[2]||(e[2]=e=>t.$emit("update:showText",!n.showText))},[Dr("i",{class:a(["fas fa-eye cursor-pointer",{"text-gray-500":!n.showText}])},null,2)])]),Dr("label",Bu,[zu,Dr("input",{id:"overall-strength",type:"range",min:"5",max:"200",step:"1",value:n.overallStrength,onChange:e[3]||(e[3]=e=>t.$emit("update:overallStrength",parseFloat(e.target.value)))},null,40,qu)]),Dr("label",Xu,[Hu,Dr("input",{id:"synonym-strength",type:"range",min:"0",max:"3",step:"0.1",value:n.synonymStrength,onChange:e[4]||(e[4]=e=>t.$emit("update:synonymStrength",parseFloat(e.target.value)))},null,40,Yu)]),Dr("label",Wu,[Gu,Dr("input",{id:"relationship-strength",type:"range",min:"0",max:"2",step:"0.1",value:n.relationshipStrength,onChange:e[5]||(e[5]=e=>t.$emit("update:relationshipStrength",parseFloat(e.target.value)))},null,40,Ku)]),Dr("label",Zu,[Ju,Dr("input",{id:"color-variation",type:"range",min:"0",max:"1",step:"0.05",value:n.colorVariation,onChange:e[6]||(e[6]=e=>t.$emit("update:colorVariation",parseFloat(e.target.value)))},null,40,Qu)]),Dr("label",tc,[ec,Dr("input",{id:"radius",type:"range",min:"0.2",max:"2",step:"0.05",value:n.textSize,onChange:e[7]||(e[7]=e=>t.$emit("update:textSize",parseFloat(e.target.value)))},null,40,nc)]),Dr("label",rc,[ic,Dr("input",{id:"radius",type:"range",min:"1",max:"16",step:"1",value:n.radius,onChange:e[8]||(e[8]=e=>t.$emit("update:radius",parseFloat(e.target.value)))},null,40,oc)])])],64)}]]),ac={key:0,class:"absolute bottom-4 right-4 bg-white border-2 rounded-full border-blue-200 px-4 py-2 flex items-center"},uc=["innerHTML"],cc={class:"font-semibold"},fc={props:["el","type"],data:()=>({text:null,prependedSvg:null}),watch:{el(t){switch(this.type){case"node":Za(".red-stroke").classed("red-stroke",!1);let e=Ka(`circle[index="${t.index}"]`).classed("red-stroke",!0);this.text=t.label,this.prependedSvg=`<circle r="8" fill="${e.attr("fill")}" class="node-circle"></circle>`;break;case"synonymLink":Za(".red-stroke").classed("red-stroke",!1),Ka(`line.synonym[index="${t.index}"]`).classed("red-stroke",!0),this.text=`${t.source.label} [${t.label}] ${t.target.label}`,this.prependedSvg=null;break;case"relationshipLink":Za(".red-stroke").classed("red-stroke",!1),Ka(`line.relationship[index="${t.index}"]`).classed("red-stroke",!0),this.text=`${t.source.label} [${t.label}] ${t.target.label}`,this.prependedSvg=null}}}},hc=(0,Vu.Z)(fc,[["render",function(t,e,n,r,i,o){return i.text?(Cr(),Lr("div",ac,[i.prependedSvg?(Cr(),Lr("svg",{key:0,viewBox:"-9 -9 18 18",class:"inline-block w-5 h-5 mr-2",innerHTML:i.prependedSvg},null,8,uc)):qr("v-if",!0),Dr("span",cc,u(i.text),1)])):qr("v-if",!0)}]]),pc={class:"w-1/2 border border-neutral-700 filter-none"},dc=Dr("h1",{class:"p-2 bg-white font-bold text-lg text-center"},"Document",-1),gc={class:"p-4 bg-slate-200"},vc={props:{visible:Boolean},data:()=>({text:null}),mounted(){fetch(mu+`${_u}/document/`).then((t=>t.json())).then((t=>{this.text=t}))},methods:{toggleVisibility(t){t.target===t.currentTarget&&this.$emit("update:visible",!this.visible)}}},yc=(0,Vu.Z)(vc,[["render",function(t,e,n,r,i,o){return function(t,e){const n=Ke;if(null===n)return t;const r=oi(n)||n.proxy,i=t.dirs||(t.dirs=[]);for(let t=0;t<e.length;t++){let[n,o,s,l=f]=e[t];M(n)&&(n={mounted:n,updated:n}),n.deep&&cn(o),i.push({dir:n,instance:r,value:o,oldValue:void 0,arg:s,modifiers:l})}return t}((Cr(),Lr("div",{class:"absolute top-0 left-0 w-full h-full flex justify-center items-center backdrop-blur-sm",onClick:e[0]||(e[0]=t=>o.toggleVisibility(t))},[Dr("div",pc,[dc,Dr("p",gc,u(i.text?i.text:"Carregando..."),1)])],512)),[[Fi,n.visible]])}]]),mc=(t,e)=>{let n={},r=null;const i=/(NE|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-z]{4}-[0-9a-f]{12})-.*/;let o=new Set;return t.forEach((t=>{let e=i.exec(t.id);if(e){let t=e[1];o.add(t)}})),o=Array.from(o).sort(((t,e)=>"NE"===t?-1:"NE"===e?1:0)),r=Wa([0,o.length],Ga),o.forEach(((i,o)=>{let s=t.filter((t=>t.id.startsWith(i))).sort();s.forEach(((t,l)=>{if("NE"===i)n[t.id]="#ffffff";else{let i=o+l*e/s.length;n[t.id]=r(i)}}))})),n},_c={components:{ControlPanel:lc,BridgeManager:ju,Highlight:hc,DocumentModal:yc},data:()=>({title:"",showText:!0,overallStrength:50,synonymStrength:1,relationshipStrength:.2,colorVariation:1,textSize:1,radius:8,nodes:[],relationshipLinks:[],synonymLinks:[],simulation:null,scale:{value:1,event:null},highlighted:{el:null,type:null},bridgeNode:null,documentVisible:!1}),computed:{viewBox(){let t=this.nodes.reduce(((t,e)=>({minX:e.x<t.minX?e.x:t.minX,minY:e.y<t.minY?e.y:t.minY,maxX:e.x>t.maxX?e.x:t.maxX,maxY:e.y>t.maxY?e.y:t.maxY})),{minX:0,minY:0,maxX:0,maxY:0}),e=t.minX-2*this.radius,n=t.minY-2*this.radius;return`${e} ${n} ${t.maxX+2*this.radius-e} ${t.maxY+2*this.radius-n}`},colorSchema(){return mc(this.nodes,this.colorVariation)}},emits:["highlightNode","highlightLink","openBridges","finishReload"],watch:{nodes(){this.runSimulation()},overallStrength(){this.runSimulation()},synonymStrength(){this.runSimulation()},relationshipStrength(){this.runSimulation()},radius(){this.runSimulation()},scale(t,e){!function(t,e,n){let r=Ka("#graph-svg"),i=r.node().parentNode,{offsetWidth:o,offsetHeight:s}=i;if(r.style("width",o*t),r.style("height",s*t),n){let r=t/e,{scrollLeft:o,scrollTop:s}=i,{offsetX:l,offsetY:a}=n,u=l-o,c=a-s;i.scrollLeft=l*r-u,i.scrollTop=a*r-c}}(t.value,e.value,t.event)},reload(t,e){t&&!e&&(this.scale={value:1,event:null},this.fetchGraph(),this.$emit("finishReload"))}},mounted(){this.fetchGraph(),window.select=Ka,window.selectAll=Za},methods:{fetchGraph(){fetch(mu+`${_u}/json/`).then((t=>t.json())).then((t=>{let{document:e,entities:n,graph:r,links:i}=t;this.title=e.split("/").slice(-1)[0].split(".")[0],this.nodes=Object.entries(n).map((([t,e])=>({id:t,label:e,graph:_u}))),this.relationshipLinks=r.map((({subject_id:t,relation:e,object_id:n})=>({source:t,target:n,label:e}))),this.synonymLinks=Object.entries(i).flatMap((([t,e])=>e.map((e=>({source:t,target:e,label:"="}))))).filter(((t,e,n)=>e===n.findIndex((e=>e.source===t.source&&e.target===t.target||e.source===t.target&&e.target===t.source))))}))},runSimulation(){this.simulation?.stop(),this.simulation=function(t){var e,n=1,r=.001,i=1-Math.pow(r,1/300),o=0,s=.6,l=new Map,a=Cs(f),u=gs("tick","end"),c=function(){let t=1;return()=>(t=(1664525*t+1013904223)%Qa)/Qa}();function f(){h(),u.call("tick",e),n<r&&(a.stop(),u.call("end",e))}function h(r){var a,u,c=t.length;void 0===r&&(r=1);for(var f=0;f<r;++f)for(n+=(o-n)*i,l.forEach((function(t){t(n)})),a=0;a<c;++a)null==(u=t[a]).fx?u.x+=u.vx*=s:(u.x=u.fx,u.vx=0),null==u.fy?u.y+=u.vy*=s:(u.y=u.fy,u.vy=0);return e}function p(){for(var e,n=0,r=t.length;n<r;++n){if((e=t[n]).index=n,null!=e.fx&&(e.x=e.fx),null!=e.fy&&(e.y=e.fy),isNaN(e.x)||isNaN(e.y)){var i=10*Math.sqrt(.5+n),o=n*nu;e.x=i*Math.cos(o),e.y=i*Math.sin(o)}(isNaN(e.vx)||isNaN(e.vy))&&(e.vx=e.vy=0)}}function d(e){return e.initialize&&e.initialize(t,c),e}return null==t&&(t=[]),p(),e={tick:h,restart:function(){return a.restart(f),e},stop:function(){return a.stop(),e},nodes:function(n){return arguments.length?(t=n,p(),l.forEach(d),e):t},alpha:function(t){return arguments.length?(n=+t,e):n},alphaMin:function(t){return arguments.length?(r=+t,e):r},alphaDecay:function(t){return arguments.length?(i=+t,e):+i},alphaTarget:function(t){return arguments.length?(o=+t,e):o},velocityDecay:function(t){return arguments.length?(s=1-t,e):1-s},randomSource:function(t){return arguments.length?(c=t,l.forEach(d),e):c},force:function(t,n){return arguments.length>1?(null==n?l.delete(t):l.set(t,d(n)),e):l.get(t)},find:function(e,n,r){var i,o,s,l,a,u=0,c=t.length;for(null==r?r=1/0:r*=r,u=0;u<c;++u)(s=(i=e-(l=t[u]).x)*i+(o=n-l.y)*o)<r&&(a=l,r=s);return a},on:function(t,n){return arguments.length>1?(u.on(t,n),e):u.on(t)}}}(this.nodes).force("charge",function(){var t,e,n,r,i,o=fu(-30),s=1,l=1/0,a=.81;function u(n){var i,o=t.length,s=lu(t,tu,eu).visitAfter(f);for(r=n,i=0;i<o;++i)e=t[i],s.visit(h)}function c(){if(t){var e,n,r=t.length;for(i=new Array(r),e=0;e<r;++e)n=t[e],i[n.index]=+o(n,e,t)}}function f(t){var e,n,r,o,s,l=0,a=0;if(t.length){for(r=o=s=0;s<4;++s)(e=t[s])&&(n=Math.abs(e.value))&&(l+=e.value,a+=n,r+=n*e.x,o+=n*e.y);t.x=r/a,t.y=o/a}else{(e=t).x=e.data.x,e.y=e.data.y;do{l+=i[e.data.index]}while(e=e.next)}t.value=l}function h(t,o,u,c){if(!t.value)return!0;var f=t.x-e.x,h=t.y-e.y,p=c-o,d=f*f+h*h;if(p*p/a<d)return d<l&&(0===f&&(d+=(f=hu(n))*f),0===h&&(d+=(h=hu(n))*h),d<s&&(d=Math.sqrt(s*d)),e.vx+=f*t.value*r/d,e.vy+=h*t.value*r/d),!0;if(!(t.length||d>=l)){(t.data!==e||t.next)&&(0===f&&(d+=(f=hu(n))*f),0===h&&(d+=(h=hu(n))*h),d<s&&(d=Math.sqrt(s*d)));do{t.data!==e&&(p=i[t.data.index]*r/d,e.vx+=f*p,e.vy+=h*p)}while(t=t.next)}}return u.initialize=function(e,r){t=e,n=r,c()},u.strength=function(t){return arguments.length?(o="function"==typeof t?t:fu(+t),c(),u):o},u.distanceMin=function(t){return arguments.length?(s=t*t,u):Math.sqrt(s)},u.distanceMax=function(t){return arguments.length?(l=t*t,u):Math.sqrt(l)},u.theta=function(t){return arguments.length?(a=t*t,u):Math.sqrt(a)},u}().strength(-this.overallStrength)).force("collision",function(t){var e,n,r,i=1,o=1;function s(){for(var t,s,a,u,c,f,h,p=e.length,d=0;d<o;++d)for(s=lu(e,pu,du).visitAfter(l),t=0;t<p;++t)a=e[t],f=n[a.index],h=f*f,u=a.x+a.vx,c=a.y+a.vy,s.visit(g);function g(t,e,n,o,s){var l=t.data,p=t.r,d=f+p;if(!l)return e>u+d||o<u-d||n>c+d||s<c-d;if(l.index>a.index){var g=u-l.x-l.vx,v=c-l.y-l.vy,y=g*g+v*v;y<d*d&&(0===g&&(y+=(g=hu(r))*g),0===v&&(y+=(v=hu(r))*v),y=(d-(y=Math.sqrt(y)))/y*i,a.vx+=(g*=y)*(d=(p*=p)/(h+p)),a.vy+=(v*=y)*d,l.vx-=g*(d=1-d),l.vy-=v*d)}}}function l(t){if(t.data)return t.r=n[t.data.index];for(var e=t.r=0;e<4;++e)t[e]&&t[e].r>t.r&&(t.r=t[e].r)}function a(){if(e){var r,i,o=e.length;for(n=new Array(o),r=0;r<o;++r)i=e[r],n[i.index]=+t(i,r,e)}}return"function"!=typeof t&&(t=fu(null==t?1:+t)),s.initialize=function(t,n){e=t,r=n,a()},s.iterations=function(t){return arguments.length?(o=+t,s):o},s.strength=function(t){return arguments.length?(i=+t,s):i},s.radius=function(e){return arguments.length?(t="function"==typeof e?e:fu(+e),a(),s):t},s}().radius(this.radius)).force("synonymLink",yu(this.synonymLinks).id((t=>t.id)).strength(this.synonymStrength)).force("relationshipLinks",yu(this.relationshipLinks).id((t=>t.id)).strength(this.relationshipStrength))},updateScale(t){t.preventDefault(),this.scale={value:Math.min(Math.max(1,this.scale.value+-.005*t.deltaY),50),event:t}},navigate(t){let e=Ka("#graph-svg").node().parentNode,n=e.scrollTop,r=e.scrollLeft,i=t.clientX,o=t.clientY;function s(t){e.scrollLeft=r-(t.clientX-i),e.scrollTop=n-(t.clientY-o)}e.style.cursor="grabbing",e.style.userSelect="none",document.addEventListener("mousemove",s),document.addEventListener("mouseup",(function t(n){document.removeEventListener("mousemove",s),document.removeEventListener("mouseup",t),e.style.cursor="default",e.style.removeProperty("user-select")}))},expandNode(t,e){let{nodes:n,relationshipLinks:r,synonymLinks:i}=e;n.forEach((e=>{e.x=t.x,e.y=t.y}));let o=n.filter((t=>!this.nodes.some((e=>e.id===t.id)))),s=r.filter((t=>!this.relationshipLinks.some((e=>e.source.id===t.source&&e.target.id===t.target)))),l=i.filter((t=>!this.synonymLinks.some((e=>e.source.id===t.source&&e.target.id===t.target))));this.nodes=[...this.nodes,...o],this.relationshipLinks=[...this.relationshipLinks,...s],this.synonymLinks=[...this.synonymLinks,...l],this.colorVariation=0}}},xc={components:{Graph:(0,Vu.Z)(_c,[["render",function(t,e,n,r,o,s){const l=Dn("ControlPanel"),a=Dn("BridgeManager"),c=Dn("Highlight"),f=Dn("DocumentModal");return Cr(),Lr(Sr,null,[Dr("div",Ii,[(Cr(),Lr("svg",{id:"graph-svg",class:"graph-svg",viewBox:s.viewBox,onWheel:e[0]||(e[0]=t=>s.updateScale(t)),onMousedown:e[1]||(e[1]=t=>s.navigate(t)),onDblclick:e[2]||(e[2]=t=>o.bridgeNode=null)},[(Cr(!0),Lr(Sr,null,zn(o.synonymLinks,(t=>(Cr(),Lr("line",{class:"synonym",x1:t.source.x,y1:t.source.y,x2:t.target.x,y2:t.target.y,index:t.index,onMouseover:e=>o.highlighted={el:t,type:"synonymLink"}},null,40,zi)))),256)),(Cr(!0),Lr(Sr,null,zn(o.relationshipLinks,(t=>(Cr(),Lr("line",{class:"relationship",x1:t.source.x,y1:t.source.y,x2:t.target.x,y2:t.target.y,index:t.index,onMouseover:e=>o.highlighted={el:t,type:"relationshipLink"}},null,40,qi)))),256)),(Cr(!0),Lr(Sr,null,zn(o.nodes,(t=>(Cr(),Lr("g",{transform:`translate(${t.x}, ${t.y})`},[Dr("circle",{class:"node-circle",r:o.radius,fill:s.colorSchema[t.id],index:t.index,onMouseover:e=>o.highlighted={el:t,type:"node"},onClick:e=>o.bridgeNode=t},null,40,Hi),o.showText?(Cr(),Lr("text",{key:0,class:"node-text",style:i({fontSize:o.textSize+"em"})},u(t.label),5)):qr("v-if",!0)],8,Xi)))),256))],40,Bi))]),Ir(l,{"document-visible":o.documentVisible,"onUpdate:document-visible":e[3]||(e[3]=t=>o.documentVisible=t),"show-text":o.showText,"onUpdate:show-text":e[4]||(e[4]=t=>o.showText=t),"overall-strength":o.overallStrength,"onUpdate:overall-strength":e[5]||(e[5]=t=>o.overallStrength=t),"synonym-strength":o.synonymStrength,"onUpdate:synonym-strength":e[6]||(e[6]=t=>o.synonymStrength=t),"relationship-strength":o.relationshipStrength,"onUpdate:relationship-strength":e[7]||(e[7]=t=>o.relationshipStrength=t),"color-variation":o.colorVariation,"onUpdate:color-variation":e[8]||(e[8]=t=>o.colorVariation=t),"text-size":o.textSize,"onUpdate:text-size":e[9]||(e[9]=t=>o.textSize=t),radius:o.radius,"onUpdate:radius":e[10]||(e[10]=t=>o.radius=t),onReload:s.fetchGraph},null,8,["document-visible","show-text","overall-strength","synonym-strength","relationship-strength","color-variation","text-size","radius","onReload"]),Ir(a,{node:o.bridgeNode,onExpandNode:s.expandNode},null,8,["node","onExpandNode"]),Ir(c,{el:o.highlighted.el,type:o.highlighted.type},null,8,["el","type"]),Ir(f,{visible:o.documentVisible,"onUpdate:visible":e[11]||(e[11]=t=>o.documentVisible=t)},null,8,["visible"])],64)}]])},data:()=>({})};((...t)=>{const e=(Di||(Di=xr(Ui))).createApp(...t),{mount:n}=e;return e.mount=t=>{const r=function(t){return E(t)?document.querySelector(t):t}(t);if(!r)return;const i=e._component;M(i)||i.render||i.template||(i.template=r.innerHTML),r.innerHTML="";const o=n(r,!1,r instanceof SVGElement);return r instanceof Element&&(r.removeAttribute("v-cloak"),r.setAttribute("data-v-app","")),o},e})((0,Vu.Z)(xc,[["render",function(t,e,n,r,i,o){const s=Dn("Graph");return Cr(),Pr(s)}]])).mount("#graph-container")})()})();
\ No newline at end of file
+(()=>{"use strict";var t={744:(t,e)=>{e.Z=(t,e)=>{const n=t.__vccOpts||t;for(const[t,r]of e)n[t]=r;return n}}},e={};function n(r){var i=e[r];if(void 0!==i)return i.exports;var o=e[r]={exports:{}};return t[r](o,o.exports,n),o.exports}n.g=function(){if("object"==typeof globalThis)return globalThis;try{return this||new Function("return this")()}catch(t){if("object"==typeof window)return window}}(),(()=>{function t(t,e){const n=Object.create(null),r=t.split(",");for(let t=0;t<r.length;t++)n[r[t]]=!0;return e?t=>!!n[t.toLowerCase()]:t=>!!n[t]}const e=t("itemscope,allowfullscreen,formnovalidate,ismap,nomodule,novalidate,readonly");function r(t){return!!t||""===t}function i(t){if(w(t)){const e={};for(let n=0;n<t.length;n++){const r=t[n],o=E(r)?l(r):i(r);if(o)for(const t in o)e[t]=o[t]}return e}return E(t)||N(t)?t:void 0}const o=/;(?![^(]*\))/g,s=/:(.+)/;function l(t){const e={};return t.split(o).forEach((t=>{if(t){const n=t.split(s);n.length>1&&(e[n[0].trim()]=n[1].trim())}})),e}function a(t){let e="";if(E(t))e=t;else if(w(t))for(let n=0;n<t.length;n++){const r=a(t[n]);r&&(e+=r+" ")}else if(N(t))for(const n in t)t[n]&&(e+=n+" ");return e.trim()}const u=t=>E(t)?t:null==t?"":w(t)||N(t)&&(t.toString===O||!M(t.toString))?JSON.stringify(t,c,2):String(t),c=(t,e)=>e&&e.__v_isRef?c(t,e.value):S(e)?{[`Map(${e.size})`]:[...e.entries()].reduce(((t,[e,n])=>(t[`${e} =>`]=n,t)),{})}:k(e)?{[`Set(${e.size})`]:[...e.values()]}:!N(e)||w(e)||T(e)?e:String(e),f={},h=[],p=()=>{},d=()=>!1,g=/^on[^a-z]/,v=t=>g.test(t),y=t=>t.startsWith("onUpdate:"),m=Object.assign,_=(t,e)=>{const n=t.indexOf(e);n>-1&&t.splice(n,1)},x=Object.prototype.hasOwnProperty,b=(t,e)=>x.call(t,e),w=Array.isArray,S=t=>"[object Map]"===$(t),k=t=>"[object Set]"===$(t),M=t=>"function"==typeof t,E=t=>"string"==typeof t,A=t=>"symbol"==typeof t,N=t=>null!==t&&"object"==typeof t,C=t=>N(t)&&M(t.then)&&M(t.catch),O=Object.prototype.toString,$=t=>O.call(t),T=t=>"[object Object]"===$(t),L=t=>E(t)&&"NaN"!==t&&"-"!==t[0]&&""+parseInt(t,10)===t,P=t(",key,ref,ref_for,ref_key,onVnodeBeforeMount,onVnodeMounted,onVnodeBeforeUpdate,onVnodeUpdated,onVnodeBeforeUnmount,onVnodeUnmounted"),V=t=>{const e=Object.create(null);return n=>e[n]||(e[n]=t(n))},j=/-(\w)/g,F=V((t=>t.replace(j,((t,e)=>e?e.toUpperCase():"")))),R=/\B([A-Z])/g,U=V((t=>t.replace(R,"-$1").toLowerCase())),D=V((t=>t.charAt(0).toUpperCase()+t.slice(1))),I=V((t=>t?`on${D(t)}`:"")),B=(t,e)=>!Object.is(t,e),z=(t,e)=>{for(let n=0;n<t.length;n++)t[n](e)},q=(t,e,n)=>{Object.defineProperty(t,e,{configurable:!0,enumerable:!1,value:n})},X=t=>{const e=parseFloat(t);return isNaN(e)?t:e};let H;const Y=()=>H||(H="undefined"!=typeof globalThis?globalThis:"undefined"!=typeof self?self:"undefined"!=typeof window?window:void 0!==n.g?n.g:{});let W;class G{constructor(t=!1){this.active=!0,this.effects=[],this.cleanups=[],!t&&W&&(this.parent=W,this.index=(W.scopes||(W.scopes=[])).push(this)-1)}run(t){if(this.active){const e=W;try{return W=this,t()}finally{W=e}}}on(){W=this}off(){W=this.parent}stop(t){if(this.active){let e,n;for(e=0,n=this.effects.length;e<n;e++)this.effects[e].stop();for(e=0,n=this.cleanups.length;e<n;e++)this.cleanups[e]();if(this.scopes)for(e=0,n=this.scopes.length;e<n;e++)this.scopes[e].stop(!0);if(this.parent&&!t){const t=this.parent.scopes.pop();t&&t!==this&&(this.parent.scopes[this.index]=t,t.index=this.index)}this.active=!1}}}const K=t=>{const e=new Set(t);return e.w=0,e.n=0,e},Z=t=>(t.w&nt)>0,J=t=>(t.n&nt)>0,Q=new WeakMap;let tt,et=0,nt=1;const rt=Symbol(""),it=Symbol("");class ot{constructor(t,e=null,n){this.fn=t,this.scheduler=e,this.active=!0,this.deps=[],this.parent=void 0,function(t,e=W){e&&e.active&&e.effects.push(t)}(this,n)}run(){if(!this.active)return this.fn();let t=tt,e=lt;for(;t;){if(t===this)return;t=t.parent}try{return this.parent=tt,tt=this,lt=!0,nt=1<<++et,et<=30?(({deps:t})=>{if(t.length)for(let e=0;e<t.length;e++)t[e].w|=nt})(this):st(this),this.fn()}finally{et<=30&&(t=>{const{deps:e}=t;if(e.length){let n=0;for(let r=0;r<e.length;r++){const i=e[r];Z(i)&&!J(i)?i.delete(t):e[n++]=i,i.w&=~nt,i.n&=~nt}e.length=n}})(this),nt=1<<--et,tt=this.parent,lt=e,this.parent=void 0,this.deferStop&&this.stop()}}stop(){tt===this?this.deferStop=!0:this.active&&(st(this),this.onStop&&this.onStop(),this.active=!1)}}function st(t){const{deps:e}=t;if(e.length){for(let n=0;n<e.length;n++)e[n].delete(t);e.length=0}}let lt=!0;const at=[];function ut(){at.push(lt),lt=!1}function ct(){const t=at.pop();lt=void 0===t||t}function ft(t,e,n){if(lt&&tt){let e=Q.get(t);e||Q.set(t,e=new Map);let r=e.get(n);r||e.set(n,r=K()),ht(r)}}function ht(t,e){let n=!1;et<=30?J(t)||(t.n|=nt,n=!Z(t)):n=!t.has(tt),n&&(t.add(tt),tt.deps.push(t))}function pt(t,e,n,r,i,o){const s=Q.get(t);if(!s)return;let l=[];if("clear"===e)l=[...s.values()];else if("length"===n&&w(t))s.forEach(((t,e)=>{("length"===e||e>=r)&&l.push(t)}));else switch(void 0!==n&&l.push(s.get(n)),e){case"add":w(t)?L(n)&&l.push(s.get("length")):(l.push(s.get(rt)),S(t)&&l.push(s.get(it)));break;case"delete":w(t)||(l.push(s.get(rt)),S(t)&&l.push(s.get(it)));break;case"set":S(t)&&l.push(s.get(rt))}if(1===l.length)l[0]&&dt(l[0]);else{const t=[];for(const e of l)e&&t.push(...e);dt(K(t))}}function dt(t,e){const n=w(t)?t:[...t];for(const t of n)t.computed&&gt(t);for(const t of n)t.computed||gt(t)}function gt(t,e){(t!==tt||t.allowRecurse)&&(t.scheduler?t.scheduler():t.run())}const vt=t("__proto__,__v_isRef,__isVue"),yt=new Set(Object.getOwnPropertyNames(Symbol).filter((t=>"arguments"!==t&&"caller"!==t)).map((t=>Symbol[t])).filter(A)),mt=St(),_t=St(!1,!0),xt=St(!0),bt=wt();function wt(){const t={};return["includes","indexOf","lastIndexOf"].forEach((e=>{t[e]=function(...t){const n=se(this);for(let t=0,e=this.length;t<e;t++)ft(n,0,t+"");const r=n[e](...t);return-1===r||!1===r?n[e](...t.map(se)):r}})),["push","pop","shift","unshift","splice"].forEach((e=>{t[e]=function(...t){ut();const n=se(this)[e].apply(this,t);return ct(),n}})),t}function St(t=!1,e=!1){return function(n,r,i){if("__v_isReactive"===r)return!t;if("__v_isReadonly"===r)return t;if("__v_isShallow"===r)return e;if("__v_raw"===r&&i===(t?e?Jt:Zt:e?Kt:Gt).get(n))return n;const o=w(n);if(!t&&o&&b(bt,r))return Reflect.get(bt,r,i);const s=Reflect.get(n,r,i);return(A(r)?yt.has(r):vt(r))?s:(t||ft(n,0,r),e?s:ce(s)?o&&L(r)?s:s.value:N(s)?t?te(s):Qt(s):s)}}function kt(t=!1){return function(e,n,r,i){let o=e[n];if(re(o)&&ce(o)&&!ce(r))return!1;if(!t&&!re(r)&&(ie(r)||(r=se(r),o=se(o)),!w(e)&&ce(o)&&!ce(r)))return o.value=r,!0;const s=w(e)&&L(n)?Number(n)<e.length:b(e,n),l=Reflect.set(e,n,r,i);return e===se(i)&&(s?B(r,o)&&pt(e,"set",n,r):pt(e,"add",n,r)),l}}const Mt={get:mt,set:kt(),deleteProperty:function(t,e){const n=b(t,e),r=(t[e],Reflect.deleteProperty(t,e));return r&&n&&pt(t,"delete",e,void 0),r},has:function(t,e){const n=Reflect.has(t,e);return A(e)&&yt.has(e)||ft(t,0,e),n},ownKeys:function(t){return ft(t,0,w(t)?"length":rt),Reflect.ownKeys(t)}},Et={get:xt,set:(t,e)=>!0,deleteProperty:(t,e)=>!0},At=m({},Mt,{get:_t,set:kt(!0)}),Nt=t=>t,Ct=t=>Reflect.getPrototypeOf(t);function Ot(t,e,n=!1,r=!1){const i=se(t=t.__v_raw),o=se(e);n||(e!==o&&ft(i,0,e),ft(i,0,o));const{has:s}=Ct(i),l=r?Nt:n?ue:ae;return s.call(i,e)?l(t.get(e)):s.call(i,o)?l(t.get(o)):void(t!==i&&t.get(e))}function $t(t,e=!1){const n=this.__v_raw,r=se(n),i=se(t);return e||(t!==i&&ft(r,0,t),ft(r,0,i)),t===i?n.has(t):n.has(t)||n.has(i)}function Tt(t,e=!1){return t=t.__v_raw,!e&&ft(se(t),0,rt),Reflect.get(t,"size",t)}function Lt(t){t=se(t);const e=se(this);return Ct(e).has.call(e,t)||(e.add(t),pt(e,"add",t,t)),this}function Pt(t,e){e=se(e);const n=se(this),{has:r,get:i}=Ct(n);let o=r.call(n,t);o||(t=se(t),o=r.call(n,t));const s=i.call(n,t);return n.set(t,e),o?B(e,s)&&pt(n,"set",t,e):pt(n,"add",t,e),this}function Vt(t){const e=se(this),{has:n,get:r}=Ct(e);let i=n.call(e,t);i||(t=se(t),i=n.call(e,t)),r&&r.call(e,t);const o=e.delete(t);return i&&pt(e,"delete",t,void 0),o}function jt(){const t=se(this),e=0!==t.size,n=t.clear();return e&&pt(t,"clear",void 0,void 0),n}function Ft(t,e){return function(n,r){const i=this,o=i.__v_raw,s=se(o),l=e?Nt:t?ue:ae;return!t&&ft(s,0,rt),o.forEach(((t,e)=>n.call(r,l(t),l(e),i)))}}function Rt(t,e,n){return function(...r){const i=this.__v_raw,o=se(i),s=S(o),l="entries"===t||t===Symbol.iterator&&s,a="keys"===t&&s,u=i[t](...r),c=n?Nt:e?ue:ae;return!e&&ft(o,0,a?it:rt),{next(){const{value:t,done:e}=u.next();return e?{value:t,done:e}:{value:l?[c(t[0]),c(t[1])]:c(t),done:e}},[Symbol.iterator](){return this}}}}function Ut(t){return function(...e){return"delete"!==t&&this}}function Dt(){const t={get(t){return Ot(this,t)},get size(){return Tt(this)},has:$t,add:Lt,set:Pt,delete:Vt,clear:jt,forEach:Ft(!1,!1)},e={get(t){return Ot(this,t,!1,!0)},get size(){return Tt(this)},has:$t,add:Lt,set:Pt,delete:Vt,clear:jt,forEach:Ft(!1,!0)},n={get(t){return Ot(this,t,!0)},get size(){return Tt(this,!0)},has(t){return $t.call(this,t,!0)},add:Ut("add"),set:Ut("set"),delete:Ut("delete"),clear:Ut("clear"),forEach:Ft(!0,!1)},r={get(t){return Ot(this,t,!0,!0)},get size(){return Tt(this,!0)},has(t){return $t.call(this,t,!0)},add:Ut("add"),set:Ut("set"),delete:Ut("delete"),clear:Ut("clear"),forEach:Ft(!0,!0)};return["keys","values","entries",Symbol.iterator].forEach((i=>{t[i]=Rt(i,!1,!1),n[i]=Rt(i,!0,!1),e[i]=Rt(i,!1,!0),r[i]=Rt(i,!0,!0)})),[t,n,e,r]}const[It,Bt,zt,qt]=Dt();function Xt(t,e){const n=e?t?qt:zt:t?Bt:It;return(e,r,i)=>"__v_isReactive"===r?!t:"__v_isReadonly"===r?t:"__v_raw"===r?e:Reflect.get(b(n,r)&&r in e?n:e,r,i)}const Ht={get:Xt(!1,!1)},Yt={get:Xt(!1,!0)},Wt={get:Xt(!0,!1)},Gt=new WeakMap,Kt=new WeakMap,Zt=new WeakMap,Jt=new WeakMap;function Qt(t){return re(t)?t:ee(t,!1,Mt,Ht,Gt)}function te(t){return ee(t,!0,Et,Wt,Zt)}function ee(t,e,n,r,i){if(!N(t))return t;if(t.__v_raw&&(!e||!t.__v_isReactive))return t;const o=i.get(t);if(o)return o;const s=function(t){return t.__v_skip||!Object.isExtensible(t)?0:function(t){switch(t){case"Object":case"Array":return 1;case"Map":case"Set":case"WeakMap":case"WeakSet":return 2;default:return 0}}((t=>$(t).slice(8,-1))(t))}(t);if(0===s)return t;const l=new Proxy(t,2===s?r:n);return i.set(t,l),l}function ne(t){return re(t)?ne(t.__v_raw):!(!t||!t.__v_isReactive)}function re(t){return!(!t||!t.__v_isReadonly)}function ie(t){return!(!t||!t.__v_isShallow)}function oe(t){return ne(t)||re(t)}function se(t){const e=t&&t.__v_raw;return e?se(e):t}function le(t){return q(t,"__v_skip",!0),t}const ae=t=>N(t)?Qt(t):t,ue=t=>N(t)?te(t):t;function ce(t){return!(!t||!0!==t.__v_isRef)}const fe={get:(t,e,n)=>{return ce(r=Reflect.get(t,e,n))?r.value:r;var r},set:(t,e,n,r)=>{const i=t[e];return ce(i)&&!ce(n)?(i.value=n,!0):Reflect.set(t,e,n,r)}};function he(t){return ne(t)?t:new Proxy(t,fe)}class pe{constructor(t,e,n,r){this._setter=e,this.dep=void 0,this.__v_isRef=!0,this._dirty=!0,this.effect=new ot(t,(()=>{var t;this._dirty||(this._dirty=!0,(t=se(t=this)).dep&&dt(t.dep))})),this.effect.computed=this,this.effect.active=this._cacheable=!r,this.__v_isReadonly=n}get value(){const t=se(this);return e=t,lt&&tt&&ht((e=se(e)).dep||(e.dep=K())),!t._dirty&&t._cacheable||(t._dirty=!1,t._value=t.effect.run()),t._value;var e}set value(t){this._setter(t)}}function de(t,e,n,r){let i;try{i=r?t(...r):t()}catch(t){ve(t,e,n)}return i}function ge(t,e,n,r){if(M(t)){const i=de(t,e,n,r);return i&&C(i)&&i.catch((t=>{ve(t,e,n)})),i}const i=[];for(let o=0;o<t.length;o++)i.push(ge(t[o],e,n,r));return i}function ve(t,e,n,r=!0){if(e&&e.vnode,e){let r=e.parent;const i=e.proxy,o=n;for(;r;){const e=r.ec;if(e)for(let n=0;n<e.length;n++)if(!1===e[n](t,i,o))return;r=r.parent}const s=e.appContext.config.errorHandler;if(s)return void de(s,null,10,[t,i,o])}!function(t,e,n,r=!0){console.error(t)}(t,0,0,r)}let ye=!1,me=!1;const _e=[];let xe=0;const be=[];let we=null,Se=0;const ke=[];let Me=null,Ee=0;const Ae=Promise.resolve();let Ne=null,Ce=null;function Oe(t){const e=Ne||Ae;return t?e.then(this?t.bind(this):t):e}function $e(t){_e.length&&_e.includes(t,ye&&t.allowRecurse?xe+1:xe)||t===Ce||(null==t.id?_e.push(t):_e.splice(function(t){let e=xe+1,n=_e.length;for(;e<n;){const r=e+n>>>1;je(_e[r])<t?e=r+1:n=r}return e}(t.id),0,t),Te())}function Te(){ye||me||(me=!0,Ne=Ae.then(Fe))}function Le(t,e,n,r){w(t)?n.push(...t):e&&e.includes(t,t.allowRecurse?r+1:r)||n.push(t),Te()}function Pe(t,e=null){if(be.length){for(Ce=e,we=[...new Set(be)],be.length=0,Se=0;Se<we.length;Se++)we[Se]();we=null,Se=0,Ce=null,Pe(t,e)}}function Ve(t){if(Pe(),ke.length){const t=[...new Set(ke)];if(ke.length=0,Me)return void Me.push(...t);for(Me=t,Me.sort(((t,e)=>je(t)-je(e))),Ee=0;Ee<Me.length;Ee++)Me[Ee]();Me=null,Ee=0}}const je=t=>null==t.id?1/0:t.id;function Fe(t){me=!1,ye=!0,Pe(t),_e.sort(((t,e)=>je(t)-je(e)));try{for(xe=0;xe<_e.length;xe++){const t=_e[xe];t&&!1!==t.active&&de(t,null,14)}}finally{xe=0,_e.length=0,Ve(),ye=!1,Ne=null,(_e.length||be.length||ke.length)&&Fe(t)}}new Set,new Map;let Re,Ue=[],De=!1;function Ie(t,...e){Re?Re.emit(t,...e):De||Ue.push({event:t,args:e})}function Be(t,e){var n,r;Re=t,Re?(Re.enabled=!0,Ue.forEach((({event:t,args:e})=>Re.emit(t,...e))),Ue=[]):"undefined"!=typeof window&&window.HTMLElement&&!(null===(r=null===(n=window.navigator)||void 0===n?void 0:n.userAgent)||void 0===r?void 0:r.includes("jsdom"))?((e.__VUE_DEVTOOLS_HOOK_REPLAY__=e.__VUE_DEVTOOLS_HOOK_REPLAY__||[]).push((t=>{Be(t,e)})),setTimeout((()=>{Re||(e.__VUE_DEVTOOLS_HOOK_REPLAY__=null,De=!0,Ue=[])}),3e3)):(De=!0,Ue=[])}const ze=He("component:added"),qe=He("component:updated"),Xe=He("component:removed");function He(t){return e=>{Ie(t,e.appContext.app,e.uid,e.parent?e.parent.uid:void 0,e)}}function Ye(t,e,...n){if(t.isUnmounted)return;const r=t.vnode.props||f;let i=n;const o=e.startsWith("update:"),s=o&&e.slice(7);if(s&&s in r){const t=`${"modelValue"===s?"model":s}Modifiers`,{number:e,trim:o}=r[t]||f;o&&(i=n.map((t=>t.trim()))),e&&(i=n.map(X))}let l;__VUE_PROD_DEVTOOLS__&&function(t,e,n){Ie("component:emit",t.appContext.app,t,e,n)}(t,e,i);let a=r[l=I(e)]||r[l=I(F(e))];!a&&o&&(a=r[l=I(U(e))]),a&&ge(a,t,6,i);const u=r[l+"Once"];if(u){if(t.emitted){if(t.emitted[l])return}else t.emitted={};t.emitted[l]=!0,ge(u,t,6,i)}}function We(t,e,n=!1){const r=e.emitsCache,i=r.get(t);if(void 0!==i)return i;const o=t.emits;let s={},l=!1;if(__VUE_OPTIONS_API__&&!M(t)){const r=t=>{const n=We(t,e,!0);n&&(l=!0,m(s,n))};!n&&e.mixins.length&&e.mixins.forEach(r),t.extends&&r(t.extends),t.mixins&&t.mixins.forEach(r)}return o||l?(w(o)?o.forEach((t=>s[t]=null)):m(s,o),r.set(t,s),s):(r.set(t,null),null)}function Ge(t,e){return!(!t||!v(e))&&(e=e.slice(2).replace(/Once$/,""),b(t,e[0].toLowerCase()+e.slice(1))||b(t,U(e))||b(t,e))}let Ke=null,Ze=null;function Je(t){const e=Ke;return Ke=t,Ze=t&&t.type.__scopeId||null,e}function Qe(t){const{type:e,vnode:n,proxy:r,withProxy:i,props:o,propsOptions:[s],slots:l,attrs:a,emit:u,render:c,renderCache:f,data:h,setupState:p,ctx:d,inheritAttrs:g}=t;let v,m;const _=Je(t);try{if(4&n.shapeFlag){const t=i||r;v=Xr(c.call(t,t,f,o,p,h,d)),m=a}else{const t=e;v=Xr(t.length>1?t(o,{attrs:a,slots:l,emit:u}):t(o,null)),m=e.props?a:tn(a)}}catch(e){Ar.length=0,ve(e,t,1),v=Ir(Mr)}let x=v;if(m&&!1!==g){const t=Object.keys(m),{shapeFlag:e}=x;t.length&&7&e&&(s&&t.some(y)&&(m=en(m,s)),x=Br(x,m))}return n.dirs&&(x=Br(x),x.dirs=x.dirs?x.dirs.concat(n.dirs):n.dirs),n.transition&&(x.transition=n.transition),v=x,Je(_),v}const tn=t=>{let e;for(const n in t)("class"===n||"style"===n||v(n))&&((e||(e={}))[n]=t[n]);return e},en=(t,e)=>{const n={};for(const r in t)y(r)&&r.slice(9)in e||(n[r]=t[r]);return n};function nn(t,e,n){const r=Object.keys(e);if(r.length!==Object.keys(t).length)return!0;for(let i=0;i<r.length;i++){const o=r[i];if(e[o]!==t[o]&&!Ge(n,o))return!0}return!1}function rn(t,e,n=!1){const r=Zr||Ke;if(r){const i=null==r.parent?r.vnode.appContext&&r.vnode.appContext.provides:r.parent.provides;if(i&&t in i)return i[t];if(arguments.length>1)return n&&M(e)?e.call(r.proxy):e}}const on={};function sn(t,e,n){return ln(t,e,n)}function ln(t,e,{immediate:n,deep:r,flush:i,onTrack:o,onTrigger:s}=f){const l=Zr;let a,u,c=!1,h=!1;if(ce(t)?(a=()=>t.value,c=ie(t)):ne(t)?(a=()=>t,r=!0):w(t)?(h=!0,c=t.some((t=>ne(t)||ie(t))),a=()=>t.map((t=>ce(t)?t.value:ne(t)?cn(t):M(t)?de(t,l,2):void 0))):a=M(t)?e?()=>de(t,l,2):()=>{if(!l||!l.isUnmounted)return u&&u(),ge(t,l,3,[d])}:p,e&&r){const t=a;a=()=>cn(t())}let d=t=>{u=m.onStop=()=>{de(t,l,4)}};if(ni)return d=p,e?n&&ge(e,l,3,[a(),h?[]:void 0,d]):a(),p;let g=h?[]:on;const v=()=>{if(m.active)if(e){const t=m.run();(r||c||(h?t.some(((t,e)=>B(t,g[e]))):B(t,g)))&&(u&&u(),ge(e,l,3,[t,g===on?void 0:g,d]),g=t)}else m.run()};let y;v.allowRecurse=!!e,y="sync"===i?v:"post"===i?()=>_r(v,l&&l.suspense):()=>function(t){Le(t,we,be,Se)}(v);const m=new ot(a,y);return e?n?v():g=m.run():"post"===i?_r(m.run.bind(m),l&&l.suspense):m.run(),()=>{m.stop(),l&&l.scope&&_(l.scope.effects,m)}}function an(t,e,n){const r=this.proxy,i=E(t)?t.includes(".")?un(r,t):()=>r[t]:t.bind(r,r);let o;M(e)?o=e:(o=e.handler,n=e);const s=Zr;Qr(this);const l=ln(i,o.bind(r),n);return s?Qr(s):ti(),l}function un(t,e){const n=e.split(".");return()=>{let e=t;for(let t=0;t<n.length&&e;t++)e=e[n[t]];return e}}function cn(t,e){if(!N(t)||t.__v_skip)return t;if((e=e||new Set).has(t))return t;if(e.add(t),ce(t))cn(t.value,e);else if(w(t))for(let n=0;n<t.length;n++)cn(t[n],e);else if(k(t)||S(t))t.forEach((t=>{cn(t,e)}));else if(T(t))for(const n in t)cn(t[n],e);return t}const fn=[Function,Array],hn={name:"BaseTransition",props:{mode:String,appear:Boolean,persisted:Boolean,onBeforeEnter:fn,onEnter:fn,onAfterEnter:fn,onEnterCancelled:fn,onBeforeLeave:fn,onLeave:fn,onAfterLeave:fn,onLeaveCancelled:fn,onBeforeAppear:fn,onAppear:fn,onAfterAppear:fn,onAppearCancelled:fn},setup(t,{slots:e}){const n=Jr(),r=function(){const t={isMounted:!1,isLeaving:!1,isUnmounting:!1,leavingVNodes:new Map};return Cn((()=>{t.isMounted=!0})),Tn((()=>{t.isUnmounting=!0})),t}();let i;return()=>{const o=e.default&&_n(e.default(),!0);if(!o||!o.length)return;let s=o[0];if(o.length>1){let t=!1;for(const e of o)if(e.type!==Mr){s=e,t=!0;break}}const l=se(t),{mode:a}=l;if(r.isLeaving)return vn(s);const u=yn(s);if(!u)return vn(s);const c=gn(u,l,r,n);mn(u,c);const f=n.subTree,h=f&&yn(f);let p=!1;const{getTransitionKey:d}=u.type;if(d){const t=d();void 0===i?i=t:t!==i&&(i=t,p=!0)}if(h&&h.type!==Mr&&(!jr(u,h)||p)){const t=gn(h,l,r,n);if(mn(h,t),"out-in"===a)return r.isLeaving=!0,t.afterLeave=()=>{r.isLeaving=!1,n.update()},vn(s);"in-out"===a&&u.type!==Mr&&(t.delayLeave=(t,e,n)=>{dn(r,h)[String(h.key)]=h,t._leaveCb=()=>{e(),t._leaveCb=void 0,delete c.delayedLeave},c.delayedLeave=n})}return s}}},pn=hn;function dn(t,e){const{leavingVNodes:n}=t;let r=n.get(e.type);return r||(r=Object.create(null),n.set(e.type,r)),r}function gn(t,e,n,r){const{appear:i,mode:o,persisted:s=!1,onBeforeEnter:l,onEnter:a,onAfterEnter:u,onEnterCancelled:c,onBeforeLeave:f,onLeave:h,onAfterLeave:p,onLeaveCancelled:d,onBeforeAppear:g,onAppear:v,onAfterAppear:y,onAppearCancelled:m}=e,_=String(t.key),x=dn(n,t),b=(t,e)=>{t&&ge(t,r,9,e)},S=(t,e)=>{const n=e[1];b(t,e),w(t)?t.every((t=>t.length<=1))&&n():t.length<=1&&n()},k={mode:o,persisted:s,beforeEnter(e){let r=l;if(!n.isMounted){if(!i)return;r=g||l}e._leaveCb&&e._leaveCb(!0);const o=x[_];o&&jr(t,o)&&o.el._leaveCb&&o.el._leaveCb(),b(r,[e])},enter(t){let e=a,r=u,o=c;if(!n.isMounted){if(!i)return;e=v||a,r=y||u,o=m||c}let s=!1;const l=t._enterCb=e=>{s||(s=!0,b(e?o:r,[t]),k.delayedLeave&&k.delayedLeave(),t._enterCb=void 0)};e?S(e,[t,l]):l()},leave(e,r){const i=String(t.key);if(e._enterCb&&e._enterCb(!0),n.isUnmounting)return r();b(f,[e]);let o=!1;const s=e._leaveCb=n=>{o||(o=!0,r(),b(n?d:p,[e]),e._leaveCb=void 0,x[i]===t&&delete x[i])};x[i]=t,h?S(h,[e,s]):s()},clone:t=>gn(t,e,n,r)};return k}function vn(t){if(bn(t))return(t=Br(t)).children=null,t}function yn(t){return bn(t)?t.children?t.children[0]:void 0:t}function mn(t,e){6&t.shapeFlag&&t.component?mn(t.component.subTree,e):128&t.shapeFlag?(t.ssContent.transition=e.clone(t.ssContent),t.ssFallback.transition=e.clone(t.ssFallback)):t.transition=e}function _n(t,e=!1,n){let r=[],i=0;for(let o=0;o<t.length;o++){let s=t[o];const l=null==n?s.key:String(n)+String(null!=s.key?s.key:o);s.type===Sr?(128&s.patchFlag&&i++,r=r.concat(_n(s.children,e,l))):(e||s.type!==Mr)&&r.push(null!=l?Br(s,{key:l}):s)}if(i>1)for(let t=0;t<r.length;t++)r[t].patchFlag=-2;return r}const xn=t=>!!t.type.__asyncLoader,bn=t=>t.type.__isKeepAlive;function wn(t,e){kn(t,"a",e)}function Sn(t,e){kn(t,"da",e)}function kn(t,e,n=Zr){const r=t.__wdc||(t.__wdc=()=>{let e=n;for(;e;){if(e.isDeactivated)return;e=e.parent}return t()});if(En(e,r,n),n){let t=n.parent;for(;t&&t.parent;)bn(t.parent.vnode)&&Mn(r,e,n,t),t=t.parent}}function Mn(t,e,n,r){const i=En(e,t,r,!0);Ln((()=>{_(r[e],i)}),n)}function En(t,e,n=Zr,r=!1){if(n){const i=n[t]||(n[t]=[]),o=e.__weh||(e.__weh=(...r)=>{if(n.isUnmounted)return;ut(),Qr(n);const i=ge(e,n,t,r);return ti(),ct(),i});return r?i.unshift(o):i.push(o),o}}RegExp,RegExp;const An=t=>(e,n=Zr)=>(!ni||"sp"===t)&&En(t,e,n),Nn=An("bm"),Cn=An("m"),On=An("bu"),$n=An("u"),Tn=An("bum"),Ln=An("um"),Pn=An("sp"),Vn=An("rtg"),jn=An("rtc");function Fn(t,e=Zr){En("ec",t,e)}function Rn(t,e,n,r){const i=t.dirs,o=e&&e.dirs;for(let s=0;s<i.length;s++){const l=i[s];o&&(l.oldValue=o[s].value);let a=l.dir[r];a&&(ut(),ge(a,n,8,[t.el,l,t,e]),ct())}}const Un="components";function Dn(t,e){return function(t,e,n=!0,r=!1){const i=Ke||Zr;if(i){const n=i.type;if(t===Un){const t=function(t){return M(t)&&t.displayName||t.name}(n);if(t&&(t===e||t===F(e)||t===D(F(e))))return n}const o=Bn(i[t]||n[t],e)||Bn(i.appContext[t],e);return!o&&r?n:o}}(Un,t,!0,e)||t}const In=Symbol();function Bn(t,e){return t&&(t[e]||t[F(e)]||t[D(F(e))])}function zn(t,e,n,r){let i;const o=n&&n[r];if(w(t)||E(t)){i=new Array(t.length);for(let n=0,r=t.length;n<r;n++)i[n]=e(t[n],n,void 0,o&&o[n])}else if("number"==typeof t){i=new Array(t);for(let n=0;n<t;n++)i[n]=e(n+1,n,void 0,o&&o[n])}else if(N(t))if(t[Symbol.iterator])i=Array.from(t,((t,n)=>e(t,n,void 0,o&&o[n])));else{const n=Object.keys(t);i=new Array(n.length);for(let r=0,s=n.length;r<s;r++){const s=n[r];i[r]=e(t[s],s,r,o&&o[r])}}else i=[];return n&&(n[r]=i),i}const qn=t=>t?ei(t)?oi(t)||t.proxy:qn(t.parent):null,Xn=m(Object.create(null),{$:t=>t,$el:t=>t.vnode.el,$data:t=>t.data,$props:t=>t.props,$attrs:t=>t.attrs,$slots:t=>t.slots,$refs:t=>t.refs,$parent:t=>qn(t.parent),$root:t=>qn(t.root),$emit:t=>t.emit,$options:t=>__VUE_OPTIONS_API__?Kn(t):t.type,$forceUpdate:t=>t.f||(t.f=()=>$e(t.update)),$nextTick:t=>t.n||(t.n=Oe.bind(t.proxy)),$watch:t=>__VUE_OPTIONS_API__?an.bind(t):p}),Hn={get({_:t},e){const{ctx:n,setupState:r,data:i,props:o,accessCache:s,type:l,appContext:a}=t;let u;if("$"!==e[0]){const l=s[e];if(void 0!==l)switch(l){case 1:return r[e];case 2:return i[e];case 4:return n[e];case 3:return o[e]}else{if(r!==f&&b(r,e))return s[e]=1,r[e];if(i!==f&&b(i,e))return s[e]=2,i[e];if((u=t.propsOptions[0])&&b(u,e))return s[e]=3,o[e];if(n!==f&&b(n,e))return s[e]=4,n[e];__VUE_OPTIONS_API__&&!Yn||(s[e]=0)}}const c=Xn[e];let h,p;return c?("$attrs"===e&&ft(t,0,e),c(t)):(h=l.__cssModules)&&(h=h[e])?h:n!==f&&b(n,e)?(s[e]=4,n[e]):(p=a.config.globalProperties,b(p,e)?p[e]:void 0)},set({_:t},e,n){const{data:r,setupState:i,ctx:o}=t;return i!==f&&b(i,e)?(i[e]=n,!0):r!==f&&b(r,e)?(r[e]=n,!0):!(b(t.props,e)||"$"===e[0]&&e.slice(1)in t||(o[e]=n,0))},has({_:{data:t,setupState:e,accessCache:n,ctx:r,appContext:i,propsOptions:o}},s){let l;return!!n[s]||t!==f&&b(t,s)||e!==f&&b(e,s)||(l=o[0])&&b(l,s)||b(r,s)||b(Xn,s)||b(i.config.globalProperties,s)},defineProperty(t,e,n){return null!=n.get?t._.accessCache[e]=0:b(n,"value")&&this.set(t,e,n.value,null),Reflect.defineProperty(t,e,n)}};let Yn=!0;function Wn(t,e,n){ge(w(t)?t.map((t=>t.bind(e.proxy))):t.bind(e.proxy),e,n)}function Gn(t,e,n,r){const i=r.includes(".")?un(n,r):()=>n[r];if(E(t)){const n=e[t];M(n)&&sn(i,n)}else if(M(t))sn(i,t.bind(n));else if(N(t))if(w(t))t.forEach((t=>Gn(t,e,n,r)));else{const r=M(t.handler)?t.handler.bind(n):e[t.handler];M(r)&&sn(i,r,t)}}function Kn(t){const e=t.type,{mixins:n,extends:r}=e,{mixins:i,optionsCache:o,config:{optionMergeStrategies:s}}=t.appContext,l=o.get(e);let a;return l?a=l:i.length||n||r?(a={},i.length&&i.forEach((t=>Zn(a,t,s,!0))),Zn(a,e,s)):a=e,o.set(e,a),a}function Zn(t,e,n,r=!1){const{mixins:i,extends:o}=e;o&&Zn(t,o,n,!0),i&&i.forEach((e=>Zn(t,e,n,!0)));for(const i in e)if(r&&"expose"===i);else{const r=Jn[i]||n&&n[i];t[i]=r?r(t[i],e[i]):e[i]}return t}const Jn={data:Qn,props:nr,emits:nr,methods:nr,computed:nr,beforeCreate:er,created:er,beforeMount:er,mounted:er,beforeUpdate:er,updated:er,beforeDestroy:er,beforeUnmount:er,destroyed:er,unmounted:er,activated:er,deactivated:er,errorCaptured:er,serverPrefetch:er,components:nr,directives:nr,watch:function(t,e){if(!t)return e;if(!e)return t;const n=m(Object.create(null),t);for(const r in e)n[r]=er(t[r],e[r]);return n},provide:Qn,inject:function(t,e){return nr(tr(t),tr(e))}};function Qn(t,e){return e?t?function(){return m(M(t)?t.call(this,this):t,M(e)?e.call(this,this):e)}:e:t}function tr(t){if(w(t)){const e={};for(let n=0;n<t.length;n++)e[t[n]]=t[n];return e}return t}function er(t,e){return t?[...new Set([].concat(t,e))]:e}function nr(t,e){return t?m(m(Object.create(null),t),e):e}function rr(t,e,n,r){const[i,o]=t.propsOptions;let s,l=!1;if(e)for(let a in e){if(P(a))continue;const u=e[a];let c;i&&b(i,c=F(a))?o&&o.includes(c)?(s||(s={}))[c]=u:n[c]=u:Ge(t.emitsOptions,a)||a in r&&u===r[a]||(r[a]=u,l=!0)}if(o){const e=se(n),r=s||f;for(let s=0;s<o.length;s++){const l=o[s];n[l]=ir(i,e,l,r[l],t,!b(r,l))}}return l}function ir(t,e,n,r,i,o){const s=t[n];if(null!=s){const t=b(s,"default");if(t&&void 0===r){const t=s.default;if(s.type!==Function&&M(t)){const{propsDefaults:o}=i;n in o?r=o[n]:(Qr(i),r=o[n]=t.call(null,e),ti())}else r=t}s[0]&&(o&&!t?r=!1:!s[1]||""!==r&&r!==U(n)||(r=!0))}return r}function or(t,e,n=!1){const r=e.propsCache,i=r.get(t);if(i)return i;const o=t.props,s={},l=[];let a=!1;if(__VUE_OPTIONS_API__&&!M(t)){const r=t=>{a=!0;const[n,r]=or(t,e,!0);m(s,n),r&&l.push(...r)};!n&&e.mixins.length&&e.mixins.forEach(r),t.extends&&r(t.extends),t.mixins&&t.mixins.forEach(r)}if(!o&&!a)return r.set(t,h),h;if(w(o))for(let t=0;t<o.length;t++){const e=F(o[t]);sr(e)&&(s[e]=f)}else if(o)for(const t in o){const e=F(t);if(sr(e)){const n=o[t],r=s[e]=w(n)||M(n)?{type:n}:n;if(r){const t=ur(Boolean,r.type),n=ur(String,r.type);r[0]=t>-1,r[1]=n<0||t<n,(t>-1||b(r,"default"))&&l.push(e)}}}const u=[s,l];return r.set(t,u),u}function sr(t){return"$"!==t[0]}function lr(t){const e=t&&t.toString().match(/^\s*function (\w+)/);return e?e[1]:null===t?"null":""}function ar(t,e){return lr(t)===lr(e)}function ur(t,e){return w(e)?e.findIndex((e=>ar(e,t))):M(e)&&ar(e,t)?0:-1}const cr=t=>"_"===t[0]||"$stable"===t,fr=t=>w(t)?t.map(Xr):[Xr(t)],hr=(t,e,n)=>{if(e._n)return e;const r=function(t,e=Ke,n){if(!e)return t;if(t._n)return t;const r=(...n)=>{r._d&&$r(-1);const i=Je(e),o=t(...n);return Je(i),r._d&&$r(1),__VUE_PROD_DEVTOOLS__&&qe(e),o};return r._n=!0,r._c=!0,r._d=!0,r}(((...t)=>fr(e(...t))),n);return r._c=!1,r},pr=(t,e,n)=>{const r=t._ctx;for(const n in t){if(cr(n))continue;const i=t[n];if(M(i))e[n]=hr(0,i,r);else if(null!=i){const t=fr(i);e[n]=()=>t}}},dr=(t,e)=>{const n=fr(e);t.slots.default=()=>n};function gr(){return{app:null,config:{isNativeTag:d,performance:!1,globalProperties:{},optionMergeStrategies:{},errorHandler:void 0,warnHandler:void 0,compilerOptions:{}},mixins:[],components:{},directives:{},provides:Object.create(null),optionsCache:new WeakMap,propsCache:new WeakMap,emitsCache:new WeakMap}}let vr=0;function yr(t,e){return function(n,r=null){M(n)||(n=Object.assign({},n)),null==r||N(r)||(r=null);const i=gr(),o=new Set;let s=!1;const l=i.app={_uid:vr++,_component:n,_props:r,_container:null,_context:i,_instance:null,version:li,get config(){return i.config},set config(t){},use:(t,...e)=>(o.has(t)||(t&&M(t.install)?(o.add(t),t.install(l,...e)):M(t)&&(o.add(t),t(l,...e))),l),mixin:t=>(__VUE_OPTIONS_API__&&(i.mixins.includes(t)||i.mixins.push(t)),l),component:(t,e)=>e?(i.components[t]=e,l):i.components[t],directive:(t,e)=>e?(i.directives[t]=e,l):i.directives[t],mount(o,a,u){if(!s){const c=Ir(n,r);return c.appContext=i,a&&e?e(c,o):t(c,o,u),s=!0,l._container=o,o.__vue_app__=l,__VUE_PROD_DEVTOOLS__&&(l._instance=c.component,function(t,e){Ie("app:init",t,e,{Fragment:Sr,Text:kr,Comment:Mr,Static:Er})}(l,li)),oi(c.component)||c.component.proxy}},unmount(){s&&(t(null,l._container),__VUE_PROD_DEVTOOLS__&&(l._instance=null,function(t){Ie("app:unmount",t)}(l)),delete l._container.__vue_app__)},provide:(t,e)=>(i.provides[t]=e,l)};return l}}function mr(t,e,n,r,i=!1){if(w(t))return void t.forEach(((t,o)=>mr(t,e&&(w(e)?e[o]:e),n,r,i)));if(xn(r)&&!i)return;const o=4&r.shapeFlag?oi(r.component)||r.component.proxy:r.el,s=i?null:o,{i:l,r:a}=t,u=e&&e.r,c=l.refs===f?l.refs={}:l.refs,h=l.setupState;if(null!=u&&u!==a&&(E(u)?(c[u]=null,b(h,u)&&(h[u]=null)):ce(u)&&(u.value=null)),M(a))de(a,l,12,[s,c]);else{const e=E(a),r=ce(a);if(e||r){const r=()=>{if(t.f){const n=e?c[a]:a.value;i?w(n)&&_(n,o):w(n)?n.includes(o)||n.push(o):e?(c[a]=[o],b(h,a)&&(h[a]=c[a])):(a.value=[o],t.k&&(c[t.k]=a.value))}else e?(c[a]=s,b(h,a)&&(h[a]=s)):ce(a)&&(a.value=s,t.k&&(c[t.k]=s))};s?(r.id=-1,_r(r,n)):r()}}}const _r=function(t,e){e&&e.pendingBranch?w(t)?e.effects.push(...t):e.effects.push(t):Le(t,Me,ke,Ee)};function xr(t,e){"boolean"!=typeof __VUE_OPTIONS_API__&&(Y().__VUE_OPTIONS_API__=!0),"boolean"!=typeof __VUE_PROD_DEVTOOLS__&&(Y().__VUE_PROD_DEVTOOLS__=!1);const n=Y();n.__VUE__=!0,__VUE_PROD_DEVTOOLS__&&Be(n.__VUE_DEVTOOLS_GLOBAL_HOOK__,n);const{insert:r,remove:i,patchProp:o,createElement:s,createText:l,createComment:a,setText:u,setElementText:c,parentNode:d,nextSibling:g,setScopeId:v=p,cloneNode:y,insertStaticContent:_}=t,x=(t,e,n,r=null,i=null,o=null,s=!1,l=null,a=!!e.dynamicChildren)=>{if(t===e)return;t&&!jr(t,e)&&(r=et(t),K(t,i,o,!0),t=null),-2===e.patchFlag&&(a=!1,e.dynamicChildren=null);const{type:u,ref:c,shapeFlag:f}=e;switch(u){case kr:w(t,e,n,r);break;case Mr:S(t,e,n,r);break;case Er:null==t&&k(e,n,r,s);break;case Sr:L(t,e,n,r,i,o,s,l,a);break;default:1&f?M(t,e,n,r,i,o,s,l,a):6&f?V(t,e,n,r,i,o,s,l,a):(64&f||128&f)&&u.process(t,e,n,r,i,o,s,l,a,rt)}null!=c&&i&&mr(c,t&&t.ref,o,e||t,!e)},w=(t,e,n,i)=>{if(null==t)r(e.el=l(e.children),n,i);else{const n=e.el=t.el;e.children!==t.children&&u(n,e.children)}},S=(t,e,n,i)=>{null==t?r(e.el=a(e.children||""),n,i):e.el=t.el},k=(t,e,n,r)=>{[t.el,t.anchor]=_(t.children,e,n,r,t.el,t.anchor)},M=(t,e,n,r,i,o,s,l,a)=>{s=s||"svg"===e.type,null==t?E(e,n,r,i,o,s,l,a):O(t,e,i,o,s,l,a)},E=(t,e,n,i,l,a,u,f)=>{let h,p;const{type:d,props:g,shapeFlag:v,transition:m,patchFlag:_,dirs:x}=t;if(t.el&&void 0!==y&&-1===_)h=t.el=y(t.el);else{if(h=t.el=s(t.type,a,g&&g.is,g),8&v?c(h,t.children):16&v&&N(t.children,h,null,i,l,a&&"foreignObject"!==d,u,f),x&&Rn(t,null,i,"created"),g){for(const e in g)"value"===e||P(e)||o(h,e,null,g[e],a,t.children,i,l,tt);"value"in g&&o(h,"value",null,g.value),(p=g.onVnodeBeforeMount)&&Wr(p,i,t)}A(h,t,t.scopeId,u,i)}__VUE_PROD_DEVTOOLS__&&(Object.defineProperty(h,"__vnode",{value:t,enumerable:!1}),Object.defineProperty(h,"__vueParentComponent",{value:i,enumerable:!1})),x&&Rn(t,null,i,"beforeMount");const b=(!l||l&&!l.pendingBranch)&&m&&!m.persisted;b&&m.beforeEnter(h),r(h,e,n),((p=g&&g.onVnodeMounted)||b||x)&&_r((()=>{p&&Wr(p,i,t),b&&m.enter(h),x&&Rn(t,null,i,"mounted")}),l)},A=(t,e,n,r,i)=>{if(n&&v(t,n),r)for(let e=0;e<r.length;e++)v(t,r[e]);if(i&&e===i.subTree){const e=i.vnode;A(t,e,e.scopeId,e.slotScopeIds,i.parent)}},N=(t,e,n,r,i,o,s,l,a=0)=>{for(let u=a;u<t.length;u++){const a=t[u]=l?Hr(t[u]):Xr(t[u]);x(null,a,e,n,r,i,o,s,l)}},O=(t,e,n,r,i,s,l)=>{const a=e.el=t.el;let{patchFlag:u,dynamicChildren:h,dirs:p}=e;u|=16&t.patchFlag;const d=t.props||f,g=e.props||f;let v;n&&br(n,!1),(v=g.onVnodeBeforeUpdate)&&Wr(v,n,e,t),p&&Rn(e,t,n,"beforeUpdate"),n&&br(n,!0);const y=i&&"foreignObject"!==e.type;if(h?$(t.dynamicChildren,h,a,n,r,y,s):l||B(t,e,a,null,n,r,y,s,!1),u>0){if(16&u)T(a,e,d,g,n,r,i);else if(2&u&&d.class!==g.class&&o(a,"class",null,g.class,i),4&u&&o(a,"style",d.style,g.style,i),8&u){const s=e.dynamicProps;for(let e=0;e<s.length;e++){const l=s[e],u=d[l],c=g[l];c===u&&"value"!==l||o(a,l,u,c,i,t.children,n,r,tt)}}1&u&&t.children!==e.children&&c(a,e.children)}else l||null!=h||T(a,e,d,g,n,r,i);((v=g.onVnodeUpdated)||p)&&_r((()=>{v&&Wr(v,n,e,t),p&&Rn(e,t,n,"updated")}),r)},$=(t,e,n,r,i,o,s)=>{for(let l=0;l<e.length;l++){const a=t[l],u=e[l],c=a.el&&(a.type===Sr||!jr(a,u)||70&a.shapeFlag)?d(a.el):n;x(a,u,c,null,r,i,o,s,!0)}},T=(t,e,n,r,i,s,l)=>{if(n!==r){for(const a in r){if(P(a))continue;const u=r[a],c=n[a];u!==c&&"value"!==a&&o(t,a,c,u,l,e.children,i,s,tt)}if(n!==f)for(const a in n)P(a)||a in r||o(t,a,n[a],null,l,e.children,i,s,tt);"value"in r&&o(t,"value",n.value,r.value)}},L=(t,e,n,i,o,s,a,u,c)=>{const f=e.el=t?t.el:l(""),h=e.anchor=t?t.anchor:l("");let{patchFlag:p,dynamicChildren:d,slotScopeIds:g}=e;g&&(u=u?u.concat(g):g),null==t?(r(f,n,i),r(h,n,i),N(e.children,n,h,o,s,a,u,c)):p>0&&64&p&&d&&t.dynamicChildren?($(t.dynamicChildren,d,n,o,s,a,u),(null!=e.key||o&&e===o.subTree)&&wr(t,e,!0)):B(t,e,n,h,o,s,a,u,c)},V=(t,e,n,r,i,o,s,l,a)=>{e.slotScopeIds=l,null==t?512&e.shapeFlag?i.ctx.activate(e,n,r,s,a):j(e,n,r,i,o,s,a):R(t,e,a)},j=(t,e,n,r,i,o,s)=>{const l=t.component=function(t,e,n){const r=t.type,i=(e?e.appContext:t.appContext)||Gr,o={uid:Kr++,vnode:t,type:r,parent:e,appContext:i,root:null,next:null,subTree:null,effect:null,update:null,scope:new G(!0),render:null,proxy:null,exposed:null,exposeProxy:null,withProxy:null,provides:e?e.provides:Object.create(i.provides),accessCache:null,renderCache:[],components:null,directives:null,propsOptions:or(r,i),emitsOptions:We(r,i),emit:null,emitted:null,propsDefaults:f,inheritAttrs:r.inheritAttrs,ctx:f,data:f,props:f,attrs:f,slots:f,refs:f,setupState:f,setupContext:null,suspense:n,suspenseId:n?n.pendingId:0,asyncDep:null,asyncResolved:!1,isMounted:!1,isUnmounted:!1,isDeactivated:!1,bc:null,c:null,bm:null,m:null,bu:null,u:null,um:null,bum:null,da:null,a:null,rtg:null,rtc:null,ec:null,sp:null};return o.ctx={_:o},o.root=e?e.root:o,o.emit=Ye.bind(null,o),t.ce&&t.ce(o),o}(t,r,i);if(bn(t)&&(l.ctx.renderer=rt),function(t,e=!1){ni=e;const{props:n,children:r}=t.vnode,i=ei(t);(function(t,e,n,r=!1){const i={},o={};q(o,Fr,1),t.propsDefaults=Object.create(null),rr(t,e,i,o);for(const e in t.propsOptions[0])e in i||(i[e]=void 0);n?t.props=r?i:ee(i,!1,At,Yt,Kt):t.type.props?t.props=i:t.props=o,t.attrs=o})(t,n,i,e),((t,e)=>{if(32&t.vnode.shapeFlag){const n=e._;n?(t.slots=se(e),q(e,"_",n)):pr(e,t.slots={})}else t.slots={},e&&dr(t,e);q(t.slots,Fr,1)})(t,r);const o=i?function(t,e){const n=t.type;t.accessCache=Object.create(null),t.proxy=le(new Proxy(t.ctx,Hn));const{setup:r}=n;if(r){const n=t.setupContext=r.length>1?function(t){const e=e=>{t.exposed=e||{}};let n;return{get attrs(){return n||(n=function(t){return new Proxy(t.attrs,{get:(e,n)=>(ft(t,0,"$attrs"),e[n])})}(t))},slots:t.slots,emit:t.emit,expose:e}}(t):null;Qr(t),ut();const i=de(r,t,0,[t.props,n]);if(ct(),ti(),C(i)){if(i.then(ti,ti),e)return i.then((n=>{ri(t,n,e)})).catch((e=>{ve(e,t,0)}));t.asyncDep=i}else ri(t,i,e)}else ii(t,e)}(t,e):void 0;ni=!1}(l),l.asyncDep){if(i&&i.registerDep(l,D),!t.el){const t=l.subTree=Ir(Mr);S(null,t,e,n)}}else D(l,t,e,n,i,o,s)},R=(t,e,n)=>{const r=e.component=t.component;if(function(t,e,n){const{props:r,children:i,component:o}=t,{props:s,children:l,patchFlag:a}=e,u=o.emitsOptions;if(e.dirs||e.transition)return!0;if(!(n&&a>=0))return!(!i&&!l||l&&l.$stable)||r!==s&&(r?!s||nn(r,s,u):!!s);if(1024&a)return!0;if(16&a)return r?nn(r,s,u):!!s;if(8&a){const t=e.dynamicProps;for(let e=0;e<t.length;e++){const n=t[e];if(s[n]!==r[n]&&!Ge(u,n))return!0}}return!1}(t,e,n)){if(r.asyncDep&&!r.asyncResolved)return void I(r,e,n);r.next=e,function(t){const e=_e.indexOf(t);e>xe&&_e.splice(e,1)}(r.update),r.update()}else e.el=t.el,r.vnode=e},D=(t,e,n,r,i,o,s)=>{const l=t.effect=new ot((()=>{if(t.isMounted){let e,{next:n,bu:r,u:l,parent:a,vnode:u}=t,c=n;br(t,!1),n?(n.el=u.el,I(t,n,s)):n=u,r&&z(r),(e=n.props&&n.props.onVnodeBeforeUpdate)&&Wr(e,a,n,u),br(t,!0);const f=Qe(t),h=t.subTree;t.subTree=f,x(h,f,d(h.el),et(h),t,i,o),n.el=f.el,null===c&&function({vnode:t,parent:e},n){for(;e&&e.subTree===t;)(t=e.vnode).el=n,e=e.parent}(t,f.el),l&&_r(l,i),(e=n.props&&n.props.onVnodeUpdated)&&_r((()=>Wr(e,a,n,u)),i),__VUE_PROD_DEVTOOLS__&&qe(t)}else{let s;const{el:l,props:a}=e,{bm:u,m:c,parent:f}=t,h=xn(e);if(br(t,!1),u&&z(u),!h&&(s=a&&a.onVnodeBeforeMount)&&Wr(s,f,e),br(t,!0),l&&st){const n=()=>{t.subTree=Qe(t),st(l,t.subTree,t,i,null)};h?e.type.__asyncLoader().then((()=>!t.isUnmounted&&n())):n()}else{const s=t.subTree=Qe(t);x(null,s,n,r,t,i,o),e.el=s.el}if(c&&_r(c,i),!h&&(s=a&&a.onVnodeMounted)){const t=e;_r((()=>Wr(s,f,t)),i)}(256&e.shapeFlag||f&&xn(f.vnode)&&256&f.vnode.shapeFlag)&&t.a&&_r(t.a,i),t.isMounted=!0,__VUE_PROD_DEVTOOLS__&&ze(t),e=n=r=null}}),(()=>$e(a)),t.scope),a=t.update=()=>l.run();a.id=t.uid,br(t,!0),a()},I=(t,e,n)=>{e.component=t;const r=t.vnode.props;t.vnode=e,t.next=null,function(t,e,n,r){const{props:i,attrs:o,vnode:{patchFlag:s}}=t,l=se(i),[a]=t.propsOptions;let u=!1;if(!(r||s>0)||16&s){let r;rr(t,e,i,o)&&(u=!0);for(const o in l)e&&(b(e,o)||(r=U(o))!==o&&b(e,r))||(a?!n||void 0===n[o]&&void 0===n[r]||(i[o]=ir(a,l,o,void 0,t,!0)):delete i[o]);if(o!==l)for(const t in o)e&&b(e,t)||(delete o[t],u=!0)}else if(8&s){const n=t.vnode.dynamicProps;for(let r=0;r<n.length;r++){let s=n[r];if(Ge(t.emitsOptions,s))continue;const c=e[s];if(a)if(b(o,s))c!==o[s]&&(o[s]=c,u=!0);else{const e=F(s);i[e]=ir(a,l,e,c,t,!1)}else c!==o[s]&&(o[s]=c,u=!0)}}u&&pt(t,"set","$attrs")}(t,e.props,r,n),((t,e,n)=>{const{vnode:r,slots:i}=t;let o=!0,s=f;if(32&r.shapeFlag){const t=e._;t?n&&1===t?o=!1:(m(i,e),n||1!==t||delete i._):(o=!e.$stable,pr(e,i)),s=e}else e&&(dr(t,e),s={default:1});if(o)for(const t in i)cr(t)||t in s||delete i[t]})(t,e.children,n),ut(),Pe(void 0,t.update),ct()},B=(t,e,n,r,i,o,s,l,a=!1)=>{const u=t&&t.children,f=t?t.shapeFlag:0,h=e.children,{patchFlag:p,shapeFlag:d}=e;if(p>0){if(128&p)return void H(u,h,n,r,i,o,s,l,a);if(256&p)return void X(u,h,n,r,i,o,s,l,a)}8&d?(16&f&&tt(u,i,o),h!==u&&c(n,h)):16&f?16&d?H(u,h,n,r,i,o,s,l,a):tt(u,i,o,!0):(8&f&&c(n,""),16&d&&N(h,n,r,i,o,s,l,a))},X=(t,e,n,r,i,o,s,l,a)=>{e=e||h;const u=(t=t||h).length,c=e.length,f=Math.min(u,c);let p;for(p=0;p<f;p++){const r=e[p]=a?Hr(e[p]):Xr(e[p]);x(t[p],r,n,null,i,o,s,l,a)}u>c?tt(t,i,o,!0,!1,f):N(e,n,r,i,o,s,l,a,f)},H=(t,e,n,r,i,o,s,l,a)=>{let u=0;const c=e.length;let f=t.length-1,p=c-1;for(;u<=f&&u<=p;){const r=t[u],c=e[u]=a?Hr(e[u]):Xr(e[u]);if(!jr(r,c))break;x(r,c,n,null,i,o,s,l,a),u++}for(;u<=f&&u<=p;){const r=t[f],u=e[p]=a?Hr(e[p]):Xr(e[p]);if(!jr(r,u))break;x(r,u,n,null,i,o,s,l,a),f--,p--}if(u>f){if(u<=p){const t=p+1,f=t<c?e[t].el:r;for(;u<=p;)x(null,e[u]=a?Hr(e[u]):Xr(e[u]),n,f,i,o,s,l,a),u++}}else if(u>p)for(;u<=f;)K(t[u],i,o,!0),u++;else{const d=u,g=u,v=new Map;for(u=g;u<=p;u++){const t=e[u]=a?Hr(e[u]):Xr(e[u]);null!=t.key&&v.set(t.key,u)}let y,m=0;const _=p-g+1;let b=!1,w=0;const S=new Array(_);for(u=0;u<_;u++)S[u]=0;for(u=d;u<=f;u++){const r=t[u];if(m>=_){K(r,i,o,!0);continue}let c;if(null!=r.key)c=v.get(r.key);else for(y=g;y<=p;y++)if(0===S[y-g]&&jr(r,e[y])){c=y;break}void 0===c?K(r,i,o,!0):(S[c-g]=u+1,c>=w?w=c:b=!0,x(r,e[c],n,null,i,o,s,l,a),m++)}const k=b?function(t){const e=t.slice(),n=[0];let r,i,o,s,l;const a=t.length;for(r=0;r<a;r++){const a=t[r];if(0!==a){if(i=n[n.length-1],t[i]<a){e[r]=i,n.push(r);continue}for(o=0,s=n.length-1;o<s;)l=o+s>>1,t[n[l]]<a?o=l+1:s=l;a<t[n[o]]&&(o>0&&(e[r]=n[o-1]),n[o]=r)}}for(o=n.length,s=n[o-1];o-- >0;)n[o]=s,s=e[s];return n}(S):h;for(y=k.length-1,u=_-1;u>=0;u--){const t=g+u,f=e[t],h=t+1<c?e[t+1].el:r;0===S[u]?x(null,f,n,h,i,o,s,l,a):b&&(y<0||u!==k[y]?W(f,n,h,2):y--)}}},W=(t,e,n,i,o=null)=>{const{el:s,type:l,transition:a,children:u,shapeFlag:c}=t;if(6&c)W(t.component.subTree,e,n,i);else if(128&c)t.suspense.move(e,n,i);else if(64&c)l.move(t,e,n,rt);else if(l!==Sr)if(l!==Er)if(2!==i&&1&c&&a)if(0===i)a.beforeEnter(s),r(s,e,n),_r((()=>a.enter(s)),o);else{const{leave:t,delayLeave:i,afterLeave:o}=a,l=()=>r(s,e,n),u=()=>{t(s,(()=>{l(),o&&o()}))};i?i(s,l,u):u()}else r(s,e,n);else(({el:t,anchor:e},n,i)=>{let o;for(;t&&t!==e;)o=g(t),r(t,n,i),t=o;r(e,n,i)})(t,e,n);else{r(s,e,n);for(let t=0;t<u.length;t++)W(u[t],e,n,i);r(t.anchor,e,n)}},K=(t,e,n,r=!1,i=!1)=>{const{type:o,props:s,ref:l,children:a,dynamicChildren:u,shapeFlag:c,patchFlag:f,dirs:h}=t;if(null!=l&&mr(l,null,n,t,!0),256&c)return void e.ctx.deactivate(t);const p=1&c&&h,d=!xn(t);let g;if(d&&(g=s&&s.onVnodeBeforeUnmount)&&Wr(g,e,t),6&c)Q(t.component,n,r);else{if(128&c)return void t.suspense.unmount(n,r);p&&Rn(t,null,e,"beforeUnmount"),64&c?t.type.remove(t,e,n,i,rt,r):u&&(o!==Sr||f>0&&64&f)?tt(u,e,n,!1,!0):(o===Sr&&384&f||!i&&16&c)&&tt(a,e,n),r&&Z(t)}(d&&(g=s&&s.onVnodeUnmounted)||p)&&_r((()=>{g&&Wr(g,e,t),p&&Rn(t,null,e,"unmounted")}),n)},Z=t=>{const{type:e,el:n,anchor:r,transition:o}=t;if(e===Sr)return void J(n,r);if(e===Er)return void(({el:t,anchor:e})=>{let n;for(;t&&t!==e;)n=g(t),i(t),t=n;i(e)})(t);const s=()=>{i(n),o&&!o.persisted&&o.afterLeave&&o.afterLeave()};if(1&t.shapeFlag&&o&&!o.persisted){const{leave:e,delayLeave:r}=o,i=()=>e(n,s);r?r(t.el,s,i):i()}else s()},J=(t,e)=>{let n;for(;t!==e;)n=g(t),i(t),t=n;i(e)},Q=(t,e,n)=>{const{bum:r,scope:i,update:o,subTree:s,um:l}=t;r&&z(r),i.stop(),o&&(o.active=!1,K(s,t,e,n)),l&&_r(l,e),_r((()=>{t.isUnmounted=!0}),e),e&&e.pendingBranch&&!e.isUnmounted&&t.asyncDep&&!t.asyncResolved&&t.suspenseId===e.pendingId&&(e.deps--,0===e.deps&&e.resolve()),__VUE_PROD_DEVTOOLS__&&Xe(t)},tt=(t,e,n,r=!1,i=!1,o=0)=>{for(let s=o;s<t.length;s++)K(t[s],e,n,r,i)},et=t=>6&t.shapeFlag?et(t.component.subTree):128&t.shapeFlag?t.suspense.next():g(t.anchor||t.el),nt=(t,e,n)=>{null==t?e._vnode&&K(e._vnode,null,null,!0):x(e._vnode||null,t,e,null,null,null,n),Ve(),e._vnode=t},rt={p:x,um:K,m:W,r:Z,mt:j,mc:N,pc:B,pbc:$,n:et,o:t};let it,st;return e&&([it,st]=e(rt)),{render:nt,hydrate:it,createApp:yr(nt,it)}}function br({effect:t,update:e},n){t.allowRecurse=e.allowRecurse=n}function wr(t,e,n=!1){const r=t.children,i=e.children;if(w(r)&&w(i))for(let t=0;t<r.length;t++){const e=r[t];let o=i[t];1&o.shapeFlag&&!o.dynamicChildren&&((o.patchFlag<=0||32===o.patchFlag)&&(o=i[t]=Hr(i[t]),o.el=e.el),n||wr(e,o))}}const Sr=Symbol(void 0),kr=Symbol(void 0),Mr=Symbol(void 0),Er=Symbol(void 0),Ar=[];let Nr=null;function Cr(t=!1){Ar.push(Nr=t?null:[])}let Or=1;function $r(t){Or+=t}function Tr(t){return t.dynamicChildren=Or>0?Nr||h:null,Ar.pop(),Nr=Ar[Ar.length-1]||null,Or>0&&Nr&&Nr.push(t),t}function Lr(t,e,n,r,i,o){return Tr(Dr(t,e,n,r,i,o,!0))}function Pr(t,e,n,r,i){return Tr(Ir(t,e,n,r,i,!0))}function Vr(t){return!!t&&!0===t.__v_isVNode}function jr(t,e){return t.type===e.type&&t.key===e.key}const Fr="__vInternal",Rr=({key:t})=>null!=t?t:null,Ur=({ref:t,ref_key:e,ref_for:n})=>null!=t?E(t)||ce(t)||M(t)?{i:Ke,r:t,k:e,f:!!n}:t:null;function Dr(t,e=null,n=null,r=0,i=null,o=(t===Sr?0:1),s=!1,l=!1){const a={__v_isVNode:!0,__v_skip:!0,type:t,props:e,key:e&&Rr(e),ref:e&&Ur(e),scopeId:Ze,slotScopeIds:null,children:n,component:null,suspense:null,ssContent:null,ssFallback:null,dirs:null,transition:null,el:null,anchor:null,target:null,targetAnchor:null,staticCount:0,shapeFlag:o,patchFlag:r,dynamicProps:i,dynamicChildren:null,appContext:null};return l?(Yr(a,n),128&o&&t.normalize(a)):n&&(a.shapeFlag|=E(n)?8:16),Or>0&&!s&&Nr&&(a.patchFlag>0||6&o)&&32!==a.patchFlag&&Nr.push(a),a}const Ir=function(t,e=null,n=null,r=0,o=null,s=!1){if(t&&t!==In||(t=Mr),Vr(t)){const r=Br(t,e,!0);return n&&Yr(r,n),Or>0&&!s&&Nr&&(6&r.shapeFlag?Nr[Nr.indexOf(t)]=r:Nr.push(r)),r.patchFlag|=-2,r}if(function(t){return M(t)&&"__vccOpts"in t}(t)&&(t=t.__vccOpts),e){e=function(t){return t?oe(t)||Fr in t?m({},t):t:null}(e);let{class:t,style:n}=e;t&&!E(t)&&(e.class=a(t)),N(n)&&(oe(n)&&!w(n)&&(n=m({},n)),e.style=i(n))}return Dr(t,e,n,r,o,E(t)?1:(t=>t.__isSuspense)(t)?128:(t=>t.__isTeleport)(t)?64:N(t)?4:M(t)?2:0,s,!0)};function Br(t,e,n=!1){const{props:r,ref:o,patchFlag:s,children:l}=t,u=e?function(...t){const e={};for(let n=0;n<t.length;n++){const r=t[n];for(const t in r)if("class"===t)e.class!==r.class&&(e.class=a([e.class,r.class]));else if("style"===t)e.style=i([e.style,r.style]);else if(v(t)){const n=e[t],i=r[t];!i||n===i||w(n)&&n.includes(i)||(e[t]=n?[].concat(n,i):i)}else""!==t&&(e[t]=r[t])}return e}(r||{},e):r;return{__v_isVNode:!0,__v_skip:!0,type:t.type,props:u,key:u&&Rr(u),ref:e&&e.ref?n&&o?w(o)?o.concat(Ur(e)):[o,Ur(e)]:Ur(e):o,scopeId:t.scopeId,slotScopeIds:t.slotScopeIds,children:l,target:t.target,targetAnchor:t.targetAnchor,staticCount:t.staticCount,shapeFlag:t.shapeFlag,patchFlag:e&&t.type!==Sr?-1===s?16:16|s:s,dynamicProps:t.dynamicProps,dynamicChildren:t.dynamicChildren,appContext:t.appContext,dirs:t.dirs,transition:t.transition,component:t.component,suspense:t.suspense,ssContent:t.ssContent&&Br(t.ssContent),ssFallback:t.ssFallback&&Br(t.ssFallback),el:t.el,anchor:t.anchor}}function zr(t=" ",e=0){return Ir(kr,null,t,e)}function qr(t="",e=!1){return e?(Cr(),Pr(Mr,null,t)):Ir(Mr,null,t)}function Xr(t){return null==t||"boolean"==typeof t?Ir(Mr):w(t)?Ir(Sr,null,t.slice()):"object"==typeof t?Hr(t):Ir(kr,null,String(t))}function Hr(t){return null===t.el||t.memo?t:Br(t)}function Yr(t,e){let n=0;const{shapeFlag:r}=t;if(null==e)e=null;else if(w(e))n=16;else if("object"==typeof e){if(65&r){const n=e.default;return void(n&&(n._c&&(n._d=!1),Yr(t,n()),n._c&&(n._d=!0)))}{n=32;const r=e._;r||Fr in e?3===r&&Ke&&(1===Ke.slots._?e._=1:(e._=2,t.patchFlag|=1024)):e._ctx=Ke}}else M(e)?(e={default:e,_ctx:Ke},n=32):(e=String(e),64&r?(n=16,e=[zr(e)]):n=8);t.children=e,t.shapeFlag|=n}function Wr(t,e,n,r=null){ge(t,e,7,[n,r])}const Gr=gr();let Kr=0;let Zr=null;const Jr=()=>Zr||Ke,Qr=t=>{Zr=t,t.scope.on()},ti=()=>{Zr&&Zr.scope.off(),Zr=null};function ei(t){return 4&t.vnode.shapeFlag}let ni=!1;function ri(t,e,n){M(e)?t.type.__ssrInlineRender?t.ssrRender=e:t.render=e:N(e)&&(__VUE_PROD_DEVTOOLS__&&(t.devtoolsRawSetupState=e),t.setupState=he(e)),ii(t,n)}function ii(t,e,n){const r=t.type;t.render||(t.render=r.render||p),__VUE_OPTIONS_API__&&(Qr(t),ut(),function(t){const e=Kn(t),n=t.proxy,r=t.ctx;Yn=!1,e.beforeCreate&&Wn(e.beforeCreate,t,"bc");const{data:i,computed:o,methods:s,watch:l,provide:a,inject:u,created:c,beforeMount:f,mounted:h,beforeUpdate:d,updated:g,activated:v,deactivated:y,beforeDestroy:m,beforeUnmount:_,destroyed:x,unmounted:b,render:S,renderTracked:k,renderTriggered:E,errorCaptured:A,serverPrefetch:C,expose:O,inheritAttrs:$,components:T,directives:L,filters:P}=e;if(u&&function(t,e,n=p,r=!1){w(t)&&(t=tr(t));for(const n in t){const i=t[n];let o;o=N(i)?"default"in i?rn(i.from||n,i.default,!0):rn(i.from||n):rn(i),ce(o)&&r?Object.defineProperty(e,n,{enumerable:!0,configurable:!0,get:()=>o.value,set:t=>o.value=t}):e[n]=o}}(u,r,null,t.appContext.config.unwrapInjectedRef),s)for(const t in s){const e=s[t];M(e)&&(r[t]=e.bind(n))}if(i){const e=i.call(n,n);N(e)&&(t.data=Qt(e))}if(Yn=!0,o)for(const t in o){const e=o[t],i=M(e)?e.bind(n,n):M(e.get)?e.get.bind(n,n):p,s=!M(e)&&M(e.set)?e.set.bind(n):p,l=si({get:i,set:s});Object.defineProperty(r,t,{enumerable:!0,configurable:!0,get:()=>l.value,set:t=>l.value=t})}if(l)for(const t in l)Gn(l[t],r,n,t);if(a){const t=M(a)?a.call(n):a;Reflect.ownKeys(t).forEach((e=>{!function(t,e){if(Zr){let n=Zr.provides;const r=Zr.parent&&Zr.parent.provides;r===n&&(n=Zr.provides=Object.create(r)),n[t]=e}}(e,t[e])}))}function V(t,e){w(e)?e.forEach((e=>t(e.bind(n)))):e&&t(e.bind(n))}if(c&&Wn(c,t,"c"),V(Nn,f),V(Cn,h),V(On,d),V($n,g),V(wn,v),V(Sn,y),V(Fn,A),V(jn,k),V(Vn,E),V(Tn,_),V(Ln,b),V(Pn,C),w(O))if(O.length){const e=t.exposed||(t.exposed={});O.forEach((t=>{Object.defineProperty(e,t,{get:()=>n[t],set:e=>n[t]=e})}))}else t.exposed||(t.exposed={});S&&t.render===p&&(t.render=S),null!=$&&(t.inheritAttrs=$),T&&(t.components=T),L&&(t.directives=L)}(t),ct(),ti())}function oi(t){if(t.exposed)return t.exposeProxy||(t.exposeProxy=new Proxy(he(le(t.exposed)),{get:(e,n)=>n in e?e[n]:n in Xn?Xn[n](t):void 0}))}const si=(t,e)=>function(t,e,n=!1){let r,i;const o=M(t);return o?(r=t,i=p):(r=t.get,i=t.set),new pe(r,i,o||!i,n)}(t,0,ni);Symbol("");const li="3.2.35",ai="undefined"!=typeof document?document:null,ui=ai&&ai.createElement("template"),ci={insert:(t,e,n)=>{e.insertBefore(t,n||null)},remove:t=>{const e=t.parentNode;e&&e.removeChild(t)},createElement:(t,e,n,r)=>{const i=e?ai.createElementNS("http://www.w3.org/2000/svg",t):ai.createElement(t,n?{is:n}:void 0);return"select"===t&&r&&null!=r.multiple&&i.setAttribute("multiple",r.multiple),i},createText:t=>ai.createTextNode(t),createComment:t=>ai.createComment(t),setText:(t,e)=>{t.nodeValue=e},setElementText:(t,e)=>{t.textContent=e},parentNode:t=>t.parentNode,nextSibling:t=>t.nextSibling,querySelector:t=>ai.querySelector(t),setScopeId(t,e){t.setAttribute(e,"")},cloneNode(t){const e=t.cloneNode(!0);return"_value"in t&&(e._value=t._value),e},insertStaticContent(t,e,n,r,i,o){const s=n?n.previousSibling:e.lastChild;if(i&&(i===o||i.nextSibling))for(;e.insertBefore(i.cloneNode(!0),n),i!==o&&(i=i.nextSibling););else{ui.innerHTML=r?`<svg>${t}</svg>`:t;const i=ui.content;if(r){const t=i.firstChild;for(;t.firstChild;)i.appendChild(t.firstChild);i.removeChild(t)}e.insertBefore(i,n)}return[s?s.nextSibling:e.firstChild,n?n.previousSibling:e.lastChild]}},fi=/\s*!important$/;function hi(t,e,n){if(w(n))n.forEach((n=>hi(t,e,n)));else if(null==n&&(n=""),e.startsWith("--"))t.setProperty(e,n);else{const r=function(t,e){const n=di[e];if(n)return n;let r=F(e);if("filter"!==r&&r in t)return di[e]=r;r=D(r);for(let n=0;n<pi.length;n++){const i=pi[n]+r;if(i in t)return di[e]=i}return e}(t,e);fi.test(n)?t.setProperty(U(r),n.replace(fi,""),"important"):t[r]=n}}const pi=["Webkit","Moz","ms"],di={},gi="http://www.w3.org/1999/xlink",[vi,yi]=(()=>{let t=Date.now,e=!1;if("undefined"!=typeof window){Date.now()>document.createEvent("Event").timeStamp&&(t=()=>performance.now());const n=navigator.userAgent.match(/firefox\/(\d+)/i);e=!!(n&&Number(n[1])<=53)}return[t,e]})();let mi=0;const _i=Promise.resolve(),xi=()=>{mi=0};const bi=/(?:Once|Passive|Capture)$/,wi=/^on[a-z]/;"undefined"!=typeof HTMLElement&&HTMLElement;const Si="transition",ki="animation",Mi=(t,{slots:e})=>function(t,e,n){const r=arguments.length;return 2===r?N(e)&&!w(e)?Vr(e)?Ir(t,null,[e]):Ir(t,e):Ir(t,null,e):(r>3?n=Array.prototype.slice.call(arguments,2):3===r&&Vr(n)&&(n=[n]),Ir(t,e,n))}(pn,function(t){const e={};for(const n in t)n in Ei||(e[n]=t[n]);if(!1===t.css)return e;const{name:n="v",type:r,duration:i,enterFromClass:o=`${n}-enter-from`,enterActiveClass:s=`${n}-enter-active`,enterToClass:l=`${n}-enter-to`,appearFromClass:a=o,appearActiveClass:u=s,appearToClass:c=l,leaveFromClass:f=`${n}-leave-from`,leaveActiveClass:h=`${n}-leave-active`,leaveToClass:p=`${n}-leave-to`}=t,d=function(t){if(null==t)return null;if(N(t))return[Ci(t.enter),Ci(t.leave)];{const e=Ci(t);return[e,e]}}(i),g=d&&d[0],v=d&&d[1],{onBeforeEnter:y,onEnter:_,onEnterCancelled:x,onLeave:b,onLeaveCancelled:w,onBeforeAppear:S=y,onAppear:k=_,onAppearCancelled:M=x}=e,E=(t,e,n)=>{$i(t,e?c:l),$i(t,e?u:s),n&&n()};let A=!1;const C=(t,e)=>{A=!1,$i(t,f),$i(t,p),$i(t,h),e&&e()},O=t=>(e,n)=>{const i=t?k:_,s=()=>E(e,t,n);Ai(i,[e,s]),Ti((()=>{$i(e,t?a:o),Oi(e,t?c:l),Ni(i)||Pi(e,r,g,s)}))};return m(e,{onBeforeEnter(t){Ai(y,[t]),Oi(t,o),Oi(t,s)},onBeforeAppear(t){Ai(S,[t]),Oi(t,a),Oi(t,u)},onEnter:O(!1),onAppear:O(!0),onLeave(t,e){A=!0;const n=()=>C(t,e);Oi(t,f),document.body.offsetHeight,Oi(t,h),Ti((()=>{A&&($i(t,f),Oi(t,p),Ni(b)||Pi(t,r,v,n))})),Ai(b,[t,n])},onEnterCancelled(t){E(t,!1),Ai(x,[t])},onAppearCancelled(t){E(t,!0),Ai(M,[t])},onLeaveCancelled(t){C(t),Ai(w,[t])}})}(t),e);Mi.displayName="Transition";const Ei={name:String,type:String,css:{type:Boolean,default:!0},duration:[String,Number,Object],enterFromClass:String,enterActiveClass:String,enterToClass:String,appearFromClass:String,appearActiveClass:String,appearToClass:String,leaveFromClass:String,leaveActiveClass:String,leaveToClass:String},Ai=(Mi.props=m({},pn.props,Ei),(t,e=[])=>{w(t)?t.forEach((t=>t(...e))):t&&t(...e)}),Ni=t=>!!t&&(w(t)?t.some((t=>t.length>1)):t.length>1);function Ci(t){return X(t)}function Oi(t,e){e.split(/\s+/).forEach((e=>e&&t.classList.add(e))),(t._vtc||(t._vtc=new Set)).add(e)}function $i(t,e){e.split(/\s+/).forEach((e=>e&&t.classList.remove(e)));const{_vtc:n}=t;n&&(n.delete(e),n.size||(t._vtc=void 0))}function Ti(t){requestAnimationFrame((()=>{requestAnimationFrame(t)}))}let Li=0;function Pi(t,e,n,r){const i=t._endId=++Li,o=()=>{i===t._endId&&r()};if(n)return setTimeout(o,n);const{type:s,timeout:l,propCount:a}=function(t,e){const n=window.getComputedStyle(t),r=t=>(n[t]||"").split(", "),i=r("transitionDelay"),o=r("transitionDuration"),s=Vi(i,o),l=r("animationDelay"),a=r("animationDuration"),u=Vi(l,a);let c=null,f=0,h=0;return e===Si?s>0&&(c=Si,f=s,h=o.length):e===ki?u>0&&(c=ki,f=u,h=a.length):(f=Math.max(s,u),c=f>0?s>u?Si:ki:null,h=c?c===Si?o.length:a.length:0),{type:c,timeout:f,propCount:h,hasTransform:c===Si&&/\b(transform|all)(,|$)/.test(n.transitionProperty)}}(t,e);if(!s)return r();const u=s+"end";let c=0;const f=()=>{t.removeEventListener(u,h),o()},h=e=>{e.target===t&&++c>=a&&f()};setTimeout((()=>{c<a&&f()}),l+1),t.addEventListener(u,h)}function Vi(t,e){for(;t.length<e.length;)t=t.concat(t);return Math.max(...e.map(((e,n)=>ji(e)+ji(t[n]))))}function ji(t){return 1e3*Number(t.slice(0,-1).replace(",","."))}new WeakMap,new WeakMap;const Fi={beforeMount(t,{value:e},{transition:n}){t._vod="none"===t.style.display?"":t.style.display,n&&e?n.beforeEnter(t):Ri(t,e)},mounted(t,{value:e},{transition:n}){n&&e&&n.enter(t)},updated(t,{value:e,oldValue:n},{transition:r}){!e!=!n&&(r?e?(r.beforeEnter(t),Ri(t,!0),r.enter(t)):r.leave(t,(()=>{Ri(t,!1)})):Ri(t,e))},beforeUnmount(t,{value:e}){Ri(t,e)}};function Ri(t,e){t.style.display=e?t._vod:"none"}const Ui=m({patchProp:(t,n,i,o,s=!1,l,a,u,c)=>{"class"===n?function(t,e,n){const r=t._vtc;r&&(e=(e?[e,...r]:[...r]).join(" ")),null==e?t.removeAttribute("class"):n?t.setAttribute("class",e):t.className=e}(t,o,s):"style"===n?function(t,e,n){const r=t.style,i=E(n);if(n&&!i){for(const t in n)hi(r,t,n[t]);if(e&&!E(e))for(const t in e)null==n[t]&&hi(r,t,"")}else{const o=r.display;i?e!==n&&(r.cssText=n):e&&t.removeAttribute("style"),"_vod"in t&&(r.display=o)}}(t,i,o):v(n)?y(n)||function(t,e,n,r,i=null){const o=t._vei||(t._vei={}),s=o[e];if(r&&s)s.value=r;else{const[n,l]=function(t){let e;if(bi.test(t)){let n;for(e={};n=t.match(bi);)t=t.slice(0,t.length-n[0].length),e[n[0].toLowerCase()]=!0}return[U(t.slice(2)),e]}(e);if(r){const s=o[e]=function(t,e){const n=t=>{const r=t.timeStamp||vi();(yi||r>=n.attached-1)&&ge(function(t,e){if(w(e)){const n=t.stopImmediatePropagation;return t.stopImmediatePropagation=()=>{n.call(t),t._stopped=!0},e.map((t=>e=>!e._stopped&&t&&t(e)))}return e}(t,n.value),e,5,[t])};return n.value=t,n.attached=mi||(_i.then(xi),mi=vi()),n}(r,i);!function(t,e,n,r){t.addEventListener(e,n,r)}(t,n,s,l)}else s&&(function(t,e,n,r){t.removeEventListener(e,n,r)}(t,n,s,l),o[e]=void 0)}}(t,n,0,o,a):("."===n[0]?(n=n.slice(1),1):"^"===n[0]?(n=n.slice(1),0):function(t,e,n,r){return r?"innerHTML"===e||"textContent"===e||!!(e in t&&wi.test(e)&&M(n)):"spellcheck"!==e&&"draggable"!==e&&"translate"!==e&&("form"!==e&&(("list"!==e||"INPUT"!==t.tagName)&&(("type"!==e||"TEXTAREA"!==t.tagName)&&((!wi.test(e)||!E(n))&&e in t))))}(t,n,o,s))?function(t,e,n,i,o,s,l){if("innerHTML"===e||"textContent"===e)return i&&l(i,o,s),void(t[e]=null==n?"":n);if("value"===e&&"PROGRESS"!==t.tagName&&!t.tagName.includes("-")){t._value=n;const r=null==n?"":n;return t.value===r&&"OPTION"!==t.tagName||(t.value=r),void(null==n&&t.removeAttribute(e))}let a=!1;if(""===n||null==n){const i=typeof t[e];"boolean"===i?n=r(n):null==n&&"string"===i?(n="",a=!0):"number"===i&&(n=0,a=!0)}try{t[e]=n}catch(t){}a&&t.removeAttribute(e)}(t,n,o,l,a,u,c):("true-value"===n?t._trueValue=o:"false-value"===n&&(t._falseValue=o),function(t,n,i,o,s){if(o&&n.startsWith("xlink:"))null==i?t.removeAttributeNS(gi,n.slice(6,n.length)):t.setAttributeNS(gi,n,i);else{const o=e(n);null==i||o&&!r(i)?t.removeAttribute(n):t.setAttribute(n,o?"":i)}}(t,n,o,s))}},ci);let Di;const Ii={class:"overflow-auto h-full w-full"},Bi=["viewBox"],zi=["x1","y1","x2","y2","index","onMouseover"],qi=["x1","y1","x2","y2","index","onMouseover"],Xi=["transform"],Hi=["r","fill","index","onMouseover","onClick"];function Yi(){}function Wi(t){return null==t?Yi:function(){return this.querySelector(t)}}function Gi(t){return null==t?[]:Array.isArray(t)?t:Array.from(t)}function Ki(){return[]}function Zi(t){return null==t?Ki:function(){return this.querySelectorAll(t)}}function Ji(t){return function(){return this.matches(t)}}function Qi(t){return function(e){return e.matches(t)}}var to=Array.prototype.find;function eo(){return this.firstElementChild}var no=Array.prototype.filter;function ro(){return Array.from(this.children)}function io(t){return new Array(t.length)}function oo(t,e){this.ownerDocument=t.ownerDocument,this.namespaceURI=t.namespaceURI,this._next=null,this._parent=t,this.__data__=e}function so(t){return function(){return t}}function lo(t,e,n,r,i,o){for(var s,l=0,a=e.length,u=o.length;l<u;++l)(s=e[l])?(s.__data__=o[l],r[l]=s):n[l]=new oo(t,o[l]);for(;l<a;++l)(s=e[l])&&(i[l]=s)}function ao(t,e,n,r,i,o,s){var l,a,u,c=new Map,f=e.length,h=o.length,p=new Array(f);for(l=0;l<f;++l)(a=e[l])&&(p[l]=u=s.call(a,a.__data__,l,e)+"",c.has(u)?i[l]=a:c.set(u,a));for(l=0;l<h;++l)u=s.call(t,o[l],l,o)+"",(a=c.get(u))?(r[l]=a,a.__data__=o[l],c.delete(u)):n[l]=new oo(t,o[l]);for(l=0;l<f;++l)(a=e[l])&&c.get(p[l])===a&&(i[l]=a)}function uo(t){return t.__data__}function co(t){return"object"==typeof t&&"length"in t?t:Array.from(t)}function fo(t,e){return t<e?-1:t>e?1:t>=e?0:NaN}oo.prototype={constructor:oo,appendChild:function(t){return this._parent.insertBefore(t,this._next)},insertBefore:function(t,e){return this._parent.insertBefore(t,e)},querySelector:function(t){return this._parent.querySelector(t)},querySelectorAll:function(t){return this._parent.querySelectorAll(t)}};var ho="http://www.w3.org/1999/xhtml";const po={svg:"http://www.w3.org/2000/svg",xhtml:ho,xlink:"http://www.w3.org/1999/xlink",xml:"http://www.w3.org/XML/1998/namespace",xmlns:"http://www.w3.org/2000/xmlns/"};function go(t){var e=t+="",n=e.indexOf(":");return n>=0&&"xmlns"!==(e=t.slice(0,n))&&(t=t.slice(n+1)),po.hasOwnProperty(e)?{space:po[e],local:t}:t}function vo(t){return function(){this.removeAttribute(t)}}function yo(t){return function(){this.removeAttributeNS(t.space,t.local)}}function mo(t,e){return function(){this.setAttribute(t,e)}}function _o(t,e){return function(){this.setAttributeNS(t.space,t.local,e)}}function xo(t,e){return function(){var n=e.apply(this,arguments);null==n?this.removeAttribute(t):this.setAttribute(t,n)}}function bo(t,e){return function(){var n=e.apply(this,arguments);null==n?this.removeAttributeNS(t.space,t.local):this.setAttributeNS(t.space,t.local,n)}}function wo(t){return t.ownerDocument&&t.ownerDocument.defaultView||t.document&&t||t.defaultView}function So(t){return function(){this.style.removeProperty(t)}}function ko(t,e,n){return function(){this.style.setProperty(t,e,n)}}function Mo(t,e,n){return function(){var r=e.apply(this,arguments);null==r?this.style.removeProperty(t):this.style.setProperty(t,r,n)}}function Eo(t,e){return t.style.getPropertyValue(e)||wo(t).getComputedStyle(t,null).getPropertyValue(e)}function Ao(t){return function(){delete this[t]}}function No(t,e){return function(){this[t]=e}}function Co(t,e){return function(){var n=e.apply(this,arguments);null==n?delete this[t]:this[t]=n}}function Oo(t){return t.trim().split(/^|\s+/)}function $o(t){return t.classList||new To(t)}function To(t){this._node=t,this._names=Oo(t.getAttribute("class")||"")}function Lo(t,e){for(var n=$o(t),r=-1,i=e.length;++r<i;)n.add(e[r])}function Po(t,e){for(var n=$o(t),r=-1,i=e.length;++r<i;)n.remove(e[r])}function Vo(t){return function(){Lo(this,t)}}function jo(t){return function(){Po(this,t)}}function Fo(t,e){return function(){(e.apply(this,arguments)?Lo:Po)(this,t)}}function Ro(){this.textContent=""}function Uo(t){return function(){this.textContent=t}}function Do(t){return function(){var e=t.apply(this,arguments);this.textContent=null==e?"":e}}function Io(){this.innerHTML=""}function Bo(t){return function(){this.innerHTML=t}}function zo(t){return function(){var e=t.apply(this,arguments);this.innerHTML=null==e?"":e}}function qo(){this.nextSibling&&this.parentNode.appendChild(this)}function Xo(){this.previousSibling&&this.parentNode.insertBefore(this,this.parentNode.firstChild)}function Ho(t){return function(){var e=this.ownerDocument,n=this.namespaceURI;return n===ho&&e.documentElement.namespaceURI===ho?e.createElement(t):e.createElementNS(n,t)}}function Yo(t){return function(){return this.ownerDocument.createElementNS(t.space,t.local)}}function Wo(t){var e=go(t);return(e.local?Yo:Ho)(e)}function Go(){return null}function Ko(){var t=this.parentNode;t&&t.removeChild(this)}function Zo(){var t=this.cloneNode(!1),e=this.parentNode;return e?e.insertBefore(t,this.nextSibling):t}function Jo(){var t=this.cloneNode(!0),e=this.parentNode;return e?e.insertBefore(t,this.nextSibling):t}function Qo(t){return t.trim().split(/^|\s+/).map((function(t){var e="",n=t.indexOf(".");return n>=0&&(e=t.slice(n+1),t=t.slice(0,n)),{type:t,name:e}}))}function ts(t){return function(){var e=this.__on;if(e){for(var n,r=0,i=-1,o=e.length;r<o;++r)n=e[r],t.type&&n.type!==t.type||n.name!==t.name?e[++i]=n:this.removeEventListener(n.type,n.listener,n.options);++i?e.length=i:delete this.__on}}}function es(t,e,n){return function(){var r,i=this.__on,o=function(t){return function(e){t.call(this,e,this.__data__)}}(e);if(i)for(var s=0,l=i.length;s<l;++s)if((r=i[s]).type===t.type&&r.name===t.name)return this.removeEventListener(r.type,r.listener,r.options),this.addEventListener(r.type,r.listener=o,r.options=n),void(r.value=e);this.addEventListener(t.type,o,n),r={type:t.type,name:t.name,value:e,listener:o,options:n},i?i.push(r):this.__on=[r]}}function ns(t,e,n){var r=wo(t),i=r.CustomEvent;"function"==typeof i?i=new i(e,n):(i=r.document.createEvent("Event"),n?(i.initEvent(e,n.bubbles,n.cancelable),i.detail=n.detail):i.initEvent(e,!1,!1)),t.dispatchEvent(i)}function rs(t,e){return function(){return ns(this,t,e)}}function is(t,e){return function(){return ns(this,t,e.apply(this,arguments))}}To.prototype={add:function(t){this._names.indexOf(t)<0&&(this._names.push(t),this._node.setAttribute("class",this._names.join(" ")))},remove:function(t){var e=this._names.indexOf(t);e>=0&&(this._names.splice(e,1),this._node.setAttribute("class",this._names.join(" ")))},contains:function(t){return this._names.indexOf(t)>=0}};var os=[null];function ss(t,e){this._groups=t,this._parents=e}function ls(){return new ss([[document.documentElement]],os)}ss.prototype=ls.prototype={constructor:ss,select:function(t){"function"!=typeof t&&(t=Wi(t));for(var e=this._groups,n=e.length,r=new Array(n),i=0;i<n;++i)for(var o,s,l=e[i],a=l.length,u=r[i]=new Array(a),c=0;c<a;++c)(o=l[c])&&(s=t.call(o,o.__data__,c,l))&&("__data__"in o&&(s.__data__=o.__data__),u[c]=s);return new ss(r,this._parents)},selectAll:function(t){t="function"==typeof t?function(t){return function(){return Gi(t.apply(this,arguments))}}(t):Zi(t);for(var e=this._groups,n=e.length,r=[],i=[],o=0;o<n;++o)for(var s,l=e[o],a=l.length,u=0;u<a;++u)(s=l[u])&&(r.push(t.call(s,s.__data__,u,l)),i.push(s));return new ss(r,i)},selectChild:function(t){return this.select(null==t?eo:function(t){return function(){return to.call(this.children,t)}}("function"==typeof t?t:Qi(t)))},selectChildren:function(t){return this.selectAll(null==t?ro:function(t){return function(){return no.call(this.children,t)}}("function"==typeof t?t:Qi(t)))},filter:function(t){"function"!=typeof t&&(t=Ji(t));for(var e=this._groups,n=e.length,r=new Array(n),i=0;i<n;++i)for(var o,s=e[i],l=s.length,a=r[i]=[],u=0;u<l;++u)(o=s[u])&&t.call(o,o.__data__,u,s)&&a.push(o);return new ss(r,this._parents)},data:function(t,e){if(!arguments.length)return Array.from(this,uo);var n=e?ao:lo,r=this._parents,i=this._groups;"function"!=typeof t&&(t=so(t));for(var o=i.length,s=new Array(o),l=new Array(o),a=new Array(o),u=0;u<o;++u){var c=r[u],f=i[u],h=f.length,p=co(t.call(c,c&&c.__data__,u,r)),d=p.length,g=l[u]=new Array(d),v=s[u]=new Array(d),y=a[u]=new Array(h);n(c,f,g,v,y,p,e);for(var m,_,x=0,b=0;x<d;++x)if(m=g[x]){for(x>=b&&(b=x+1);!(_=v[b])&&++b<d;);m._next=_||null}}return(s=new ss(s,r))._enter=l,s._exit=a,s},enter:function(){return new ss(this._enter||this._groups.map(io),this._parents)},exit:function(){return new ss(this._exit||this._groups.map(io),this._parents)},join:function(t,e,n){var r=this.enter(),i=this,o=this.exit();return"function"==typeof t?(r=t(r))&&(r=r.selection()):r=r.append(t+""),null!=e&&(i=e(i))&&(i=i.selection()),null==n?o.remove():n(o),r&&i?r.merge(i).order():i},merge:function(t){for(var e=t.selection?t.selection():t,n=this._groups,r=e._groups,i=n.length,o=r.length,s=Math.min(i,o),l=new Array(i),a=0;a<s;++a)for(var u,c=n[a],f=r[a],h=c.length,p=l[a]=new Array(h),d=0;d<h;++d)(u=c[d]||f[d])&&(p[d]=u);for(;a<i;++a)l[a]=n[a];return new ss(l,this._parents)},selection:function(){return this},order:function(){for(var t=this._groups,e=-1,n=t.length;++e<n;)for(var r,i=t[e],o=i.length-1,s=i[o];--o>=0;)(r=i[o])&&(s&&4^r.compareDocumentPosition(s)&&s.parentNode.insertBefore(r,s),s=r);return this},sort:function(t){function e(e,n){return e&&n?t(e.__data__,n.__data__):!e-!n}t||(t=fo);for(var n=this._groups,r=n.length,i=new Array(r),o=0;o<r;++o){for(var s,l=n[o],a=l.length,u=i[o]=new Array(a),c=0;c<a;++c)(s=l[c])&&(u[c]=s);u.sort(e)}return new ss(i,this._parents).order()},call:function(){var t=arguments[0];return arguments[0]=this,t.apply(null,arguments),this},nodes:function(){return Array.from(this)},node:function(){for(var t=this._groups,e=0,n=t.length;e<n;++e)for(var r=t[e],i=0,o=r.length;i<o;++i){var s=r[i];if(s)return s}return null},size:function(){let t=0;for(const e of this)++t;return t},empty:function(){return!this.node()},each:function(t){for(var e=this._groups,n=0,r=e.length;n<r;++n)for(var i,o=e[n],s=0,l=o.length;s<l;++s)(i=o[s])&&t.call(i,i.__data__,s,o);return this},attr:function(t,e){var n=go(t);if(arguments.length<2){var r=this.node();return n.local?r.getAttributeNS(n.space,n.local):r.getAttribute(n)}return this.each((null==e?n.local?yo:vo:"function"==typeof e?n.local?bo:xo:n.local?_o:mo)(n,e))},style:function(t,e,n){return arguments.length>1?this.each((null==e?So:"function"==typeof e?Mo:ko)(t,e,null==n?"":n)):Eo(this.node(),t)},property:function(t,e){return arguments.length>1?this.each((null==e?Ao:"function"==typeof e?Co:No)(t,e)):this.node()[t]},classed:function(t,e){var n=Oo(t+"");if(arguments.length<2){for(var r=$o(this.node()),i=-1,o=n.length;++i<o;)if(!r.contains(n[i]))return!1;return!0}return this.each(("function"==typeof e?Fo:e?Vo:jo)(n,e))},text:function(t){return arguments.length?this.each(null==t?Ro:("function"==typeof t?Do:Uo)(t)):this.node().textContent},html:function(t){return arguments.length?this.each(null==t?Io:("function"==typeof t?zo:Bo)(t)):this.node().innerHTML},raise:function(){return this.each(qo)},lower:function(){return this.each(Xo)},append:function(t){var e="function"==typeof t?t:Wo(t);return this.select((function(){return this.appendChild(e.apply(this,arguments))}))},insert:function(t,e){var n="function"==typeof t?t:Wo(t),r=null==e?Go:"function"==typeof e?e:Wi(e);return this.select((function(){return this.insertBefore(n.apply(this,arguments),r.apply(this,arguments)||null)}))},remove:function(){return this.each(Ko)},clone:function(t){return this.select(t?Jo:Zo)},datum:function(t){return arguments.length?this.property("__data__",t):this.node().__data__},on:function(t,e,n){var r,i,o=Qo(t+""),s=o.length;if(!(arguments.length<2)){for(l=e?es:ts,r=0;r<s;++r)this.each(l(o[r],e,n));return this}var l=this.node().__on;if(l)for(var a,u=0,c=l.length;u<c;++u)for(r=0,a=l[u];r<s;++r)if((i=o[r]).type===a.type&&i.name===a.name)return a.value},dispatch:function(t,e){return this.each(("function"==typeof e?is:rs)(t,e))},[Symbol.iterator]:function*(){for(var t=this._groups,e=0,n=t.length;e<n;++e)for(var r,i=t[e],o=0,s=i.length;o<s;++o)(r=i[o])&&(yield r)}};const as=ls;var us={value:()=>{}};function cs(){for(var t,e=0,n=arguments.length,r={};e<n;++e){if(!(t=arguments[e]+"")||t in r||/[\s.]/.test(t))throw new Error("illegal type: "+t);r[t]=[]}return new fs(r)}function fs(t){this._=t}function hs(t,e){return t.trim().split(/^|\s+/).map((function(t){var n="",r=t.indexOf(".");if(r>=0&&(n=t.slice(r+1),t=t.slice(0,r)),t&&!e.hasOwnProperty(t))throw new Error("unknown type: "+t);return{type:t,name:n}}))}function ps(t,e){for(var n,r=0,i=t.length;r<i;++r)if((n=t[r]).name===e)return n.value}function ds(t,e,n){for(var r=0,i=t.length;r<i;++r)if(t[r].name===e){t[r]=us,t=t.slice(0,r).concat(t.slice(r+1));break}return null!=n&&t.push({name:e,value:n}),t}fs.prototype=cs.prototype={constructor:fs,on:function(t,e){var n,r=this._,i=hs(t+"",r),o=-1,s=i.length;if(!(arguments.length<2)){if(null!=e&&"function"!=typeof e)throw new Error("invalid callback: "+e);for(;++o<s;)if(n=(t=i[o]).type)r[n]=ds(r[n],t.name,e);else if(null==e)for(n in r)r[n]=ds(r[n],t.name,null);return this}for(;++o<s;)if((n=(t=i[o]).type)&&(n=ps(r[n],t.name)))return n},copy:function(){var t={},e=this._;for(var n in e)t[n]=e[n].slice();return new fs(t)},call:function(t,e){if((n=arguments.length-2)>0)for(var n,r,i=new Array(n),o=0;o<n;++o)i[o]=arguments[o+2];if(!this._.hasOwnProperty(t))throw new Error("unknown type: "+t);for(o=0,n=(r=this._[t]).length;o<n;++o)r[o].value.apply(e,i)},apply:function(t,e,n){if(!this._.hasOwnProperty(t))throw new Error("unknown type: "+t);for(var r=this._[t],i=0,o=r.length;i<o;++i)r[i].value.apply(e,n)}};const gs=cs;var vs,ys,ms=0,_s=0,xs=0,bs=0,ws=0,Ss=0,ks="object"==typeof performance&&performance.now?performance:Date,Ms="object"==typeof window&&window.requestAnimationFrame?window.requestAnimationFrame.bind(window):function(t){setTimeout(t,17)};function Es(){return ws||(Ms(As),ws=ks.now()+Ss)}function As(){ws=0}function Ns(){this._call=this._time=this._next=null}function Cs(t,e,n){var r=new Ns;return r.restart(t,e,n),r}function Os(){ws=(bs=ks.now())+Ss,ms=_s=0;try{!function(){Es(),++ms;for(var t,e=vs;e;)(t=ws-e._time)>=0&&e._call.call(void 0,t),e=e._next;--ms}()}finally{ms=0,function(){for(var t,e,n=vs,r=1/0;n;)n._call?(r>n._time&&(r=n._time),t=n,n=n._next):(e=n._next,n._next=null,n=t?t._next=e:vs=e);ys=t,Ts(r)}(),ws=0}}function $s(){var t=ks.now(),e=t-bs;e>1e3&&(Ss-=e,bs=t)}function Ts(t){ms||(_s&&(_s=clearTimeout(_s)),t-ws>24?(t<1/0&&(_s=setTimeout(Os,t-ks.now()-Ss)),xs&&(xs=clearInterval(xs))):(xs||(bs=ks.now(),xs=setInterval($s,1e3)),ms=1,Ms(Os)))}function Ls(t,e,n){var r=new Ns;return e=null==e?0:+e,r.restart((n=>{r.stop(),t(n+e)}),e,n),r}Ns.prototype=Cs.prototype={constructor:Ns,restart:function(t,e,n){if("function"!=typeof t)throw new TypeError("callback is not a function");n=(null==n?Es():+n)+(null==e?0:+e),this._next||ys===this||(ys?ys._next=this:vs=this,ys=this),this._call=t,this._time=n,Ts()},stop:function(){this._call&&(this._call=null,this._time=1/0,Ts())}};var Ps=gs("start","end","cancel","interrupt"),Vs=[];function js(t,e,n,r,i,o){var s=t.__transition;if(s){if(n in s)return}else t.__transition={};!function(t,e,n){var r,i=t.__transition;function o(a){var u,c,f,h;if(1!==n.state)return l();for(u in i)if((h=i[u]).name===n.name){if(3===h.state)return Ls(o);4===h.state?(h.state=6,h.timer.stop(),h.on.call("interrupt",t,t.__data__,h.index,h.group),delete i[u]):+u<e&&(h.state=6,h.timer.stop(),h.on.call("cancel",t,t.__data__,h.index,h.group),delete i[u])}if(Ls((function(){3===n.state&&(n.state=4,n.timer.restart(s,n.delay,n.time),s(a))})),n.state=2,n.on.call("start",t,t.__data__,n.index,n.group),2===n.state){for(n.state=3,r=new Array(f=n.tween.length),u=0,c=-1;u<f;++u)(h=n.tween[u].value.call(t,t.__data__,n.index,n.group))&&(r[++c]=h);r.length=c+1}}function s(e){for(var i=e<n.duration?n.ease.call(null,e/n.duration):(n.timer.restart(l),n.state=5,1),o=-1,s=r.length;++o<s;)r[o].call(t,i);5===n.state&&(n.on.call("end",t,t.__data__,n.index,n.group),l())}function l(){for(var r in n.state=6,n.timer.stop(),delete i[e],i)return;delete t.__transition}i[e]=n,n.timer=Cs((function(t){n.state=1,n.timer.restart(o,n.delay,n.time),n.delay<=t&&o(t-n.delay)}),0,n.time)}(t,n,{name:e,index:r,group:i,on:Ps,tween:Vs,time:o.time,delay:o.delay,duration:o.duration,ease:o.ease,timer:null,state:0})}function Fs(t,e){var n=Us(t,e);if(n.state>0)throw new Error("too late; already scheduled");return n}function Rs(t,e){var n=Us(t,e);if(n.state>3)throw new Error("too late; already running");return n}function Us(t,e){var n=t.__transition;if(!n||!(n=n[e]))throw new Error("transition not found");return n}function Ds(t,e){return t=+t,e=+e,function(n){return t*(1-n)+e*n}}var Is,Bs=180/Math.PI,zs={translateX:0,translateY:0,rotate:0,skewX:0,scaleX:1,scaleY:1};function qs(t,e,n,r,i,o){var s,l,a;return(s=Math.sqrt(t*t+e*e))&&(t/=s,e/=s),(a=t*n+e*r)&&(n-=t*a,r-=e*a),(l=Math.sqrt(n*n+r*r))&&(n/=l,r/=l,a/=l),t*r<e*n&&(t=-t,e=-e,a=-a,s=-s),{translateX:i,translateY:o,rotate:Math.atan2(e,t)*Bs,skewX:Math.atan(a)*Bs,scaleX:s,scaleY:l}}function Xs(t,e,n,r){function i(t){return t.length?t.pop()+" ":""}return function(o,s){var l=[],a=[];return o=t(o),s=t(s),function(t,r,i,o,s,l){if(t!==i||r!==o){var a=s.push("translate(",null,e,null,n);l.push({i:a-4,x:Ds(t,i)},{i:a-2,x:Ds(r,o)})}else(i||o)&&s.push("translate("+i+e+o+n)}(o.translateX,o.translateY,s.translateX,s.translateY,l,a),function(t,e,n,o){t!==e?(t-e>180?e+=360:e-t>180&&(t+=360),o.push({i:n.push(i(n)+"rotate(",null,r)-2,x:Ds(t,e)})):e&&n.push(i(n)+"rotate("+e+r)}(o.rotate,s.rotate,l,a),function(t,e,n,o){t!==e?o.push({i:n.push(i(n)+"skewX(",null,r)-2,x:Ds(t,e)}):e&&n.push(i(n)+"skewX("+e+r)}(o.skewX,s.skewX,l,a),function(t,e,n,r,o,s){if(t!==n||e!==r){var l=o.push(i(o)+"scale(",null,",",null,")");s.push({i:l-4,x:Ds(t,n)},{i:l-2,x:Ds(e,r)})}else 1===n&&1===r||o.push(i(o)+"scale("+n+","+r+")")}(o.scaleX,o.scaleY,s.scaleX,s.scaleY,l,a),o=s=null,function(t){for(var e,n=-1,r=a.length;++n<r;)l[(e=a[n]).i]=e.x(t);return l.join("")}}}var Hs=Xs((function(t){const e=new("function"==typeof DOMMatrix?DOMMatrix:WebKitCSSMatrix)(t+"");return e.isIdentity?zs:qs(e.a,e.b,e.c,e.d,e.e,e.f)}),"px, ","px)","deg)"),Ys=Xs((function(t){return null==t?zs:(Is||(Is=document.createElementNS("http://www.w3.org/2000/svg","g")),Is.setAttribute("transform",t),(t=Is.transform.baseVal.consolidate())?qs((t=t.matrix).a,t.b,t.c,t.d,t.e,t.f):zs)}),", ",")",")");function Ws(t,e){var n,r;return function(){var i=Rs(this,t),o=i.tween;if(o!==n)for(var s=0,l=(r=n=o).length;s<l;++s)if(r[s].name===e){(r=r.slice()).splice(s,1);break}i.tween=r}}function Gs(t,e,n){var r,i;if("function"!=typeof n)throw new Error;return function(){var o=Rs(this,t),s=o.tween;if(s!==r){i=(r=s).slice();for(var l={name:e,value:n},a=0,u=i.length;a<u;++a)if(i[a].name===e){i[a]=l;break}a===u&&i.push(l)}o.tween=i}}function Ks(t,e,n){var r=t._id;return t.each((function(){var t=Rs(this,r);(t.value||(t.value={}))[e]=n.apply(this,arguments)})),function(t){return Us(t,r).value[e]}}function Zs(t,e,n){t.prototype=e.prototype=n,n.constructor=t}function Js(t,e){var n=Object.create(t.prototype);for(var r in e)n[r]=e[r];return n}function Qs(){}var tl=.7,el=1/tl,nl="\\s*([+-]?\\d+)\\s*",rl="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)\\s*",il="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)%\\s*",ol=/^#([0-9a-f]{3,8})$/,sl=new RegExp(`^rgb\\(${nl},${nl},${nl}\\)$`),ll=new RegExp(`^rgb\\(${il},${il},${il}\\)$`),al=new RegExp(`^rgba\\(${nl},${nl},${nl},${rl}\\)$`),ul=new RegExp(`^rgba\\(${il},${il},${il},${rl}\\)$`),cl=new RegExp(`^hsl\\(${rl},${il},${il}\\)$`),fl=new RegExp(`^hsla\\(${rl},${il},${il},${rl}\\)$`),hl={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};function pl(){return this.rgb().formatHex()}function dl(){return this.rgb().formatRgb()}function gl(t){var e,n;return t=(t+"").trim().toLowerCase(),(e=ol.exec(t))?(n=e[1].length,e=parseInt(e[1],16),6===n?vl(e):3===n?new xl(e>>8&15|e>>4&240,e>>4&15|240&e,(15&e)<<4|15&e,1):8===n?yl(e>>24&255,e>>16&255,e>>8&255,(255&e)/255):4===n?yl(e>>12&15|e>>8&240,e>>8&15|e>>4&240,e>>4&15|240&e,((15&e)<<4|15&e)/255):null):(e=sl.exec(t))?new xl(e[1],e[2],e[3],1):(e=ll.exec(t))?new xl(255*e[1]/100,255*e[2]/100,255*e[3]/100,1):(e=al.exec(t))?yl(e[1],e[2],e[3],e[4]):(e=ul.exec(t))?yl(255*e[1]/100,255*e[2]/100,255*e[3]/100,e[4]):(e=cl.exec(t))?El(e[1],e[2]/100,e[3]/100,1):(e=fl.exec(t))?El(e[1],e[2]/100,e[3]/100,e[4]):hl.hasOwnProperty(t)?vl(hl[t]):"transparent"===t?new xl(NaN,NaN,NaN,0):null}function vl(t){return new xl(t>>16&255,t>>8&255,255&t,1)}function yl(t,e,n,r){return r<=0&&(t=e=n=NaN),new xl(t,e,n,r)}function ml(t){return t instanceof Qs||(t=gl(t)),t?new xl((t=t.rgb()).r,t.g,t.b,t.opacity):new xl}function _l(t,e,n,r){return 1===arguments.length?ml(t):new xl(t,e,n,null==r?1:r)}function xl(t,e,n,r){this.r=+t,this.g=+e,this.b=+n,this.opacity=+r}function bl(){return`#${Ml(this.r)}${Ml(this.g)}${Ml(this.b)}`}function wl(){const t=Sl(this.opacity);return`${1===t?"rgb(":"rgba("}${kl(this.r)}, ${kl(this.g)}, ${kl(this.b)}${1===t?")":`, ${t})`}`}function Sl(t){return isNaN(t)?1:Math.max(0,Math.min(1,t))}function kl(t){return Math.max(0,Math.min(255,Math.round(t)||0))}function Ml(t){return((t=kl(t))<16?"0":"")+t.toString(16)}function El(t,e,n,r){return r<=0?t=e=n=NaN:n<=0||n>=1?t=e=NaN:e<=0&&(t=NaN),new Nl(t,e,n,r)}function Al(t){if(t instanceof Nl)return new Nl(t.h,t.s,t.l,t.opacity);if(t instanceof Qs||(t=gl(t)),!t)return new Nl;if(t instanceof Nl)return t;var e=(t=t.rgb()).r/255,n=t.g/255,r=t.b/255,i=Math.min(e,n,r),o=Math.max(e,n,r),s=NaN,l=o-i,a=(o+i)/2;return l?(s=e===o?(n-r)/l+6*(n<r):n===o?(r-e)/l+2:(e-n)/l+4,l/=a<.5?o+i:2-o-i,s*=60):l=a>0&&a<1?0:s,new Nl(s,l,a,t.opacity)}function Nl(t,e,n,r){this.h=+t,this.s=+e,this.l=+n,this.opacity=+r}function Cl(t){return(t=(t||0)%360)<0?t+360:t}function Ol(t){return Math.max(0,Math.min(1,t||0))}function $l(t,e,n){return 255*(t<60?e+(n-e)*t/60:t<180?n:t<240?e+(n-e)*(240-t)/60:e)}function Tl(t,e,n,r,i){var o=t*t,s=o*t;return((1-3*t+3*o-s)*e+(4-6*o+3*s)*n+(1+3*t+3*o-3*s)*r+s*i)/6}Zs(Qs,gl,{copy(t){return Object.assign(new this.constructor,this,t)},displayable(){return this.rgb().displayable()},hex:pl,formatHex:pl,formatHex8:function(){return this.rgb().formatHex8()},formatHsl:function(){return Al(this).formatHsl()},formatRgb:dl,toString:dl}),Zs(xl,_l,Js(Qs,{brighter(t){return t=null==t?el:Math.pow(el,t),new xl(this.r*t,this.g*t,this.b*t,this.opacity)},darker(t){return t=null==t?tl:Math.pow(tl,t),new xl(this.r*t,this.g*t,this.b*t,this.opacity)},rgb(){return this},clamp(){return new xl(kl(this.r),kl(this.g),kl(this.b),Sl(this.opacity))},displayable(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:bl,formatHex:bl,formatHex8:function(){return`#${Ml(this.r)}${Ml(this.g)}${Ml(this.b)}${Ml(255*(isNaN(this.opacity)?1:this.opacity))}`},formatRgb:wl,toString:wl})),Zs(Nl,(function(t,e,n,r){return 1===arguments.length?Al(t):new Nl(t,e,n,null==r?1:r)}),Js(Qs,{brighter(t){return t=null==t?el:Math.pow(el,t),new Nl(this.h,this.s,this.l*t,this.opacity)},darker(t){return t=null==t?tl:Math.pow(tl,t),new Nl(this.h,this.s,this.l*t,this.opacity)},rgb(){var t=this.h%360+360*(this.h<0),e=isNaN(t)||isNaN(this.s)?0:this.s,n=this.l,r=n+(n<.5?n:1-n)*e,i=2*n-r;return new xl($l(t>=240?t-240:t+120,i,r),$l(t,i,r),$l(t<120?t+240:t-120,i,r),this.opacity)},clamp(){return new Nl(Cl(this.h),Ol(this.s),Ol(this.l),Sl(this.opacity))},displayable(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl(){const t=Sl(this.opacity);return`${1===t?"hsl(":"hsla("}${Cl(this.h)}, ${100*Ol(this.s)}%, ${100*Ol(this.l)}%${1===t?")":`, ${t})`}`}}));const Ll=t=>()=>t;function Pl(t,e){var n=e-t;return n?function(t,e){return function(n){return t+n*e}}(t,n):Ll(isNaN(t)?e:t)}const Vl=function t(e){var n=function(t){return 1==(t=+t)?Pl:function(e,n){return n-e?function(t,e,n){return t=Math.pow(t,n),e=Math.pow(e,n)-t,n=1/n,function(r){return Math.pow(t+r*e,n)}}(e,n,t):Ll(isNaN(e)?n:e)}}(e);function r(t,e){var r=n((t=_l(t)).r,(e=_l(e)).r),i=n(t.g,e.g),o=n(t.b,e.b),s=Pl(t.opacity,e.opacity);return function(e){return t.r=r(e),t.g=i(e),t.b=o(e),t.opacity=s(e),t+""}}return r.gamma=t,r}(1);function jl(t){return function(e){var n,r,i=e.length,o=new Array(i),s=new Array(i),l=new Array(i);for(n=0;n<i;++n)r=_l(e[n]),o[n]=r.r||0,s[n]=r.g||0,l[n]=r.b||0;return o=t(o),s=t(s),l=t(l),r.opacity=1,function(t){return r.r=o(t),r.g=s(t),r.b=l(t),r+""}}}jl((function(t){var e=t.length-1;return function(n){var r=n<=0?n=0:n>=1?(n=1,e-1):Math.floor(n*e),i=t[r],o=t[r+1],s=r>0?t[r-1]:2*i-o,l=r<e-1?t[r+2]:2*o-i;return Tl((n-r/e)*e,s,i,o,l)}})),jl((function(t){var e=t.length;return function(n){var r=Math.floor(((n%=1)<0?++n:n)*e),i=t[(r+e-1)%e],o=t[r%e],s=t[(r+1)%e],l=t[(r+2)%e];return Tl((n-r/e)*e,i,o,s,l)}}));var Fl=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,Rl=new RegExp(Fl.source,"g");function Ul(t,e){var n,r,i,o=Fl.lastIndex=Rl.lastIndex=0,s=-1,l=[],a=[];for(t+="",e+="";(n=Fl.exec(t))&&(r=Rl.exec(e));)(i=r.index)>o&&(i=e.slice(o,i),l[s]?l[s]+=i:l[++s]=i),(n=n[0])===(r=r[0])?l[s]?l[s]+=r:l[++s]=r:(l[++s]=null,a.push({i:s,x:Ds(n,r)})),o=Rl.lastIndex;return o<e.length&&(i=e.slice(o),l[s]?l[s]+=i:l[++s]=i),l.length<2?a[0]?function(t){return function(e){return t(e)+""}}(a[0].x):function(t){return function(){return t}}(e):(e=a.length,function(t){for(var n,r=0;r<e;++r)l[(n=a[r]).i]=n.x(t);return l.join("")})}function Dl(t,e){var n;return("number"==typeof e?Ds:e instanceof gl?Vl:(n=gl(e))?(e=n,Vl):Ul)(t,e)}function Il(t){return function(){this.removeAttribute(t)}}function Bl(t){return function(){this.removeAttributeNS(t.space,t.local)}}function zl(t,e,n){var r,i,o=n+"";return function(){var s=this.getAttribute(t);return s===o?null:s===r?i:i=e(r=s,n)}}function ql(t,e,n){var r,i,o=n+"";return function(){var s=this.getAttributeNS(t.space,t.local);return s===o?null:s===r?i:i=e(r=s,n)}}function Xl(t,e,n){var r,i,o;return function(){var s,l,a=n(this);if(null!=a)return(s=this.getAttribute(t))===(l=a+"")?null:s===r&&l===i?o:(i=l,o=e(r=s,a));this.removeAttribute(t)}}function Hl(t,e,n){var r,i,o;return function(){var s,l,a=n(this);if(null!=a)return(s=this.getAttributeNS(t.space,t.local))===(l=a+"")?null:s===r&&l===i?o:(i=l,o=e(r=s,a));this.removeAttributeNS(t.space,t.local)}}function Yl(t,e){return function(n){this.setAttribute(t,e.call(this,n))}}function Wl(t,e){return function(n){this.setAttributeNS(t.space,t.local,e.call(this,n))}}function Gl(t,e){var n,r;function i(){var i=e.apply(this,arguments);return i!==r&&(n=(r=i)&&Wl(t,i)),n}return i._value=e,i}function Kl(t,e){var n,r;function i(){var i=e.apply(this,arguments);return i!==r&&(n=(r=i)&&Yl(t,i)),n}return i._value=e,i}function Zl(t,e){return function(){Fs(this,t).delay=+e.apply(this,arguments)}}function Jl(t,e){return e=+e,function(){Fs(this,t).delay=e}}function Ql(t,e){return function(){Rs(this,t).duration=+e.apply(this,arguments)}}function ta(t,e){return e=+e,function(){Rs(this,t).duration=e}}function ea(t,e){if("function"!=typeof e)throw new Error;return function(){Rs(this,t).ease=e}}function na(t,e,n){var r,i,o=function(t){return(t+"").trim().split(/^|\s+/).every((function(t){var e=t.indexOf(".");return e>=0&&(t=t.slice(0,e)),!t||"start"===t}))}(e)?Fs:Rs;return function(){var s=o(this,t),l=s.on;l!==r&&(i=(r=l).copy()).on(e,n),s.on=i}}var ra=as.prototype.constructor;function ia(t){return function(){this.style.removeProperty(t)}}function oa(t,e,n){return function(r){this.style.setProperty(t,e.call(this,r),n)}}function sa(t,e,n){var r,i;function o(){var o=e.apply(this,arguments);return o!==i&&(r=(i=o)&&oa(t,o,n)),r}return o._value=e,o}function la(t){return function(e){this.textContent=t.call(this,e)}}function aa(t){var e,n;function r(){var r=t.apply(this,arguments);return r!==n&&(e=(n=r)&&la(r)),e}return r._value=t,r}var ua=0;function ca(t,e,n,r){this._groups=t,this._parents=e,this._name=n,this._id=r}function fa(){return++ua}var ha=as.prototype;ca.prototype=function(t){return as().transition(t)}.prototype={constructor:ca,select:function(t){var e=this._name,n=this._id;"function"!=typeof t&&(t=Wi(t));for(var r=this._groups,i=r.length,o=new Array(i),s=0;s<i;++s)for(var l,a,u=r[s],c=u.length,f=o[s]=new Array(c),h=0;h<c;++h)(l=u[h])&&(a=t.call(l,l.__data__,h,u))&&("__data__"in l&&(a.__data__=l.__data__),f[h]=a,js(f[h],e,n,h,f,Us(l,n)));return new ca(o,this._parents,e,n)},selectAll:function(t){var e=this._name,n=this._id;"function"!=typeof t&&(t=Zi(t));for(var r=this._groups,i=r.length,o=[],s=[],l=0;l<i;++l)for(var a,u=r[l],c=u.length,f=0;f<c;++f)if(a=u[f]){for(var h,p=t.call(a,a.__data__,f,u),d=Us(a,n),g=0,v=p.length;g<v;++g)(h=p[g])&&js(h,e,n,g,p,d);o.push(p),s.push(a)}return new ca(o,s,e,n)},selectChild:ha.selectChild,selectChildren:ha.selectChildren,filter:function(t){"function"!=typeof t&&(t=Ji(t));for(var e=this._groups,n=e.length,r=new Array(n),i=0;i<n;++i)for(var o,s=e[i],l=s.length,a=r[i]=[],u=0;u<l;++u)(o=s[u])&&t.call(o,o.__data__,u,s)&&a.push(o);return new ca(r,this._parents,this._name,this._id)},merge:function(t){if(t._id!==this._id)throw new Error;for(var e=this._groups,n=t._groups,r=e.length,i=n.length,o=Math.min(r,i),s=new Array(r),l=0;l<o;++l)for(var a,u=e[l],c=n[l],f=u.length,h=s[l]=new Array(f),p=0;p<f;++p)(a=u[p]||c[p])&&(h[p]=a);for(;l<r;++l)s[l]=e[l];return new ca(s,this._parents,this._name,this._id)},selection:function(){return new ra(this._groups,this._parents)},transition:function(){for(var t=this._name,e=this._id,n=fa(),r=this._groups,i=r.length,o=0;o<i;++o)for(var s,l=r[o],a=l.length,u=0;u<a;++u)if(s=l[u]){var c=Us(s,e);js(s,t,n,u,l,{time:c.time+c.delay+c.duration,delay:0,duration:c.duration,ease:c.ease})}return new ca(r,this._parents,t,n)},call:ha.call,nodes:ha.nodes,node:ha.node,size:ha.size,empty:ha.empty,each:ha.each,on:function(t,e){var n=this._id;return arguments.length<2?Us(this.node(),n).on.on(t):this.each(na(n,t,e))},attr:function(t,e){var n=go(t),r="transform"===n?Ys:Dl;return this.attrTween(t,"function"==typeof e?(n.local?Hl:Xl)(n,r,Ks(this,"attr."+t,e)):null==e?(n.local?Bl:Il)(n):(n.local?ql:zl)(n,r,e))},attrTween:function(t,e){var n="attr."+t;if(arguments.length<2)return(n=this.tween(n))&&n._value;if(null==e)return this.tween(n,null);if("function"!=typeof e)throw new Error;var r=go(t);return this.tween(n,(r.local?Gl:Kl)(r,e))},style:function(t,e,n){var r="transform"==(t+="")?Hs:Dl;return null==e?this.styleTween(t,function(t,e){var n,r,i;return function(){var o=Eo(this,t),s=(this.style.removeProperty(t),Eo(this,t));return o===s?null:o===n&&s===r?i:i=e(n=o,r=s)}}(t,r)).on("end.style."+t,ia(t)):"function"==typeof e?this.styleTween(t,function(t,e,n){var r,i,o;return function(){var s=Eo(this,t),l=n(this),a=l+"";return null==l&&(this.style.removeProperty(t),a=l=Eo(this,t)),s===a?null:s===r&&a===i?o:(i=a,o=e(r=s,l))}}(t,r,Ks(this,"style."+t,e))).each(function(t,e){var n,r,i,o,s="style."+e,l="end."+s;return function(){var a=Rs(this,t),u=a.on,c=null==a.value[s]?o||(o=ia(e)):void 0;u===n&&i===c||(r=(n=u).copy()).on(l,i=c),a.on=r}}(this._id,t)):this.styleTween(t,function(t,e,n){var r,i,o=n+"";return function(){var s=Eo(this,t);return s===o?null:s===r?i:i=e(r=s,n)}}(t,r,e),n).on("end.style."+t,null)},styleTween:function(t,e,n){var r="style."+(t+="");if(arguments.length<2)return(r=this.tween(r))&&r._value;if(null==e)return this.tween(r,null);if("function"!=typeof e)throw new Error;return this.tween(r,sa(t,e,null==n?"":n))},text:function(t){return this.tween("text","function"==typeof t?function(t){return function(){var e=t(this);this.textContent=null==e?"":e}}(Ks(this,"text",t)):function(t){return function(){this.textContent=t}}(null==t?"":t+""))},textTween:function(t){var e="text";if(arguments.length<1)return(e=this.tween(e))&&e._value;if(null==t)return this.tween(e,null);if("function"!=typeof t)throw new Error;return this.tween(e,aa(t))},remove:function(){return this.on("end.remove",function(t){return function(){var e=this.parentNode;for(var n in this.__transition)if(+n!==t)return;e&&e.removeChild(this)}}(this._id))},tween:function(t,e){var n=this._id;if(t+="",arguments.length<2){for(var r,i=Us(this.node(),n).tween,o=0,s=i.length;o<s;++o)if((r=i[o]).name===t)return r.value;return null}return this.each((null==e?Ws:Gs)(n,t,e))},delay:function(t){var e=this._id;return arguments.length?this.each(("function"==typeof t?Zl:Jl)(e,t)):Us(this.node(),e).delay},duration:function(t){var e=this._id;return arguments.length?this.each(("function"==typeof t?Ql:ta)(e,t)):Us(this.node(),e).duration},ease:function(t){var e=this._id;return arguments.length?this.each(ea(e,t)):Us(this.node(),e).ease},easeVarying:function(t){if("function"!=typeof t)throw new Error;return this.each(function(t,e){return function(){var n=e.apply(this,arguments);if("function"!=typeof n)throw new Error;Rs(this,t).ease=n}}(this._id,t))},end:function(){var t,e,n=this,r=n._id,i=n.size();return new Promise((function(o,s){var l={value:s},a={value:function(){0==--i&&o()}};n.each((function(){var n=Rs(this,r),i=n.on;i!==t&&((e=(t=i).copy())._.cancel.push(l),e._.interrupt.push(l),e._.end.push(a)),n.on=e})),0===i&&o()}))},[Symbol.iterator]:ha[Symbol.iterator]};var pa={time:null,delay:0,duration:250,ease:function(t){return((t*=2)<=1?t*t*t:(t-=2)*t*t+2)/2}};function da(t,e){for(var n;!(n=t.__transition)||!(n=n[e]);)if(!(t=t.parentNode))throw new Error(`transition ${e} not found`);return n}as.prototype.interrupt=function(t){return this.each((function(){!function(t,e){var n,r,i,o=t.__transition,s=!0;if(o){for(i in e=null==e?null:e+"",o)(n=o[i]).name===e?(r=n.state>2&&n.state<5,n.state=6,n.timer.stop(),n.on.call(r?"interrupt":"cancel",t,t.__data__,n.index,n.group),delete o[i]):s=!1;s&&delete t.__transition}}(this,t)}))},as.prototype.transition=function(t){var e,n;t instanceof ca?(e=t._id,t=t._name):(e=fa(),(n=pa).time=Es(),t=null==t?null:t+"");for(var r=this._groups,i=r.length,o=0;o<i;++o)for(var s,l=r[o],a=l.length,u=0;u<a;++u)(s=l[u])&&js(s,t,e,u,l,n||da(s,e));return new ca(r,this._parents,t,e)};const{abs:ga,max:va,min:ya}=Math;function ma(t){return{type:t}}function _a(t,e){var n,r=e?e.length:0,i=t?Math.min(r,t.length):0,o=new Array(i),s=new Array(r);for(n=0;n<i;++n)o[n]=Sa(t[n],e[n]);for(;n<r;++n)s[n]=e[n];return function(t){for(n=0;n<i;++n)s[n]=o[n](t);return s}}function xa(t,e){var n=new Date;return t=+t,e=+e,function(r){return n.setTime(t*(1-r)+e*r),n}}function ba(t,e){var n,r={},i={};for(n in null!==t&&"object"==typeof t||(t={}),null!==e&&"object"==typeof e||(e={}),e)n in t?r[n]=Sa(t[n],e[n]):i[n]=e[n];return function(t){for(n in r)i[n]=r[n](t);return i}}function wa(t,e){e||(e=[]);var n,r=t?Math.min(e.length,t.length):0,i=e.slice();return function(o){for(n=0;n<r;++n)i[n]=t[n]*(1-o)+e[n]*o;return i}}function Sa(t,e){var n,r=typeof e;return null==e||"boolean"===r?Ll(e):("number"===r?Ds:"string"===r?(n=gl(e))?(e=n,Vl):Ul:e instanceof gl?Vl:e instanceof Date?xa:function(t){return ArrayBuffer.isView(t)&&!(t instanceof DataView)}(e)?wa:Array.isArray(e)?_a:"function"!=typeof e.valueOf&&"function"!=typeof e.toString||isNaN(e)?ba:Ds)(t,e)}function ka(t,e){return t=+t,e=+e,function(n){return Math.round(t*(1-n)+e*n)}}function Ma(t){return t}function Ea(t,e){switch(arguments.length){case 0:break;case 1:"function"==typeof t?this.interpolator(t):this.range(t);break;default:this.domain(t),"function"==typeof e?this.interpolator(e):this.range(e)}return this}["w","e"].map(ma),["n","s"].map(ma),["n","w","e","s","nw","ne","sw","se"].map(ma);var Aa=Math.sqrt(50),Na=Math.sqrt(10),Ca=Math.sqrt(2);function Oa(t,e,n){var r=(e-t)/Math.max(0,n),i=Math.floor(Math.log(r)/Math.LN10),o=r/Math.pow(10,i);return i>=0?(o>=Aa?10:o>=Na?5:o>=Ca?2:1)*Math.pow(10,i):-Math.pow(10,-i)/(o>=Aa?10:o>=Na?5:o>=Ca?2:1)}var $a,Ta=/^(?:(.)?([<>=^]))?([+\-( ])?([$#])?(0)?(\d+)?(,)?(\.\d+)?(~)?([a-z%])?$/i;function La(t){if(!(e=Ta.exec(t)))throw new Error("invalid format: "+t);var e;return new Pa({fill:e[1],align:e[2],sign:e[3],symbol:e[4],zero:e[5],width:e[6],comma:e[7],precision:e[8]&&e[8].slice(1),trim:e[9],type:e[10]})}function Pa(t){this.fill=void 0===t.fill?" ":t.fill+"",this.align=void 0===t.align?">":t.align+"",this.sign=void 0===t.sign?"-":t.sign+"",this.symbol=void 0===t.symbol?"":t.symbol+"",this.zero=!!t.zero,this.width=void 0===t.width?void 0:+t.width,this.comma=!!t.comma,this.precision=void 0===t.precision?void 0:+t.precision,this.trim=!!t.trim,this.type=void 0===t.type?"":t.type+""}function Va(t,e){if((n=(t=e?t.toExponential(e-1):t.toExponential()).indexOf("e"))<0)return null;var n,r=t.slice(0,n);return[r.length>1?r[0]+r.slice(2):r,+t.slice(n+1)]}function ja(t){return(t=Va(Math.abs(t)))?t[1]:NaN}function Fa(t,e){var n=Va(t,e);if(!n)return t+"";var r=n[0],i=n[1];return i<0?"0."+new Array(-i).join("0")+r:r.length>i+1?r.slice(0,i+1)+"."+r.slice(i+1):r+new Array(i-r.length+2).join("0")}La.prototype=Pa.prototype,Pa.prototype.toString=function(){return this.fill+this.align+this.sign+this.symbol+(this.zero?"0":"")+(void 0===this.width?"":Math.max(1,0|this.width))+(this.comma?",":"")+(void 0===this.precision?"":"."+Math.max(0,0|this.precision))+(this.trim?"~":"")+this.type};const Ra={"%":(t,e)=>(100*t).toFixed(e),b:t=>Math.round(t).toString(2),c:t=>t+"",d:function(t){return Math.abs(t=Math.round(t))>=1e21?t.toLocaleString("en").replace(/,/g,""):t.toString(10)},e:(t,e)=>t.toExponential(e),f:(t,e)=>t.toFixed(e),g:(t,e)=>t.toPrecision(e),o:t=>Math.round(t).toString(8),p:(t,e)=>Fa(100*t,e),r:Fa,s:function(t,e){var n=Va(t,e);if(!n)return t+"";var r=n[0],i=n[1],o=i-($a=3*Math.max(-8,Math.min(8,Math.floor(i/3))))+1,s=r.length;return o===s?r:o>s?r+new Array(o-s+1).join("0"):o>0?r.slice(0,o)+"."+r.slice(o):"0."+new Array(1-o).join("0")+Va(t,Math.max(0,e+o-1))[0]},X:t=>Math.round(t).toString(16).toUpperCase(),x:t=>Math.round(t).toString(16)};function Ua(t){return t}var Da,Ia,Ba,za=Array.prototype.map,qa=["y","z","a","f","p","n","µ","m","","k","M","G","T","P","E","Z","Y"];function Xa(t){var e=t.domain;return t.ticks=function(t){var n=e();return function(t,e,n){var r,i,o,s,l=-1;if(n=+n,(t=+t)==(e=+e)&&n>0)return[t];if((r=e<t)&&(i=t,t=e,e=i),0===(s=Oa(t,e,n))||!isFinite(s))return[];if(s>0){let n=Math.round(t/s),r=Math.round(e/s);for(n*s<t&&++n,r*s>e&&--r,o=new Array(i=r-n+1);++l<i;)o[l]=(n+l)*s}else{s=-s;let n=Math.round(t*s),r=Math.round(e*s);for(n/s<t&&++n,r/s>e&&--r,o=new Array(i=r-n+1);++l<i;)o[l]=(n+l)/s}return r&&o.reverse(),o}(n[0],n[n.length-1],null==t?10:t)},t.tickFormat=function(t,n){var r=e();return function(t,e,n,r){var i,o=function(t,e,n){var r=Math.abs(e-t)/Math.max(0,n),i=Math.pow(10,Math.floor(Math.log(r)/Math.LN10)),o=r/i;return o>=Aa?i*=10:o>=Na?i*=5:o>=Ca&&(i*=2),e<t?-i:i}(t,e,n);switch((r=La(null==r?",f":r)).type){case"s":var s=Math.max(Math.abs(t),Math.abs(e));return null!=r.precision||isNaN(i=function(t,e){return Math.max(0,3*Math.max(-8,Math.min(8,Math.floor(ja(e)/3)))-ja(Math.abs(t)))}(o,s))||(r.precision=i),Ba(r,s);case"":case"e":case"g":case"p":case"r":null!=r.precision||isNaN(i=function(t,e){return t=Math.abs(t),e=Math.abs(e)-t,Math.max(0,ja(e)-ja(t))+1}(o,Math.max(Math.abs(t),Math.abs(e))))||(r.precision=i-("e"===r.type));break;case"f":case"%":null!=r.precision||isNaN(i=function(t){return Math.max(0,-ja(Math.abs(t)))}(o))||(r.precision=i-2*("%"===r.type))}return Ia(r)}(r[0],r[r.length-1],null==t?10:t,n)},t.nice=function(n){null==n&&(n=10);var r,i,o=e(),s=0,l=o.length-1,a=o[s],u=o[l],c=10;for(u<a&&(i=a,a=u,u=i,i=s,s=l,l=i);c-- >0;){if((i=Oa(a,u,n))===r)return o[s]=a,o[l]=u,e(o);if(i>0)a=Math.floor(a/i)*i,u=Math.ceil(u/i)*i;else{if(!(i<0))break;a=Math.ceil(a*i)/i,u=Math.floor(u*i)/i}r=i}return t},t}function Ha(){var t,e,n,r,i,o=0,s=1,l=Ma,a=!1;function u(e){return null==e||isNaN(e=+e)?i:l(0===n?.5:(e=(r(e)-t)*n,a?Math.max(0,Math.min(1,e)):e))}function c(t){return function(e){var n,r;return arguments.length?([n,r]=e,l=t(n,r),u):[l(0),l(1)]}}return u.domain=function(i){return arguments.length?([o,s]=i,t=r(o=+o),e=r(s=+s),n=t===e?0:1/(e-t),u):[o,s]},u.clamp=function(t){return arguments.length?(a=!!t,u):a},u.interpolator=function(t){return arguments.length?(l=t,u):l},u.range=c(Sa),u.rangeRound=c(ka),u.unknown=function(t){return arguments.length?(i=t,u):i},function(i){return r=i,t=i(o),e=i(s),n=t===e?0:1/(e-t),u}}function Ya(t,e){return e.domain(t.domain()).interpolator(t.interpolator()).clamp(t.clamp()).unknown(t.unknown())}function Wa(){var t=Xa(Ha()(Ma));return t.copy=function(){return Ya(t,Wa())},Ea.apply(t,arguments)}function Ga(t){return t=Math.max(0,Math.min(1,t)),"rgb("+Math.max(0,Math.min(255,Math.round(34.61+t*(1172.33-t*(10793.56-t*(33300.12-t*(38394.49-14825.05*t)))))))+", "+Math.max(0,Math.min(255,Math.round(23.31+t*(557.33+t*(1225.33-t*(3574.96-t*(1073.77+707.56*t)))))))+", "+Math.max(0,Math.min(255,Math.round(27.2+t*(3211.1-t*(15327.97-t*(27814-t*(22569.18-6838.66*t)))))))+")"}function Ka(t){return"string"==typeof t?new ss([[document.querySelector(t)]],[document.documentElement]):new ss([[t]],os)}function Za(t){return"string"==typeof t?new ss([document.querySelectorAll(t)],[document.documentElement]):new ss([Gi(t)],os)}function Ja(t,e,n){this.k=t,this.x=e,this.y=n}Da=function(t){var e,n,r=void 0===t.grouping||void 0===t.thousands?Ua:(e=za.call(t.grouping,Number),n=t.thousands+"",function(t,r){for(var i=t.length,o=[],s=0,l=e[0],a=0;i>0&&l>0&&(a+l+1>r&&(l=Math.max(1,r-a)),o.push(t.substring(i-=l,i+l)),!((a+=l+1)>r));)l=e[s=(s+1)%e.length];return o.reverse().join(n)}),i=void 0===t.currency?"":t.currency[0]+"",o=void 0===t.currency?"":t.currency[1]+"",s=void 0===t.decimal?".":t.decimal+"",l=void 0===t.numerals?Ua:function(t){return function(e){return e.replace(/[0-9]/g,(function(e){return t[+e]}))}}(za.call(t.numerals,String)),a=void 0===t.percent?"%":t.percent+"",u=void 0===t.minus?"−":t.minus+"",c=void 0===t.nan?"NaN":t.nan+"";function f(t){var e=(t=La(t)).fill,n=t.align,f=t.sign,h=t.symbol,p=t.zero,d=t.width,g=t.comma,v=t.precision,y=t.trim,m=t.type;"n"===m?(g=!0,m="g"):Ra[m]||(void 0===v&&(v=12),y=!0,m="g"),(p||"0"===e&&"="===n)&&(p=!0,e="0",n="=");var _="$"===h?i:"#"===h&&/[boxX]/.test(m)?"0"+m.toLowerCase():"",x="$"===h?o:/[%p]/.test(m)?a:"",b=Ra[m],w=/[defgprs%]/.test(m);function S(t){var i,o,a,h=_,S=x;if("c"===m)S=b(t)+S,t="";else{var k=(t=+t)<0||1/t<0;if(t=isNaN(t)?c:b(Math.abs(t),v),y&&(t=function(t){t:for(var e,n=t.length,r=1,i=-1;r<n;++r)switch(t[r]){case".":i=e=r;break;case"0":0===i&&(i=r),e=r;break;default:if(!+t[r])break t;i>0&&(i=0)}return i>0?t.slice(0,i)+t.slice(e+1):t}(t)),k&&0==+t&&"+"!==f&&(k=!1),h=(k?"("===f?f:u:"-"===f||"("===f?"":f)+h,S=("s"===m?qa[8+$a/3]:"")+S+(k&&"("===f?")":""),w)for(i=-1,o=t.length;++i<o;)if(48>(a=t.charCodeAt(i))||a>57){S=(46===a?s+t.slice(i+1):t.slice(i))+S,t=t.slice(0,i);break}}g&&!p&&(t=r(t,1/0));var M=h.length+t.length+S.length,E=M<d?new Array(d-M+1).join(e):"";switch(g&&p&&(t=r(E+t,E.length?d-S.length:1/0),E=""),n){case"<":t=h+t+S+E;break;case"=":t=h+E+t+S;break;case"^":t=E.slice(0,M=E.length>>1)+h+t+S+E.slice(M);break;default:t=E+h+t+S}return l(t)}return v=void 0===v?6:/[gprs]/.test(m)?Math.max(1,Math.min(21,v)):Math.max(0,Math.min(20,v)),S.toString=function(){return t+""},S}return{format:f,formatPrefix:function(t,e){var n=f(((t=La(t)).type="f",t)),r=3*Math.max(-8,Math.min(8,Math.floor(ja(e)/3))),i=Math.pow(10,-r),o=qa[8+r/3];return function(t){return n(i*t)+o}}}}({thousands:",",grouping:[3],currency:["$",""]}),Ia=Da.format,Ba=Da.formatPrefix,Ja.prototype={constructor:Ja,scale:function(t){return 1===t?this:new Ja(this.k*t,this.x,this.y)},translate:function(t,e){return 0===t&0===e?this:new Ja(this.k,this.x+this.k*t,this.y+this.k*e)},apply:function(t){return[t[0]*this.k+this.x,t[1]*this.k+this.y]},applyX:function(t){return t*this.k+this.x},applyY:function(t){return t*this.k+this.y},invert:function(t){return[(t[0]-this.x)/this.k,(t[1]-this.y)/this.k]},invertX:function(t){return(t-this.x)/this.k},invertY:function(t){return(t-this.y)/this.k},rescaleX:function(t){return t.copy().domain(t.range().map(this.invertX,this).map(t.invert,t))},rescaleY:function(t){return t.copy().domain(t.range().map(this.invertY,this).map(t.invert,t))},toString:function(){return"translate("+this.x+","+this.y+") scale("+this.k+")"}},new Ja(1,0,0),Ja.prototype;const Qa=4294967296;function tu(t){return t.x}function eu(t){return t.y}var nu=Math.PI*(3-Math.sqrt(5));function ru(t,e,n,r){if(isNaN(e)||isNaN(n))return t;var i,o,s,l,a,u,c,f,h,p=t._root,d={data:r},g=t._x0,v=t._y0,y=t._x1,m=t._y1;if(!p)return t._root=d,t;for(;p.length;)if((u=e>=(o=(g+y)/2))?g=o:y=o,(c=n>=(s=(v+m)/2))?v=s:m=s,i=p,!(p=p[f=c<<1|u]))return i[f]=d,t;if(l=+t._x.call(null,p.data),a=+t._y.call(null,p.data),e===l&&n===a)return d.next=p,i?i[f]=d:t._root=d,t;do{i=i?i[f]=new Array(4):t._root=new Array(4),(u=e>=(o=(g+y)/2))?g=o:y=o,(c=n>=(s=(v+m)/2))?v=s:m=s}while((f=c<<1|u)==(h=(a>=s)<<1|l>=o));return i[h]=p,i[f]=d,t}function iu(t,e,n,r,i){this.node=t,this.x0=e,this.y0=n,this.x1=r,this.y1=i}function ou(t){return t[0]}function su(t){return t[1]}function lu(t,e,n){var r=new au(null==e?ou:e,null==n?su:n,NaN,NaN,NaN,NaN);return null==t?r:r.addAll(t)}function au(t,e,n,r,i,o){this._x=t,this._y=e,this._x0=n,this._y0=r,this._x1=i,this._y1=o,this._root=void 0}function uu(t){for(var e={data:t.data},n=e;t=t.next;)n=n.next={data:t.data};return e}var cu=lu.prototype=au.prototype;function fu(t){return function(){return t}}function hu(t){return 1e-6*(t()-.5)}function pu(t){return t.x+t.vx}function du(t){return t.y+t.vy}function gu(t){return t.index}function vu(t,e){var n=t.get(e);if(!n)throw new Error("node not found: "+e);return n}function yu(t){var e,n,r,i,o,s,l=gu,a=function(t){return 1/Math.min(i[t.source.index],i[t.target.index])},u=fu(30),c=1;function f(r){for(var i=0,l=t.length;i<c;++i)for(var a,u,f,h,p,d,g,v=0;v<l;++v)u=(a=t[v]).source,h=(f=a.target).x+f.vx-u.x-u.vx||hu(s),p=f.y+f.vy-u.y-u.vy||hu(s),h*=d=((d=Math.sqrt(h*h+p*p))-n[v])/d*r*e[v],p*=d,f.vx-=h*(g=o[v]),f.vy-=p*g,u.vx+=h*(g=1-g),u.vy+=p*g}function h(){if(r){var s,a,u=r.length,c=t.length,f=new Map(r.map(((t,e)=>[l(t,e,r),t])));for(s=0,i=new Array(u);s<c;++s)(a=t[s]).index=s,"object"!=typeof a.source&&(a.source=vu(f,a.source)),"object"!=typeof a.target&&(a.target=vu(f,a.target)),i[a.source.index]=(i[a.source.index]||0)+1,i[a.target.index]=(i[a.target.index]||0)+1;for(s=0,o=new Array(c);s<c;++s)a=t[s],o[s]=i[a.source.index]/(i[a.source.index]+i[a.target.index]);e=new Array(c),p(),n=new Array(c),d()}}function p(){if(r)for(var n=0,i=t.length;n<i;++n)e[n]=+a(t[n],n,t)}function d(){if(r)for(var e=0,i=t.length;e<i;++e)n[e]=+u(t[e],e,t)}return null==t&&(t=[]),f.initialize=function(t,e){r=t,s=e,h()},f.links=function(e){return arguments.length?(t=e,h(),f):t},f.id=function(t){return arguments.length?(l=t,f):l},f.iterations=function(t){return arguments.length?(c=+t,f):c},f.strength=function(t){return arguments.length?(a="function"==typeof t?t:fu(+t),p(),f):a},f.distance=function(t){return arguments.length?(u="function"==typeof t?t:fu(+t),d(),f):u},f}cu.copy=function(){var t,e,n=new au(this._x,this._y,this._x0,this._y0,this._x1,this._y1),r=this._root;if(!r)return n;if(!r.length)return n._root=uu(r),n;for(t=[{source:r,target:n._root=new Array(4)}];r=t.pop();)for(var i=0;i<4;++i)(e=r.source[i])&&(e.length?t.push({source:e,target:r.target[i]=new Array(4)}):r.target[i]=uu(e));return n},cu.add=function(t){const e=+this._x.call(null,t),n=+this._y.call(null,t);return ru(this.cover(e,n),e,n,t)},cu.addAll=function(t){var e,n,r,i,o=t.length,s=new Array(o),l=new Array(o),a=1/0,u=1/0,c=-1/0,f=-1/0;for(n=0;n<o;++n)isNaN(r=+this._x.call(null,e=t[n]))||isNaN(i=+this._y.call(null,e))||(s[n]=r,l[n]=i,r<a&&(a=r),r>c&&(c=r),i<u&&(u=i),i>f&&(f=i));if(a>c||u>f)return this;for(this.cover(a,u).cover(c,f),n=0;n<o;++n)ru(this,s[n],l[n],t[n]);return this},cu.cover=function(t,e){if(isNaN(t=+t)||isNaN(e=+e))return this;var n=this._x0,r=this._y0,i=this._x1,o=this._y1;if(isNaN(n))i=(n=Math.floor(t))+1,o=(r=Math.floor(e))+1;else{for(var s,l,a=i-n||1,u=this._root;n>t||t>=i||r>e||e>=o;)switch(l=(e<r)<<1|t<n,(s=new Array(4))[l]=u,u=s,a*=2,l){case 0:i=n+a,o=r+a;break;case 1:n=i-a,o=r+a;break;case 2:i=n+a,r=o-a;break;case 3:n=i-a,r=o-a}this._root&&this._root.length&&(this._root=u)}return this._x0=n,this._y0=r,this._x1=i,this._y1=o,this},cu.data=function(){var t=[];return this.visit((function(e){if(!e.length)do{t.push(e.data)}while(e=e.next)})),t},cu.extent=function(t){return arguments.length?this.cover(+t[0][0],+t[0][1]).cover(+t[1][0],+t[1][1]):isNaN(this._x0)?void 0:[[this._x0,this._y0],[this._x1,this._y1]]},cu.find=function(t,e,n){var r,i,o,s,l,a,u,c=this._x0,f=this._y0,h=this._x1,p=this._y1,d=[],g=this._root;for(g&&d.push(new iu(g,c,f,h,p)),null==n?n=1/0:(c=t-n,f=e-n,h=t+n,p=e+n,n*=n);a=d.pop();)if(!(!(g=a.node)||(i=a.x0)>h||(o=a.y0)>p||(s=a.x1)<c||(l=a.y1)<f))if(g.length){var v=(i+s)/2,y=(o+l)/2;d.push(new iu(g[3],v,y,s,l),new iu(g[2],i,y,v,l),new iu(g[1],v,o,s,y),new iu(g[0],i,o,v,y)),(u=(e>=y)<<1|t>=v)&&(a=d[d.length-1],d[d.length-1]=d[d.length-1-u],d[d.length-1-u]=a)}else{var m=t-+this._x.call(null,g.data),_=e-+this._y.call(null,g.data),x=m*m+_*_;if(x<n){var b=Math.sqrt(n=x);c=t-b,f=e-b,h=t+b,p=e+b,r=g.data}}return r},cu.remove=function(t){if(isNaN(o=+this._x.call(null,t))||isNaN(s=+this._y.call(null,t)))return this;var e,n,r,i,o,s,l,a,u,c,f,h,p=this._root,d=this._x0,g=this._y0,v=this._x1,y=this._y1;if(!p)return this;if(p.length)for(;;){if((u=o>=(l=(d+v)/2))?d=l:v=l,(c=s>=(a=(g+y)/2))?g=a:y=a,e=p,!(p=p[f=c<<1|u]))return this;if(!p.length)break;(e[f+1&3]||e[f+2&3]||e[f+3&3])&&(n=e,h=f)}for(;p.data!==t;)if(r=p,!(p=p.next))return this;return(i=p.next)&&delete p.next,r?(i?r.next=i:delete r.next,this):e?(i?e[f]=i:delete e[f],(p=e[0]||e[1]||e[2]||e[3])&&p===(e[3]||e[2]||e[1]||e[0])&&!p.length&&(n?n[h]=p:this._root=p),this):(this._root=i,this)},cu.removeAll=function(t){for(var e=0,n=t.length;e<n;++e)this.remove(t[e]);return this},cu.root=function(){return this._root},cu.size=function(){var t=0;return this.visit((function(e){if(!e.length)do{++t}while(e=e.next)})),t},cu.visit=function(t){var e,n,r,i,o,s,l=[],a=this._root;for(a&&l.push(new iu(a,this._x0,this._y0,this._x1,this._y1));e=l.pop();)if(!t(a=e.node,r=e.x0,i=e.y0,o=e.x1,s=e.y1)&&a.length){var u=(r+o)/2,c=(i+s)/2;(n=a[3])&&l.push(new iu(n,u,c,o,s)),(n=a[2])&&l.push(new iu(n,r,c,u,s)),(n=a[1])&&l.push(new iu(n,u,i,o,c)),(n=a[0])&&l.push(new iu(n,r,i,u,c))}return this},cu.visitAfter=function(t){var e,n=[],r=[];for(this._root&&n.push(new iu(this._root,this._x0,this._y0,this._x1,this._y1));e=n.pop();){var i=e.node;if(i.length){var o,s=e.x0,l=e.y0,a=e.x1,u=e.y1,c=(s+a)/2,f=(l+u)/2;(o=i[0])&&n.push(new iu(o,s,l,c,f)),(o=i[1])&&n.push(new iu(o,c,l,a,f)),(o=i[2])&&n.push(new iu(o,s,f,c,u)),(o=i[3])&&n.push(new iu(o,c,f,a,u))}r.push(e)}for(;e=r.pop();)t(e.node,e.x0,e.y0,e.x1,e.y1);return this},cu.x=function(t){return arguments.length?(this._x=t,this):this._x},cu.y=function(t){return arguments.length?(this._y=t,this):this._y};const mu=window.location.pathname.match(/.*(?:base|clean)\//)[0],_u=window.location.pathname.match(/\/([^\/]*)\/$/)[1],xu={key:0,class:"absolute border border-neutral-700 bg-white top-0 right-10"},bu={class:"p-2 pt-3 text-center"},wu=zr("Pontes: "),Su={class:"font-semibold"},ku={class:"bg-slate-200 max-h-60 overflow-auto"},Mu={key:0,class:"py-2 px-3 border-t border-neutral-400 text-center"},Eu=[Dr("span",{class:"text-sm flex-grow"},"Carregando...",-1)],Au={class:"py-2 px-3 border-t border-neutral-400 flex items-center"},Nu={class:"text-sm flex-grow"},Cu=["onClick"],Ou=["href"],$u=[Dr("i",{class:"fas fa-level-up-alt"},null,-1)],Tu={key:2,class:"py-2 px-3 border-t border-neutral-400 text-center"},Lu=[Dr("span",{class:"text-sm flex-grow"},"Sem pontes.",-1)],Pu={props:["node"],emits:["expandNode"],data:()=>({bridges:{},title:null,show:!1,loading:!1}),watch:{node(t){t?(this.title=t.label,this.loading=!0,this.show=!0,fetch(mu+`${t.graph}/bridges/${t.id}/`).then((t=>t.json())).then((t=>{this.bridges=t})).finally((()=>{this.loading=!1}))):this.show=!1}},methods:{expandNode(t,e){fetch(mu+`${t}/${e}/`).then((t=>t.json())).then((n=>{let{entities:r,graph:i,links:o}=n,s=Object.entries(r).map((([e,n])=>({id:e,label:n,graph:t}))),l=i.map((({subject_id:t,relation:e,object_id:n})=>({source:t,target:n,label:e}))),a=Object.entries(o).flatMap((([t,e])=>e.map((e=>({source:t,target:e,label:"="}))))).filter(((t,e,n)=>t===n.find((e=>e.source===t.source&&e.target===t.target||e.source===t.target&&e.target===t.source))));a.push({source:this.node,target:e,label:"bridge"}),this.$emit("expandNode",this.node,{nodes:s,relationshipLinks:l,synonymLinks:a})}))},linkTo:t=>mu+`${t}/`}};var Vu=n(744);const ju=(0,Vu.Z)(Pu,[["render",function(t,e,n,r,i,o){return i.show?(Cr(),Lr("div",xu,[Dr("h1",bu,[wu,Dr("span",Su,u(i.title),1)]),Dr("div",ku,[i.loading?(Cr(),Lr("div",Mu,Eu)):Object.keys(i.bridges).length>0?(Cr(!0),Lr(Sr,{key:1},zn(i.bridges,((t,e)=>(Cr(),Lr("div",Au,[Dr("span",Nu,u(e.replace(/\.(json|kgb)$/,"")),1),Dr("i",{class:"fas fa-code-branch mx-2",onClick:n=>o.expandNode(e,t)},null,8,Cu),Dr("a",{href:o.linkTo(e),target:"_blank"},$u,8,Ou)])))),256)):(Cr(),Lr("div",Tu,Lu))])])):qr("v-if",!0)}]]),Fu={class:"absolute top-4 left-4"},Ru=[Dr("i",{class:"fas fa-book cursor-pointer"},null,-1)],Uu={class:"absolute bottom-4 left-4"},Du={class:"flex mb-1"},Iu=[Dr("i",{class:"fas fa-sync-alt cursor-pointer"},null,-1)],Bu={class:"flex justify-between mb-1"},zu=zr(" Força - Geral: "),qu=["value"],Xu={class:"flex justify-between mb-1"},Hu=zr(" Força - Sinônimos: "),Yu=["value"],Wu={class:"flex justify-between mb-1"},Gu=zr(" Força - Relações: "),Ku=["value"],Zu={class:"flex justify-between mb-1"},Ju=zr(" Variação de Cores: "),Qu=["value"],tc={class:"flex justify-between mb-1"},ec=zr(" Tamanho do Texto: "),nc=["value"],rc={class:"flex justify-between"},ic=zr(" Raio: "),oc=["value"],sc={props:{documentVisible:Boolean,showText:Boolean,overallStrength:Number,synonymStrength:Number,relationshipStrength:Number,colorVariation:Number,textSize:Number,radius:Number},emits:["reload","update:documentVisible","update:showText","update:overallStrength","update:synonymStrength","update:relationshipStrength","update:colorVariation","update:textSize","update:radius"]},lc=(0,Vu.Z)(sc,[["render",function(t,e,n,r,i,o){return Cr(),Lr(Sr,null,[Dr("div",Fu,[Dr("div",{class:"mx-2",onClick:e[0]||(e[0]=e=>t.$emit("update:documentVisible",!n.documentVisible))},Ru)]),Dr("div",Uu,[Dr("div",Du,[Dr("div",{class:"mx-2",onClick:e[1]||(e[1]=e=>t.$emit("reload"))},Iu),Dr("div",{class:"mx-2",onClick:e[2]||(e[2]=e=>t.$emit("update:showText",!n.showText))},[Dr("i",{class:a(["fas fa-eye cursor-pointer",{"text-gray-500":!n.showText}])},null,2)])]),Dr("label",Bu,[zu,Dr("input",{id:"overall-strength",type:"range",min:"5",max:"200",step:"1",value:n.overallStrength,onChange:e[3]||(e[3]=e=>t.$emit("update:overallStrength",parseFloat(e.target.value)))},null,40,qu)]),Dr("label",Xu,[Hu,Dr("input",{id:"synonym-strength",type:"range",min:"0",max:"3",step:"0.1",value:n.synonymStrength,onChange:e[4]||(e[4]=e=>t.$emit("update:synonymStrength",parseFloat(e.target.value)))},null,40,Yu)]),Dr("label",Wu,[Gu,Dr("input",{id:"relationship-strength",type:"range",min:"0",max:"2",step:"0.1",value:n.relationshipStrength,onChange:e[5]||(e[5]=e=>t.$emit("update:relationshipStrength",parseFloat(e.target.value)))},null,40,Ku)]),Dr("label",Zu,[Ju,Dr("input",{id:"color-variation",type:"range",min:"0",max:"1",step:"0.05",value:n.colorVariation,onChange:e[6]||(e[6]=e=>t.$emit("update:colorVariation",parseFloat(e.target.value)))},null,40,Qu)]),Dr("label",tc,[ec,Dr("input",{id:"radius",type:"range",min:"0.2",max:"2",step:"0.05",value:n.textSize,onChange:e[7]||(e[7]=e=>t.$emit("update:textSize",parseFloat(e.target.value)))},null,40,nc)]),Dr("label",rc,[ic,Dr("input",{id:"radius",type:"range",min:"1",max:"16",step:"1",value:n.radius,onChange:e[8]||(e[8]=e=>t.$emit("update:radius",parseFloat(e.target.value)))},null,40,oc)])])],64)}]]),ac={key:0,class:"absolute bottom-4 right-4 bg-white border-2 rounded-full border-blue-200 px-4 py-2 flex items-center"},uc=["innerHTML"],cc={class:"font-semibold"},fc={props:["el","type"],data:()=>({text:null,prependedSvg:null}),watch:{el(t){switch(this.type){case"node":Za(".red-stroke").classed("red-stroke",!1);let e=Ka(`circle[index="${t.index}"]`).classed("red-stroke",!0);this.text=t.label,this.prependedSvg=`<circle r="8" fill="${e.attr("fill")}" class="node-circle"></circle>`;break;case"synonymLink":Za(".red-stroke").classed("red-stroke",!1),Ka(`line.synonym[index="${t.index}"]`).classed("red-stroke",!0),this.text=`${t.source.label} [${t.label}] ${t.target.label}`,this.prependedSvg=null;break;case"relationshipLink":Za(".red-stroke").classed("red-stroke",!1),Ka(`line.relationship[index="${t.index}"]`).classed("red-stroke",!0),this.text=`${t.source.label} [${t.label}] ${t.target.label}`,this.prependedSvg=null}}}},hc=(0,Vu.Z)(fc,[["render",function(t,e,n,r,i,o){return i.text?(Cr(),Lr("div",ac,[i.prependedSvg?(Cr(),Lr("svg",{key:0,viewBox:"-9 -9 18 18",class:"inline-block w-5 h-5 mr-2",innerHTML:i.prependedSvg},null,8,uc)):qr("v-if",!0),Dr("span",cc,u(i.text),1)])):qr("v-if",!0)}]]),pc={class:"w-1/2 border border-neutral-700 filter-none"},dc=Dr("h1",{class:"p-2 bg-white font-bold text-lg text-center"},"Document",-1),gc={class:"p-4 bg-slate-200"},vc={props:{visible:Boolean},data:()=>({text:null}),mounted(){fetch(mu+`${_u}/document/`).then((t=>t.json())).then((t=>{this.text=t}))},methods:{toggleVisibility(t){t.target===t.currentTarget&&this.$emit("update:visible",!this.visible)}}},yc=(0,Vu.Z)(vc,[["render",function(t,e,n,r,i,o){return function(t,e){const n=Ke;if(null===n)return t;const r=oi(n)||n.proxy,i=t.dirs||(t.dirs=[]);for(let t=0;t<e.length;t++){let[n,o,s,l=f]=e[t];M(n)&&(n={mounted:n,updated:n}),n.deep&&cn(o),i.push({dir:n,instance:r,value:o,oldValue:void 0,arg:s,modifiers:l})}return t}((Cr(),Lr("div",{class:"absolute top-0 left-0 w-full h-full flex justify-center items-center backdrop-blur-sm",onClick:e[0]||(e[0]=t=>o.toggleVisibility(t))},[Dr("div",pc,[dc,Dr("p",gc,u(i.text?i.text:"Carregando..."),1)])],512)),[[Fi,n.visible]])}]]),mc=(t,e)=>{let n={},r=null;const i=/(NE|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-z]{4}-[0-9a-f]{12})-.*/;let o=new Set;return t.forEach((t=>{let e=i.exec(t.id);if(e){let t=e[1];o.add(t)}})),o=Array.from(o).sort(((t,e)=>"NE"===t?-1:"NE"===e?1:0)),r=Wa([0,o.length],Ga),o.forEach(((i,o)=>{let s=t.filter((t=>t.id.startsWith(i))).sort();s.forEach(((t,l)=>{if("NE"===i)n[t.id]="#ffffff";else{let i=o+l*e/s.length;n[t.id]=r(i)}}))})),n},_c={components:{ControlPanel:lc,BridgeManager:ju,Highlight:hc,DocumentModal:yc},data:()=>({title:"",showText:!0,overallStrength:50,synonymStrength:1,relationshipStrength:.2,colorVariation:1,textSize:1,radius:8,nodes:[],relationshipLinks:[],synonymLinks:[],simulation:null,scale:{value:1,event:null},highlighted:{el:null,type:null},bridgeNode:null,documentVisible:!1}),computed:{viewBox(){let t=this.nodes.reduce(((t,e)=>({minX:e.x<t.minX?e.x:t.minX,minY:e.y<t.minY?e.y:t.minY,maxX:e.x>t.maxX?e.x:t.maxX,maxY:e.y>t.maxY?e.y:t.maxY})),{minX:0,minY:0,maxX:0,maxY:0}),e=t.minX-2*this.radius,n=t.minY-2*this.radius;return`${e} ${n} ${t.maxX+2*this.radius-e} ${t.maxY+2*this.radius-n}`},colorSchema(){return mc(this.nodes,this.colorVariation)}},emits:["highlightNode","highlightLink","openBridges","finishReload"],watch:{nodes(){this.runSimulation()},overallStrength(){this.runSimulation()},synonymStrength(){this.runSimulation()},relationshipStrength(){this.runSimulation()},radius(){this.runSimulation()},scale(t,e){!function(t,e,n){let r=Ka("#graph-svg"),i=r.node().parentNode,{offsetWidth:o,offsetHeight:s}=i;if(r.style("width",o*t),r.style("height",s*t),n){let r=t/e,{scrollLeft:o,scrollTop:s}=i,{offsetX:l,offsetY:a}=n,u=l-o,c=a-s;i.scrollLeft=l*r-u,i.scrollTop=a*r-c}}(t.value,e.value,t.event)},reload(t,e){t&&!e&&(this.scale={value:1,event:null},this.fetchGraph(),this.$emit("finishReload"))}},mounted(){this.fetchGraph(),window.select=Ka,window.selectAll=Za},methods:{fetchGraph(){fetch(mu+`${_u}/json/`).then((t=>t.json())).then((t=>{let{document:e,entities:n,graph:r,links:i}=t;this.title=e.split("/").slice(-1)[0].split(".")[0],this.nodes=Object.entries(n).map((([t,e])=>({id:t,label:e,graph:_u}))),this.relationshipLinks=r.map((({subject_id:t,relation:e,object_id:n})=>({source:t,target:n,label:e}))),this.synonymLinks=Object.entries(i).flatMap((([t,e])=>e.map((e=>({source:t,target:e,label:"="}))))).filter(((t,e,n)=>e===n.findIndex((e=>e.source===t.source&&e.target===t.target||e.source===t.target&&e.target===t.source))))}))},runSimulation(){this.simulation?.stop(),this.simulation=function(t){var e,n=1,r=.001,i=1-Math.pow(r,1/300),o=0,s=.6,l=new Map,a=Cs(f),u=gs("tick","end"),c=function(){let t=1;return()=>(t=(1664525*t+1013904223)%Qa)/Qa}();function f(){h(),u.call("tick",e),n<r&&(a.stop(),u.call("end",e))}function h(r){var a,u,c=t.length;void 0===r&&(r=1);for(var f=0;f<r;++f)for(n+=(o-n)*i,l.forEach((function(t){t(n)})),a=0;a<c;++a)null==(u=t[a]).fx?u.x+=u.vx*=s:(u.x=u.fx,u.vx=0),null==u.fy?u.y+=u.vy*=s:(u.y=u.fy,u.vy=0);return e}function p(){for(var e,n=0,r=t.length;n<r;++n){if((e=t[n]).index=n,null!=e.fx&&(e.x=e.fx),null!=e.fy&&(e.y=e.fy),isNaN(e.x)||isNaN(e.y)){var i=10*Math.sqrt(.5+n),o=n*nu;e.x=i*Math.cos(o),e.y=i*Math.sin(o)}(isNaN(e.vx)||isNaN(e.vy))&&(e.vx=e.vy=0)}}function d(e){return e.initialize&&e.initialize(t,c),e}return null==t&&(t=[]),p(),e={tick:h,restart:function(){return a.restart(f),e},stop:function(){return a.stop(),e},nodes:function(n){return arguments.length?(t=n,p(),l.forEach(d),e):t},alpha:function(t){return arguments.length?(n=+t,e):n},alphaMin:function(t){return arguments.length?(r=+t,e):r},alphaDecay:function(t){return arguments.length?(i=+t,e):+i},alphaTarget:function(t){return arguments.length?(o=+t,e):o},velocityDecay:function(t){return arguments.length?(s=1-t,e):1-s},randomSource:function(t){return arguments.length?(c=t,l.forEach(d),e):c},force:function(t,n){return arguments.length>1?(null==n?l.delete(t):l.set(t,d(n)),e):l.get(t)},find:function(e,n,r){var i,o,s,l,a,u=0,c=t.length;for(null==r?r=1/0:r*=r,u=0;u<c;++u)(s=(i=e-(l=t[u]).x)*i+(o=n-l.y)*o)<r&&(a=l,r=s);return a},on:function(t,n){return arguments.length>1?(u.on(t,n),e):u.on(t)}}}(this.nodes).force("charge",function(){var t,e,n,r,i,o=fu(-30),s=1,l=1/0,a=.81;function u(n){var i,o=t.length,s=lu(t,tu,eu).visitAfter(f);for(r=n,i=0;i<o;++i)e=t[i],s.visit(h)}function c(){if(t){var e,n,r=t.length;for(i=new Array(r),e=0;e<r;++e)n=t[e],i[n.index]=+o(n,e,t)}}function f(t){var e,n,r,o,s,l=0,a=0;if(t.length){for(r=o=s=0;s<4;++s)(e=t[s])&&(n=Math.abs(e.value))&&(l+=e.value,a+=n,r+=n*e.x,o+=n*e.y);t.x=r/a,t.y=o/a}else{(e=t).x=e.data.x,e.y=e.data.y;do{l+=i[e.data.index]}while(e=e.next)}t.value=l}function h(t,o,u,c){if(!t.value)return!0;var f=t.x-e.x,h=t.y-e.y,p=c-o,d=f*f+h*h;if(p*p/a<d)return d<l&&(0===f&&(d+=(f=hu(n))*f),0===h&&(d+=(h=hu(n))*h),d<s&&(d=Math.sqrt(s*d)),e.vx+=f*t.value*r/d,e.vy+=h*t.value*r/d),!0;if(!(t.length||d>=l)){(t.data!==e||t.next)&&(0===f&&(d+=(f=hu(n))*f),0===h&&(d+=(h=hu(n))*h),d<s&&(d=Math.sqrt(s*d)));do{t.data!==e&&(p=i[t.data.index]*r/d,e.vx+=f*p,e.vy+=h*p)}while(t=t.next)}}return u.initialize=function(e,r){t=e,n=r,c()},u.strength=function(t){return arguments.length?(o="function"==typeof t?t:fu(+t),c(),u):o},u.distanceMin=function(t){return arguments.length?(s=t*t,u):Math.sqrt(s)},u.distanceMax=function(t){return arguments.length?(l=t*t,u):Math.sqrt(l)},u.theta=function(t){return arguments.length?(a=t*t,u):Math.sqrt(a)},u}().strength(-this.overallStrength)).force("collision",function(t){var e,n,r,i=1,o=1;function s(){for(var t,s,a,u,c,f,h,p=e.length,d=0;d<o;++d)for(s=lu(e,pu,du).visitAfter(l),t=0;t<p;++t)a=e[t],f=n[a.index],h=f*f,u=a.x+a.vx,c=a.y+a.vy,s.visit(g);function g(t,e,n,o,s){var l=t.data,p=t.r,d=f+p;if(!l)return e>u+d||o<u-d||n>c+d||s<c-d;if(l.index>a.index){var g=u-l.x-l.vx,v=c-l.y-l.vy,y=g*g+v*v;y<d*d&&(0===g&&(y+=(g=hu(r))*g),0===v&&(y+=(v=hu(r))*v),y=(d-(y=Math.sqrt(y)))/y*i,a.vx+=(g*=y)*(d=(p*=p)/(h+p)),a.vy+=(v*=y)*d,l.vx-=g*(d=1-d),l.vy-=v*d)}}}function l(t){if(t.data)return t.r=n[t.data.index];for(var e=t.r=0;e<4;++e)t[e]&&t[e].r>t.r&&(t.r=t[e].r)}function a(){if(e){var r,i,o=e.length;for(n=new Array(o),r=0;r<o;++r)i=e[r],n[i.index]=+t(i,r,e)}}return"function"!=typeof t&&(t=fu(null==t?1:+t)),s.initialize=function(t,n){e=t,r=n,a()},s.iterations=function(t){return arguments.length?(o=+t,s):o},s.strength=function(t){return arguments.length?(i=+t,s):i},s.radius=function(e){return arguments.length?(t="function"==typeof e?e:fu(+e),a(),s):t},s}().radius(this.radius)).force("synonymLink",yu(this.synonymLinks).id((t=>t.id)).strength(this.synonymStrength)).force("relationshipLinks",yu(this.relationshipLinks).id((t=>t.id)).strength(this.relationshipStrength))},updateScale(t){t.preventDefault(),this.scale={value:Math.min(Math.max(1,this.scale.value+-.005*t.deltaY),50),event:t}},navigate(t){let e=Ka("#graph-svg").node().parentNode,n=e.scrollTop,r=e.scrollLeft,i=t.clientX,o=t.clientY;function s(t){e.scrollLeft=r-(t.clientX-i),e.scrollTop=n-(t.clientY-o)}e.style.cursor="grabbing",e.style.userSelect="none",document.addEventListener("mousemove",s),document.addEventListener("mouseup",(function t(n){document.removeEventListener("mousemove",s),document.removeEventListener("mouseup",t),e.style.cursor="default",e.style.removeProperty("user-select")}))},expandNode(t,e){let{nodes:n,relationshipLinks:r,synonymLinks:i}=e;n.forEach((e=>{e.x=t.x,e.y=t.y}));let o=n.filter((t=>!this.nodes.some((e=>e.id===t.id)))),s=r.filter((t=>!this.relationshipLinks.some((e=>e.source.id===t.source&&e.target.id===t.target)))),l=i.filter((t=>!this.synonymLinks.some((e=>e.source.id===t.source&&e.target.id===t.target))));this.nodes=[...this.nodes,...o],this.relationshipLinks=[...this.relationshipLinks,...s],this.synonymLinks=[...this.synonymLinks,...l],this.colorVariation=0}}},xc={components:{Graph:(0,Vu.Z)(_c,[["render",function(t,e,n,r,o,s){const l=Dn("ControlPanel"),a=Dn("BridgeManager"),c=Dn("Highlight"),f=Dn("DocumentModal");return Cr(),Lr(Sr,null,[Dr("div",Ii,[(Cr(),Lr("svg",{id:"graph-svg",class:"graph-svg",viewBox:s.viewBox,onWheel:e[0]||(e[0]=t=>s.updateScale(t)),onMousedown:e[1]||(e[1]=t=>s.navigate(t)),onDblclick:e[2]||(e[2]=t=>o.bridgeNode=null)},[(Cr(!0),Lr(Sr,null,zn(o.synonymLinks,(t=>(Cr(),Lr("line",{class:"synonym",x1:t.source.x,y1:t.source.y,x2:t.target.x,y2:t.target.y,index:t.index,onMouseover:e=>o.highlighted={el:t,type:"synonymLink"}},null,40,zi)))),256)),(Cr(!0),Lr(Sr,null,zn(o.relationshipLinks,(t=>(Cr(),Lr("line",{class:"relationship",x1:t.source.x,y1:t.source.y,x2:t.target.x,y2:t.target.y,index:t.index,onMouseover:e=>o.highlighted={el:t,type:"relationshipLink"}},null,40,qi)))),256)),(Cr(!0),Lr(Sr,null,zn(o.nodes,(t=>(Cr(),Lr("g",{transform:`translate(${t.x}, ${t.y})`},[Dr("circle",{class:"node-circle",r:o.radius,fill:s.colorSchema[t.id],index:t.index,onMouseover:e=>o.highlighted={el:t,type:"node"},onClick:e=>o.bridgeNode=t},null,40,Hi),o.showText?(Cr(),Lr("text",{key:0,class:"node-text",style:i({fontSize:o.textSize+"em"})},u(t.label),5)):qr("v-if",!0)],8,Xi)))),256))],40,Bi))]),Ir(l,{"document-visible":o.documentVisible,"onUpdate:document-visible":e[3]||(e[3]=t=>o.documentVisible=t),"show-text":o.showText,"onUpdate:show-text":e[4]||(e[4]=t=>o.showText=t),"overall-strength":o.overallStrength,"onUpdate:overall-strength":e[5]||(e[5]=t=>o.overallStrength=t),"synonym-strength":o.synonymStrength,"onUpdate:synonym-strength":e[6]||(e[6]=t=>o.synonymStrength=t),"relationship-strength":o.relationshipStrength,"onUpdate:relationship-strength":e[7]||(e[7]=t=>o.relationshipStrength=t),"color-variation":o.colorVariation,"onUpdate:color-variation":e[8]||(e[8]=t=>o.colorVariation=t),"text-size":o.textSize,"onUpdate:text-size":e[9]||(e[9]=t=>o.textSize=t),radius:o.radius,"onUpdate:radius":e[10]||(e[10]=t=>o.radius=t),onReload:s.fetchGraph},null,8,["document-visible","show-text","overall-strength","synonym-strength","relationship-strength","color-variation","text-size","radius","onReload"]),Ir(a,{node:o.bridgeNode,onExpandNode:s.expandNode},null,8,["node","onExpandNode"]),Ir(c,{el:o.highlighted.el,type:o.highlighted.type},null,8,["el","type"]),Ir(f,{visible:o.documentVisible,"onUpdate:visible":e[11]||(e[11]=t=>o.documentVisible=t)},null,8,["visible"])],64)}]])},data:()=>({})};((...t)=>{const e=(Di||(Di=xr(Ui))).createApp(...t),{mount:n}=e;return e.mount=t=>{const r=function(t){return E(t)?document.querySelector(t):t}(t);if(!r)return;const i=e._component;M(i)||i.render||i.template||(i.template=r.innerHTML),r.innerHTML="";const o=n(r,!1,r instanceof SVGElement);return r instanceof Element&&(r.removeAttribute("v-cloak"),r.setAttribute("data-v-app","")),o},e})((0,Vu.Z)(xc,[["render",function(t,e,n,r,i,o){const s=Dn("Graph");return Cr(),Pr(s)}]])).mount("#graph-container")})()})();
\ No newline at end of file
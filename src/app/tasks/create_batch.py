@@ -1,22 +1,20 @@
-from multiprocessing import Process
 from werkzeug.datastructures.file_storage import FileStorage
 
 from ...constants import DOCUMENT_DIR
-from ...ctxkg.builders.runner import run
-from ...utils.batch_data.helpers import set_batch_data
+from ...ctxkg.builders.runner import save_params
+from ...utils.batch_data.helpers import set_batch_data, refresh_stage_progress, clear_stop_request
+from ...utils.batch_data.jobs import enqueue_stage
 
 from ...languages import Language
 
 
 def create_batch(language: Language, batch: str, files: list[FileStorage], size: str, extraction_model: str,
-                 ratio: float, similarity_threshold: float, bridge_threshold: float, batch_size: int):
+                 ratio: float, similarity_threshold: float, bridge_threshold: float, batch_size: int, workers: int,
+                 priority: int = 0):
     _setup_docs(language, batch, files)
-    p = Process(
-        target=run,
-        args=(language, batch, size, extraction_model, ratio, similarity_threshold, bridge_threshold, batch_size),
-        name=f"Creating batch {batch}"
-    )
-    p.start()
+    save_params(language, batch, size, extraction_model, ratio, similarity_threshold, bridge_threshold, batch_size,
+                workers)
+    enqueue_stage(language, batch, "triples", priority)
 
 
 def _setup_docs(language: Language, name: str, files: list[FileStorage]):
@@ -25,8 +23,11 @@ def _setup_docs(language: Language, name: str, files: list[FileStorage]):
         return
     batch_dir.mkdir()
 
+    # A stop left from a deleted batch with the same name must not stop this one
+    clear_stop_request(language, name)
     set_batch_data(language, name, "triples", "pending")
 
     for file in files:
         target_file = batch_dir / file.filename  # type: ignore
         file.save(target_file)
+    refresh_stage_progress(language, name, "triples")
@@ -0,0 +1,41 @@
+import os
+import time
+from multiprocessing import Process
+
+from ...constants import JOB_POLL_SECONDS, JOB_WORKERS
+from ...utils.batch_data.helpers import STAGES
+from ...utils.batch_data.jobs import claim_job, claim_worker_pool, finish_job
+
+
+def start_workers(count=JOB_WORKERS):
+    # With the reloader, both its process and the server process it restarts load the app. Workers are started by the
+    # first of them and keep running across reloads.
+    if not claim_worker_pool(os.getpid()):
+        return
+    for i in range(count):
+        Process(target=_work, name=f"Batch worker {i}").start()
+
+
+def _work():
+    from ...ctxkg.builders.runner import EncoderMap, run_stage
+
+    parent_pid = os.getppid()
+    encoders: EncoderMap = {}
+    try:
+        while os.getppid() == parent_pid:
+            job = claim_job(os.getpid())
+            if job is None:
+                time.sleep(JOB_POLL_SECONDS)
+                continue
+
+            try:
+                status = run_stage(job["language"], job["batch"], job["stage"], encoders)
+            except Exception:
+                finish_job(job, "failed")
+                continue
+
+            stage_index = STAGES.index(job["stage"])
+            next_stage = STAGES[stage_index + 1] if status == "done" and stage_index + 1 < len(STAGES) else None
+            finish_job(job, "failed" if status == "failed" else "finished", next_stage)
+    except KeyboardInterrupt:
+        pass
@@ -1,19 +1,28 @@
 from typing import get_args
 
-from ...utils.batch_data.helpers import get_metadata, set_batch_data
+from ...utils.batch_data.helpers import get_metadata, set_batch_data, reconcile_metadata
+from ...utils.batch_data.jobs import fail_interrupted_jobs, get_running_batches
+from .job_queue import start_workers
 
 from ...languages import Language
 
 
 def startup():
+    reconcile_metadata()
+    fail_interrupted_jobs()
     _pause_interrupted_processes()
+    start_workers()
 
 
 def _pause_interrupted_processes():
+    # Batches whose job is still running in a live worker are left as they are
     metadata = get_metadata()
+    running_batches = get_running_batches()
     for language in get_args(Language):
         batches = metadata[language]
         for batch, batch_data in batches.items():
+            if (language, batch) in running_batches:
+                continue
             for stage, status in batch_data.items():
                 if status == "started":
                     set_batch_data(language, batch, stage, "paused")  # type: ignore
@@ -7,6 +7,18 @@ from .languages import English, Portuguese
 BASE_PATH = Path()
 
 METADATA_PATH = BASE_PATH / "metadata.json"
+METADATA_DB_PATH = BASE_PATH / "metadata.sqlite3"
+
+CACHE_DIR = BASE_PATH / ".cache"
+ENCODING_CACHE_DIR = CACHE_DIR / "encodings"
+ENCODING_CACHE_MAX_BYTES = 4 * 1024 ** 3
+ENCODER_SOCKET_PATH = CACHE_DIR / "encoder.sock"
+VIEWER_CACHE_MAX_BYTES = 512 * 1024 ** 2
+PAGE_SIZE = 200
+MAX_PAGE_SIZE = 5000
+JOB_WORKERS = 1
+JOB_POLL_SECONDS = 2.0
+STOP_CHECK_SECONDS = 1.0
 
 ENGLISH_PREFIX: English = "en"
 PORTUGUESE_PREFIX: Portuguese = "pt-BR"
@@ -31,6 +43,7 @@ DEFAULT_PARAMS: BatchParams = {
         "threshold": 0.8,
         "batch_size": 300,
         "extraction_model": "default",
+        "workers": 1,
     },
     "bridges": {
         "size": "small",
@@ -1,66 +1,339 @@
 import json
+import os
+import zlib
+from array import array
+from multiprocessing import get_context
 from pathlib import Path
 from tkinter import Tk
 from tkinter.filedialog import askdirectory
+from typing import TYPE_CHECKING, Callable, Optional
 from tqdm import tqdm
 
 from ..models.graph import Graph
-from ..models.encoder import Encoder
+from ..models.lazy_encoder import LazyEncoder
+from ..models.bridge_index import BridgeIndex
+from ..models.embedding_store import EmbeddingStore
+from ..models.graph_file import list_graph_files
+from ..models.graph_store import GraphStore
 from ...constants import GRAPH_DIR
-from ...utils.batch_data.helpers import set_batch_data, save_batch_params
+from ...utils.batch_data.helpers import set_batch_data, save_batch_params, refresh_stage_progress, pause_stopped_stage
+from ...utils.batch_data.helpers import batch_exists, finish_stage
+from ...utils.batch_data.stop_signal import StopSignal
 
 from ...languages import Language
 
+if TYPE_CHECKING:
+    from ..models.graph import AnyEncoder
 
-def build_bridges(language: Language, batch: str, size, ratio, threshold, batch_size):
+
+def build_bridges(language: Language, batch: str, size, ratio, threshold, batch_size, use_index=False, workers=1,
+                  shard: Optional[tuple[int, int]] = None, incremental=False,
+                  encoder: Optional["AnyEncoder"] = None):
     kg_dir = GRAPH_DIR / language / batch
     bridge_dir = kg_dir / "bridges"
     bridge_dir.mkdir(exist_ok=True)
 
-    encoder = Encoder(size=size, language=language, ratio=ratio)
+    encoder = encoder or LazyEncoder(size=size, language=language, ratio=ratio)
 
     set_batch_data(language, batch, "bridges", "started")
+    should_stop = StopSignal(language, batch)
     try:
-        _build_bridges(kg_dir, encoder, threshold, batch_size)
-        set_batch_data(language, batch, "bridges", "done")
+        if use_index:
+            completed = _build_bridges_with_index(kg_dir, encoder, threshold, batch_size, should_stop)
+        elif shard is not None:
+            _import_bridge_files(kg_dir)
+            if not _build_bridge_shard(kg_dir, encoder, threshold, batch_size, *shard, should_stop=should_stop):
+                pause_stopped_stage(language, batch, "bridges")
+            return
+        else:
+            _import_bridge_files(kg_dir)
+            completed = _build_bridges(kg_dir, encoder, threshold, batch_size, workers, should_stop)
+            # Pairs compared before a stop are merged too, so their bridges can be viewed while the batch is paused.
+            # A deleted batch isn't merged, as that would write its files again
+            if batch_exists(language, batch):
+                _merge_bridges(kg_dir, incremental)
+        refresh_stage_progress(language, batch, "bridges")
+        if completed:
+            finish_stage(language, batch, "bridges", "done")
+        else:
+            pause_stopped_stage(language, batch, "bridges")
+    except Exception:
+        finish_stage(language, batch, "bridges", "failed")
+
+
+def merge_bridges(language: Language, batch: str, incremental=False):
+    kg_dir = GRAPH_DIR / language / batch
+    try:
+        is_complete = _merge_bridges(kg_dir, incremental)
+        refresh_stage_progress(language, batch, "bridges")
+        set_batch_data(language, batch, "bridges", "done" if is_complete else "started")
     except Exception:
         set_batch_data(language, batch, "bridges", "failed")
 
 
-def _build_bridges(kg_dir: Path, encoder, threshold, batch_size):
+def rename_bridge_graphs(kg_dir: Path, renames: dict[str, str]):
+    bridge_dir = kg_dir / "bridges"
+    if not renames or not bridge_dir.exists():
+        return
+
+    _import_bridge_files(kg_dir)
+    part_dir = bridge_dir / "parts"
+    for part_file in sorted(part_dir.glob("*.jsonl")):
+        _truncate_incomplete_line(part_file)
+        temporary_file = part_dir / f".{part_file.name}.tmp"
+        with part_file.open("r", encoding="utf-8") as f, temporary_file.open("w", encoding="utf-8") as renamed_f:
+            for line in f:
+                record = json.loads(line)
+                record["source"] = renames.get(record["source"], record["source"])
+                record["target"] = renames.get(record["target"], record["target"])
+                renamed_f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(temporary_file, part_file)
+
+    for graph_name in renames:
+        (bridge_dir / graph_name).unlink(missing_ok=True)
+    _merge_bridges(kg_dir)
+
+
+def _build_bridges(kg_dir: Path, encoder, threshold, batch_size, workers=1,
+                   should_stop: Optional[Callable[[], bool]] = None):
+    if workers <= 1:
+        return _build_bridge_shard(kg_dir, encoder, threshold, batch_size, should_stop=should_stop)
+
+    # Every graph is encoded here first, so the workers only read the stored matrix and never load BERT
+    graph_dir = kg_dir / "clean"
+    store = EmbeddingStore(graph_dir, encoder, batch_size)
+    for graph_file in list_graph_files(graph_dir):
+        if should_stop is not None and should_stop():
+            return False
+        store.load(graph_file)
+
+    shard_args = [
+        (kg_dir, encoder.size, encoder.language, encoder.ratio, threshold, batch_size, shard, workers, should_stop)
+        for shard in range(workers)
+    ]
+    with get_context("spawn").Pool(min(workers, os.cpu_count() or 1)) as pool:
+        return all(list(pool.imap_unordered(_run_bridge_shard, shard_args)))
+
+
+def _run_bridge_shard(args):
+    kg_dir, size, language, ratio, threshold, batch_size, shard, shard_count, should_stop = args
+    encoder = LazyEncoder(size=size, language=language, ratio=ratio)
+    return _build_bridge_shard(kg_dir, encoder, threshold, batch_size, shard, shard_count, should_stop)
+
+
+def _build_bridge_shard(kg_dir: Path, encoder, threshold, batch_size, shard=0, shard_count=1,
+                        should_stop: Optional[Callable[[], bool]] = None):
+    graph_dir = kg_dir / "clean"
+    part_dir = kg_dir / "bridges" / "parts"
+    part_dir.mkdir(parents=True, exist_ok=True)
+
+    store = EmbeddingStore(graph_dir, encoder, batch_size)
+    graph_files = list_graph_files(graph_dir)
+    done_pairs = {(record["source"], record["target"]) for record in _read_parts(part_dir)}
+
+    part_file = part_dir / f"shard-{shard}-of-{shard_count}.jsonl"
+    _truncate_incomplete_line(part_file)
+    with part_file.open("a", encoding="utf-8") as f:
+        for i, source_file in enumerate(tqdm(graph_files, position=shard)):
+            target_files = [
+                target_file for target_file in graph_files[i+1:]
+                if _get_pair_shard(source_file.name, target_file.name, shard_count) == shard
+                and (source_file.name, target_file.name) not in done_pairs
+            ]
+            if not target_files:
+                continue
+
+            entity_ids, encodings = store.load(source_file)
+            for target_file in target_files:
+                if should_stop is not None and should_stop():
+                    return False
+                target_entity_ids, target_encodings = store.load(target_file)
+                bridges, reverse_bridges = Graph.match_entities_both_ways(
+                    entity_ids, encodings, target_entity_ids, target_encodings, threshold
+                )
+                record = {
+                    "source": source_file.name,
+                    "target": target_file.name,
+                    "bridges": bridges,
+                    "reverse": reverse_bridges,
+                }
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+    return True
+
+
+def _merge_bridges(kg_dir: Path, incremental=False):
     graph_dir = kg_dir / "clean"
     bridge_dir = kg_dir / "bridges"
+    part_dir = bridge_dir / "parts"
     bridge_dir.mkdir(exist_ok=True)
+    part_dir.mkdir(exist_ok=True)
+    graph_names = [f.name for f in list_graph_files(graph_dir)]
+    known_names = set(graph_names)
+
+    state_file = part_dir / "merged.json"
+    state = _read_json(state_file) if incremental and state_file.is_file() else {"offsets": {}, "targets": {}}
+
+    # An incremental merge only reads the records appended since the last merge and patches the bridge files they
+    # touch, so adding a few documents rewrites the old files without reading every pair again. Records are indexed by
+    # their position in the logs and read back one bridge file at a time, so only that file's pairs are held in memory
+    positions = _index_parts(part_dir, state["offsets"], known_names)
+
+    store = GraphStore(kg_dir)
+    for source_name in list(positions) if incremental else graph_names:
+        bridge_file = bridge_dir / source_name
+        source_bridges = _read_json(bridge_file) if incremental and bridge_file.is_file() else {}
+        source_bridges.update(_read_positions(part_dir, positions.pop(source_name, {})))
+        source_bridges = {name: source_bridges[name] for name in graph_names if name in source_bridges}
+        _write_json(bridge_file, source_bridges, indent=2)
+        store.put_bridges(bridge_file, source_bridges)
+        state["targets"][source_name] = len(source_bridges)
+
+    _write_json(state_file, state)
+    return all(state["targets"].get(name) == len(graph_names) - 1 for name in graph_names)
 
-    graph_files = [file for file in graph_dir.glob("*.json")]
-    for source_file in tqdm(graph_files):
-        bridges = _get_existing_bridges(bridge_dir, source_file)
-        target_files = [file for file in graph_files if file.name not in bridges and file != source_file]
-        if target_files:
-            graph = Graph.from_json(source_file, encoder).build_entity_encodings(batch_size)
-            for target_file in tqdm(target_files, leave=False):
-                target_graph = Graph.from_json(target_file, encoder).build_entity_encodings(batch_size)
-                bridges[target_file.name] = graph.build_bridges(target_graph, threshold)
-        with (bridge_dir / source_file.name).open("w", encoding="utf-8") as f:
+
+def _import_bridge_files(kg_dir: Path):
+    # Bridge files written before the pair logs existed are turned into a log once, so their pairs are not compared
+    # again and merges keep them
+    bridge_dir = kg_dir / "bridges"
+    part_dir = bridge_dir / "parts"
+    bridge_files = list_graph_files(bridge_dir)
+    if part_dir.exists() or not bridge_files:
+        return
+    part_dir.mkdir(parents=True, exist_ok=True)
+
+    bridges = {bridge_file.name: _read_json(bridge_file) for bridge_file in bridge_files}
+    pairs = sorted({tuple(sorted((source, target))) for source in bridges for target in bridges[source]})
+    lines = []
+    for source, target in pairs:
+        pair_bridges = bridges.get(source, {}).get(target)
+        reverse_bridges = bridges.get(target, {}).get(source)
+        if pair_bridges is None:
+            pair_bridges = {value: key for key, value in reverse_bridges.items()}
+        if reverse_bridges is None:
+            reverse_bridges = {value: key for key, value in pair_bridges.items()}
+        record = {"source": source, "target": target, "bridges": pair_bridges, "reverse": reverse_bridges}
+        lines.append(json.dumps(record, ensure_ascii=False) + "\n")
+
+    part_file = part_dir / "imported.jsonl"
+    temporary_file = part_dir / ".imported.jsonl.tmp"
+    temporary_file.write_text("".join(lines), encoding="utf-8")
+    os.replace(temporary_file, part_file)
+    _write_json(part_dir / "merged.json", {
+        "offsets": {part_file.name: part_file.stat().st_size},
+        "targets": {name: len(source_bridges) for name, source_bridges in bridges.items()},
+    })
+
+
+def _build_bridges_with_index(kg_dir: Path, encoder, threshold, batch_size,
+                              should_stop: Optional[Callable[[], bool]] = None):
+    graph_dir = kg_dir / "clean"
+    bridge_dir = kg_dir / "bridges"
+    bridge_dir.mkdir(exist_ok=True)
+
+    # Bridges only come out of the complete index, so a stop keeps just the encodings stored so far
+    store = EmbeddingStore(graph_dir, encoder, batch_size)
+    index = BridgeIndex()
+    for graph_file in tqdm(list_graph_files(graph_dir)):
+        if should_stop is not None and should_stop():
+            return False
+        index.add_graph(graph_file.name, *store.load(graph_file))
+
+    store = GraphStore(kg_dir)
+    for source_name, bridges in index.build().build_bridges(threshold).items():
+        with (bridge_dir / source_name).open("w", encoding="utf-8") as f:
             json.dump(bridges, f, indent=2, ensure_ascii=False)
+        store.put_bridges(bridge_dir / source_name, bridges)
+    return True
+
+
+def _get_pair_shard(source_name: str, target_name: str, shard_count: int):
+    # Hashing the names keeps a pair in the same shard when graphs are added to the batch
+    return zlib.crc32(f"{source_name}\0{target_name}".encode("utf-8")) % shard_count
 
 
-def _get_existing_bridges(bridge_dir: Path, source_file: Path):
-    bridge_file = bridge_dir / source_file.name
-    bridges = {} if not bridge_file.is_file() else _read_json(bridge_file)
-    missing_files = [f for f in bridge_dir.glob("*.json") if f.name not in bridges]
-    for target_file in missing_files:
-        target_bridges = _read_json(target_file)
-        if source_file.name in target_bridges:
-            bridges[target_file.name] = {value: key for key, value in target_bridges[source_file.name].items()}
+def _read_parts(part_dir: Path, offsets: Optional[dict[str, int]] = None):
+    for _, _, record in _read_part_positions(part_dir, offsets):
+        yield record
+
+
+def _read_part_positions(part_dir: Path, offsets: Optional[dict[str, int]] = None):
+    offsets = {} if offsets is None else offsets
+    for part_file in sorted(part_dir.glob("*.jsonl")):
+        with part_file.open("rb") as f:
+            f.seek(offsets.get(part_file.name, 0))
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                position = offsets.get(part_file.name, 0)
+                offsets[part_file.name] = position + len(line)
+                yield part_file.name, position, json.loads(line)
+
+
+def _index_parts(part_dir: Path, offsets: dict[str, int], known_names: set[str]):
+    # Each graph gets the positions of the records that give its bridges, doubled and with one added when the record's
+    # reverse bridges are the ones to read
+    positions: dict[str, dict[str, array]] = {}
+    for part_name, position, record in _read_part_positions(part_dir, offsets):
+        source, target = record["source"], record["target"]
+        if source in known_names and target in known_names:
+            positions.setdefault(source, {}).setdefault(part_name, array("q")).append(position * 2)
+            positions.setdefault(target, {}).setdefault(part_name, array("q")).append(position * 2 + 1)
+    return positions
+
+
+def _read_positions(part_dir: Path, part_positions: dict[str, array]):
+    bridges: dict[str, dict[str, str]] = {}
+    for part_name, file_positions in part_positions.items():
+        with (part_dir / part_name).open("rb") as f:
+            for position in file_positions:
+                f.seek(position // 2)
+                record = json.loads(f.readline())
+                if position % 2:
+                    bridges[record["source"]] = record["reverse"]
+                else:
+                    bridges[record["target"]] = record["bridges"]
     return bridges
 
 
-def _read_json(file):
-    with open(file, "r", encoding="utf-8") as f:
+def _read_json(file: Path):
+    with file.open("r", encoding="utf-8") as f:
         return json.load(f)
 
 
+def _write_json(file: Path, content, indent=None):
+    temporary_file = file.parent / f".{file.name}.tmp"
+    with temporary_file.open("w", encoding="utf-8") as f:
+        json.dump(content, f, indent=indent, ensure_ascii=False)
+    os.replace(temporary_file, file)
+
+
+def _truncate_incomplete_line(part_file: Path):
+    if not part_file.is_file():
+        return
+    with part_file.open("r+b") as f:
+        position = f.seek(0, os.SEEK_END)
+        while position > 0:
+            start = max(0, position - 65536)
+            f.seek(start)
+            newline = f.read(position - start).rfind(b"\n")
+            if newline >= 0:
+                f.truncate(start + newline + 1)
+                return
+            position = start
+        f.truncate(0)
+
+
+def _parse_shard(shard: Optional[str]):
+    if shard is None:
+        return None
+    index, count = (int(value) for value in shard.split("/"))
+    if not 0 <= index < count:
+        raise Exception(f"Invalid shard {shard}, expected i/k with 0 <= i < k.")
+    return index, count
+
+
 def _get_dir(language, name):
     if language and name:
         return GRAPH_DIR / language / name
@@ -75,18 +348,23 @@ def _get_dir(language, name):
 
 
 if __name__ == "__main__":
-    from .cli_args import LANGUAGE, NAME, SIZE, RATIO, THRESHOLD, BATCH_SIZE
+    from .cli_args import (LANGUAGE, NAME, SIZE, RATIO, THRESHOLD, BATCH_SIZE, WORKERS, USE_INDEX, SHARD, MERGE,
+                           INCREMENTAL)
 
     kg_dir = _get_dir(LANGUAGE, NAME)
     language: Language = LANGUAGE if LANGUAGE else kg_dir.parent.name  # type: ignore
     name = NAME if NAME else kg_dir.name
 
-    save_batch_params(language, name, "bridges", {
-        "size": SIZE,
-        "extraction_model": "default",
-        "ratio": RATIO,
-        "threshold": THRESHOLD,
-        "batch_size": BATCH_SIZE,
-    })
+    if MERGE:
+        merge_bridges(language, name, INCREMENTAL)
+    else:
+        save_batch_params(language, name, "bridges", {
+            "size": SIZE,
+            "extraction_model": "default",
+            "ratio": RATIO,
+            "threshold": THRESHOLD,
+            "batch_size": BATCH_SIZE,
+        })
 
-    build_bridges(language, name, SIZE, RATIO, THRESHOLD, BATCH_SIZE)
+        build_bridges(language, name, SIZE, RATIO, THRESHOLD, BATCH_SIZE, USE_INDEX, WORKERS, _parse_shard(SHARD),
+                      INCREMENTAL)
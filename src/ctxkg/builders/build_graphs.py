@@ -1,19 +1,28 @@
 import traceback
 from pathlib import Path
 from datetime import datetime
+from typing import TYPE_CHECKING, Optional
 from tqdm import tqdm
 from tkinter import Tk
 from tkinter.filedialog import askdirectory
 
 from ..models.graph import Graph
-from ..models.encoder import Encoder
+from ..models.lazy_encoder import LazyEncoder
+from ..models.graph_file import GRAPH_SUFFIXES, GraphFormat, list_graph_files
+from ..models.graph_store import GraphStore
 from ...constants import TRIPLE_DIR, GRAPH_DIR
-from ...utils.batch_data.helpers import set_batch_data, save_batch_params
+from ...utils.batch_data.helpers import set_batch_data, save_batch_params, add_stage_progress, refresh_stage_progress
+from ...utils.batch_data.helpers import pause_stopped_stage, finish_stage
+from ...utils.batch_data.stop_signal import StopSignal
 
 from ...languages import Language
 
+if TYPE_CHECKING:
+    from ..models.graph import AnyEncoder
 
-def build_graphs(language: Language, batch: str, size, ratio, threshold, batch_size):
+
+def build_graphs(language: Language, batch: str, size, ratio, threshold, batch_size,
+                 graph_format: GraphFormat = "json", encoder: Optional["AnyEncoder"] = None):
     triple_dir = TRIPLE_DIR / language / batch
     kg_dir = GRAPH_DIR / language / batch
     kg_dir.mkdir(exist_ok=True)
@@ -23,20 +32,30 @@ def build_graphs(language: Language, batch: str, size, ratio, threshold, batch_s
     errors_dir = base_dir / "errors"
     errors_dir.mkdir(exist_ok=True)
 
-    graph_file_names = [f.stem for f in base_dir.glob("*.json")]
+    graph_file_names = [f.stem for f in list_graph_files(base_dir)]
     remaining_files = [f for f in triple_dir.glob("*.csv") if f.stem not in graph_file_names]
     sorted_files = sorted(remaining_files, key=lambda file: file.stat().st_size)
 
     set_batch_data(language, batch, "base", "started")
+    refresh_stage_progress(language, batch, "base")
 
-    encoder = Encoder(size=size, language=language, ratio=ratio)
+    encoder = encoder or LazyEncoder(size=size, language=language, ratio=ratio)
+    store = GraphStore(kg_dir)
+    should_stop = StopSignal(language, batch)
+    stopped = False
     failed_files = []
     for file in tqdm(sorted_files):
+        if should_stop():
+            stopped = True
+            break
         try:
             graph = Graph.from_csv(file, encoder)
             graph.build_entity_encodings(batch_size)
             graph.build_links(threshold=threshold)
-            graph.save_json(base_dir / f"{file.stem}.json")
+            graph_file = base_dir / f"{file.stem}{GRAPH_SUFFIXES[graph_format]}"
+            graph.save(graph_file)
+            store.put_graph("base", graph_file, graph.build_json())
+            add_stage_progress(language, batch, "base")
         except KeyboardInterrupt:
             break
         except Exception:
@@ -46,15 +65,19 @@ def build_graphs(language: Language, batch: str, size, ratio, threshold, batch_s
             failed_files.append(full_error)
 
     if len(failed_files) > 0:
-        set_batch_data(language, batch, "base", "failed")
         with open(errors_dir / "failed_files.txt", "w", encoding="utf-8") as f:
             f.write("\n==========\n".join(failed_files))
+
+    if stopped:
+        pause_stopped_stage(language, batch, "base")
+    elif len(failed_files) > 0:
+        finish_stage(language, batch, "base", "failed")
     else:
-        set_batch_data(language, batch, "base", "done")
+        finish_stage(language, batch, "base", "done")
 
 
 if __name__ == "__main__":
-    from .cli_args import SIZE, RATIO, THRESHOLD, LANGUAGE, NAME, BATCH_SIZE
+    from .cli_args import SIZE, RATIO, THRESHOLD, LANGUAGE, NAME, BATCH_SIZE, GRAPH_FORMAT
 
     if LANGUAGE and NAME:
         batch_dir = TRIPLE_DIR / LANGUAGE / NAME
@@ -75,4 +98,4 @@ if __name__ == "__main__":
         "batch_size": BATCH_SIZE,
     })
 
-    build_graphs(SIZE, RATIO, THRESHOLD, language, batch, BATCH_SIZE)
+    build_graphs(language, batch, SIZE, RATIO, THRESHOLD, BATCH_SIZE, GRAPH_FORMAT)
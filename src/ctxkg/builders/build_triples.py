@@ -4,7 +4,7 @@ from triple_extractor_ptbr_pligabue.model import TripleExtractor
 from .constants import OPEN_IE_DIR, OPEN_IE_SOURCE_DIR, OPEN_IE_JAR
 from ...constants import (ENGLISH_PREFIX, PORTUGUESE_PREFIX, DOCUMENT_DIR, TRIPLE_DIR,
                           ENGLISH_DOC_DIR, PORTUGUESE_DOC_DIR, PORTUGUESE_TRIPLE_DIR)
-from ...utils.batch_data.helpers import set_batch_data
+from ...utils.batch_data.helpers import set_batch_data, finish_stage, refresh_stage_progress
 
 from ...languages import Language
 from ...utils.batch_data.types import BatchStatus
@@ -69,7 +69,11 @@ def _build_triples_pt_BR(batches: list[str], extraction_model: str):
 
 def _set_multiple_batches(language: Language, batches: list[str], status: BatchStatus):
     for batch in batches:
-        set_batch_data(language, batch, "triples", status)
+        if status == "started":
+            set_batch_data(language, batch, "triples", status)
+        else:
+            finish_stage(language, batch, "triples", status)
+        refresh_stage_progress(language, batch, "triples")
 
 
 if __name__ == "__main__":
@@ -1,42 +1,68 @@
+import os
+from functools import partial
+from multiprocessing import get_context
 from pathlib import Path
 from tkinter import Tk
 from tkinter.filedialog import askdirectory
 
 from ..models.graph import Graph
-from ..models.encoder import Encoder
+from ..models.graph_file import list_graph_files
+from ..models.graph_store import GraphStore
 from ...constants import GRAPH_DIR
-from ...utils.batch_data.helpers import set_batch_data
+from ...utils.batch_data.helpers import set_batch_data, add_stage_progress, refresh_stage_progress, pause_stopped_stage
+from ...utils.batch_data.helpers import finish_stage
+from ...utils.batch_data.stop_signal import StopSignal
 
 from ...languages import Language
 
 
-def clean_batch(language: Language, batch: str):
+def clean_batch(language: Language, batch: str, workers=1):
     batch_dir = GRAPH_DIR / language / batch
 
     set_batch_data(language, batch, "clean", "started")
+    refresh_stage_progress(language, batch, "clean")
+    should_stop = StopSignal(language, batch)
     try:
-        _clean_dir(batch_dir)
-        set_batch_data(language, batch, "clean", "done")
+        cleaned_files = _clean_dir(batch_dir, workers)
+        for _ in cleaned_files:
+            add_stage_progress(language, batch, "clean")
+            if should_stop():
+                # Closing the generator terminates the pool; every cleaned graph is already saved
+                cleaned_files.close()
+                pause_stopped_stage(language, batch, "clean")
+                return
+        finish_stage(language, batch, "clean", "done")
     except Exception:
-        set_batch_data(language, batch, "clean", "failed")
+        finish_stage(language, batch, "clean", "failed")
 
 
-def _clean_dir(batch_dir: Path):
+def _clean_dir(batch_dir: Path, workers=1):
     base_dir = batch_dir / "base"
     clean_dir = batch_dir / "clean"
     clean_dir.mkdir(exist_ok=True)
-    encoder = Encoder()
 
-    clean_graph_names = [f.stem for f in clean_dir.glob("*.json")]
-    graphs_to_be_cleaned = [f for f in base_dir.glob("*.json") if f.stem not in clean_graph_names]
-    for file in graphs_to_be_cleaned:
-        graph = Graph.from_json(file, encoder)
-        graph.clean()
-        graph.save_json(clean_dir / file.name)
+    clean_graph_names = {f.stem for f in list_graph_files(clean_dir)}
+    graphs_to_be_cleaned = [f for f in list_graph_files(base_dir) if f.stem not in clean_graph_names]
+
+    if workers > 1:
+        largest_first = sorted(graphs_to_be_cleaned, key=lambda file: file.stat().st_size, reverse=True)
+        # Spawned, since the process may have TensorFlow loaded from building base graphs, which forking can deadlock
+        with get_context("spawn").Pool(min(workers, os.cpu_count() or 1)) as pool:
+            yield from pool.imap_unordered(partial(_clean_file, clean_dir=clean_dir), largest_first)
+    else:
+        for file in graphs_to_be_cleaned:
+            yield _clean_file(file, clean_dir)
+
+
+def _clean_file(file: Path, clean_dir: Path):
+    graph = Graph.from_file(file)
+    graph.clean()
+    graph.save(clean_dir / file.name)
+    GraphStore(clean_dir.parent).put_graph("clean", clean_dir / file.name, graph.build_json())
 
 
 if __name__ == "__main__":
-    from .cli_args import LANGUAGE, NAME
+    from .cli_args import LANGUAGE, NAME, WORKERS
 
     if LANGUAGE and NAME:
         batch_dir = GRAPH_DIR / LANGUAGE / NAME
@@ -49,4 +75,4 @@ if __name__ == "__main__":
     language: Language = LANGUAGE if LANGUAGE else batch_dir.parent.name  # type: ignore
     batch = NAME if NAME else batch_dir.name
 
-    clean_batch(language, batch)
+    clean_batch(language, batch, WORKERS)
@@ -12,6 +12,12 @@ parser.add_argument("-t", "--threshold", type=float, default=DEFAULT_PARAMS["bas
 parser.add_argument("-l", "--language", type=str, default="en")
 parser.add_argument("-n", "--name", type=str)
 parser.add_argument("-b", "--batch", type=int, default=DEFAULT_PARAMS["base"]["batch_size"])
+parser.add_argument("-w", "--workers", type=int, default=DEFAULT_PARAMS["base"]["workers"])
+parser.add_argument("--index", dest="use_index", action="store_true")
+parser.add_argument("--binary", dest="graph_format", action="store_const", const="binary", default="json")
+parser.add_argument("--shard", type=str)
+parser.add_argument("--merge", action="store_true")
+parser.add_argument("--incremental", action="store_true")
 parser.set_defaults(size="small")
 args = parser.parse_args()
 
@@ -21,3 +27,9 @@ THRESHOLD = args.threshold
 LANGUAGE = args.language
 NAME = args.name
 BATCH_SIZE = args.batch
+WORKERS = args.workers
+USE_INDEX = args.use_index
+GRAPH_FORMAT = args.graph_format
+SHARD = args.shard
+MERGE = args.merge
+INCREMENTAL = args.incremental
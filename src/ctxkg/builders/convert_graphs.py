@@ -0,0 +1,61 @@
+from pathlib import Path
+from tkinter import Tk
+from tkinter.filedialog import askdirectory
+from tqdm import tqdm
+
+from ..models.embedding_store import EmbeddingStore
+from ..models.graph_file import GRAPH_SUFFIXES, GraphFormat, list_graph_files, read_graph_data, write_graph_data
+from ..models.graph_store import GraphStore
+from .build_bridges import rename_bridge_graphs
+from ...constants import GRAPH_DIR
+
+from ...languages import Language
+
+
+def convert_batch(language: Language, batch: str, graph_format: GraphFormat):
+    kg_dir = GRAPH_DIR / language / batch
+    clean_dir = kg_dir / "clean"
+    suffix = GRAPH_SUFFIXES[graph_format]
+
+    converted_files: list[Path] = []
+    for version in ["base", "clean"]:
+        graph_dir = kg_dir / version
+        if not graph_dir.exists():
+            continue
+        for graph_file in tqdm(list_graph_files(graph_dir)):
+            if graph_file.suffix != suffix:
+                write_graph_data(graph_file.with_suffix(suffix), read_graph_data(graph_file))
+                converted_files.append(graph_file)
+
+    # Stored embeddings and bridges refer to clean graphs by file name
+    renames = {f.name: f.with_suffix(suffix).name for f in converted_files if f.parent == clean_dir}
+    if clean_dir.exists():
+        for store_name in EmbeddingStore.get_store_names(clean_dir):
+            store = EmbeddingStore(clean_dir, name=store_name)
+            for graph_name, converted_name in renames.items():
+                store.rename(graph_name, clean_dir / converted_name)
+
+    for graph_file in converted_files:
+        graph_file.unlink()
+    rename_bridge_graphs(kg_dir, renames)
+
+    graph_store = GraphStore(kg_dir)
+    graph_store.sync("base")
+    graph_store.sync("clean")
+
+
+if __name__ == "__main__":
+    from .cli_args import LANGUAGE, NAME, GRAPH_FORMAT
+
+    if LANGUAGE and NAME:
+        batch_dir = GRAPH_DIR / LANGUAGE / NAME
+    else:
+        base_dir = GRAPH_DIR / LANGUAGE if LANGUAGE else GRAPH_DIR
+        Tk().withdraw()
+        directory = askdirectory(initialdir=base_dir)
+        batch_dir = Path(directory)
+
+    language: Language = LANGUAGE if LANGUAGE else batch_dir.parent.name  # type: ignore
+    batch = NAME if NAME else batch_dir.name
+
+    convert_batch(language, batch, GRAPH_FORMAT)
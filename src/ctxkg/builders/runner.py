@@ -1,38 +1,70 @@
 from typing import Optional
 
-from ...utils.batch_data.helpers import save_batch_params
+from ..models.lazy_encoder import LazyEncoder
+from ...constants import DEFAULT_PARAMS
+from ...utils.batch_data.helpers import get_batch_data, get_batch_params, save_batch_params
 
 from ...languages import Language
-from ...utils.batch_data.types import Stage
+from ...utils.batch_data.types import BatchStatus, Stage
+
+EncoderMap = dict[tuple[str, str, float], LazyEncoder]
 
 
 def run(language: Language, batch: str, size: str, extraction_model: str, ratio: float,
-        similarity_threshold: float, bridge_threshold: float, batch_size: int):
+        similarity_threshold: float, bridge_threshold: float, batch_size: int, workers: int = 1):
+    save_params(language, batch, size, extraction_model, ratio, similarity_threshold, bridge_threshold, batch_size,
+                workers)
+
+    for stage in ["triples", "base", "clean", "bridges"]:
+        run_stage(language, batch, stage)  # type: ignore
+
+
+def run_stage(language: Language, batch: str, stage: Stage, encoders: Optional[EncoderMap] = None) -> BatchStatus:
     from .build_triples import build_triples
     from .build_graphs import build_graphs
     from .clean_graphs import clean_batch
     from .build_bridges import build_bridges
 
-    _save_params(language, batch, size, extraction_model, ratio, similarity_threshold, bridge_threshold, batch_size)
+    params = get_batch_params(language, batch)
+    size = params["base"]["size"]
+    ratio = params["base"]["ratio"]
+    batch_size = params["base"]["batch_size"]
+    workers = params["base"].get("workers", DEFAULT_PARAMS["base"]["workers"])
+
+    if stage == "triples" and _should_run_stage(language, batch, "triples"):
+        build_triples(language, batch, params["base"]["extraction_model"])
+    elif stage == "base" and _should_run_stage(language, batch, "base", "triples"):
+        encoder = _get_encoder(encoders, language, size, ratio)
+        build_graphs(language, batch, size, ratio, params["base"]["threshold"], batch_size, encoder=encoder)
+    elif stage == "clean" and _should_run_stage(language, batch, "clean", "base"):
+        clean_batch(language, batch, workers)
+    elif stage == "bridges" and _should_run_stage(language, batch, "bridges", "clean"):
+        encoder = _get_encoder(encoders, language, size, ratio)
+        build_bridges(language, batch, size, ratio, params["bridges"]["threshold"], batch_size, workers=workers,
+                      encoder=encoder)
+
+    return get_batch_data(language, batch)[stage]
+
 
-    if _should_run_stage(language, batch, "triples"):
-        build_triples(language, batch, extraction_model)
-    if _should_run_stage(language, batch, "base", "triples"):
-        build_graphs(language, batch, size, ratio, similarity_threshold, batch_size)
-    if _should_run_stage(language, batch, "clean", "base"):
-        clean_batch(language, batch)
-    if _should_run_stage(language, batch, "bridges", "clean"):
-        build_bridges(language, batch, size, ratio, bridge_threshold, batch_size)
+def _get_encoder(encoders: Optional[EncoderMap], language: Language, size: str, ratio: float):
+    # Encoders kept in the map stay loaded between stages and batches of the same worker
+    if encoders is None:
+        return None
+    key = (language, size, ratio)
+    if key not in encoders:
+        encoders[key] = LazyEncoder(size=size, language=language, ratio=ratio)
+    return encoders[key]
 
 
-def _save_params(language: Language, batch: str, size: str, extraction_model: str, ratio: float,
-                 similarity_threshold: float, bridge_threshold: float, batch_size: int):
+def save_params(language: Language, batch: str, size: str, extraction_model: str, ratio: float,
+                similarity_threshold: float, bridge_threshold: float, batch_size: int, workers: int):
     save_batch_params(language, batch, "base", {
         "size": size,
         "extraction_model": extraction_model,
         "ratio": ratio,
         "threshold": similarity_threshold,
         "batch_size": batch_size,
+        "workers": workers,
     })
     save_batch_params(language, batch, "bridges", {
         "size": size,
@@ -44,9 +76,9 @@ def _save_params(language: Language, batch: str, size: str, extraction_model: st
 
 
 def _should_run_stage(language: Language, batch: str, stage: Stage, previous_stage: Optional[Stage] = None):
-    from ...utils.batch_data.helpers import get_metadata
+    from ...utils.batch_data.helpers import get_batch_data
 
-    batch_data = get_metadata()[language][batch]
+    batch_data = get_batch_data(language, batch)
     already_started = batch_data[stage] == "started"
     previous_stage_succeeded = previous_stage is None or batch_data[previous_stage] == "done"
     is_pending = batch_data[stage] == "pending"
@@ -0,0 +1,7 @@
+from ..models.encoder_service import serve_encoder
+
+
+if __name__ == "__main__":
+    from .cli_args import LANGUAGE, SIZE, RATIO
+
+    serve_encoder(preload=[(LANGUAGE, SIZE, RATIO)])
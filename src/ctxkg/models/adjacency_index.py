@@ -0,0 +1,51 @@
+from typing import Optional
+
+
+class AdjacencyIndex:
+    def __init__(self, graph_data):
+        self.entities: dict[str, str] = graph_data["entities"]
+        self.positions = {entity_id: i for i, entity_id in enumerate(self.entities)}
+        self.triples: list[dict] = graph_data["graph"]
+        self.links: dict[str, list[str]] = graph_data["links"]
+
+        self.neighbours: dict[str, list[str]] = {}
+        self.subject_triples: dict[str, list[int]] = {}
+        for i, triple in enumerate(self.triples):
+            subject_id, object_id = triple["subject_id"], triple["object_id"]
+            self.neighbours.setdefault(subject_id, []).append(object_id)
+            self.neighbours.setdefault(object_id, []).append(subject_id)
+            self.subject_triples.setdefault(subject_id, []).append(i)
+
+    def expand(self, entity_id: str, max_depth: Optional[int] = None, max_nodes: Optional[int] = None):
+        expanded = {entity_id}
+        frontier = [entity_id]
+        depth = 0
+        truncated = False
+        while frontier and not truncated:
+            if max_depth is not None and depth >= max_depth:
+                truncated = any(n not in expanded for e in frontier for n in self.neighbours.get(e, []))
+                break
+            next_frontier = []
+            for e in frontier:
+                for neighbour in self.neighbours.get(e, []):
+                    if neighbour in expanded:
+                        continue
+                    if max_nodes is not None and len(expanded) >= max_nodes:
+                        truncated = True
+                        break
+                    expanded.add(neighbour)
+                    next_frontier.append(neighbour)
+            frontier = next_frontier
+            depth += 1
+
+        entity_ids = sorted((e for e in expanded if e in self.positions), key=self.positions.__getitem__)
+        triple_positions = sorted(i for e in expanded for i in self.subject_triples.get(e, []))
+        return {
+            "entities": {e: self.entities[e] for e in entity_ids},
+            # With limits, triples leading out of the expanded nodes are left out so every edge has both its ends
+            "graph": [self.triples[i] for i in triple_positions if self.triples[i]["object_id"] in expanded],
+            "links": {
+                e: [linked for linked in self.links[e] if linked in expanded] for e in entity_ids if e in self.links
+            },
+            "truncated": truncated,
+        }
@@ -0,0 +1,147 @@
+import numpy as np
+
+
+class BridgeIndex:
+    def __init__(self, k=128, n_lists=None, n_probe=16, train_iterations=10, seed=0):
+        self.k = k
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.train_iterations = train_iterations
+        self.rng = np.random.default_rng(seed)
+
+        self.graph_names: list[str] = []
+        self.entity_ids: list[str] = []
+        self._encodings: list[np.ndarray] = []
+        self._row_graphs: list[np.ndarray] = []
+
+        self.encodings = np.zeros((0, 0), dtype=np.float32)
+        self.row_graphs = np.zeros(0, dtype=np.int32)
+        self.centroids = np.zeros((0, 0), dtype=np.float32)
+        self.list_offsets = np.zeros(1, dtype=np.int64)
+        self.list_rows = np.zeros(0, dtype=np.int64)
+
+    def add_graph(self, name: str, entity_ids: list[str], encodings):
+        graph_index = len(self.graph_names)
+        self.graph_names.append(name)
+        self.entity_ids.extend(entity_ids)
+        if entity_ids:
+            self._encodings.append(np.asarray(encodings, dtype=np.float32))
+            self._row_graphs.append(np.full(len(entity_ids), graph_index, dtype=np.int32))
+        return self
+
+    def build(self):
+        if self._encodings:
+            self.encodings = np.concatenate(self._encodings)
+            self.row_graphs = np.concatenate(self._row_graphs)
+        self._encodings = []
+        self._row_graphs = []
+
+        n_rows = len(self.encodings)
+        if n_rows == 0:
+            return self
+
+        n_lists = self.n_lists or max(1, int(np.sqrt(n_rows)))
+        self.centroids = self._train_centroids(min(n_lists, n_rows))
+        assignments = self._nearest_centroids(self.encodings, 1)[:, 0]
+        self.list_rows = np.argsort(assignments, kind="stable")
+        self.list_offsets = np.searchsorted(assignments[self.list_rows], np.arange(len(self.centroids) + 1))
+        return self
+
+    def search(self):
+        n_rows = len(self.encodings)
+        k = min(self.k, n_rows)
+        top_scores = np.full((n_rows, k), -np.inf, dtype=np.float32)
+        top_rows = np.full((n_rows, k), -1, dtype=np.int64)
+        if n_rows == 0:
+            return top_scores, top_rows
+
+        n_probe = min(self.n_probe, len(self.centroids))
+        probes = self._nearest_centroids(self.encodings, n_probe).ravel()
+        probe_queries = np.argsort(probes, kind="stable") // n_probe
+        probe_offsets = np.searchsorted(np.sort(probes), np.arange(len(self.centroids) + 1))
+        for list_index in range(len(self.centroids)):
+            members = self.list_rows[self.list_offsets[list_index]:self.list_offsets[list_index+1]]
+            queries = probe_queries[probe_offsets[list_index]:probe_offsets[list_index+1]]
+            if len(members) == 0 or len(queries) == 0:
+                continue
+
+            scores = self.encodings[queries] @ self.encodings[members].T
+            scores[self.row_graphs[queries][:, None] == self.row_graphs[members][None, :]] = -np.inf
+
+            merged_scores = np.concatenate([top_scores[queries], scores], axis=1)
+            merged_rows = np.concatenate([top_rows[queries], np.broadcast_to(members, scores.shape)], axis=1)
+            best = np.argpartition(-merged_scores, k - 1, axis=1)[:, :k]
+            top_scores[queries] = np.take_along_axis(merged_scores, best, axis=1)
+            top_rows[queries] = np.take_along_axis(merged_rows, best, axis=1)
+
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        return np.take_along_axis(top_scores, order, axis=1), np.take_along_axis(top_rows, order, axis=1)
+
+    def build_bridges(self, threshold: float):
+        bridges: dict[str, dict[str, dict[str, str]]] = {
+            name: {target: {} for target in self.graph_names if target != name} for name in self.graph_names
+        }
+
+        for row, match in self._mutual_matches(threshold):
+            source = self.graph_names[self.row_graphs[row]]
+            target = self.graph_names[self.row_graphs[match]]
+            bridges[source][target][self.entity_ids[row]] = self.entity_ids[match]
+
+        graphs_by_id: dict[str, list[str]] = {}
+        for row, entity_id in enumerate(self.entity_ids):
+            graphs_by_id.setdefault(entity_id, []).append(self.graph_names[self.row_graphs[row]])
+        for entity_id, graphs in graphs_by_id.items():
+            for source in graphs:
+                for target in graphs:
+                    if source != target:
+                        bridges[source][target][entity_id] = entity_id
+
+        return bridges
+
+    def _mutual_matches(self, threshold: float):
+        scores, rows = self.search()
+        n_graphs = len(self.graph_names)
+
+        queries = np.repeat(np.arange(len(rows)), rows.shape[1])
+        ranks = np.tile(np.arange(rows.shape[1]), len(rows))
+        scores, rows = scores.ravel(), rows.ravel()
+        valid = np.isfinite(scores)
+        queries, ranks, scores, rows = queries[valid], ranks[valid], scores[valid], rows[valid]
+
+        # The hits are sorted by score, so the first hit of each target graph is the query's best match in it.
+        keys = queries * n_graphs + self.row_graphs[rows]
+        order = np.lexsort((ranks, keys))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = keys[order][1:] != keys[order][:-1]
+        best = order[first]
+        best_keys, best_rows, best_scores = keys[best], rows[best], scores[best]
+
+        reverse_keys = best_rows * n_graphs + self.row_graphs[best_keys // n_graphs]
+        positions = np.minimum(np.searchsorted(best_keys, reverse_keys), len(best_keys) - 1)
+        is_mutual = (best_keys[positions] == reverse_keys) & (best_rows[positions] == best_keys // n_graphs)
+        is_match = is_mutual & (best_scores > threshold)
+
+        return zip((best_keys // n_graphs)[is_match].tolist(), best_rows[is_match].tolist())
+
+    def _train_centroids(self, n_lists: int):
+        sample_size = min(len(self.encodings), n_lists * 64)
+        sample = self.encodings[self.rng.choice(len(self.encodings), sample_size, replace=False)]
+        centroids = sample[self.rng.choice(sample_size, n_lists, replace=False)].copy()
+
+        for _ in range(self.train_iterations):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            counts = np.bincount(assignments, minlength=n_lists)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            empty = counts == 0
+            sums[empty] = sample[self.rng.choice(sample_size, int(empty.sum()))]
+            centroids = sums / np.maximum(np.linalg.norm(sums, axis=1, keepdims=True), 1e-12)
+
+        return centroids.astype(np.float32)
+
+    def _nearest_centroids(self, encodings: np.ndarray, n: int, block_size=4096):
+        nearest = np.empty((len(encodings), n), dtype=np.int64)
+        for i in range(0, len(encodings), block_size):
+            scores = encodings[i:i+block_size] @ self.centroids.T
+            nearest[i:i+block_size] = np.argpartition(-scores, n - 1, axis=1)[:, :n]
+        return nearest
@@ -0,0 +1,169 @@
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+from .graph import Graph
+
+if TYPE_CHECKING:
+    from .graph import AnyEncoder
+
+
+class EmbeddingStore:
+    LOCK_TIMEOUT = 60
+
+    def __init__(self, graph_dir: Path, encoder: Optional["AnyEncoder"] = None, batch_size=None, dtype="float32",
+                 name: Optional[str] = None):
+        self.graph_dir = graph_dir
+        self.store_dir = graph_dir / "embeddings"
+        self.store_dir.mkdir(exist_ok=True)
+        self.encoder = encoder
+        self.batch_size = batch_size
+        self.dtype = np.dtype(dtype)
+
+        if name is None:
+            if encoder is None:
+                raise Exception("An embedding store needs either an encoder or a store name.")
+            name = f"{encoder.language}-{encoder.size}-{encoder.ratio}-{self.dtype.name}"
+        self.matrix_path = self.store_dir / f"{name}.bin"
+        self.index_path = self.store_dir / f"{name}.jsonl"
+        self.lock_path = self.store_dir / f"{name}.lock"
+
+        self.entries: dict[str, dict] = {}
+        self.rows = 0
+        self.columns = 0
+        self.index_position = 0
+        self.matrix: Optional[np.memmap] = None
+        self._refresh_index()
+
+    def load(self, graph_file: Path):
+        entry = self._get_valid_entry(graph_file)
+        if entry is None:
+            entry = self._append(graph_file)
+        return entry["entity_ids"], self._get_rows(entry)
+
+    @staticmethod
+    def get_store_names(graph_dir: Path):
+        return sorted(path.stem for path in (graph_dir / "embeddings").glob("*.jsonl"))
+
+    def rename(self, graph_name: str, graph_file: Path):
+        # Converting a graph to another file format keeps its entities, so its rows are reused under the new name
+        with self._lock():
+            self._refresh_index()
+            entry = self.entries.get(graph_name)
+            if entry is None or graph_name == graph_file.name:
+                return
+            stat = graph_file.stat()
+            self._write_entry({
+                **entry,
+                "graph": graph_file.name,
+                "file_hash": self._hash(graph_file),
+                "file_size": stat.st_size,
+                "file_mtime": stat.st_mtime_ns,
+            })
+            self._refresh_index()
+
+    def read(self, graph_name: str):
+        if graph_name not in self.entries:
+            self._refresh_index()
+        entry = self.entries.get(graph_name)
+        return None if entry is None else (entry["entity_ids"], self._get_rows(entry))
+
+    def _get_valid_entry(self, graph_file: Path):
+        if graph_file.name not in self.entries:
+            self._refresh_index()
+        entry = self.entries.get(graph_file.name)
+        if entry is None:
+            return None
+
+        stat = graph_file.stat()
+        if entry["file_size"] == stat.st_size and entry["file_mtime"] == stat.st_mtime_ns:
+            return entry
+        return entry if entry["file_hash"] == self._hash(graph_file) else None
+
+    def _append(self, graph_file: Path):
+        stat = graph_file.stat()
+        graph = Graph.from_file(graph_file, self.encoder)
+        entity_ids = list(graph.entities.keys())
+        encodings = graph.build_entity_encodings(self.batch_size).get_stacked_encodings() if entity_ids else None
+
+        with self._lock():
+            self._refresh_index()
+            columns = self.columns or (encodings.shape[1] if encodings is not None else 0)
+            entry = {
+                "graph": graph_file.name,
+                "offset": self.rows,
+                "columns": columns,
+                "entity_ids": entity_ids,
+                "file_hash": self._hash(graph_file),
+                "file_size": stat.st_size,
+                "file_mtime": stat.st_mtime_ns,
+            }
+
+            # Anything past the indexed rows or the last complete index line was left by an interrupted append
+            with self.matrix_path.open("a+b") as f:
+                f.truncate(self.rows * columns * self.dtype.itemsize)
+                if encodings is not None:
+                    f.write(encodings.astype(self.dtype).tobytes())
+            self._write_entry(entry)
+            self._refresh_index()
+        return entry
+
+    def _write_entry(self, entry):
+        with self.index_path.open("a+", encoding="utf-8") as f:
+            f.truncate(self.index_position)
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def _get_rows(self, entry):
+        offset, count = entry["offset"], len(entry["entity_ids"])
+        if count == 0:
+            return np.zeros((0, self.columns), dtype=self.dtype)
+        if self.matrix is None or len(self.matrix) < offset + count:
+            self.matrix = np.memmap(self.matrix_path, dtype=self.dtype, mode="r", shape=(self.rows, self.columns))
+        return self.matrix[offset:offset+count]
+
+    def _refresh_index(self):
+        if not self.index_path.exists():
+            return
+        with self.index_path.open("rb") as f:
+            f.seek(self.index_position)
+            new_lines = f.read()
+
+        complete_length = new_lines.rfind(b"\n") + 1
+        for line in new_lines[:complete_length].splitlines():
+            entry = json.loads(line)
+            self.entries[entry["graph"]] = entry
+            self.rows = max(self.rows, entry["offset"] + len(entry["entity_ids"]))
+            self.columns = self.columns or entry["columns"]
+        self.index_position += complete_length
+
+    @contextmanager
+    def _lock(self):
+        while True:
+            try:
+                fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                if self._lock_age() > self.LOCK_TIMEOUT:
+                    self.lock_path.unlink(missing_ok=True)
+                time.sleep(0.1)
+        try:
+            yield
+        finally:
+            os.close(fd)
+            self.lock_path.unlink(missing_ok=True)
+
+    def _lock_age(self):
+        try:
+            return time.time() - self.lock_path.stat().st_mtime
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def _hash(graph_file: Path):
+        return hashlib.sha256(graph_file.read_bytes()).hexdigest()[:16]
@@ -1,94 +1,197 @@
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
 import numpy as np
 import tensorflow as tf
-from keras import Model
+import tensorflow_hub as hub
 from tensorflow_hub import KerasLayer
 from transformers import TFBertTokenizer, TFAutoModel
 from triple_extractor_ptbr_pligabue.constants import BERT_MODEL_NAME
 
-from ...constants import ENGLISH_PREFIX, PORTUGUESE_PREFIX
+from ...constants import ENGLISH_PREFIX, PORTUGUESE_PREFIX, ENCODING_CACHE_DIR, ENCODING_CACHE_MAX_BYTES
+from .encoder_service import TripleTexts, get_triple_texts, mean_entity_encodings
+from .encoding_cache import EncodingCache
+from .entity import Entity
 from .triple import Triple
 
 
 class Encoder:
-    SEP_ID = 102
+    SEQUENCE_LENGTH = 128
     tfhub_preprocess_url = "https://tfhub.dev/tensorflow/bert_en_uncased_preprocess/3"
     tfhub_encoder_urls = {
         "big": "https://tfhub.dev/tensorflow/bert_en_uncased_L-12_H-768_A-12/4",
         "medium": "https://tfhub.dev/tensorflow/small_bert/bert_en_uncased_L-8_H-512_A-8/2",
         "small": "https://tfhub.dev/tensorflow/small_bert/bert_en_uncased_L-4_H-512_A-8/2"
     }
+    _models: dict[tuple[str, str], tuple] = {}
+    _models_lock = Lock()
 
-    def __init__(self, size="small", language=ENGLISH_PREFIX, ratio=1.0):
+    def __init__(self, size="small", language=ENGLISH_PREFIX, ratio=1.0,
+                 cache_dir: Optional[Path] = ENCODING_CACHE_DIR):
+        self.size: str = size
+        self.language: str = language
         self.ratio: float = ratio
-
-        if language == ENGLISH_PREFIX:
-            id_list_key, preprocessor, text_input, seq_out, pooled_out = self._english_bert_models(size)
-        elif language == PORTUGUESE_PREFIX:
-            id_list_key, preprocessor, text_input, seq_out, pooled_out = self._portuguse_bert_models()
-        else:
-            raise Exception(f"No BERT model found for {language}.")
-
-        self.id_list_key = id_list_key
-        self.preprocessor: KerasLayer = preprocessor
-        self.sequence_model: Model = Model(text_input, seq_out)
-        self.cls_model: Model = Model(text_input, pooled_out)
-
-    def build_entity_encodings(self, triples: list[Triple], batch_size=None):
-        batch_size = batch_size or len(triples)
-        for i in range(0, len(triples), batch_size):
-            batch = triples[i:i+batch_size]
-            subject_inputs = tf.constant([triple.subject.text for triple in batch])
-            object_inputs = tf.constant([triple.object.text for triple in batch])
-            triples_inputs = tf.constant([triple.to_text() for triple in batch])
-
-            # type: ignore
-            triple_end_indexes = np.argmax(self.preprocessor(triples_inputs)[self.id_list_key] == self.SEP_ID, axis=1)  # type: ignore  # noqa: E501
-            subject_end_indexes = np.argmax(self.preprocessor(subject_inputs)[self.id_list_key] == self.SEP_ID, axis=1)  # type: ignore  # noqa: E501
-            object_input_lengths = np.argmax(self.preprocessor(object_inputs)[self.id_list_key] == self.SEP_ID, axis=1) - 1  # type: ignore  # noqa: E501
-            object_start_indexes = triple_end_indexes - object_input_lengths
-
-            triple_encodings = self.sequence_model(triples_inputs)
-
-            triple_data = zip(triple_end_indexes, subject_end_indexes, object_start_indexes, triple_encodings, batch)  # type: ignore  # noqa: E501
-            for t_end, sub_end, obj_start, encoding, triple in triple_data:
-                base_subject_encoding = tf.reduce_mean(encoding[1:sub_end], 0)
-                base_object_encoding = tf.reduce_mean(encoding[obj_start:t_end], 0)
-                cls_encodings = encoding[0]
-
-                subject_encoding = tf.add(base_subject_encoding * self.ratio, cls_encodings * (1 - self.ratio))
-                object_encoding = tf.add(base_object_encoding * self.ratio, cls_encodings * (1 - self.ratio))
-
-                triple.subject.add_encoding(subject_encoding)
-                triple.object.add_encoding(object_encoding)
-
-        return self
-
-    def _english_bert_models(self, size):
-        text_input = tf.keras.layers.Input(shape=(), dtype=tf.string)
-        preprocessor = KerasLayer(self.tfhub_preprocess_url)
-        encoder_inputs = preprocessor(text_input)
-        encoder = KerasLayer(self.tfhub_encoder_urls[size])
-        outputs = encoder(encoder_inputs)
+        self.cache: Optional[EncodingCache] = None
+        if cache_dir is not None:
+            self.cache = EncodingCache(cache_dir / f"{language}-{size}-{ratio}", ENCODING_CACHE_MAX_BYTES)
+
+        self.tokenizer, self.sequence_model, self.cls_id, self.sep_id, self.pad_id = self._get_models(language, size)
+
+    def build_entity_encodings(self, triples: list[Triple], entities: list[Entity], batch_size=None):
+        if not triples:
+            return np.zeros((len(entities), 0), dtype=np.float32)
+
+        return mean_entity_encodings(self.encode_triples(triples, batch_size), triples, entities)
+
+    def encode_triples(self, triples: list[Triple], batch_size=None):
+        return self.encode_texts([get_triple_texts(triple) for triple in triples], batch_size)
+
+    def encode_texts(self, triple_texts: list[TripleTexts], batch_size=None):
+        keys = [EncodingCache.get_key(texts) for texts in triple_texts]
+        encodings = self.cache.get_many(keys) if self.cache is not None else {}
+        missing_texts = list({key: texts for key, texts in zip(keys, triple_texts) if key not in encodings}.values())
+
+        new_encodings: dict[str, np.ndarray] = {}
+        token_ids = self.tokenize({text for texts in missing_texts for text in texts})
+        token_budget = (batch_size or len(missing_texts)) * self.SEQUENCE_LENGTH
+        for batch in self._get_batches(missing_texts, token_ids, token_budget):
+            word_ids, input_mask, subject_mask, object_mask = self._pack(batch, token_ids)
+
+            sequence_encodings = self.sequence_model(word_ids, input_mask)
+            cls_encodings = sequence_encodings[:, 0] * (1 - self.ratio)
+            subject_encodings = self._mean_pool(sequence_encodings, subject_mask) * self.ratio + cls_encodings
+            object_encodings = self._mean_pool(sequence_encodings, object_mask) * self.ratio + cls_encodings
+
+            batch_encodings = tf.stack([subject_encodings, object_encodings], axis=1).numpy()
+            for texts, encoding in zip(batch, batch_encodings):
+                new_encodings[EncodingCache.get_key(texts)] = encoding
+
+        if self.cache is not None:
+            self.cache.put_many(new_encodings)
+        encodings.update(new_encodings)
+        return np.stack([encodings[key] for key in keys])
+
+    def tokenize(self, texts: set[str]):
+        unique_texts = list(texts)
+        if not unique_texts:
+            return {}
+        tokens = self.tokenizer(tf.constant(unique_texts))
+        flat_ids = tokens.flat_values.numpy()
+        row_splits = tokens.row_splits.numpy()
+        return dict(zip(unique_texts, np.split(flat_ids, row_splits[1:-1])))
+
+    def _get_batches(self, triple_texts: list[TripleTexts], token_ids: dict[str, np.ndarray], token_budget: int):
+        # Triples are sorted by length and each batch is padded to its own longest triple, so batches of short triples
+        # can hold many more triples within the same number of tokens.
+        lengths = [self._get_sequence_length(texts, token_ids) for texts in triple_texts]
+        batch: list[TripleTexts] = []
+        for index in sorted(range(len(triple_texts)), key=lengths.__getitem__):
+            if batch and (len(batch) + 1) * lengths[index] > token_budget:
+                yield batch
+                batch = []
+            batch.append(triple_texts[index])
+        if batch:
+            yield batch
+
+    def _get_sequence_length(self, texts: TripleTexts, token_ids: dict[str, np.ndarray]):
+        token_count = sum(len(token_ids[text]) for text in texts)
+        return min(token_count, self.SEQUENCE_LENGTH - 2) + 2
+
+    def _pack(self, batch: list[TripleTexts], token_ids: dict[str, np.ndarray]):
+        # Tokenizing the subject, relation and object separately gives the same word pieces as tokenizing the triple
+        # text, since BERT splits on whitespace before applying WordPiece. The spans then come from the lengths.
+        lengths = [self._fit_lengths([len(token_ids[text]) for text in texts]) for texts in batch]
+        sequences = [
+            np.concatenate([token_ids[text][:length] for text, length in zip(texts, text_lengths)])
+            for texts, text_lengths in zip(batch, lengths)
+        ]
+        sequence_length = max(len(sequence) for sequence in sequences) + 2
+
+        word_ids = np.full((len(batch), sequence_length), self.pad_id, dtype=np.int32)
+        spans = np.zeros((len(batch), 4), dtype=np.int64)
+        for row, ((subject_length, relation_length, _), sequence) in enumerate(zip(lengths, sequences)):
+            word_ids[row, 0] = self.cls_id
+            word_ids[row, 1:len(sequence)+1] = sequence
+            word_ids[row, len(sequence)+1] = self.sep_id
+            spans[row] = (1, 1 + subject_length, 1 + subject_length + relation_length, len(sequence) + 1)
+
+        positions = np.arange(sequence_length)[np.newaxis, :]
+        input_mask = (positions <= spans[:, 3:]).astype(np.int32)
+        subject_mask = (positions >= spans[:, 0:1]) & (positions < spans[:, 1:2])
+        object_mask = (positions >= spans[:, 2:3]) & (positions < spans[:, 3:])
+        return word_ids, input_mask, subject_mask, object_mask
+
+    def _fit_lengths(self, text_lengths: list[int]):
+        # Triples too long for the sequence lose relation tokens first, then the subject and object are cut to share
+        # what is left, so neither span ends up empty
+        max_tokens = self.SEQUENCE_LENGTH - 2
+        subject_length, relation_length, object_length = text_lengths
+        relation_length = min(relation_length, max(max_tokens - subject_length - object_length, 0))
+        if subject_length + object_length > max_tokens:
+            object_length = min(object_length, max_tokens - min(subject_length, max_tokens // 2))
+            subject_length = max_tokens - object_length
+        return subject_length, relation_length, object_length
+
+    @staticmethod
+    def _mean_pool(encodings, mask):
+        mask = tf.cast(mask, encodings.dtype)
+        span_sums = tf.einsum("bl,blh->bh", mask, encodings)
+        return span_sums / tf.maximum(tf.reduce_sum(mask, axis=1, keepdims=True), 1.0)
+
+    @classmethod
+    def _get_models(cls, language: str, size: str):
+        # Models are loaded once per process for each language and size, and shared by every encoder in it
+        with cls._models_lock:
+            if (language, size) not in cls._models:
+                if language == ENGLISH_PREFIX:
+                    cls._models[(language, size)] = cls._english_bert_models(size)
+                elif language == PORTUGUESE_PREFIX:
+                    cls._models[(language, size)] = cls._portuguse_bert_models()
+                else:
+                    raise Exception(f"No BERT model found for {language}.")
+            return cls._models[(language, size)]
+
+    @classmethod
+    def _english_bert_models(cls, size):
+        preprocessor = hub.load(cls.tfhub_preprocess_url)
+        special_tokens = preprocessor.tokenize.get_special_tokens_dict()
+        encoder = KerasLayer(cls.tfhub_encoder_urls[size])
+
+        def sequence_model(word_ids, input_mask):
+            return encoder({
+                "input_word_ids": tf.constant(word_ids),
+                "input_mask": tf.constant(input_mask),
+                "input_type_ids": tf.zeros_like(word_ids),
+            })["sequence_output"]
+
+        def tokenizer(texts):
+            return preprocessor.tokenize(texts).merge_dims(-2, -1)
 
         return (
-            "input_word_ids",
-            preprocessor,
-            text_input,
-            outputs["sequence_output"],  # type: ignore
-            outputs["pooled_output"],  # type: ignore
+            tokenizer,
+            sequence_model,
+            int(special_tokens["start_of_sequence_id"]),
+            int(special_tokens["end_of_segment_id"]),
+            int(special_tokens["padding_id"]),
         )
 
-    def _portuguse_bert_models(self):
-        text_input = tf.keras.layers.Input(shape=(), dtype=tf.string)
+    @staticmethod
+    def _portuguse_bert_models():
         preprocessor = TFBertTokenizer.from_pretrained(BERT_MODEL_NAME)
-        encoder_inputs = preprocessor(text_input)
         encoder = TFAutoModel.from_pretrained(BERT_MODEL_NAME).bert
-        outputs = encoder(encoder_inputs)
+
+        def sequence_model(word_ids, input_mask):
+            return encoder(
+                input_ids=tf.constant(word_ids),
+                attention_mask=tf.constant(input_mask),
+                token_type_ids=tf.zeros_like(word_ids),
+            ).last_hidden_state
 
         return (
-            "input_ids",
-            preprocessor,
-            text_input,
-            outputs.last_hidden_state,
-            outputs.pooler_output,
+            preprocessor.unpaired_tokenize,
+            sequence_model,
+            int(preprocessor.cls_token_id),
+            int(preprocessor.sep_token_id),
+            int(preprocessor.pad_token_id),
         )
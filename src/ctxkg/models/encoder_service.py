@@ -0,0 +1,161 @@
+import json
+import socket
+import socketserver
+import struct
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+from ...constants import ENGLISH_PREFIX, ENCODER_SOCKET_PATH
+
+if TYPE_CHECKING:
+    from .encoder import Encoder
+    from .entity import Entity
+    from .triple import Triple
+
+TripleTexts = tuple[str, str, str]
+
+# Every message is a little-endian uint64 length followed by that many bytes. Requests and response headers are JSON;
+# encodings follow their header as raw float32 bytes.
+FRAME_HEADER = struct.Struct("<Q")
+
+
+def get_triple_texts(triple: "Triple") -> TripleTexts:
+    return (triple.subject.text, str(triple.relation), triple.object.text)
+
+
+def mean_entity_encodings(triple_encodings: np.ndarray, triples: list["Triple"], entities: list["Entity"]):
+    entity_indexes = {entity: i for i, entity in enumerate(entities)}
+    segment_ids = np.array([entity_indexes[t.subject] for t in triples] + [entity_indexes[t.object] for t in triples])
+    encodings = np.concatenate([triple_encodings[:, 0], triple_encodings[:, 1]])
+    encoding_sums = np.zeros((len(entities), encodings.shape[1]), dtype=encodings.dtype)
+    np.add.at(encoding_sums, segment_ids, encodings)
+    encoding_counts = np.bincount(segment_ids, minlength=len(entities)).astype(np.float32)
+    return encoding_sums / np.maximum(encoding_counts, 1)[:, np.newaxis]
+
+
+def send_frame(connection: socket.socket, payload: bytes):
+    connection.sendall(FRAME_HEADER.pack(len(payload)))
+    connection.sendall(payload)
+
+
+def receive_frame(connection: socket.socket) -> bytes:
+    size, = FRAME_HEADER.unpack(_receive_exactly(connection, FRAME_HEADER.size))
+    return _receive_exactly(connection, size)
+
+
+def _receive_exactly(connection: socket.socket, size: int) -> bytes:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = connection.recv_into(view[received:])
+        if count == 0:
+            raise ConnectionError("Encoder connection closed.")
+        received += count
+    return bytes(buffer)
+
+
+class RemoteEncoder:
+    def __init__(self, size="small", language=ENGLISH_PREFIX, ratio=1.0, socket_path: Path = ENCODER_SOCKET_PATH):
+        self.size: str = size
+        self.language: str = language
+        self.ratio: float = ratio
+        self.connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self.connection.connect(str(socket_path))
+            self._request({"ping": True})
+        except OSError:
+            self.connection.close()
+            raise
+
+    def build_entity_encodings(self, triples: list["Triple"], entities: list["Entity"], batch_size=None):
+        if not triples:
+            return np.zeros((len(entities), 0), dtype=np.float32)
+        return mean_entity_encodings(self.encode_triples(triples, batch_size), triples, entities)
+
+    def encode_triples(self, triples: list["Triple"], batch_size=None):
+        header = self._request({
+            "language": self.language,
+            "size": self.size,
+            "ratio": self.ratio,
+            "batch_size": batch_size,
+            "texts": [get_triple_texts(triple) for triple in triples],
+        })
+        return np.frombuffer(receive_frame(self.connection), dtype="<f4").reshape(header["shape"])
+
+    def _request(self, request):
+        send_frame(self.connection, json.dumps(request, ensure_ascii=False).encode("utf-8"))
+        header = json.loads(receive_frame(self.connection))
+        if "error" in header:
+            raise Exception(f"Encoder server error: {header['error']}")
+        return header
+
+
+class EncoderRequestHandler(socketserver.BaseRequestHandler):
+    server: "EncoderServer"
+
+    def handle(self):
+        while True:
+            try:
+                request = json.loads(receive_frame(self.request))
+            except ConnectionError:
+                return
+
+            try:
+                if request.get("ping"):
+                    send_frame(self.request, b'{"ok": true}')
+                    continue
+                texts = [tuple(triple_texts) for triple_texts in request["texts"]]
+                encodings = self.server.encode(
+                    request["language"], request["size"], request["ratio"], texts, request["batch_size"]
+                )
+            except Exception as e:
+                send_frame(self.request, json.dumps({"error": str(e)}).encode("utf-8"))
+                continue
+            send_frame(self.request, json.dumps({"shape": list(encodings.shape)}).encode("utf-8"))
+            send_frame(self.request, encodings.astype("<f4").tobytes())
+
+
+class EncoderServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path):
+        self.encoders: dict[tuple[str, str, float], "Encoder"] = {}
+        # Requests run one at a time, so concurrent stages don't hold several batches of activations in memory
+        self.lock = Lock()
+        super().__init__(str(socket_path), EncoderRequestHandler)
+
+    def get_encoder(self, language: str, size: str, ratio: float):
+        key = (language, size, ratio)
+        if key not in self.encoders:
+            from .encoder import Encoder
+            self.encoders[key] = Encoder(size=size, language=language, ratio=ratio)
+        return self.encoders[key]
+
+    def encode(self, language: str, size: str, ratio: float, texts: list[TripleTexts], batch_size: Optional[int]):
+        if not texts:
+            return np.zeros((0, 2, 0), dtype=np.float32)
+        with self.lock:
+            return self.get_encoder(language, size, ratio).encode_texts(texts, batch_size)
+
+
+def serve_encoder(socket_path: Path = ENCODER_SOCKET_PATH, preload: Optional[list[tuple[str, str, float]]] = None):
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        try:
+            RemoteEncoder(socket_path=socket_path).connection.close()
+        except OSError:
+            socket_path.unlink()
+        else:
+            raise Exception(f"An encoder server is already listening on {socket_path}.")
+
+    with EncoderServer(socket_path) as server:
+        for language, size, ratio in preload or []:
+            server.get_encoder(language, size, ratio)
+        try:
+            server.serve_forever()
+        finally:
+            socket_path.unlink(missing_ok=True)
@@ -0,0 +1,150 @@
+import hashlib
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+
+class EncodingCache:
+    QUERY_CHUNK_SIZE = 500
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.vectors_path = cache_dir / "vectors.f32"
+        # The encoder server creates its encoders in the main thread and uses them from a thread per client, one
+        # request at a time
+        self.connection = sqlite3.connect(
+            cache_dir / "index.sqlite3", timeout=60, isolation_level=None, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, slot INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+
+    @staticmethod
+    def get_key(texts: tuple[str, ...]):
+        return hashlib.sha1("\x1f".join(texts).encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, np.ndarray]:
+        if not keys:
+            return {}
+
+        # Slots are read under the write lock, so another process can't evict a key and reuse its slot in between
+        with self._transaction():
+            shape = self._get_shape()
+            slots = self._get_slots(keys) if shape is not None else {}
+            if not slots:
+                return {}
+
+            vectors = self._open_vectors(shape, "r")
+            encodings = {key: np.array(vectors[slot]) for key, slot in slots.items()}
+            now = time.time()
+            self.connection.executemany(
+                "UPDATE entries SET last_used = ? WHERE key = ?", [(now, key) for key in slots]
+            )
+        return encodings
+
+    def put_many(self, encodings: dict[str, np.ndarray]):
+        if not encodings:
+            return
+
+        shape: tuple[int, ...] = next(iter(encodings.values())).shape
+        max_slots = self.max_bytes // (int(np.prod(shape)) * 4)
+        items = list(encodings.items())[-max_slots:] if max_slots > 0 else []
+        if not items:
+            return
+
+        with self._transaction():
+            stored_shape = self._get_shape()
+            if stored_shape is None:
+                self._set_meta("rows", shape[0])
+                self._set_meta("columns", shape[1])
+            elif stored_shape != shape:
+                raise Exception(f"Encoding shape {shape} does not match the cached shape {stored_shape}.")
+
+            # Keys another process stored meanwhile keep their slot, which would otherwise never be reused. They are
+            # marked as used first so making room for the new keys doesn't evict them.
+            now = time.time()
+            existing_slots = self._get_slots([key for key, _ in items])
+            self.connection.executemany(
+                "UPDATE entries SET last_used = ? WHERE key = ?", [(now, key) for key in existing_slots]
+            )
+            new_keys = [key for key, _ in items if key not in existing_slots]
+            new_slots = self._allocate_slots(len(new_keys), max_slots, shape)
+            self.connection.executemany(
+                "INSERT INTO entries (key, slot, last_used) VALUES (?, ?, ?)",
+                [(key, slot, now) for key, slot in zip(new_keys, new_slots)],
+            )
+
+            slots = {**existing_slots, **dict(zip(new_keys, new_slots))}
+            items = [(key, encoding) for key, encoding in items if key in slots]
+            if not items:
+                return
+            vectors = self._open_vectors(shape, "r+")
+            rows = [slots[key] for key, _ in items]
+            vectors[rows] = np.stack([encoding for _, encoding in items]).astype(np.float32)
+            vectors.flush()
+
+    def _get_slots(self, keys: list[str]) -> dict[str, int]:
+        slots: dict[str, int] = {}
+        unique_keys = list(set(keys))
+        for i in range(0, len(unique_keys), self.QUERY_CHUNK_SIZE):
+            chunk = unique_keys[i:i+self.QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.connection.execute(f"SELECT key, slot FROM entries WHERE key IN ({placeholders})", chunk)
+            slots.update(rows)
+        return slots
+
+    def _allocate_slots(self, count: int, max_slots: int, shape: tuple[int, ...]):
+        next_slot = self._get_meta("next_slot") or 0
+        fresh_count = min(count, max_slots - next_slot)
+        slots = list(range(next_slot, next_slot + fresh_count))
+        self._set_meta("next_slot", next_slot + fresh_count)
+
+        if fresh_count < count:
+            evicted = self.connection.execute(
+                "SELECT key, slot FROM entries ORDER BY last_used LIMIT ?", (count - fresh_count,)
+            ).fetchall()
+            self.connection.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key, _ in evicted])
+            slots.extend(slot for _, slot in evicted)
+
+        row_bytes = int(np.prod(shape)) * 4
+        current_slots = self.vectors_path.stat().st_size // row_bytes if self.vectors_path.exists() else 0
+        if current_slots < next_slot + fresh_count:
+            new_slots = min(max(current_slots * 2, next_slot + fresh_count, 1024), max_slots)
+            with self.vectors_path.open("a+b") as f:
+                f.truncate(new_slots * row_bytes)
+
+        return slots
+
+    def _open_vectors(self, shape: tuple[int, ...], mode: str):
+        slot_count = self.vectors_path.stat().st_size // (int(np.prod(shape)) * 4)
+        return np.memmap(self.vectors_path, dtype=np.float32, mode=mode, shape=(slot_count, *shape))
+
+    @contextmanager
+    def _transaction(self):
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+            self.connection.execute("COMMIT")
+        except Exception:
+            self.connection.execute("ROLLBACK")
+            raise
+
+    def _get_shape(self):
+        rows, columns = self._get_meta("rows"), self._get_meta("columns")
+        return None if rows is None or columns is None else (rows, columns)
+
+    def _get_meta(self, name: str) -> Optional[int]:
+        row = self.connection.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return None if row is None else row[0]
+
+    def _set_meta(self, name: str, value: int):
+        self.connection.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, value))
@@ -1,28 +1,36 @@
-from typing import Dict, Union
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, Optional, Union
 import numpy as np
-import pandas as pd
-import tensorflow as tf
-import json
 from pathlib import Path
 import re
 
-from .encoder import Encoder
 from .entity import Entity
+from .graph_file import read_graph_data, write_graph_data
 from .triple import Triple
 from .link import Link
 
+if TYPE_CHECKING:
+    from .encoder import Encoder
+    from .lazy_encoder import LazyEncoder
+
+    AnyEncoder = Union[Encoder, LazyEncoder]
+
 
 class Graph:
-    def __init__(self, filepath: str, encoder: Encoder, normalize=True):
+    def __init__(self, filepath: str, encoder: Optional["AnyEncoder"] = None, normalize=True):
         self.filepath = filepath
         self.encoder = encoder
         self.normalize = normalize
         self.entities: Dict[str, Entity] = {}
         self.triples: list[Triple] = []
-        self.links: list[Link] = []
+        self.encodings: Optional[np.ndarray] = None
+        # Neighbours are kept in insertion-ordered dicts so that saved links keep the order they were added in
+        self.adjacency: Dict[Entity, Dict[Entity, None]] = {}
 
     @staticmethod
-    def from_csv(filepath: Union[str, Path], encoder: Encoder):
+    def from_csv(filepath: Union[str, Path], encoder: Optional["AnyEncoder"] = None):
+        import pandas as pd
+
         graph = Graph("", encoder)
         with open(filepath, encoding="utf-8") as f:
             if m := re.match(r"# (?P<filepath>.*)", f.readline()):
@@ -44,24 +52,27 @@ class Graph:
         return graph
 
     @staticmethod
-    def from_json(filepath: Union[str, Path], encoder: Encoder):
+    def from_json(filepath: Union[str, Path], encoder: Optional["AnyEncoder"] = None):
+        return Graph.from_file(filepath, encoder)
+
+    @staticmethod
+    def from_file(filepath: Union[str, Path], encoder: Optional["AnyEncoder"] = None):
         graph = Graph("", encoder)
-        with open(filepath, encoding="utf-8") as f:
-            graph_json = json.load(f)
-            graph.filepath = graph_json["document"]
-            for id, text in graph_json["entities"].items():
-                graph.add_entity(id, text)
-            for node in graph_json["graph"]:
-                subject = graph.get_entity_by_id(node["subject_id"])
-                relation = node["relation"]
-                object = graph.get_entity_by_id(node["object_id"])
-                graph.add_triple(subject, relation, object)
-            for id, links in graph_json["links"].items():
-                entity = graph.get_entity_by_id(id)
-                for link in links:
-                    linked_entity = graph.get_entity_by_id(link)
-                    if not graph.link_exists(entity, linked_entity):
-                        graph.add_link(entity, linked_entity)
+        graph_json = read_graph_data(filepath)
+        graph.filepath = graph_json["document"]
+        for id, text in graph_json["entities"].items():
+            graph.add_entity(id, text)
+        for node in graph_json["graph"]:
+            subject = graph.get_entity_by_id(node["subject_id"])
+            relation = node["relation"]
+            object = graph.get_entity_by_id(node["object_id"])
+            graph.add_triple(subject, relation, object)
+        for id, links in graph_json["links"].items():
+            entity = graph.get_entity_by_id(id)
+            for link in links:
+                linked_entity = graph.get_entity_by_id(link)
+                if not graph.link_exists(entity, linked_entity):
+                    graph.add_link(entity, linked_entity)
         return graph
 
     def get_entity_by_id(self, entity_id: str, entity_text=""):
@@ -69,7 +80,7 @@ class Graph:
             return self.entities[entity_id]
         return self.add_entity(entity_id, entity_text)
 
-    def add_encoder(self, encoder: Encoder):
+    def add_encoder(self, encoder: "AnyEncoder"):
         self.encoder = encoder
         return self
 
@@ -84,50 +95,81 @@ class Graph:
         return new_triple
 
     def add_link(self, entity_a: Entity, entity_b: Entity):
-        new_link = Link(entity_a, entity_b)
-        self.links.append(new_link)
-        return new_link
+        self.adjacency.setdefault(entity_a, {})[entity_b] = None
+        self.adjacency.setdefault(entity_b, {})[entity_a] = None
+        return Link(entity_a, entity_b)
+
+    @property
+    def links(self):
+        links: list[Link] = []
+        seen: set[Entity] = set()
+        for entity, linked_entities in self.adjacency.items():
+            links.extend(Link(entity, linked_entity) for linked_entity in linked_entities if linked_entity not in seen)
+            seen.add(entity)
+        return links
+
+    def remove_links(self, entity: Entity):
+        for linked_entity in self.adjacency.pop(entity, {}):
+            if linked_entity is not entity:
+                del self.adjacency[linked_entity][entity]
+
+    def clear_links(self):
+        self.adjacency = {}
 
     def get_linked_entities(self, entity: Entity):
-        linked_entities: list[Entity] = []
-        for link in self.links:
-            if link.entity_a is not entity and link.entity_b is not entity:
-                continue
-            linked_entity = link.entity_a if link.entity_b is entity else link.entity_b
-            linked_entities.append(linked_entity)  # type: ignore
-        return linked_entities
+        return list(self.adjacency.get(entity, {}))
 
     def link_exists(self, entity_a: Entity, entity_b: Entity):
-        return entity_b in self.get_linked_entities(entity_a)
+        return entity_b in self.adjacency.get(entity_a, {})
 
     def build_entity_encodings(self, batch_size=None):
-        self.encoder.build_entity_encodings(self.triples, batch_size)
+        if self.encoder is None:
+            raise Exception("An encoder is required to build entity encodings.")
+        self.encodings = self.encoder.build_entity_encodings(self.triples, list(self.entities.values()), batch_size)
         return self
 
     def get_stacked_encodings(self):
-        encodings = [entity.encoding for entity in self.entities.values()]
-        return tf.math.l2_normalize(encodings, 1) if self.normalize else encodings
+        if self.encodings is None:
+            raise Exception("Entity encodings have not been built.")
+        return Graph.l2_normalize(self.encodings) if self.normalize else self.encodings.astype(np.float32)
+
+    @staticmethod
+    def l2_normalize(encodings):
+        encodings = np.asarray(encodings, dtype=np.float32)
+        square_sum = np.sum(np.square(encodings), axis=1, keepdims=True)
+        return encodings / np.sqrt(np.maximum(square_sum, 1e-12))
 
-    def build_links(self, threshold: float):
-        self.links = []
+    def build_links(self, threshold: float, tile_size=1024):
+        self.clear_links()
         entities = list(self.entities.values())
-        for i, entity in enumerate(entities[:-1]):
-            pool = entities[i+1:]
-            entity_encoding = tf.math.l2_normalize([entity.encoding], 1) if self.normalize else [entity.encoding]
-            pool_encodings = [e.encoding for e in pool]
-            pool_encodings = tf.math.l2_normalize(pool_encodings, 1) if self.normalize else pool_encodings
-            similarity = tf.linalg.matmul(entity_encoding, pool_encodings, transpose_b=True).numpy()
-            similarity_mask = similarity[0] >= threshold
-            for candidate_link, should_link in zip(pool, similarity_mask):
-                if should_link:
-                    self.add_link(entity, candidate_link)
+        if len(entities) < 2:
+            return self
+
+        encodings = np.asarray(self.get_stacked_encodings(), dtype=np.float32)
+        for row, column in Graph.get_similar_pairs(encodings, threshold, tile_size):
+            self.add_link(entities[row], entities[column])
         return self
 
+    @staticmethod
+    def get_similar_pairs(encodings: np.ndarray, threshold: float, tile_size=1024):
+        rows, columns = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)]
+        for i in range(0, len(encodings), tile_size):
+            for j in range(i, len(encodings), tile_size):
+                similarity = encodings[i:i+tile_size] @ encodings[j:j+tile_size].T
+                tile_rows, tile_columns = np.nonzero(similarity >= threshold)
+                upper = tile_rows + i < tile_columns + j
+                rows.append(tile_rows[upper] + i)
+                columns.append(tile_columns[upper] + j)
+
+        all_rows, all_columns = np.concatenate(rows), np.concatenate(columns)
+        order = np.lexsort((all_columns, all_rows))
+        return zip(all_rows[order].tolist(), all_columns[order].tolist())
+
     def build_triple_json(self, triple: Triple):
         return {"subject_id": triple.subject.id, "relation": triple.relation, "object_id": triple.object.id}
 
-    def save_json(self, filepath: Union[str, Path]):
-        graph_json = {
+    def build_json(self):
+        return {
             "document": Path(self.filepath).resolve().as_posix(),
             "entities": {entity_id: entity.text for entity_id, entity in self.entities.items()},
             "graph": [self.build_triple_json(t) for t in self.triples],
@@ -135,78 +177,112 @@ class Graph:
                 e_id: [linked_e.id for linked_e in self.get_linked_entities(e)] for e_id, e in self.entities.items()
             },
         }
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(graph_json, f, indent=2, ensure_ascii=False)
+
+    def save_json(self, filepath: Union[str, Path]):
+        return self.save(filepath)
+
+    def save(self, filepath: Union[str, Path]):
+        write_graph_data(filepath, self.build_json())
         return self
 
     def number_of_appearences(self, entity):
         return len([triple for triple in self.triples if triple.includes_entity(entity)])
 
-    def get_replacement(self, pool: list[Entity], sorted_by_appearences: list[Entity]):
-        for entity in sorted_by_appearences:
-            if entity in pool:
-                return entity
-        return None
+    def count_appearences(self):
+        return Counter(entity for triple in self.triples for entity in set(triple.entities()))
 
-    def replace_entity_in_triples(self, original: Entity, replacement: Entity):
-        for triple in self.triples:
-            triple.replace_entity(original, replacement)
+    def get_entity_priority(self, entity: Entity, appearences: Counter):
+        return (entity.is_named_entity(), appearences[entity])
 
-    def get_first_appearance(self, target_triple: Triple):
-        for triple in self.triples:
-            if triple == target_triple:
-                return triple
-        return None
+    def find_replacement(self, replacements: Dict[Entity, Entity], entity: Entity):
+        root = entity
+        while root in replacements:
+            root = replacements[root]
+        while entity in replacements and replacements[entity] is not root:
+            replacements[entity], entity = root, replacements[entity]
+        return root
 
-    def get_entity_priority(self, entity: Entity):
-        return (entity.is_named_entity(), self.number_of_appearences(entity))
+    def replace_entities_in_triples(self, replacements: Dict[Entity, Entity]):
+        for triple in self.triples:
+            triple.replace_entity(triple.subject, self.find_replacement(replacements, triple.subject))
+            triple.replace_entity(triple.object, self.find_replacement(replacements, triple.object))
 
     def clean(self):
         entity_list = list(self.entities.values())
-        sorted_entities = sorted(entity_list, key=self.get_entity_priority, reverse=True)
+        appearences = self.count_appearences()
+        sorted_entities = sorted(entity_list, key=lambda e: self.get_entity_priority(e, appearences), reverse=True)
+        ranks = {entity: rank for rank, entity in enumerate(sorted_entities)}
+
+        # Each entity is merged into the highest ranked of itself and its remaining synonyms. Merged entities form
+        # chains (a -> b -> c), which are resolved when the triples are rewritten at the end.
+        replacements: Dict[Entity, Entity] = {}
         for entity in entity_list:
-            entity_pool = [entity] + self.get_linked_entities(entity)
-            replacement = self.get_replacement(entity_pool, sorted_entities)
-            if replacement and entity is not replacement:
-                self.replace_entity_in_triples(entity, replacement)
-                self.links = [l for l in self.links if l.entity_a is not entity and l.entity_b is not entity]
+            replacement = min([entity] + self.get_linked_entities(entity), key=ranks.__getitem__)
+            if entity is not replacement:
+                replacements[entity] = replacement
+                self.remove_links(entity)
                 del self.entities[entity.id]
+        self.replace_entities_in_triples(replacements)
         self.remove_duplicates()
         self.remove_tripleless_entities()
-        self.links = []
+        self.clear_links()
         return self
 
     def remove_duplicates(self):
-        self.triples = [triple for triple in self.triples if triple is self.get_first_appearance(triple)]
-        self.triples = [triple for triple in self.triples if triple.subject is not triple.object]
+        seen = set()
+        unique_triples: list[Triple] = []
+        for triple in self.triples:
+            key = (triple.subject, triple.relation, triple.object)
+            if key not in seen:
+                seen.add(key)
+                unique_triples.append(triple)
+        self.triples = [triple for triple in unique_triples if triple.subject is not triple.object]
 
     def remove_tripleless_entities(self):
         remaining_entities = {entity for triple in self.triples for entity in triple.entities()}
         self.entities = {id: e for id, e in self.entities.items() if e in remaining_entities}
 
     def build_bridges(self, target_graph: "Graph", threshold: float):
-        bridges = {}
-        entities = list(self.entities.values())
-        target_entities = list(target_graph.entities.values())
+        if not (self.entities and target_graph.entities):
+            return {}
 
-        if not (entities and target_entities):
-            return bridges
+        return Graph.match_entities(
+            list(self.entities.keys()),
+            self.get_stacked_encodings(),
+            list(target_graph.entities.keys()),
+            target_graph.get_stacked_encodings(),
+            threshold,
+        )
 
-        encodings = self.get_stacked_encodings()
-        target_encodings = target_graph.get_stacked_encodings()
-        similarity = tf.linalg.matmul(encodings, target_encodings, transpose_b=True).numpy()
+    @staticmethod
+    def match_entities(entity_ids: list[str], encodings, target_entity_ids: list[str], target_encodings,
+                       threshold: float):
+        bridges, _ = Graph.match_entities_both_ways(entity_ids, encodings, target_entity_ids, target_encodings,
+                                                    threshold)
+        return bridges
+
+    @staticmethod
+    def match_entities_both_ways(entity_ids: list[str], encodings, target_entity_ids: list[str], target_encodings,
+                                 threshold: float):
+        bridges: dict[str, str] = {}
+        reverse_bridges: dict[str, str] = {}
+
+        if not (entity_ids and target_entity_ids):
+            return bridges, reverse_bridges
+
+        similarity = np.matmul(encodings, np.transpose(target_encodings))
 
         row_matches = {(row, column) for column, row in enumerate(np.argmax(similarity, axis=0))}
         column_matches = {(row, column) for row, column in enumerate(np.argmax(similarity, axis=1))}
         matches = {match for match in column_matches & row_matches if similarity[match[0], match[1]] > threshold}
 
         for row, column in matches:
-            e = entities[row]
-            te = target_entities[column]
-            bridges[e.id] = te.id
+            bridges[entity_ids[row]] = target_entity_ids[column]
+            reverse_bridges[target_entity_ids[column]] = entity_ids[row]
 
-        matching_ids = set(self.entities.keys()) & set(target_graph.entities.keys())
+        matching_ids = set(entity_ids) & set(target_entity_ids)
         for matching_id in matching_ids:
             bridges[matching_id] = matching_id
+            reverse_bridges[matching_id] = matching_id
 
-        return bridges
+        return bridges, reverse_bridges
@@ -0,0 +1,127 @@
+import json
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Literal, Union
+
+import numpy as np
+
+
+GraphFormat = Literal["json", "binary"]
+
+GRAPH_SUFFIXES: dict[GraphFormat, str] = {"json": ".json", "binary": ".kgb"}
+
+# Binary layout, after the magic bytes and the header counts (all little-endian uint32), zlib-compressed:
+# string offsets (in characters), the UTF-8 string table, the entity id and text string indexes, the triples as
+# (subject entity, relation string, object entity) indexes and the links in CSR form (row pointers and entity indexes).
+MAGIC = b"CKG1"
+HEADER = struct.Struct("<5I")
+
+
+def is_graph_file(path: Path):
+    return path.is_file() and path.suffix in GRAPH_SUFFIXES.values()
+
+
+def list_graph_files(directory: Path):
+    return sorted(path for suffix in GRAPH_SUFFIXES.values() for path in directory.glob(f"*{suffix}"))
+
+
+def get_graph_format(path: Union[str, Path]) -> GraphFormat:
+    return "binary" if Path(path).suffix == GRAPH_SUFFIXES["binary"] else "json"
+
+
+def read_graph_data(path: Union[str, Path]):
+    if get_graph_format(path) == "binary":
+        return decode_binary(Path(path).read_bytes())
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_graph_data(path: Union[str, Path], graph_data):
+    path = Path(path)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    if get_graph_format(path) == "binary":
+        temp_path.write_bytes(encode_binary(graph_data))
+    else:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(graph_data, f, indent=2, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+
+def encode_binary(graph_data):
+    strings: dict[str, int] = {}
+
+    def intern(string: str):
+        return strings.setdefault(string, len(strings))
+
+    intern(graph_data["document"])
+    entity_indexes = {entity_id: i for i, entity_id in enumerate(graph_data["entities"])}
+    entities = np.array(
+        [(intern(entity_id), intern(text)) for entity_id, text in graph_data["entities"].items()], dtype="<u4"
+    ).reshape(-1, 2)
+    triples = np.array(
+        [
+            (entity_indexes[t["subject_id"]], intern(t["relation"]), entity_indexes[t["object_id"]])
+            for t in graph_data["graph"]
+        ],
+        dtype="<u4",
+    ).reshape(-1, 3)
+
+    links = graph_data["links"]
+    link_rows = [[entity_indexes[linked_id] for linked_id in links.get(entity_id, [])] for entity_id in entity_indexes]
+    link_pointers = np.cumsum([0] + [len(row) for row in link_rows], dtype="<u4")
+    link_indexes = np.array([index for row in link_rows for index in row], dtype="<u4")
+
+    string_offsets = np.cumsum([0] + [len(string) for string in strings], dtype="<u4")
+    string_table = "".join(strings).encode("utf-8")
+
+    header = HEADER.pack(len(strings), len(string_table), len(entities), len(triples), len(link_indexes))
+    body = b"".join([
+        string_offsets.tobytes(),
+        string_table,
+        entities.tobytes(),
+        triples.tobytes(),
+        link_pointers.tobytes(),
+        link_indexes.tobytes(),
+    ])
+    return MAGIC + header + zlib.compress(body, 6)
+
+
+def decode_binary(content: bytes):
+    if content[:len(MAGIC)] != MAGIC:
+        raise Exception("Not a binary graph file.")
+    n_strings, table_size, n_entities, n_triples, n_links = HEADER.unpack_from(content, len(MAGIC))
+    body = zlib.decompress(content[len(MAGIC) + HEADER.size:])
+
+    position = 0
+
+    def take(count: int, columns=1):
+        nonlocal position
+        array = np.frombuffer(body, dtype="<u4", count=count * columns, offset=position).reshape(-1, columns)
+        position += array.nbytes
+        return array
+
+    string_offsets = take(n_strings + 1)[:, 0].tolist()
+    string_table = body[position:position + table_size].decode("utf-8")
+    position += table_size
+    strings = [string_table[start:end] for start, end in zip(string_offsets[:-1], string_offsets[1:])]
+
+    entities = take(n_entities, 2).tolist()
+    triples = take(n_triples, 3).tolist()
+    link_pointers = take(n_entities + 1)[:, 0].tolist()
+    link_indexes = take(n_links)[:, 0].tolist()
+
+    entity_ids = [strings[id_index] for id_index, _ in entities]
+    return {
+        "document": strings[0],
+        "entities": {strings[id_index]: strings[text_index] for id_index, text_index in entities},
+        "graph": [
+            {"subject_id": entity_ids[subject], "relation": strings[relation], "object_id": entity_ids[object]}
+            for subject, relation, object in triples
+        ],
+        "links": {
+            entity_id: [entity_ids[i] for i in link_indexes[link_pointers[row]:link_pointers[row + 1]]]
+            for row, entity_id in enumerate(entity_ids)
+        },
+    }
@@ -0,0 +1,330 @@
+import json
+import sqlite3
+from contextlib import contextmanager
+from functools import partial
+from itertools import groupby, islice
+from operator import itemgetter
+from pathlib import Path
+from typing import Optional
+
+from .graph_file import list_graph_files, read_graph_data
+
+
+class GraphStore:
+    SCHEMA = [
+        """CREATE TABLE IF NOT EXISTS graphs (
+            id INTEGER PRIMARY KEY,
+            version TEXT NOT NULL,
+            name TEXT NOT NULL,
+            document TEXT NOT NULL,
+            entity_count INTEGER NOT NULL,
+            triple_count INTEGER NOT NULL,
+            file_size INTEGER NOT NULL,
+            file_mtime INTEGER NOT NULL,
+            UNIQUE (version, name)
+        )""",
+        """CREATE TABLE IF NOT EXISTS entities (
+            graph_id INTEGER NOT NULL,
+            position INTEGER NOT NULL,
+            entity_id TEXT NOT NULL,
+            text TEXT NOT NULL,
+            PRIMARY KEY (graph_id, position)
+        ) WITHOUT ROWID""",
+        "CREATE UNIQUE INDEX IF NOT EXISTS entities_id ON entities (graph_id, entity_id)",
+        """CREATE TABLE IF NOT EXISTS triples (
+            graph_id INTEGER NOT NULL,
+            position INTEGER NOT NULL,
+            subject_id TEXT NOT NULL,
+            relation TEXT NOT NULL,
+            object_id TEXT NOT NULL,
+            PRIMARY KEY (graph_id, position)
+        ) WITHOUT ROWID""",
+        "CREATE INDEX IF NOT EXISTS triples_subject ON triples (graph_id, subject_id)",
+        "CREATE INDEX IF NOT EXISTS triples_object ON triples (graph_id, object_id)",
+        """CREATE TABLE IF NOT EXISTS links (
+            graph_id INTEGER NOT NULL,
+            entity_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            linked_id TEXT NOT NULL,
+            PRIMARY KEY (graph_id, entity_id, position)
+        ) WITHOUT ROWID""",
+        """CREATE TABLE IF NOT EXISTS node_bridge_files (
+            source TEXT PRIMARY KEY,
+            file_size INTEGER NOT NULL,
+            file_mtime INTEGER NOT NULL
+        )""",
+        """CREATE TABLE IF NOT EXISTS node_bridges (
+            source TEXT NOT NULL,
+            source_entity TEXT NOT NULL,
+            bridges TEXT NOT NULL,
+            PRIMARY KEY (source, source_entity)
+        ) WITHOUT ROWID""",
+        """CREATE TABLE IF NOT EXISTS directories (
+            version TEXT PRIMARY KEY,
+            mtime INTEGER NOT NULL
+        )""",
+    ]
+
+    def __init__(self, kg_dir: Path):
+        self.kg_dir = kg_dir
+        self.connection = sqlite3.connect(kg_dir / "graphs.sqlite3", timeout=60, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        for statement in self.SCHEMA:
+            self.connection.execute(statement)
+
+    def put_graph(self, version: str, graph_file: Path, graph_data):
+        stat = graph_file.stat()
+        with self._transaction():
+            self.connection.execute(
+                """INSERT INTO graphs (version, name, document, entity_count, triple_count, file_size, file_mtime)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (version, name) DO UPDATE SET
+                    document = excluded.document,
+                    entity_count = excluded.entity_count,
+                    triple_count = excluded.triple_count,
+                    file_size = excluded.file_size,
+                    file_mtime = excluded.file_mtime""",
+                (version, graph_file.name, graph_data["document"], len(graph_data["entities"]),
+                 len(graph_data["graph"]), stat.st_size, stat.st_mtime_ns),
+            )
+            graph_id = self._find_graph_id(version, graph_file.name)
+            self._delete_graph_rows(graph_id)
+
+            self.connection.executemany(
+                "INSERT INTO entities (graph_id, position, entity_id, text) VALUES (?, ?, ?, ?)",
+                ((graph_id, i, entity_id, text) for i, (entity_id, text) in enumerate(graph_data["entities"].items())),
+            )
+            self.connection.executemany(
+                "INSERT INTO triples (graph_id, position, subject_id, relation, object_id) VALUES (?, ?, ?, ?, ?)",
+                (
+                    (graph_id, i, triple["subject_id"], triple["relation"], triple["object_id"])
+                    for i, triple in enumerate(graph_data["graph"])
+                ),
+            )
+            self.connection.executemany(
+                "INSERT INTO links (graph_id, entity_id, position, linked_id) VALUES (?, ?, ?, ?)",
+                (
+                    (graph_id, entity_id, i, linked_id)
+                    for entity_id, linked_ids in graph_data["links"].items()
+                    for i, linked_id in enumerate(linked_ids)
+                ),
+            )
+        return graph_id
+
+    def remove_graph(self, version: str, name: str):
+        with self._transaction():
+            graph_id = self._find_graph_id(version, name)
+            if graph_id is not None:
+                self._delete_graph_rows(graph_id)
+                self.connection.execute("DELETE FROM graphs WHERE id = ?", (graph_id,))
+            if version == "clean":
+                self.connection.execute("DELETE FROM node_bridges WHERE source = ?", (name,))
+                self.connection.execute("DELETE FROM node_bridge_files WHERE source = ?", (name,))
+
+    def sync(self, version: str):
+        # Graph files are only ever written through os.replace, so the listing can only change when the directory's
+        # mtime does. New files get placeholder rows that are indexed on first access, as their stat never matches.
+        graph_dir = self.kg_dir / version
+        mtime = graph_dir.stat().st_mtime_ns if graph_dir.exists() else -1
+        row = self.connection.execute("SELECT mtime FROM directories WHERE version = ?", (version,)).fetchone()
+        if row is not None and row[0] == mtime:
+            return
+
+        names = {graph_file.name for graph_file in list_graph_files(graph_dir)} if graph_dir.exists() else set()
+        indexed = {
+            name for name, in self.connection.execute("SELECT name FROM graphs WHERE version = ?", (version,))
+        }
+        with self._transaction():
+            self.connection.executemany(
+                """INSERT INTO graphs (version, name, document, entity_count, triple_count, file_size, file_mtime)
+                VALUES (?, ?, '', 0, 0, -1, -1)""",
+                ((version, name) for name in sorted(names - indexed)),
+            )
+        for name in indexed - names:
+            self.remove_graph(version, name)
+        self.connection.execute("INSERT OR REPLACE INTO directories (version, mtime) VALUES (?, ?)", (version, mtime))
+
+    def list_graphs(self, version: str, after: str = "", limit: Optional[int] = None) -> list[str]:
+        self.sync(version)
+        return [name for name, in self.connection.execute(
+            "SELECT name FROM graphs WHERE version = ? AND name > ? ORDER BY name LIMIT ?",
+            (version, after, -1 if limit is None else limit),
+        )]
+
+    def get_graph_id(self, version: str, graph_file: Path):
+        stat = graph_file.stat()
+        row = self.connection.execute(
+            "SELECT id, file_size, file_mtime FROM graphs WHERE version = ? AND name = ?", (version, graph_file.name)
+        ).fetchone()
+        if row is not None and (row[1], row[2]) == (stat.st_size, stat.st_mtime_ns):
+            return row[0]
+        return self.put_graph(version, graph_file, read_graph_data(graph_file))
+
+    def get_document(self, version: str, graph_file: Path) -> str:
+        return self._get_document(self.get_graph_id(version, graph_file))
+
+    def get_graph_data(self, version: str, graph_file: Path):
+        graph_id = self.get_graph_id(version, graph_file)
+        entities = self._get_entities(graph_id)
+        triples = self.connection.execute(
+            "SELECT subject_id, relation, object_id FROM triples WHERE graph_id = ? ORDER BY position", (graph_id,)
+        )
+        links_rows = self.connection.execute(
+            "SELECT entity_id, linked_id FROM links WHERE graph_id = ? ORDER BY entity_id, position", (graph_id,)
+        )
+        return {
+            "document": self._get_document(graph_id),
+            "entities": entities,
+            "graph": [
+                {"subject_id": subject_id, "relation": relation, "object_id": object_id}
+                for subject_id, relation, object_id in triples
+            ],
+            "links": self._group_links(entities, links_rows),
+        }
+
+    def get_entity_range(self, version: str, graph_file: Path, offset: int, limit: int):
+        graph_id = self.get_graph_id(version, graph_file)
+        entities = [
+            {"entity_id": entity_id, "text": text} for entity_id, text in self.connection.execute(
+                "SELECT entity_id, text FROM entities WHERE graph_id = ? AND position >= ? ORDER BY position LIMIT ?",
+                (graph_id, offset, limit),
+            )
+        ]
+        return entities, self._get_count(graph_id, "entity_count")
+
+    def get_triple_range(self, version: str, graph_file: Path, offset: int, limit: int):
+        graph_id = self.get_graph_id(version, graph_file)
+        triples = [
+            {"subject_id": subject_id, "relation": relation, "object_id": object_id}
+            for subject_id, relation, object_id in self.connection.execute(
+                """SELECT subject_id, relation, object_id FROM triples
+                WHERE graph_id = ? AND position >= ? ORDER BY position LIMIT ?""",
+                (graph_id, offset, limit),
+            )
+        ]
+        return triples, self._get_count(graph_id, "triple_count")
+
+    def iter_graph_json(self, version: str, graph_file: Path, chunk_size: int = 1000):
+        # Builds the same document as get_graph_data piece by piece, so large graphs are never held in memory
+        graph_id = self.get_graph_id(version, graph_file)
+        dumps = partial(json.dumps, ensure_ascii=False)
+        yield f'{{"document": {dumps(self._get_document(graph_id))}, "entities": {{'
+
+        rows = self.connection.execute(
+            "SELECT entity_id, text FROM entities WHERE graph_id = ? ORDER BY position", (graph_id,)
+        )
+        yield from self._join_chunks((f"{dumps(entity_id)}: {dumps(text)}" for entity_id, text in rows), chunk_size)
+        yield '}, "graph": ['
+
+        rows = self.connection.execute(
+            "SELECT subject_id, relation, object_id FROM triples WHERE graph_id = ? ORDER BY position", (graph_id,)
+        )
+        yield from self._join_chunks(
+            (
+                dumps({"subject_id": subject_id, "relation": relation, "object_id": object_id})
+                for subject_id, relation, object_id in rows
+            ),
+            chunk_size,
+        )
+        yield '], "links": {'
+
+        rows = self.connection.execute(
+            """SELECT e.entity_id, l.linked_id FROM entities e
+            LEFT JOIN links l ON l.graph_id = e.graph_id AND l.entity_id = e.entity_id
+            WHERE e.graph_id = ? ORDER BY e.position, l.position""",
+            (graph_id,),
+        )
+        grouped = groupby(rows, key=itemgetter(0))
+        yield from self._join_chunks(
+            (
+                f"{dumps(entity_id)}: {dumps([linked_id for _, linked_id in group if linked_id is not None])}"
+                for entity_id, group in grouped
+            ),
+            chunk_size,
+        )
+        yield "}}"
+
+    def put_bridges(self, bridge_file: Path, bridges: dict[str, dict[str, str]]):
+        # Bridges are stored inverted, one row per source node with all of its targets, so looking up a node's
+        # bridges is a single key read instead of a scan over every target graph
+        node_bridges: dict[str, dict[str, str]] = {}
+        for target, target_bridges in bridges.items():
+            for source_entity, target_entity in target_bridges.items():
+                node_bridges.setdefault(source_entity, {})[target] = target_entity
+
+        stat = bridge_file.stat()
+        source = bridge_file.name
+        with self._transaction():
+            self.connection.execute("DELETE FROM node_bridges WHERE source = ?", (source,))
+            self.connection.executemany(
+                "INSERT INTO node_bridges (source, source_entity, bridges) VALUES (?, ?, ?)",
+                (
+                    (source, source_entity, json.dumps(entity_bridges, ensure_ascii=False))
+                    for source_entity, entity_bridges in node_bridges.items()
+                ),
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO node_bridge_files (source, file_size, file_mtime) VALUES (?, ?, ?)",
+                (source, stat.st_size, stat.st_mtime_ns),
+            )
+
+    def get_node_bridges_json(self, bridge_file: Path, entity_id: str) -> str:
+        self._sync_bridges(bridge_file)
+        row = self.connection.execute(
+            "SELECT bridges FROM node_bridges WHERE source = ? AND source_entity = ?", (bridge_file.name, entity_id)
+        ).fetchone()
+        return "{}" if row is None else row[0]
+
+    def _sync_bridges(self, bridge_file: Path):
+        stat = bridge_file.stat()
+        row = self.connection.execute(
+            "SELECT file_size, file_mtime FROM node_bridge_files WHERE source = ?", (bridge_file.name,)
+        ).fetchone()
+        if row != (stat.st_size, stat.st_mtime_ns):
+            with bridge_file.open(encoding="utf-8") as f:
+                self.put_bridges(bridge_file, json.load(f))
+
+    def _get_document(self, graph_id: int) -> str:
+        return self.connection.execute("SELECT document FROM graphs WHERE id = ?", (graph_id,)).fetchone()[0]
+
+    def _get_entities(self, graph_id: int):
+        return dict(self.connection.execute(
+            "SELECT entity_id, text FROM entities WHERE graph_id = ? ORDER BY position", (graph_id,)
+        ).fetchall())
+
+    def _get_count(self, graph_id: int, column: str) -> int:
+        return self.connection.execute(f"SELECT {column} FROM graphs WHERE id = ?", (graph_id,)).fetchone()[0]
+
+    @staticmethod
+    def _join_chunks(items, chunk_size: int):
+        first = True
+        for chunk in iter(lambda: list(islice(items, chunk_size)), []):
+            yield ("" if first else ", ") + ", ".join(chunk)
+            first = False
+
+    @staticmethod
+    def _group_links(entities: dict[str, str], links_rows):
+        links: dict[str, list[str]] = {entity_id: [] for entity_id in entities}
+        for entity_id, linked_id in links_rows:
+            links.setdefault(entity_id, []).append(linked_id)
+        return links
+
+    def _find_graph_id(self, version: str, name: str):
+        row = self.connection.execute(
+            "SELECT id FROM graphs WHERE version = ? AND name = ?", (version, name)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def _delete_graph_rows(self, graph_id: int):
+        for table in ["entities", "triples", "links"]:
+            self.connection.execute(f"DELETE FROM {table} WHERE graph_id = ?", (graph_id,))
+
+    @contextmanager
+    def _transaction(self):
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+            self.connection.execute("COMMIT")
+        except Exception:
+            self.connection.execute("ROLLBACK")
+            raise
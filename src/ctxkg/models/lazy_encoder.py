@@ -0,0 +1,38 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+from ...constants import ENGLISH_PREFIX, ENCODING_CACHE_DIR
+from .encoder_service import RemoteEncoder
+
+if TYPE_CHECKING:
+    from .encoder import Encoder
+    from .entity import Entity
+    from .triple import Triple
+
+
+class LazyEncoder:
+    def __init__(self, size="small", language=ENGLISH_PREFIX, ratio=1.0,
+                 cache_dir: Optional[Path] = ENCODING_CACHE_DIR):
+        self.size: str = size
+        self.language: str = language
+        self.ratio: float = ratio
+        self.cache_dir = cache_dir
+        self._encoder: Optional[Union["Encoder", RemoteEncoder]] = None
+
+    def load(self):
+        # A running encoder server already has the models loaded, so they are only loaded here when there is none
+        if self._encoder is None:
+            try:
+                self._encoder = RemoteEncoder(size=self.size, language=self.language, ratio=self.ratio)
+            except OSError:
+                from .encoder import Encoder
+                self._encoder = Encoder(
+                    size=self.size, language=self.language, ratio=self.ratio, cache_dir=self.cache_dir
+                )
+        return self._encoder
+
+    def is_loaded(self):
+        return self._encoder is not None
+
+    def build_entity_encodings(self, triples: list["Triple"], entities: list["Entity"], batch_size=None):
+        return self.load().build_entity_encodings(triples, entities, batch_size)
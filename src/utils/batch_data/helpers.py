@@ -1,29 +1,90 @@
 import json
+import os
+import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
 import shutil
+import time
+from typing import get_args
 
-from ...constants import METADATA_PATH, ENGLISH_PREFIX, PORTUGUESE_PREFIX
+from ...constants import METADATA_PATH, METADATA_DB_PATH, ENGLISH_PREFIX, PORTUGUESE_PREFIX
 from ...constants import DOCUMENT_DIR, TRIPLE_DIR, GRAPH_DIR, BLABKG_DIR
 from ...constants import DEFAULT_PARAMS
 
 from ...languages import Language
 from .types import BatchMetadata, BatchStatus, Batch, BatchListItem, Stage, BlabKGException, StageParams, BatchParams
+from .types import JobState, StageProgress
+
+
+STAGES: tuple[Stage, ...] = get_args(Stage)
+
+METADATA_SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS batches (
+        language TEXT NOT NULL,
+        name TEXT NOT NULL,
+        triples TEXT NOT NULL DEFAULT 'pending',
+        base TEXT NOT NULL DEFAULT 'pending',
+        clean TEXT NOT NULL DEFAULT 'pending',
+        bridges TEXT NOT NULL DEFAULT 'pending',
+        PRIMARY KEY (language, name)
+    )""",
+    """CREATE TABLE IF NOT EXISTS stage_progress (
+        language TEXT NOT NULL,
+        name TEXT NOT NULL,
+        stage TEXT NOT NULL,
+        done INTEGER NOT NULL DEFAULT 0,
+        total INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (language, name, stage)
+    )""",
+    """CREATE TABLE IF NOT EXISTS jobs (
+        id INTEGER PRIMARY KEY,
+        language TEXT NOT NULL,
+        name TEXT NOT NULL,
+        stage TEXT NOT NULL,
+        stage_order INTEGER NOT NULL,
+        priority INTEGER NOT NULL,
+        state TEXT NOT NULL,
+        worker_pid INTEGER,
+        created_at REAL NOT NULL,
+        started_at REAL,
+        finished_at REAL
+    )""",
+    """CREATE TABLE IF NOT EXISTS stop_requests (
+        language TEXT NOT NULL,
+        name TEXT NOT NULL,
+        requested_at REAL NOT NULL,
+        PRIMARY KEY (language, name)
+    )""",
+    """CREATE TABLE IF NOT EXISTS worker_pool (
+        id INTEGER PRIMARY KEY CHECK (id = 0),
+        pid INTEGER NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS jobs_queue ON jobs (state, priority, stage_order, id)",
+    "CREATE INDEX IF NOT EXISTS jobs_batch ON jobs (language, name, id)",
+]
+
+_prepared_dbs: set[Path] = set()
 
 
 def get_metadata() -> BatchMetadata:
-    if METADATA_PATH.exists():
-        with METADATA_PATH.open(encoding="utf-8") as f:
-            return json.load(f)
+    metadata: BatchMetadata = {ENGLISH_PREFIX: {}, PORTUGUESE_PREFIX: {}}
+    with _metadata_db() as connection:
+        rows = connection.execute(f"SELECT language, name, {', '.join(STAGES)} FROM batches")
+        for language, batch, *statuses in rows:
+            metadata.setdefault(language, {})[batch] = dict(zip(STAGES, statuses))  # type: ignore
+    return metadata
 
-    metadata = _build_metadata()
-    _write_metadata(metadata)
 
-    return metadata
+def get_batch_data(language: Language, batch: str) -> Batch:
+    with _metadata_db() as connection:
+        return _get_batch_row(connection, language, batch)
 
 
 def get_batch_list(language: Language):
     metadata = get_metadata()
     batch_names = metadata[language].keys()
+    progress = _get_progress(language)
+    job_states = _get_job_states(language)
 
     batches: list[BatchListItem] = []
     for batch in batch_names:
@@ -39,6 +100,8 @@ def get_batch_list(language: Language):
             "bridges": batch_data["bridges"],
             "can_be_paused": can_be_paused,
             "can_be_resumed": can_be_resumed,
+            "progress": progress.get(batch, {}),
+            "job": job_states.get(batch),
         })
 
     sorted_batches = sorted(batches, key=_batch_priority, reverse=True)
@@ -47,29 +110,74 @@ def get_batch_list(language: Language):
 
 
 def set_batch_data(language: Language, batch: str, stage: Stage, status: BatchStatus):
-    metadata = get_metadata()
-
-    if language not in metadata:
-        metadata[language] = {}
-    if batch not in metadata[language]:
-        metadata[language][batch] = {
-            "triples": "pending",
-            "base": "pending",
-            "clean": "pending",
-            "bridges": "pending",
-        }
-    metadata[language][batch][stage] = status
-    _write_metadata(metadata)
+    with _metadata_db() as connection, _transaction(connection):
+        _set_stage_status(connection, language, batch, stage, status)
+
+
+def finish_stage(language: Language, batch: str, stage: Stage, status: BatchStatus):
+    # Only updates an existing row, so a stage ending after its batch was deleted doesn't add it back. A stage failing
+    # after a stop was requested is paused, since deleting a batch removes the files it was reading. The stop request
+    # is cleared whatever the status, as a stage may end before it checks for one.
+    with _metadata_db() as connection, _transaction(connection):
+        if status == "failed" and _has_stop_request(connection, language, batch):
+            status = "paused"
+        _update_stage_status(connection, language, batch, stage, status)
+        connection.execute("DELETE FROM stop_requests WHERE language = ? AND name = ?", (language, batch))
+
+
+def batch_exists(language: Language, batch: str) -> bool:
+    with _metadata_db() as connection:
+        return _has_batch(connection, language, batch)
+
+
+def add_stage_progress(language: Language, batch: str, stage: Stage, count=1):
+    # The row is added by refresh_stage_progress when the stage starts
+    with _metadata_db() as connection, _transaction(connection):
+        connection.execute(
+            "UPDATE stage_progress SET done = done + ? WHERE language = ? AND name = ? AND stage = ?",
+            (count, language, batch, stage),
+        )
+
+
+def refresh_stage_progress(language: Language, batch: str, stage: Stage):
+    # Counts a single stage's files, for when a stage starts and for stages whose files are written by external tools
+    doc_stems = _list_stems(DOCUMENT_DIR / language / batch)
+    _, done = _scan_stage(doc_stems, _get_stage_dirs(language, batch)[stage])
+    with _metadata_db() as connection, _transaction(connection):
+        if _has_batch(connection, language, batch):
+            _set_progress(connection, language, batch, stage, done, len(doc_stems))
+
+
+def reconcile_metadata():
+    # Stages keep their counters up to date as they write files; this scan fixes them after crashes or changes made
+    # outside the app, and adds batches found on disk that have no row yet
+    scans = {
+        (language, batch): _scan_batch(language, batch)
+        for language in [ENGLISH_PREFIX, PORTUGUESE_PREFIX]
+        for batch in _list_batch_names(language)
+    }
+    with _metadata_db() as connection, _transaction(connection):
+        for (language, batch), (stages, total) in scans.items():
+            connection.execute(
+                f"INSERT OR IGNORE INTO batches (language, name, {', '.join(STAGES)}) VALUES (?, ?, ?, ?, ?, ?)",
+                (language, batch, *(stages[stage][0] for stage in STAGES)),
+            )
+            for stage in STAGES:
+                _set_progress(connection, language, batch, stage, stages[stage][1], total)
 
 
 def pause_batch(language: Language, batch: str):
-    batch_data = get_metadata()[language][batch]
-    if _can_pause_base(batch_data):
-        set_batch_data(language, batch, "base", "paused")
-    elif _can_pause_clean(batch_data):
-        set_batch_data(language, batch, "clean", "paused")
-    elif _can_pause_bridges(batch_data):
-        set_batch_data(language, batch, "bridges", "paused")
+    # The check and the update share a transaction so a stage can't start between them
+    with _metadata_db() as connection, _transaction(connection):
+        batch_data = _get_batch_row(connection, language, batch)
+        if _is_running(batch_data):
+            _request_stop(connection, language, batch)
+        if _can_pause_base(batch_data):
+            _set_stage_status(connection, language, batch, "base", "paused")
+        elif _can_pause_clean(batch_data):
+            _set_stage_status(connection, language, batch, "clean", "paused")
+        elif _can_pause_bridges(batch_data):
+            _set_stage_status(connection, language, batch, "bridges", "paused")
 
 
 def _can_pause_base(batch_data: Batch):
@@ -84,8 +192,28 @@ def _can_pause_bridges(batch_data: Batch):
     return batch_data["clean"] == "started" and batch_data["bridges"] == "pending"
 
 
+def _is_running(batch_data: Batch):
+    return any(status == "started" for status in batch_data.values())
+
+
 def _can_pause(batch_data: Batch):
-    return _can_pause_base(batch_data) or _can_pause_clean(batch_data) or _can_pause_bridges(batch_data)
+    return _is_running(batch_data)
+
+
+def is_stop_requested(language: Language, batch: str) -> bool:
+    with _metadata_db() as connection:
+        return _has_stop_request(connection, language, batch)
+
+
+def clear_stop_request(language: Language, batch: str):
+    with _metadata_db() as connection, _transaction(connection):
+        connection.execute("DELETE FROM stop_requests WHERE language = ? AND name = ?", (language, batch))
+
+
+def pause_stopped_stage(language: Language, batch: str, stage: Stage):
+    # Only updates an existing row, since the stop may come from the batch being deleted
+    with _metadata_db() as connection, _transaction(connection):
+        _pause_stopped_stage(connection, language, batch, stage)
 
 
 def delete_batch(language: Language, batch: str):
@@ -96,15 +224,18 @@ def delete_batch(language: Language, batch: str):
     if graph_dir == BLABKG_DIR:
         raise BlabKGException("Can't delete the official BlabKG graphs.")
 
+    # The rows are deleted before the files. A stage still running on the batch stops at its next file or bridge
+    # pair, and as stages only update existing rows once started, it can't add the batch back while it stops
+    with _metadata_db() as connection, _transaction(connection):
+        _request_stop(connection, language, batch)
+        connection.execute("DELETE FROM batches WHERE language = ? AND name = ?", (language, batch))
+        connection.execute("DELETE FROM stage_progress WHERE language = ? AND name = ?", (language, batch))
+        connection.execute("DELETE FROM jobs WHERE language = ? AND name = ? AND state = 'queued'", (language, batch))
+
     shutil.rmtree(doc_dir, ignore_errors=True)
     shutil.rmtree(triple_dir, ignore_errors=True)
     shutil.rmtree(graph_dir, ignore_errors=True)
 
-    metadata = get_metadata()
-    if metadata[language] and metadata[language][batch]:
-        del metadata[language][batch]
-    _write_metadata(metadata)
-
 
 def save_batch_params(language: Language, batch: str, stage: Stage, stage_params: StageParams):
     kg_dir = GRAPH_DIR / language / batch
@@ -135,51 +266,190 @@ def _build_metadata():
 
     for language in [ENGLISH_PREFIX, PORTUGUESE_PREFIX]:
         metadata[language] = {}
-
-        doc_dir = DOCUMENT_DIR / language
-        triple_dir = TRIPLE_DIR / language
-        graph_dir = GRAPH_DIR / language
-        all_dirs = [doc_dir, triple_dir, graph_dir]
-        batch_names = {path.stem for dir in all_dirs for path in dir.iterdir() if path.is_dir()}
-
-        for batch_name in batch_names:
-            batch_doc_dir = doc_dir / batch_name
-            if not batch_doc_dir.exists():
-                batch_doc_dir.mkdir()
-
-            batch_triple_dir = triple_dir / batch_name
-            batch_base_dir = graph_dir / batch_name / "base"
-            batch_clean_dir = graph_dir / batch_name / "clean"
-            batch_bridge_dir = graph_dir / batch_name / "bridges"
-
-            metadata[language][batch_name] = {
-                "triples": _get_stage_status(batch_doc_dir, batch_triple_dir),
-                "base": _get_stage_status(batch_doc_dir, batch_base_dir),
-                "clean": _get_stage_status(batch_doc_dir, batch_clean_dir),
-                "bridges": _get_stage_status(batch_doc_dir, batch_bridge_dir),
-            }
+        for batch_name in _list_batch_names(language):
+            stages, _ = _scan_batch(language, batch_name)
+            metadata[language][batch_name] = {stage: status for stage, (status, _) in stages.items()}
 
     return metadata
 
 
-def _get_stage_status(doc_dir: Path, target_dir: Path) -> BatchStatus:
+def _list_batch_names(language: Language):
+    all_dirs = [DOCUMENT_DIR / language, TRIPLE_DIR / language, GRAPH_DIR / language]
+    return {path.stem for dir in all_dirs for path in dir.iterdir() if path.is_dir()}
+
+
+def _get_stage_dirs(language: Language, batch: str) -> dict[Stage, Path]:
+    return {
+        "triples": TRIPLE_DIR / language / batch,
+        "base": GRAPH_DIR / language / batch / "base",
+        "clean": GRAPH_DIR / language / batch / "clean",
+        "bridges": GRAPH_DIR / language / batch / "bridges",
+    }
+
+
+def _scan_batch(language: Language, batch: str):
+    doc_dir = DOCUMENT_DIR / language / batch
+    if not doc_dir.exists():
+        doc_dir.mkdir()
+
+    doc_stems = _list_stems(doc_dir)
+    stage_dirs = _get_stage_dirs(language, batch)
+    stages = {stage: _scan_stage(doc_stems, target_dir) for stage, target_dir in stage_dirs.items()}
+    return stages, len(doc_stems)
+
+
+def _scan_stage(doc_stems: set[str], target_dir: Path) -> tuple[BatchStatus, int]:
     if not target_dir.exists():
-        return "pending"
+        return "pending", 0
+
+    done = len(doc_stems & _list_stems(target_dir))
+
+    if done == len(doc_stems):
+        return "done", done
+    if done > 0:
+        return "started", done
+    return "failed", done
+
+
+def _list_stems(directory: Path):
+    if not directory.exists():
+        return set()
+    with os.scandir(directory) as entries:
+        return {Path(entry.name).stem for entry in entries if entry.is_file()}
+
+
+@contextmanager
+def _metadata_db():
+    connection = sqlite3.connect(METADATA_DB_PATH, timeout=60, isolation_level=None)
+    try:
+        # The schema is set up by the first connection of each process. WAL mode is kept in the database file.
+        db_path = METADATA_DB_PATH.resolve()
+        if db_path not in _prepared_dbs:
+            _prepare_metadata_db(connection)
+            _prepared_dbs.add(db_path)
+        yield connection
+    finally:
+        connection.close()
+
+
+def _prepare_metadata_db(connection: sqlite3.Connection):
+    connection.execute("PRAGMA journal_mode=WAL")
+    for statement in METADATA_SCHEMA:
+        connection.execute(statement)
+    if connection.execute("PRAGMA user_version").fetchone()[0] == 0:
+        with _transaction(connection):
+            # Checked again under the write lock, since another process may have filled the table meanwhile
+            if connection.execute("PRAGMA user_version").fetchone()[0] == 0:
+                _import_metadata(connection)
+                connection.execute("PRAGMA user_version = 1")
+
+
+@contextmanager
+def _transaction(connection: sqlite3.Connection):
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+        connection.execute("COMMIT")
+    except Exception:
+        connection.execute("ROLLBACK")
+        raise
+
+
+def _import_metadata(connection: sqlite3.Connection):
+    # Statuses saved by earlier versions in metadata.json are kept, unless the file was left truncated
+    metadata = None
+    if METADATA_PATH.exists():
+        try:
+            with METADATA_PATH.open(encoding="utf-8") as f:
+                metadata = json.load(f)
+        except json.JSONDecodeError:
+            pass
+    if metadata is None:
+        metadata = _build_metadata()
+
+    connection.executemany(
+        f"INSERT OR REPLACE INTO batches (language, name, {', '.join(STAGES)}) VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            (language, batch, *(batch_data.get(stage, "pending") for stage in STAGES))
+            for language, batches in metadata.items()
+            for batch, batch_data in batches.items()
+        ),
+    )
+
+
+def _get_progress(language: Language):
+    progress: dict[str, dict[Stage, StageProgress]] = {}
+    with _metadata_db() as connection:
+        rows = connection.execute(
+            "SELECT name, stage, done, total FROM stage_progress WHERE language = ?", (language,)
+        )
+        for batch, stage, done, total in rows:
+            progress.setdefault(batch, {})[stage] = {"done": done, "total": total}
+    return progress
+
+
+def _get_job_states(language: Language) -> dict[str, JobState]:
+    with _metadata_db() as connection:
+        return dict(connection.execute(
+            """SELECT name, state FROM jobs
+            WHERE id IN (SELECT MAX(id) FROM jobs WHERE language = ? GROUP BY name)""",
+            (language,),
+        ).fetchall())
+
+
+def _set_progress(connection: sqlite3.Connection, language: Language, batch: str, stage: Stage, done: int, total: int):
+    connection.execute(
+        "INSERT OR REPLACE INTO stage_progress (language, name, stage, done, total) VALUES (?, ?, ?, ?, ?)",
+        (language, batch, stage, done, total),
+    )
+
+
+def _request_stop(connection: sqlite3.Connection, language: Language, batch: str):
+    connection.execute(
+        "INSERT OR REPLACE INTO stop_requests (language, name, requested_at) VALUES (?, ?, ?)",
+        (language, batch, time.time()),
+    )
+
+
+def _has_stop_request(connection: sqlite3.Connection, language: Language, batch: str) -> bool:
+    return connection.execute(
+        "SELECT 1 FROM stop_requests WHERE language = ? AND name = ?", (language, batch)
+    ).fetchone() is not None
+
+
+def _pause_stopped_stage(connection: sqlite3.Connection, language: Language, batch: str, stage: Stage):
+    _update_stage_status(connection, language, batch, stage, "paused")
+    connection.execute("DELETE FROM stop_requests WHERE language = ? AND name = ?", (language, batch))
+
+
+def _has_batch(connection: sqlite3.Connection, language: Language, batch: str) -> bool:
+    return connection.execute(
+        "SELECT 1 FROM batches WHERE language = ? AND name = ?", (language, batch)
+    ).fetchone() is not None
+
+
+def _get_batch_row(connection: sqlite3.Connection, language: Language, batch: str) -> Batch:
+    row = connection.execute(
+        f"SELECT {', '.join(STAGES)} FROM batches WHERE language = ? AND name = ?", (language, batch)
+    ).fetchone()
+    if row is None:
+        raise KeyError(batch)
+    return dict(zip(STAGES, row))  # type: ignore
 
-    doc_set = {path.stem for path in doc_dir.iterdir() if path.is_file()}
-    target_set = {path.stem for path in target_dir.iterdir() if path.is_file()}
-    missing = doc_set - target_set
 
-    if len(missing) == 0:
-        return "done"
-    if len(missing) < len(doc_set):
-        return "started"
-    return "failed"
+def _set_stage_status(
+    connection: sqlite3.Connection, language: Language, batch: str, stage: Stage, status: BatchStatus
+):
+    connection.execute("INSERT OR IGNORE INTO batches (language, name) VALUES (?, ?)", (language, batch))
+    _update_stage_status(connection, language, batch, stage, status)
 
 
-def _write_metadata(metadata):
-    with METADATA_PATH.open("w", encoding="utf-8") as f:
-        json.dump(metadata, f, indent=2, ensure_ascii=False)
+def _update_stage_status(
+    connection: sqlite3.Connection, language: Language, batch: str, stage: Stage, status: BatchStatus
+):
+    if stage not in STAGES:
+        raise Exception(f"Unknown stage {stage}.")
+    connection.execute(f"UPDATE batches SET {stage} = ? WHERE language = ? AND name = ?", (status, language, batch))
 
 
 def _batch_priority(batch: BatchListItem):
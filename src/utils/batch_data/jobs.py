@@ -0,0 +1,113 @@
+import os
+import time
+from typing import Optional
+
+from ...languages import Language
+from .helpers import STAGES, _metadata_db, _transaction
+from .types import Job, JobState, Stage
+
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+STILL_ACTIVE = 259
+
+
+def enqueue_stage(language: Language, batch: str, stage: Stage = "triples", priority: Optional[int] = None):
+    with _metadata_db() as connection, _transaction(connection):
+        return _enqueue_stage(connection, language, batch, stage, priority)
+
+
+def claim_job(worker_pid: int) -> Optional[Job]:
+    # Higher priorities go first, then later stages, so batches already in progress finish before new ones start
+    with _metadata_db() as connection, _transaction(connection):
+        row = connection.execute(
+            """SELECT id, language, name, stage, priority FROM jobs WHERE state = 'queued'
+            ORDER BY priority DESC, stage_order DESC, id LIMIT 1"""
+        ).fetchone()
+        if row is None:
+            return None
+        connection.execute(
+            "UPDATE jobs SET state = 'running', worker_pid = ?, started_at = ? WHERE id = ?",
+            (worker_pid, time.time(), row[0]),
+        )
+    return dict(zip(["id", "language", "batch", "stage", "priority"], row))  # type: ignore
+
+
+def finish_job(job: Job, state: JobState, next_stage: Optional[Stage] = None):
+    with _metadata_db() as connection, _transaction(connection):
+        connection.execute("UPDATE jobs SET state = ?, finished_at = ? WHERE id = ?", (state, time.time(), job["id"]))
+        if next_stage is not None:
+            _enqueue_stage(connection, job["language"], job["batch"], next_stage, job["priority"])
+
+
+def fail_interrupted_jobs():
+    # Jobs whose worker is still alive are left running, as they may belong to the pool of another server process
+    with _metadata_db() as connection, _transaction(connection):
+        jobs = connection.execute("SELECT id, worker_pid FROM jobs WHERE state = 'running'").fetchall()
+        connection.executemany(
+            "UPDATE jobs SET state = 'failed', finished_at = ? WHERE id = ?",
+            [(time.time(), job_id) for job_id, worker_pid in jobs if not _is_process_alive(worker_pid)],
+        )
+
+
+def get_running_batches() -> set[tuple[Language, str]]:
+    with _metadata_db() as connection:
+        return set(connection.execute("SELECT language, name FROM jobs WHERE state = 'running'").fetchall())
+
+
+def claim_worker_pool(pid: int):
+    # Only one process runs workers at a time: the first to claim the pool while the previous owner isn't running
+    with _metadata_db() as connection, _transaction(connection):
+        row = connection.execute("SELECT pid FROM worker_pool WHERE id = 0").fetchone()
+        if row is not None and row[0] != pid and _is_process_alive(row[0]):
+            return False
+        connection.execute("INSERT OR REPLACE INTO worker_pool (id, pid) VALUES (0, ?)", (pid,))
+        return True
+
+
+def count_jobs() -> dict[JobState, int]:
+    with _metadata_db() as connection:
+        return dict(connection.execute(
+            "SELECT state, COUNT(*) FROM jobs WHERE state IN ('queued', 'running') GROUP BY state"
+        ).fetchall())
+
+
+def _is_process_alive(pid: Optional[int]):
+    if pid is None:
+        return False
+    if os.name == "nt":
+        # os.kill terminates the process on Windows instead of checking it
+        import ctypes
+
+        handle = ctypes.windll.kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+        exit_code = ctypes.c_ulong()
+        ctypes.windll.kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+        ctypes.windll.kernel32.CloseHandle(handle)
+        return exit_code.value == STILL_ACTIVE
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _enqueue_stage(connection, language: Language, batch: str, stage: Stage, priority: Optional[int]):
+    # A batch has at most one queued or running job, which queues the batch's next stage when it's done
+    active = connection.execute(
+        "SELECT 1 FROM jobs WHERE language = ? AND name = ? AND state IN ('queued', 'running')", (language, batch)
+    ).fetchone()
+    if active is not None:
+        return False
+    if priority is None:
+        row = connection.execute(
+            "SELECT priority FROM jobs WHERE language = ? AND name = ? ORDER BY id DESC LIMIT 1", (language, batch)
+        ).fetchone()
+        priority = 0 if row is None else row[0]
+    connection.execute(
+        """INSERT INTO jobs (language, name, stage, stage_order, priority, state, created_at)
+        VALUES (?, ?, ?, ?, ?, 'queued', ?)""",
+        (language, batch, stage, STAGES.index(stage), priority, time.time()),
+    )
+    return True
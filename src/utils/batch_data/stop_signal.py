@@ -0,0 +1,22 @@
+import time
+
+from ...constants import STOP_CHECK_SECONDS
+from ...languages import Language
+from .helpers import is_stop_requested
+
+
+class StopSignal:
+    # Checks are throttled, as a bridge pair can take only a few milliseconds. Instances are picklable so that
+    # worker processes can check the signal themselves.
+    def __init__(self, language: Language, batch: str, interval=STOP_CHECK_SECONDS):
+        self.language = language
+        self.batch = batch
+        self.interval = interval
+        self.checked_at = float("-inf")
+        self.stopped = False
+
+    def __call__(self) -> bool:
+        if not self.stopped and time.monotonic() - self.checked_at >= self.interval:
+            self.stopped = is_stop_requested(self.language, self.batch)
+            self.checked_at = time.monotonic()
+        return self.stopped
@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Literal, Optional
 from typing_extensions import TypedDict, NotRequired
 
 from ...languages import Language
@@ -6,6 +6,7 @@ from ...languages import Language
 
 Stage = Literal["triples", "base", "clean", "bridges"]
 BatchStatus = Literal["done", "started", "pending", "paused", "failed"]
+JobState = Literal["queued", "running", "finished", "failed"]
 
 
 class Batch(TypedDict):
@@ -19,6 +20,19 @@ BatchDataMap = dict[str, Batch]
 BatchMetadata = dict[Language, BatchDataMap]
 
 
+class StageProgress(TypedDict):
+    done: int
+    total: int
+
+
+class Job(TypedDict):
+    id: int
+    language: Language
+    batch: str
+    stage: Stage
+    priority: int
+
+
 class BatchListItem(TypedDict):
     name: str
     triples: BatchStatus
@@ -27,6 +41,8 @@ class BatchListItem(TypedDict):
     bridges: BatchStatus
     can_be_paused: bool
     can_be_resumed: bool
+    progress: dict[Stage, StageProgress]
+    job: Optional[JobState]
 
 
 class StageParams(TypedDict):
@@ -35,6 +51,7 @@ class StageParams(TypedDict):
     batch_size: int
     size: str
     extraction_model: str
+    workers: NotRequired[int]
 
 
 class BatchParams(TypedDict):
@@ -0,0 +1,81 @@
+import tempfile
+import unittest
+from pathlib import Path
+from threading import Thread
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.ctxkg.models.encoder_service import EncoderServer, RemoteEncoder
+from src.ctxkg.models.encoding_cache import EncodingCache
+
+
+class CachedEncoder:
+    # Encodes texts from their lengths and goes through an encoding cache, as the BERT encoder does
+    def __init__(self, cache_dir: Path):
+        self.cache = EncodingCache(cache_dir, 1024 ** 2)
+
+    def encode_texts(self, triple_texts, batch_size=None):
+        keys = [EncodingCache.get_key(texts) for texts in triple_texts]
+        encodings = self.cache.get_many(keys)
+        new_encodings = {
+            key: np.array([[len(texts[0]), 1], [len(texts[2]), 2]], dtype=np.float32)
+            for key, texts in zip(keys, triple_texts) if key not in encodings
+        }
+        self.cache.put_many(new_encodings)
+        encodings.update(new_encodings)
+        return np.stack([encodings[key] for key in keys])
+
+
+class TextEntity:
+    def __init__(self, text: str):
+        self.text = text
+
+
+def make_triple(subject: str, relation: str, object: str):
+    return SimpleNamespace(subject=TextEntity(subject), relation=relation, object=TextEntity(object))
+
+
+class RemoteEncoderTest(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.socket_path = Path(temp_dir.name) / "encoder.sock"
+
+        self.server = EncoderServer(self.socket_path)
+        self.addCleanup(self.server.server_close)
+        # Encoders are preloaded in the main thread and used from the server's request threads
+        self.server.encoders[("en", "small", 1.0)] = CachedEncoder(Path(temp_dir.name) / "cache")
+        thread = Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.shutdown)
+
+    def test_encode_triples(self):
+        encoder = RemoteEncoder(socket_path=self.socket_path)
+        self.addCleanup(encoder.connection.close)
+        triples = [make_triple("a", "r", "bbb"), make_triple("cc", "r", "a")]
+
+        for _ in range(2):
+            encodings = encoder.encode_triples(triples)
+            np.testing.assert_array_equal(encodings, [[[1, 1], [3, 2]], [[2, 1], [1, 2]]])
+
+    def test_build_entity_encodings(self):
+        encoder = RemoteEncoder(socket_path=self.socket_path)
+        self.addCleanup(encoder.connection.close)
+        triples = [make_triple("a", "r", "bbb"), make_triple("cc", "r", "a")]
+        entities = [triples[0].subject, triples[0].object, triples[1].subject]
+        triples[1].object = entities[0]
+
+        encodings = encoder.build_entity_encodings(triples, entities)
+        np.testing.assert_array_equal(encodings, [[1, 1.5], [3, 2], [2, 1]])
+
+    def test_server_error(self):
+        encoder = RemoteEncoder(socket_path=self.socket_path, language="pt-BR")
+        self.addCleanup(encoder.connection.close)
+        with self.assertRaises(Exception):
+            encoder.encode_triples([make_triple("a", "r", "b")])
+
+
+if __name__ == "__main__":
+    unittest.main()